@@ -0,0 +1,189 @@
+"""
+Export stored articles to NDJSON or Parquet.
+
+Streams the articles table in keyset-ordered chunks, so memory use stays
+constant however many articles are exported. The format is inferred from
+the output extension (.ndjson, .jsonl, .ndjson.gz or .parquet) unless
+--format is given. Parquet requires the optional pyarrow dependency
+(pip install lolstonksrss[parquet]).
+
+Usage:
+    python scripts/export_articles.py articles.ndjson.gz
+    python scripts/export_articles.py articles.parquet --locale en-us
+    python scripts/export_articles.py recent.ndjson --since 2025-01-01 --no-content
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Final
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings  # noqa: E402
+from src.database import ArticleRepository  # noqa: E402
+from src.services.article_transfer import FORMATS, export_articles  # noqa: E402
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+def parse_date(value: str) -> datetime:
+    """
+    Parse an ISO 8601 date or datetime argument, treating naive values as UTC.
+
+    Args:
+        value: Date string (e.g., "2025-01-01" or "2025-01-01T12:00:00+01:00")
+
+    Returns:
+        Timezone-aware datetime
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not ISO 8601
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid ISO 8601 date: {value!r}") from e
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def run_export(args: argparse.Namespace) -> int:
+    """
+    Open the database and export the selected articles.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Number of exported articles
+    """
+    repository = ArticleRepository(args.database, read_pool_size=1)
+    await repository.initialize()
+    try:
+        return await export_articles(
+            repository,
+            args.output,
+            fmt=args.format,
+            chunk_size=args.chunk_size,
+            locale=args.locale,
+            source=args.source,
+            since=args.since,
+            until=args.until,
+            include_content=not args.no_content,
+        )
+    finally:
+        await repository.close()
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = argparse.ArgumentParser(
+        description="Export stored articles to NDJSON or Parquet",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  Export everything as gzipped NDJSON:
+    python scripts/export_articles.py articles.ndjson.gz
+
+  Export one locale as Parquet:
+    python scripts/export_articles.py en-us.parquet --locale en-us
+
+  Export one source for a date range, without article bodies:
+    python scripts/export_articles.py lol.ndjson --source lol:en-us \\
+        --since 2025-01-01 --until 2025-02-01 --no-content
+        """,
+    )
+
+    parser.add_argument("output", help="Output file (.ndjson, .jsonl, .ndjson.gz or .parquet)")
+    parser.add_argument(
+        "--database",
+        "-d",
+        default=get_settings().database_path,
+        help="SQLite database to export (default: DATABASE_PATH setting)",
+    )
+    parser.add_argument(
+        "--format",
+        "-f",
+        choices=FORMATS,
+        default=None,
+        help="Output format (default: inferred from the output extension)",
+    )
+    parser.add_argument("--locale", "-l", default=None, help="Only this locale (e.g., en-us)")
+    parser.add_argument("--source", "-s", default=None, help="Only this source (e.g., lol:en-us)")
+    parser.add_argument(
+        "--since",
+        type=parse_date,
+        default=None,
+        help="Only articles published at or after this ISO 8601 date",
+    )
+    parser.add_argument(
+        "--until",
+        type=parse_date,
+        default=None,
+        help="Only articles published before this ISO 8601 date",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=5000,
+        help="Rows read and written per chunk (default: 5000)",
+    )
+    parser.add_argument(
+        "--no-content",
+        action="store_true",
+        help="Leave the content column empty (much smaller and faster exports)",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Main entry point for the script.
+
+    Parses arguments and runs the export.
+    """
+    args = parse_arguments()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if args.chunk_size < 1:
+        logger.error("Chunk size must be at least 1")
+        sys.exit(1)
+    if not Path(args.database).exists():
+        logger.error(f"Database not found: {args.database}")
+        sys.exit(1)
+
+    try:
+        start = time.perf_counter()
+        count = asyncio.run(run_export(args))
+        elapsed = time.perf_counter() - start
+        logger.info(f"Exported {count} articles to {args.output} in {elapsed:.1f}s")
+    except KeyboardInterrupt:
+        logger.info("Operation cancelled by user")
+        sys.exit(1)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -39,7 +39,8 @@ async def fetch_articles(repository: ArticleRepository, limit: int) -> list[dict
     Returns:
         List of article dictionaries with formatted data
     """
-    articles = await repository.get_latest(limit=limit)
+    # The page only shows titles and descriptions, so skip the content column
+    articles = await repository.get_latest(limit=limit, projection="summary")
 
     # Prepare articles for template
     articles_data = []
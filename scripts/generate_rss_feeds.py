@@ -237,18 +237,29 @@ def _build_category_feed_title(game_id: str, category_display: str, locale: str)
     return f"{game_name} {category_display} - {locale_title}"
 
 
-def _filter_by_category(articles: list[Article], category_display: str) -> list[Article]:
+async def _filter_by_category(
+    repository: ArticleRepository,
+    source: ArticleSource,
+    category_display: str,
+    limit: int,
+) -> list[Article]:
     """
-    Filter articles whose categories list contains the given display name.
+    Fetch the latest articles of a source tagged with the given display name.
+
+    Queries the indexed article_categories table, so each category feed gets
+    up to ``limit`` matching articles rather than the matching subset of the
+    source's latest ``limit`` articles.
 
     Args:
-        articles: List of articles to filter.
+        repository: Initialized article repository.
+        source: Source (game + locale) to restrict the feed to.
         category_display: Display name to match (e.g., "Game Updates", "Dev").
+        limit: Maximum number of articles to return.
 
     Returns:
-        Filtered list of articles matching the category.
+        Articles of the source matching the category, newest first.
     """
-    return [a for a in articles if category_display in a.categories]
+    return await repository.get_by_category(category_display, limit=limit, source=str(source))
 
 
 def _write_feed(
@@ -434,7 +445,15 @@ async def generate_feeds(
             # ---------------------------------------------------------- #
             for category_slug in categories:
                 category_display = CATEGORY_SLUG_TO_DISPLAY.get(category_slug, category_slug)
-                category_articles = _filter_by_category(locale_articles, category_display)
+                try:
+                    category_articles = await _filter_by_category(
+                        repository, source, category_display, limit
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to fetch {category_display} articles for {game_id}:{locale}: {e}"
+                    )
+                    raise
 
                 # Build path: feed/{game}/{locale}/{category}.xml
                 # For LoL: feed/lol/{locale}/{category}.xml
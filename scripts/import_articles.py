@@ -0,0 +1,144 @@
+"""
+Bulk import articles from an NDJSON or Parquet export.
+
+Reads the file in batches and writes each batch in one transaction through
+the repository's batched insert path. Articles whose GUID (or URL) is
+already stored are skipped, so an import can be re-run safely. The format
+is inferred from the input extension unless --format is given.
+
+Usage:
+    python scripts/import_articles.py articles.ndjson.gz
+    python scripts/import_articles.py articles.parquet --database data/staging.db
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Final
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings  # noqa: E402
+from src.database import ArticleRepository  # noqa: E402
+from src.services.article_transfer import FORMATS, import_articles  # noqa: E402
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+async def run_import(args: argparse.Namespace) -> dict[str, int]:
+    """
+    Open the database and import the input file.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Import statistics
+    """
+    settings = get_settings()
+    repository = ArticleRepository(
+        args.database,
+        read_pool_size=1,
+        compression=settings.content_compression,
+        compress_description=settings.compress_description,
+    )
+    await repository.initialize()
+    try:
+        return await import_articles(
+            repository, args.input, fmt=args.format, batch_size=args.batch_size
+        )
+    finally:
+        await repository.close()
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = argparse.ArgumentParser(
+        description="Bulk import articles from an NDJSON or Parquet export",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  Import into the configured database:
+    python scripts/import_articles.py articles.ndjson.gz
+
+  Import into another database file:
+    python scripts/import_articles.py articles.parquet --database data/staging.db
+        """,
+    )
+
+    parser.add_argument("input", help="Input file (.ndjson, .jsonl, .ndjson.gz or .parquet)")
+    parser.add_argument(
+        "--database",
+        "-d",
+        default=get_settings().database_path,
+        help="SQLite database to import into (default: DATABASE_PATH setting)",
+    )
+    parser.add_argument(
+        "--format",
+        "-f",
+        choices=FORMATS,
+        default=None,
+        help="Input format (default: inferred from the input extension)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Articles written per transaction (default: 1000)",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Main entry point for the script.
+
+    Parses arguments and runs the import.
+    """
+    args = parse_arguments()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if args.batch_size < 1:
+        logger.error("Batch size must be at least 1")
+        sys.exit(1)
+    if not Path(args.input).exists():
+        logger.error(f"Input file not found: {args.input}")
+        sys.exit(1)
+
+    try:
+        start = time.perf_counter()
+        stats = asyncio.run(run_import(args))
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Imported {stats['imported']} of {stats['read']} articles in {elapsed:.1f}s "
+            f"({stats['duplicates']} duplicates, {stats['invalid']} invalid)"
+        )
+    except KeyboardInterrupt:
+        logger.info("Operation cancelled by user")
+        sys.exit(1)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Run database maintenance by hand, including the one-off auto_vacuum conversion.
+
+The scheduled maintenance job never converts a database created before
+incremental auto_vacuum was enabled, because the conversion is a full
+VACUUM that rewrites the whole file while holding the writer. Run it here
+during a maintenance window (ideally with the service stopped) instead.
+
+Usage:
+    python scripts/maintain_database.py
+    python scripts/maintain_database.py --convert-auto-vacuum
+    python scripts/maintain_database.py -d data/shards/articles-europe.db --convert-auto-vacuum
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Final
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings  # noqa: E402
+from src.database import ArticleRepository  # noqa: E402
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+async def run_maintenance(args: argparse.Namespace) -> dict[str, int]:
+    """
+    Open the database and run maintenance on it.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Maintenance statistics
+    """
+    repository = ArticleRepository(args.database, read_pool_size=1)
+    await repository.initialize()
+    try:
+        return await repository.run_maintenance(
+            vacuum_pages=args.vacuum_pages, convert_auto_vacuum=args.convert_auto_vacuum
+        )
+    finally:
+        await repository.close()
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run database maintenance (vacuum, ANALYZE, WAL checkpoint)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  Convert the configured database to incremental auto_vacuum:
+    python scripts/maintain_database.py --convert-auto-vacuum
+
+  Convert one shard file:
+    python scripts/maintain_database.py -d data/shards/articles-europe.db --convert-auto-vacuum
+        """,
+    )
+
+    parser.add_argument(
+        "--database",
+        "-d",
+        default=get_settings().database_path,
+        help="SQLite database file (default: DATABASE_PATH setting)",
+    )
+    parser.add_argument(
+        "--convert-auto-vacuum",
+        action="store_true",
+        help="Rebuild a database without incremental auto_vacuum with a full VACUUM",
+    )
+    parser.add_argument(
+        "--vacuum-pages",
+        type=int,
+        default=0,
+        help="Maximum free pages to release (default: 0, all of them)",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Main entry point for the script.
+
+    Parses arguments and runs maintenance.
+    """
+    args = parse_arguments()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if not Path(args.database).exists():
+        logger.error(f"Database not found: {args.database}")
+        sys.exit(1)
+
+    try:
+        start = time.perf_counter()
+        stats = asyncio.run(run_maintenance(args))
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Maintenance finished in {elapsed:.1f}s: {stats['bytes_reclaimed']} bytes "
+            f"reclaimed, {stats['pages_after']} pages of {stats['page_size']} bytes"
+        )
+    except KeyboardInterrupt:
+        logger.info("Operation cancelled by user")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
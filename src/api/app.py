@@ -6,11 +6,14 @@ including source and category-based filtering.
 """
 
 import re
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from typing import Any, cast
+from urllib.parse import urlencode
 
-from fastapi import FastAPI, HTTPException, Path, Request, Response
+from fastapi import FastAPI, HTTPException, Path, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -30,8 +33,13 @@ from src.api.schemas import (
 from src.config import get_settings
 from src.database import ArticleRepository
 from src.models import ArticleSource, SourceCategory
-from src.rss.feed_service import FeedService, FeedServiceV2
+from src.repository import MaintainedRepository
+from src.rss.feed_service import FEED_EXTENSIONS, FeedService, FeedServiceV2, RenderedFeed
+from src.rss.generator import FEED_MEDIA_TYPES, ItemFragmentCache
+from src.services.replication import ReplicaSync, SnapshotPublisher
 from src.services.scheduler import NewsScheduler
+from src.sharded_database import ShardedArticleRepository
+from src.utils.compression import content_encodings
 from src.utils.logging import RequestIdMiddleware, configure_structlog, get_logger
 from src.utils.metrics import auto_init_metrics, get_metrics_text
 
@@ -45,6 +53,47 @@ app_state: dict[str, Any] = {}
 limiter = Limiter(key_func=get_remote_address)
 
 
+def use_repository(repository: MaintainedRepository) -> None:
+    """
+    Point the API at a different repository.
+
+    Called by a replica after it opens a newly shipped snapshot. Feed caches
+    are cleared so responses reflect the new snapshot straight away.
+
+    Args:
+        repository: Repository to serve from now on
+    """
+    app_state["repository"] = repository
+    for key in ("feed_service", "feed_service_v2"):
+        service = app_state.get(key)
+        if service is not None:
+            service.repository = repository
+            service.invalidate_cache()
+    scheduler = app_state.get("scheduler")
+    if scheduler is not None:
+        scheduler.repository = repository
+        scheduler.update_service.repository = repository
+
+
+def reject_on_replica(action: str) -> None:
+    """
+    Refuse an admin action that writes to the database on a replica.
+
+    A replica serves a read-only snapshot shipped by the primary, which is
+    where updates and backups run.
+
+    Args:
+        action: Description of the refused action, for the error message
+
+    Raises:
+        HTTPException: 409 if this node is a replica
+    """
+    if settings.node_role == "replica":
+        raise HTTPException(
+            status_code=409, detail=f"{action} must run on the primary, this node is a replica"
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
     """
@@ -77,25 +126,78 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
         },
     )
 
-    # Initialize database repository
-    repository = ArticleRepository(settings.database_path)
-    await repository.initialize()
+    # Initialize database repository. A replica serves the newest snapshot
+    # shipped by the primary instead of a database of its own.
+    replica: ReplicaSync | None = None
+    publisher: SnapshotPublisher | None = None
+    repository: MaintainedRepository
+    if settings.node_role == "replica":
+        replica = ReplicaSync(
+            settings.replication_directory,
+            settings.replica_directory,
+            read_pool_size=settings.database_read_pool_size,
+        )
+        repository = await replica.open()
+    elif settings.database_sharding:
+        if settings.node_role != "standalone":
+            raise ValueError("database_sharding is only supported with node_role 'standalone'")
+        # One SQLite file per locale group behind the same repository interface
+        repository = ShardedArticleRepository(
+            settings.database_shard_directory,
+            settings.locale_groups,
+            read_pool_size=settings.database_read_pool_size,
+            compression=settings.content_compression,
+            compress_description=settings.compress_description,
+        )
+        await repository.initialize()
+    else:
+        database = ArticleRepository(
+            settings.database_path,
+            read_pool_size=settings.database_read_pool_size,
+            compression=settings.content_compression,
+            compress_description=settings.compress_description,
+        )
+        await database.initialize()
+        if settings.node_role == "primary":
+            publisher = SnapshotPublisher(
+                database,
+                settings.replication_directory,
+                keep=settings.replication_keep,
+                pages_per_step=settings.backup_pages_per_step,
+            )
+        repository = database
+
+    # Both feed services share rendered items: an article in the main feed
+    # is also in its locale, source and category feeds
+    item_cache = ItemFragmentCache(settings.rss_item_cache_size)
 
     # Initialize feed service
-    feed_service = FeedService(repository=repository, cache_ttl=settings.feed_cache_ttl)
+    feed_service = FeedService(
+        repository=repository, cache_ttl=settings.feed_cache_ttl, item_cache=item_cache
+    )
 
     # Initialize feed service V2 for multi-locale support
-    feed_service_v2 = FeedServiceV2(repository=repository, cache_ttl=settings.feed_cache_ttl)
+    feed_service_v2 = FeedServiceV2(
+        repository=repository, cache_ttl=settings.feed_cache_ttl, item_cache=item_cache
+    )
 
-    # Initialize and start scheduler
-    scheduler = NewsScheduler(repository, interval_minutes=settings.update_interval_minutes)
+    # Initialize and start scheduler (replicas run neither maintenance nor backups)
+    scheduler = NewsScheduler(
+        repository,
+        interval_minutes=settings.update_interval_minutes,
+        maintenance_interval_hours=0 if replica else settings.maintenance_interval_hours,
+        backup_interval_hours=0 if replica else settings.backup_interval_hours,
+        publisher=publisher,
+        replica=replica,
+        replication_interval_seconds=settings.replication_interval_seconds,
+    )
     scheduler.start()
 
     # Note: Not triggering initial update on startup to avoid blocking
     # The scheduler will fetch news according to its interval
     logger.info(
         "Scheduler started, will fetch news on next scheduled interval",
-        extra={"interval_minutes": settings.update_interval_minutes},
+        extra={"interval_minutes": settings.update_interval_minutes, "role": settings.node_role},
     )
 
     # Store in app state
@@ -103,6 +205,9 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
     app_state["feed_service"] = feed_service
     app_state["feed_service_v2"] = feed_service_v2
     app_state["scheduler"] = scheduler
+    if replica is not None:
+        app_state["replica"] = replica
+        replica.on_swap = use_repository
 
     logger.info("Server initialized successfully")
 
@@ -110,7 +215,10 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
 
     # Cleanup
     scheduler.stop()
-    await repository.close()
+    if replica is not None:
+        await replica.close()
+    else:
+        await repository.close()
     logger.info("Server shutdown complete")
 
 
@@ -171,24 +279,379 @@ def get_feed_service_v2() -> FeedServiceV2:
     return cast(FeedServiceV2, service)
 
 
+# Media types accepted on .xml feed URLs and the format each selects
+_ACCEPT_FORMATS = {
+    "application/rss+xml": "rss",
+    "application/xml": "rss",
+    "text/xml": "rss",
+    "application/atom+xml": "atom",
+    "application/feed+json": "json",
+    "application/json": "json",
+}
+
+
+def negotiate_feed_format(accept: str | None) -> str:
+    """
+    Pick a feed format from an Accept header.
+
+    The known feed media type with the highest quality wins (earliest on
+    ties); anything else, including a missing header, gets RSS.
+
+    Args:
+        accept: Accept header value
+
+    Returns:
+        "rss", "atom" or "json"
+    """
+    best, best_quality = "rss", 0.0
+    for entry in (accept or "").split(","):
+        media_type, _, params = entry.partition(";")
+        fmt = _ACCEPT_FORMATS.get(media_type.strip().lower())
+        if fmt is None:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > best_quality:
+            best, best_quality = fmt, quality
+    return best
+
+
+def feed_format(request: Request) -> str:
+    """
+    Get the output format of a feed request.
+
+    ".atom" and ".json" URLs always return that format; ".xml" URLs return
+    RSS unless the Accept header asks for Atom or JSON Feed.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        "rss", "atom" or "json"
+    """
+    path = request.url.path
+    if path.endswith(".atom"):
+        return "atom"
+    if path.endswith(".json"):
+        return "json"
+    return negotiate_feed_format(request.headers.get("accept"))
+
+
+def negotiate_content_encoding(accept_encoding: str | None, available: Iterable[str]) -> str | None:
+    """
+    Pick a content coding from an Accept-Encoding header.
+
+    The available coding with the highest quality wins; on ties the
+    earlier entry of ``available`` (the server preference) is used.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+        available: Codings the body is stored in, most preferred first
+
+    Returns:
+        Coding name, or None to send the body uncompressed
+    """
+    qualities: dict[str, float] = {}
+    for entry in (accept_encoding or "").split(","):
+        coding, _, params = entry.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def if_none_match_tags(request: Request) -> set[str]:
+    """
+    Get the entity tags listed in a request's If-None-Match header.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Quoted tags with any weak prefix removed (empty without the header)
+    """
+    if_none_match = request.headers.get("if-none-match", "")
+    return {tag.strip().removeprefix("W/") for tag in if_none_match.split(",") if tag.strip()}
+
+
+def not_modified(request: Request, etags: Iterable[str], last_modified: datetime | None) -> bool:
+    """
+    Check a conditional request against a feed's validators.
+
+    If-None-Match matches any of the feed's entity tags, one per coding (a
+    client may have cached the gzip or the plain body). If-Modified-Since
+    is only consulted when If-None-Match is absent, as RFC 9110 requires.
+
+    Args:
+        request: Incoming request
+        etags: Entity tags of the feed that would be sent
+        last_modified: Last-Modified date of that feed, if known
+
+    Returns:
+        True if the client's copy is current and a 304 can be sent
+    """
+    if request.headers.get("if-none-match") is not None:
+        if request.headers["if-none-match"].strip() == "*":
+            return True
+        return not if_none_match_tags(request).isdisjoint(etags)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole-second precision
+    return last_modified.replace(microsecond=0) <= since
+
+
+def feed_headers(request: Request, last_modified: datetime | None) -> dict[str, str]:
+    """
+    Build the caching headers shared by feed responses and their 304s.
+
+    Args:
+        request: Incoming request
+        last_modified: Last-Modified date of the feed, if known
+
+    Returns:
+        Cache-Control, Vary (Accept too on negotiated URLs) and
+        Last-Modified headers
+    """
+    headers = {
+        "Cache-Control": f"public, max-age={settings.feed_cache_ttl}",
+        "Vary": "Accept-Encoding",
+    }
+    if request.url.path.endswith(".xml"):
+        headers["Vary"] = "Accept, Accept-Encoding"
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+async def unchanged_feed(
+    request: Request, service: FeedService | FeedServiceV2, fmt: str, **scope: Any
+) -> Response | None:
+    """
+    Answer a conditional feed request before the feed is fetched.
+
+    Feed validators come from the DataVersion the feed was rendered at, so
+    a client holding a feed of the current version gets its 304 from one
+    read of the article stats, without the feed cache, the articles or the
+    generators being touched. Unconditional requests skip the check.
+
+    Args:
+        request: Incoming request
+        service: Feed service that would render the feed
+        fmt: Format the feed would be rendered in
+        **scope: Filters and parameters the service renders the feed with
+            (see data_version()); they must match, or the tags never will
+
+    Returns:
+        304 Not Modified response, or None if the feed has to be sent
+    """
+    if "if-none-match" not in request.headers and "if-modified-since" not in request.headers:
+        return None
+
+    version = await service.get_data_version(**scope)
+    codings = content_encodings() if settings.feed_precompression else ()
+    etags = [version.etag(fmt, coding) for coding in (None, *codings)]
+    if not not_modified(request, etags, version.last_modified):
+        return None
+
+    headers = feed_headers(request, version.last_modified)
+    # Confirm the representation the client holds
+    matched = [tag for tag in etags if tag in if_none_match_tags(request)]
+    if matched:
+        headers["ETag"] = matched[0]
+    return Response(status_code=304, headers=headers)
+
+
+def feed_response(request: Request, feed: str, fmt: str, rss_media_type: str) -> Response:
+    """
+    Build the HTTP response for a rendered feed.
+
+    Feeds from the feed services carry validators and precompressed
+    encodings: a client whose copy is still current gets a bodiless 304,
+    otherwise the encoding it prefers is sent as is, with a matching
+    Content-Encoding and ETag.
+
+    Args:
+        request: Incoming request
+        feed: Rendered feed document
+        fmt: Format the feed was rendered in
+        rss_media_type: Media type the route has always used for RSS
+
+    Returns:
+        Response with caching, validator and Vary headers (Accept on
+        negotiated URLs), or 304 Not Modified
+    """
+    media_type = rss_media_type if fmt == "rss" else FEED_MEDIA_TYPES[fmt]
+    if not isinstance(feed, RenderedFeed):
+        headers = {**feed_headers(request, None), "Content-Type": media_type}
+        return Response(content=feed, media_type=media_type, headers=headers)
+
+    headers = feed_headers(request, feed.last_modified)
+    coding = negotiate_content_encoding(request.headers.get("accept-encoding"), feed.encodings)
+    headers["ETag"] = feed.etag_for(coding)
+    etags = [feed.etag_for(None), *(feed.etag_for(coding) for coding in feed.encodings)]
+    if not_modified(request, etags, feed.last_modified):
+        return Response(status_code=304, headers=headers)
+
+    headers["Content-Type"] = media_type
+    content: str | bytes = feed
+    if coding is not None:
+        content = feed.encodings[coding]
+        headers["Content-Encoding"] = coding
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
 @app.get("/api/articles", response_model=list[dict[str, Any]])
-async def get_articles(limit: int = 50, source: str | None = None) -> list[dict[str, Any]]:
+async def get_articles(
+    response: Response,
+    limit: int = 50,
+    source: str | None = None,
+    locale: str | None = None,
+    cursor: str | None = None,
+    include_content: bool = True,
+) -> list[dict[str, Any]]:
     """
     Get latest articles as JSON for the frontend.
 
+    Results are paginated with an opaque keyset cursor. When more articles
+    are available, the cursor for the next page is returned in the
+    ``X-Next-Cursor`` header and as a ``Link: <...>; rel="next"`` header.
+    Callers that do not need the full ``content`` HTML can set
+    ``include_content=false`` to get the lighter summary shape.
+
     Args:
-        limit: Maximum number of articles
+        response: Response used to attach pagination headers
+        limit: Maximum number of articles (default: 50, max: 500)
         source: Optional source filter
+        locale: Optional locale filter
+        cursor: Cursor from a previous page's ``X-Next-Cursor`` header
+        include_content: Include the full article content (default: True)
 
     Returns:
         List of articles as dictionaries
+
+    Raises:
+        HTTPException: If the repository is not initialized or the cursor is invalid
+    """
+    repo = app_state.get("repository")
+    if not repo:
+        raise HTTPException(status_code=500, detail="Repository not initialized")
+
+    limit = min(max(1, limit), 500)
+
+    try:
+        articles, next_cursor = await repo.get_page(
+            limit=limit,
+            cursor=cursor,
+            source=source,
+            locale=locale,
+            projection="full" if include_content else "summary",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+    if next_cursor:
+        params = urlencode(
+            {
+                k: v
+                for k, v in {
+                    "limit": limit,
+                    "source": source,
+                    "locale": locale,
+                    "include_content": None if include_content else "false",
+                    "cursor": next_cursor,
+                }.items()
+                if v is not None
+            }
+        )
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{settings.base_url}/api/articles?{params}>; rel="next"'
+
+    if include_content:
+        return [a.to_dict() for a in articles]
+    return [{k: v for k, v in a.to_dict().items() if k != "content"} for a in articles]
+
+
+@app.get("/api/search", response_model=list[dict[str, Any]])
+async def search_articles(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    limit: int = 50,
+    locale: str | None = None,
+    source: str | None = None,
+    source_category: str | None = None,
+    category: str | None = None,
+    include_content: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Full-text search over article titles and descriptions.
+
+    Every word of ``q`` must match (the last one also as a prefix) and
+    results are ranked by relevance (BM25), best match first.
+
+    Args:
+        q: Search text
+        limit: Maximum number of articles (default: 50, max: 200)
+        locale: Optional locale filter (e.g., en-us)
+        source: Optional source filter (e.g., lol:en-us)
+        source_category: Optional source category filter (e.g., analytics)
+        category: Optional article category filter (e.g., Dev)
+        include_content: Include the full article content (default: False)
+
+    Returns:
+        List of matching articles as dictionaries
+
+    Raises:
+        HTTPException: If the repository is not initialized or the query has no searchable terms
     """
     repo = app_state.get("repository")
     if not repo:
         raise HTTPException(status_code=500, detail="Repository not initialized")
 
-    articles = await repo.get_latest(limit=limit, source=source)
-    return [a.to_dict() for a in articles]
+    limit = min(max(1, limit), 200)
+
+    try:
+        articles = await repo.search(
+            q,
+            limit=limit,
+            locale=locale,
+            source=source,
+            source_category=source_category,
+            category=category,
+            projection="full" if include_content else "summary",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Query has no searchable terms") from e
+
+    if include_content:
+        return [a.to_dict() for a in articles]
+    return [{k: v for k, v in a.to_dict().items() if k != "content"} for a in articles]
 
 
 @app.get("/", response_class=FileResponse)
@@ -203,12 +666,20 @@ async def root() -> FileResponse:
 
 
 @app.get("/feed.xml", response_class=Response)
-async def get_main_feed(limit: int = 50) -> Response:
+@app.get("/feed.atom", response_class=Response)
+@app.get("/feed.json", response_class=Response)
+async def get_main_feed(request: Request, limit: int = 50, collapse: bool = False) -> Response:
     """
     Get main RSS feed with all articles from all sources.
 
+    Served as Atom or JSON Feed from the .atom and .json URLs, or from
+    /feed.xml when the Accept header asks for them.
+
     Args:
+        request: Incoming request (selects the output format)
         limit: Maximum number of articles (default: 50, max: 200)
+        collapse: Show near-duplicate stories from several sources as one
+            item listing the others (default: False)
 
     Returns:
         RSS 2.0 XML feed
@@ -223,31 +694,33 @@ async def get_main_feed(limit: int = 50) -> Response:
         service = get_feed_service()
 
         # Generate feed URL (use request URL)
-        feed_url = f"{settings.base_url}/feed.xml"
+        fmt = feed_format(request)
+        unchanged = await unchanged_feed(request, service, fmt, limit=limit, collapse=collapse)
+        if unchanged is not None:
+            return unchanged
+        feed_url = f"{settings.base_url}/feed.{FEED_EXTENSIONS[fmt]}"
 
         # Get feed
-        feed_xml = await service.get_main_feed(feed_url, limit=limit)
-
-        return Response(
-            content=feed_xml,
-            media_type="application/rss+xml; charset=utf-8",
-            headers={
-                "Cache-Control": f"public, max-age={settings.feed_cache_ttl}",
-                "Content-Type": "application/rss+xml; charset=utf-8",
-            },
+        feed_xml = await service.get_main_feed(
+            feed_url, limit=limit, collapse_duplicates=collapse, fmt=fmt
         )
 
+        return feed_response(request, feed_xml, fmt, "application/rss+xml; charset=utf-8")
+
     except Exception as e:
         logger.error(f"Error generating main feed: {e}")
         raise HTTPException(status_code=500, detail="Error generating feed") from e
 
 
 @app.get("/feed/{source}.xml", response_class=Response)
-async def get_source_feed(source: str, limit: int = 50) -> Response:
+@app.get("/feed/{source}.atom", response_class=Response)
+@app.get("/feed/{source}.json", response_class=Response)
+async def get_source_feed(request: Request, source: str, limit: int = 50) -> Response:
     """
     Get RSS feed filtered by source.
 
     Args:
+        request: Incoming request (selects the output format)
         source: Source identifier (en-us, it-it)
         limit: Maximum number of articles (default: 50, max: 200)
 
@@ -276,17 +749,22 @@ async def get_source_feed(source: str, limit: int = 50) -> Response:
         service = get_feed_service()
 
         # Generate feed
-        feed_url = f"{settings.base_url}/feed/{source}.xml"
-        feed_xml = await service.get_feed_by_source(source_map[source], feed_url, limit=limit)
-
-        return Response(
-            content=feed_xml,
-            media_type="application/rss+xml; charset=utf-8",
-            headers={
-                "Cache-Control": f"public, max-age={settings.feed_cache_ttl}",
-                "Content-Type": "application/rss+xml; charset=utf-8",
-            },
+        fmt = feed_format(request)
+        selected = source_map[source]
+        unchanged = await unchanged_feed(
+            request,
+            service,
+            fmt,
+            locale=selected.locale,
+            source_id=selected.source_id,
+            limit=limit,
         )
+        if unchanged is not None:
+            return unchanged
+        feed_url = f"{settings.base_url}/feed/{source}.{FEED_EXTENSIONS[fmt]}"
+        feed_xml = await service.get_feed_by_source(selected, feed_url, limit=limit, fmt=fmt)
+
+        return feed_response(request, feed_xml, fmt, "application/rss+xml; charset=utf-8")
 
     except HTTPException:
         raise
@@ -296,7 +774,10 @@ async def get_source_feed(source: str, limit: int = 50) -> Response:
 
 
 @app.get("/feed/category/{category}.xml", response_class=Response)
+@app.get("/feed/category/{category}.atom", response_class=Response)
+@app.get("/feed/category/{category}.json", response_class=Response)
 async def get_category_feed(
+    request: Request,
     category: str = Path(
         ...,
         max_length=50,
@@ -309,6 +790,7 @@ async def get_category_feed(
     Get RSS feed filtered by category.
 
     Args:
+        request: Incoming request (selects the output format)
         category: Category name (e.g., Champions, Patches, Media)
                  Must be alphanumeric with hyphens/underscores, max 50 characters
         limit: Maximum number of articles (default: 50, max: 200)
@@ -333,17 +815,14 @@ async def get_category_feed(
         service = get_feed_service()
 
         # Generate feed
-        feed_url = f"{settings.base_url}/feed/category/{category}.xml"
-        feed_xml = await service.get_feed_by_category(category, feed_url, limit=limit)
+        fmt = feed_format(request)
+        unchanged = await unchanged_feed(request, service, fmt, category=category, limit=limit)
+        if unchanged is not None:
+            return unchanged
+        feed_url = f"{settings.base_url}/feed/category/{category}.{FEED_EXTENSIONS[fmt]}"
+        feed_xml = await service.get_feed_by_category(category, feed_url, limit=limit, fmt=fmt)
 
-        return Response(
-            content=feed_xml,
-            media_type="application/rss+xml; charset=utf-8",
-            headers={
-                "Cache-Control": f"public, max-age={settings.feed_cache_ttl}",
-                "Content-Type": "application/rss+xml; charset=utf-8",
-            },
-        )
+        return feed_response(request, feed_xml, fmt, "application/rss+xml; charset=utf-8")
 
     except HTTPException:
         raise
@@ -383,12 +862,17 @@ async def health_check() -> HealthCheckResponse:
         locales = await repository.get_locales()
         source_categories = await repository.get_source_categories()
 
+        replica = app_state.get("replica")
+        replication_lag = replica.lag_seconds() if replica else None
+
         database_status = DatabaseStatus(
             status="connected",
             total_articles=total_articles,
             last_write_timestamp=last_write_ts.isoformat() if last_write_ts else None,
             locales=locales,
             source_categories=source_categories,
+            role=settings.node_role,
+            replication_lag_seconds=replication_lag,
         )
 
         # Get scheduler status
@@ -447,6 +931,12 @@ async def health_check() -> HealthCheckResponse:
             overall_status = "degraded"
         if total_articles == 0:
             overall_status = "degraded"
+        if (
+            replication_lag is not None
+            and replication_lag > 3 * settings.replication_interval_seconds
+        ):
+            # The primary has stopped shipping (or this replica stopped polling)
+            overall_status = "degraded"
 
         return HealthCheckResponse(
             status=overall_status,
@@ -511,7 +1001,7 @@ async def readiness_check() -> ReadinessResponse:
     has_articles = False
     if repository:
         try:
-            articles = await repository.get_latest(limit=1)
+            articles = await repository.get_latest(limit=1, projection="summary")
             has_articles = len(articles) > 0
             checks["has_articles"] = has_articles
         except Exception:
@@ -644,8 +1134,9 @@ async def trigger_update(request: Request) -> dict[str, Any]:
         Update statistics dictionary with counts and timing
 
     Raises:
-        HTTPException: If scheduler is not initialized
+        HTTPException: If this node is a replica or the scheduler is not initialized
     """
+    reject_on_replica("News updates")
     scheduler = app_state.get("scheduler")
     if not scheduler:
         raise HTTPException(status_code=500, detail="Scheduler not initialized")
@@ -654,19 +1145,111 @@ async def trigger_update(request: Request) -> dict[str, Any]:
     return cast(dict[str, Any], stats)
 
 
+@app.post("/admin/backup")
+@limiter.limit("5/minute")
+async def trigger_backup(request: Request) -> dict[str, Any]:
+    """
+    Manually trigger an online database backup.
+
+    Rate limited to 5 requests per minute per IP.
+
+    Writes a snapshot to the configured backup directory without stopping
+    updates or feed requests, then rotates old snapshots.
+
+    Returns:
+        Backup statistics dictionary with the snapshot path and size
+
+    Raises:
+        HTTPException: If this node is a replica or the scheduler is not initialized
+    """
+    reject_on_replica("Backups")
+    scheduler = app_state.get("scheduler")
+    if not scheduler:
+        raise HTTPException(status_code=500, detail="Scheduler not initialized")
+
+    stats = await scheduler.trigger_backup_now()
+    return cast(dict[str, Any], stats)
+
+
 # =============================================================================
 # Multi-Locale RSS Feed Endpoints (V2)
 # =============================================================================
 
 
+# Declared before /rss/{locale}.xml so "search" is not matched as a locale
+@app.get("/rss/search.xml", response_class=Response)
+@app.get("/rss/search.atom", response_class=Response)
+@app.get("/rss/search.json", response_class=Response)
+async def get_search_feed(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    locale: str | None = Query(
+        None,
+        pattern=r"^[a-z]{2}-[a-z]{2}$",
+        description="Locale code in format 'xx-xx' (e.g., en-us, it-it)",
+    ),
+    limit: int = 50,
+) -> Response:
+    """
+    Get RSS feed of full-text search results.
+
+    Lets feed readers subscribe to a search, e.g. ``/rss/search.xml?q=patch``.
+
+    Args:
+        request: Incoming request (selects the output format)
+        q: Search text
+        locale: Optional locale to search within
+        limit: Maximum number of articles (default: 50, max: 200)
+
+    Returns:
+        RSS 2.0 XML feed with the best matches first
+
+    Raises:
+        HTTPException: If locale is not supported, the query is invalid, or feed generation fails
+    """
+    try:
+        # Validate limit
+        limit = min(max(1, limit), 200)
+
+        service = get_feed_service_v2()
+        supported_locales = service.get_supported_locales()
+
+        if locale and locale not in supported_locales:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Locale '{locale}' not supported. Available locales: {supported_locales}",
+            )
+
+        fmt = feed_format(request)
+        unchanged = await unchanged_feed(request, service, fmt, locale=locale, query=q, limit=limit)
+        if unchanged is not None:
+            return unchanged
+        try:
+            feed_xml = await service.get_search_feed(query=q, locale=locale, limit=limit, fmt=fmt)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail="Query has no searchable terms") from e
+
+        return feed_response(request, feed_xml, fmt, "application/xml; charset=utf-8")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating search feed for {q!r}: {e}")
+        raise HTTPException(status_code=500, detail="Error generating feed") from e
+
+
 @app.get("/rss/{locale}.xml", response_class=Response)
+@app.get("/rss/{locale}.atom", response_class=Response)
+@app.get("/rss/{locale}.json", response_class=Response)
 async def get_locale_feed(
+    request: Request,
     locale: str = Path(
         ...,
         pattern=r"^[a-z]{2}-[a-z]{2}$",
         description="Locale code in format 'xx-xx' (e.g., en-us, it-it)",
     ),
     limit: int = 50,
+    collapse: bool = False,
 ) -> Response:
     """
     Get RSS feed for a specific locale.
@@ -675,8 +1258,11 @@ async def get_locale_feed(
     Uses locale-specific feed titles and descriptions from settings.
 
     Args:
+        request: Incoming request (selects the output format)
         locale: Locale code (e.g., "en-us", "it-it", "es-es")
         limit: Maximum number of articles (default: 50, max: 500)
+        collapse: Show near-duplicate stories from several sources as one
+            item listing the others (default: False)
 
     Returns:
         RSS 2.0 XML feed for the specified locale
@@ -699,17 +1285,18 @@ async def get_locale_feed(
             )
 
         # Generate feed
-        feed_xml = await service.get_feed_by_locale(locale=locale, limit=limit)
-
-        return Response(
-            content=feed_xml,
-            media_type="application/xml; charset=utf-8",
-            headers={
-                "Cache-Control": f"public, max-age={settings.feed_cache_ttl}",
-                "Content-Type": "application/xml; charset=utf-8",
-            },
+        fmt = feed_format(request)
+        unchanged = await unchanged_feed(
+            request, service, fmt, locale=locale, limit=limit, collapse=collapse
+        )
+        if unchanged is not None:
+            return unchanged
+        feed_xml = await service.get_feed_by_locale(
+            locale=locale, limit=limit, collapse_duplicates=collapse, fmt=fmt
         )
 
+        return feed_response(request, feed_xml, fmt, "application/xml; charset=utf-8")
+
     except HTTPException:
         raise
     except Exception as e:
@@ -718,7 +1305,10 @@ async def get_locale_feed(
 
 
 @app.get("/rss/{locale}/{source}.xml", response_class=Response)
+@app.get("/rss/{locale}/{source}.atom", response_class=Response)
+@app.get("/rss/{locale}/{source}.json", response_class=Response)
 async def get_source_locale_feed(
+    request: Request,
     locale: str = Path(
         ...,
         pattern=r"^[a-z]{2}-[a-z]{2}$",
@@ -739,6 +1329,7 @@ async def get_source_locale_feed(
     RSS feed for that specific source.
 
     Args:
+        request: Incoming request (selects the output format)
         locale: Locale code (e.g., "en-us", "it-it")
         source: Source identifier (e.g., "lol", "u-gg", "dexerto")
         limit: Maximum number of articles (default: 50, max: 500)
@@ -764,18 +1355,17 @@ async def get_source_locale_feed(
             )
 
         # Generate feed
+        fmt = feed_format(request)
+        unchanged = await unchanged_feed(
+            request, service, fmt, locale=locale, source_id=source, limit=limit
+        )
+        if unchanged is not None:
+            return unchanged
         feed_xml = await service.get_feed_by_source_and_locale(
-            source_id=source, locale=locale, limit=limit
+            source_id=source, locale=locale, limit=limit, fmt=fmt
         )
 
-        return Response(
-            content=feed_xml,
-            media_type="application/xml; charset=utf-8",
-            headers={
-                "Cache-Control": f"public, max-age={settings.feed_cache_ttl}",
-                "Content-Type": "application/xml; charset=utf-8",
-            },
-        )
+        return feed_response(request, feed_xml, fmt, "application/xml; charset=utf-8")
 
     except HTTPException:
         raise
@@ -785,7 +1375,10 @@ async def get_source_locale_feed(
 
 
 @app.get("/rss/{locale}/category/{category}.xml", response_class=Response)
+@app.get("/rss/{locale}/category/{category}.atom", response_class=Response)
+@app.get("/rss/{locale}/category/{category}.json", response_class=Response)
 async def get_category_locale_feed(
+    request: Request,
     locale: str = Path(
         ...,
         pattern=r"^[a-z]{2}-[a-z]{2}$",
@@ -806,6 +1399,7 @@ async def get_category_locale_feed(
     RSS feed for that specific category.
 
     Args:
+        request: Incoming request (selects the output format)
         locale: Locale code (e.g., "en-us", "it-it")
         category: Category name (e.g., "official_riot", "analytics", "community_hub")
         limit: Maximum number of articles (default: 50, max: 500)
@@ -839,18 +1433,17 @@ async def get_category_locale_feed(
             )
 
         # Generate feed
+        fmt = feed_format(request)
+        unchanged = await unchanged_feed(
+            request, service, fmt, locale=locale, source_category=category, limit=limit
+        )
+        if unchanged is not None:
+            return unchanged
         feed_xml = await service.get_feed_by_category_and_locale(
-            category=category, locale=locale, limit=limit
+            category=category, locale=locale, limit=limit, fmt=fmt
         )
 
-        return Response(
-            content=feed_xml,
-            media_type="application/xml; charset=utf-8",
-            headers={
-                "Cache-Control": f"public, max-age={settings.feed_cache_ttl}",
-                "Content-Type": "application/xml; charset=utf-8",
-            },
-        )
+        return feed_response(request, feed_xml, fmt, "application/xml; charset=utf-8")
 
     except HTTPException:
         raise
@@ -20,6 +20,10 @@ class DatabaseStatus(BaseModel):
     source_categories: list[str] = Field(
         default_factory=list, description="Available source categories"
     )
+    role: str = Field("standalone", description="Node role (standalone/primary/replica)")
+    replication_lag_seconds: float | None = Field(
+        None, description="Age of the snapshot served by a replica", ge=0
+    )
 
 
 class SchedulerStatus(BaseModel):
@@ -10,6 +10,8 @@ from functools import lru_cache
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
+from src.models import RetentionPolicy
+
 # Complete locale registry - all supported Riot locales
 RIOT_LOCALES = [
     "en-us",  # English - United States
@@ -242,6 +244,19 @@ class Settings(BaseSettings):
 
     # Database configuration
     database_path: str = "data/articles.db"
+    database_read_pool_size: int = Field(
+        default=4,
+        ge=1,
+        description="Number of pooled SQLite reader connections",
+    )
+    database_sharding: bool = Field(
+        default=False,
+        description="Store articles in one SQLite file per locale group (standalone nodes only)",
+    )
+    database_shard_directory: str = Field(
+        default="data/shards",
+        description="Directory holding the per-locale-group shard files",
+    )
 
     @property
     def effective_database_path(self) -> str:
@@ -329,6 +344,15 @@ class Settings(BaseSettings):
     rss_feed_link: str = "https://www.leagueoflegends.com/news"
     rss_max_items: int = 50
     feed_cache_ttl: int = 300  # 5 minutes
+    rss_item_cache_size: int = Field(
+        default=5000,
+        ge=0,
+        description="Rendered RSS items kept for reuse across feeds (0 disables the cache)",
+    )
+    feed_precompression: bool = Field(
+        default=True,
+        description="Store gzip/brotli encodings of each cached feed and serve them on request",
+    )
 
     # Server configuration
     base_url: str = "http://localhost:8000"
@@ -339,6 +363,114 @@ class Settings(BaseSettings):
 
     # Update scheduling
     update_interval_minutes: int = 5
+    update_max_concurrent: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of concurrent fetch workers per update cycle",
+    )
+    ingest_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Article count that flushes an ingest write batch immediately",
+    )
+    ingest_batch_delay_ms: int = Field(
+        default=50,
+        ge=0,
+        description="Milliseconds the ingest writer waits to coalesce worker submissions",
+    )
+
+    # Retention and database maintenance
+    retention_policies: list[RetentionPolicy] = Field(
+        default_factory=list,
+        description="Retention policies (JSON list) applied by the maintenance job",
+    )
+    archive_database_path: str | None = Field(
+        default=None,
+        description="SQLite file that receives expired articles instead of deleting them",
+    )
+    maintenance_interval_hours: float = Field(
+        default=24,
+        ge=0,
+        description="Hours between database maintenance runs (0 disables the job)",
+    )
+    maintenance_vacuum_pages: int = Field(
+        default=0,
+        ge=0,
+        description="Free pages released per incremental vacuum (0 releases all)",
+    )
+
+    # Online database backups
+    backup_directory: str = Field(
+        default="data/backups",
+        description="Directory receiving database snapshots",
+    )
+    backup_interval_hours: float = Field(
+        default=0,
+        ge=0,
+        description="Hours between scheduled database snapshots (0 disables the job)",
+    )
+    backup_keep: int = Field(
+        default=7,
+        ge=1,
+        description="Number of database snapshots kept by rotation",
+    )
+    backup_pages_per_step: int = Field(
+        default=1024,
+        ge=1,
+        description="Database pages copied per online backup step",
+    )
+
+    # Replication: an ingest primary ships snapshots to read-only API replicas
+    node_role: str = Field(
+        default="standalone",
+        description="Node role: 'standalone', 'primary' (ingest + ship) or 'replica' (serve only)",
+    )
+    replication_directory: str = Field(
+        default="data/replication",
+        description="Shared directory the primary ships snapshots to",
+    )
+    replica_directory: str = Field(
+        default="data/replica",
+        description="Local directory holding the snapshot a replica serves",
+    )
+    replication_interval_seconds: int = Field(
+        default=60,
+        ge=1,
+        description="Seconds between snapshot shipments (primary) or polls (replica)",
+    )
+    replication_keep: int = Field(
+        default=3,
+        ge=2,
+        description="Snapshots kept in the replication directory",
+    )
+
+    @field_validator("node_role")
+    @classmethod
+    def validate_node_role(cls, v: str) -> str:
+        """Validate node_role value."""
+        valid_roles = {"standalone", "primary", "replica"}
+        if v not in valid_roles:
+            raise ValueError(f"node_role must be one of {valid_roles}, got '{v}'")
+        return v
+
+    # Article text compression
+    content_compression: str = Field(
+        default="none",
+        description="Codec for stored article content: 'none', 'zlib' or 'zstd'",
+    )
+    compress_description: bool = Field(
+        default=False,
+        description="Also compress article descriptions with content_compression",
+    )
+
+    @field_validator("content_compression")
+    @classmethod
+    def validate_content_compression(cls, v: str) -> str:
+        """Validate content_compression value."""
+        valid_codecs = {"none", "zlib", "zstd"}
+        if v not in valid_codecs:
+            raise ValueError(f"content_compression must be one of {valid_codecs}, got '{v}'")
+        return v
 
     # Logging
     log_level: str = "INFO"
@@ -6,17 +6,226 @@ news articles. It handles schema creation, CRUD operations, indexing,
 and database migrations for multi-source, multi-locale support.
 """
 
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
 import logging
-from datetime import datetime
+import re
+import sqlite3
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
-from src.models import Article
+from src.models import Article, ArticleSource, RetentionPolicy, from_epoch_ms, to_epoch_ms
+from src.utils.compression import check_codec, compress_text, decompress_text
+from src.utils.minhash import SIMILARITY_THRESHOLD, lsh_keys, minhash, similarity
 
 logger = logging.getLogger(__name__)
 
+# Column projections for list queries. "summary" skips the content column,
+# which holds the full article HTML and dominates row size and decode time.
+PROJECTIONS: dict[str, tuple[str, ...]] = {
+    "full": ("*",),
+    "summary": (
+        "id",
+        "guid",
+        "title",
+        "url",
+        "pub_date",
+        "description",
+        "image_url",
+        "author",
+        "categories",
+        "source",
+        "created_at",
+        "locale",
+        "source_category",
+        "canonical_url",
+        "cluster_id",
+    ),
+}
+
+# Columns copied into the archive database. Archived rows are denormalized
+# so the archive file can be read without the lookup tables.
+ARCHIVE_COLUMNS: tuple[str, ...] = (
+    "id",
+    "guid",
+    "title",
+    "url",
+    "pub_date",
+    "description",
+    "content",
+    "image_url",
+    "author",
+    "categories",
+    "source",
+    "created_at",
+    "locale",
+    "source_category",
+    "canonical_url",
+    "source_id",
+)
+
+# Columns written by export_rows(). Ids and cluster ids are local to one
+# database and are reassigned when the rows are imported elsewhere.
+EXPORT_COLUMNS: tuple[str, ...] = (
+    "guid",
+    "title",
+    "url",
+    "pub_date",
+    "description",
+    "content",
+    "image_url",
+    "author",
+    "categories",
+    "source",
+    "created_at",
+    "locale",
+    "source_category",
+    "canonical_url",
+)
+
+# Article text columns that may hold compressed BLOBs (see src.utils.compression)
+COMPRESSIBLE_COLUMNS: tuple[str, ...] = ("description", "content")
+
+MS_PER_DAY = 86_400_000
+
+# Near-duplicates are only looked for among articles published this close
+CLUSTER_WINDOW_DAYS = 3
+
+# Full-text search terms: runs of word characters, matched as (prefix) tokens
+FTS_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+FTS_MIN_PREFIX = 3
+
+
+def _id_condition(column: str, count: int) -> str:
+    """
+    Build an SQL condition matching a column against ``count`` bound ids.
+
+    Args:
+        column: Column expression (e.g., "source_ref", "+a.locale_ref")
+        count: Number of ids that will be bound
+
+    Returns:
+        "column = ?" for a single id, otherwise "column IN (?, ...)"
+    """
+    if count == 1:
+        return f"{column} = ?"
+    return f"{column} IN ({','.join('?' * count)})"
+
+
+def body_hash(text: str | bytes | None) -> bytes | None:
+    """
+    Compute the content address of an article body.
+
+    Bodies are hashed as decoded text, so the same body stored plain and
+    compressed maps to the same article_bodies row.
+
+    Args:
+        text: Body text, or a stored (possibly compressed) value
+
+    Returns:
+        SHA-256 digest of the UTF-8 text, or None for an empty body
+    """
+    decoded = decompress_text(text)
+    if not decoded:
+        return None
+    return hashlib.sha256(decoded.encode("utf-8")).digest()
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn free-form user input into a safe FTS5 MATCH expression.
+
+    Each word becomes a quoted FTS5 string so operators and punctuation in
+    the input are never interpreted; all terms must match and the last one
+    also matches as a prefix (search-as-you-type) once it is at least
+    FTS_MIN_PREFIX characters long.
+
+    Args:
+        text: User search input (e.g., "patch 14.1 notes")
+
+    Returns:
+        FTS5 query string (e.g., '"patch" "14" "1" "notes"*')
+
+    Raises:
+        ValueError: If the input contains no searchable terms
+    """
+    terms = FTS_TERM_PATTERN.findall(text)
+    if not terms:
+        raise ValueError(f"No searchable terms in query: {text!r}")
+    query = " ".join(f'"{term}"' for term in terms)
+    # Shorter prefixes expand to a large share of the vocabulary
+    return query + "*" if len(terms[-1]) >= FTS_MIN_PREFIX else query
+
+
+def _iso_to_epoch_ms(value: str | int | None) -> int | None:
+    """
+    Convert a legacy stored timestamp to epoch milliseconds.
+
+    Registered as the ``epoch_ms`` SQL function during the v5 migration.
+
+    Args:
+        value: ISO 8601 string (or an already converted integer)
+
+    Returns:
+        Epoch milliseconds, or None for missing/unparseable values
+    """
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return to_epoch_ms(datetime.fromisoformat(str(value).replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+
+def encode_cursor(pub_date: int, article_id: int) -> str:
+    """
+    Encode a keyset position as an opaque pagination cursor.
+
+    Args:
+        pub_date: Stored pub_date (epoch milliseconds) of the last row on the page
+        article_id: Row id of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([pub_date, article_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (pub_date, article_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        pub_date, article_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+    if not isinstance(pub_date, int) or not isinstance(article_id, int):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return pub_date, article_id
+
 
 class ArticleRepository:
     """
@@ -27,220 +236,1868 @@ class ArticleRepository:
     async support for optimal performance. Supports multi-source and
     multi-locale queries with migration support.
 
+    Connections are pooled: initialize() opens one writer connection and
+    ``read_pool_size`` reader connections that live until close(). Writes are
+    serialized through the writer; reads check out any idle reader, which
+    WAL mode lets run concurrently with the writer.
+
+    With a compression codec, long ``content`` (and optionally
+    ``description``) values are written as compressed BLOBs and decoded
+    only for projections that read them.
+
     Attributes:
         db_path: Path to the SQLite database file
+        read_pool_size: Number of pooled reader connections
+        compression: Codec for new article text ("none", "zlib" or "zstd")
+        compress_description: Whether descriptions are compressed too
     """
 
-    # Current database schema version
-    SCHEMA_VERSION = 2
+    # Ordered schema migrations as (version, method name). Each method runs
+    # inside the transaction that records its version in schema_version.
+    MIGRATIONS: tuple[tuple[int, str], ...] = (
+        (1, "_migrate_v1_base_schema"),
+        (2, "_migrate_v2_multi_locale"),
+        (3, "_migrate_v3_article_categories"),
+        (4, "_migrate_v4_source_id"),
+        (5, "_migrate_v5_compact_rows"),
+        (6, "_migrate_v6_fulltext_search"),
+        (7, "_migrate_v7_compressed_text"),
+        (8, "_migrate_v8_shared_bodies"),
+        (9, "_migrate_v9_near_duplicate_clusters"),
+        (10, "_migrate_v10_article_stats"),
+        (11, "_migrate_v11_storage_meta"),
+    )
 
-    def __init__(self, db_path: str = "data/articles.db") -> None:
+    # Current database schema version
+    SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+    # Per-connection pragmas applied once when a pooled connection is opened
+    CONNECTION_PRAGMAS: tuple[str, ...] = (
+        # Only takes effect on a new file; old ones are converted on request by
+        # run_maintenance(convert_auto_vacuum=True)
+        "PRAGMA auto_vacuum=INCREMENTAL",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA mmap_size=268435456",  # 256 MiB
+        "PRAGMA cache_size=-16000",  # ~16 MiB page cache
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA busy_timeout=5000",
+    )
+
+    # Pragmas for read-only connections: nothing that changes the file
+    READ_ONLY_PRAGMAS: tuple[str, ...] = (
+        "PRAGMA query_only=ON",
+        "PRAGMA mmap_size=268435456",  # 256 MiB
+        "PRAGMA cache_size=-16000",  # ~16 MiB page cache
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA busy_timeout=5000",
+    )
+
+    def __init__(
+        self,
+        db_path: str = "data/articles.db",
+        read_pool_size: int = 4,
+        compression: str = "none",
+        compress_description: bool = False,
+        read_only: bool = False,
+    ) -> None:
         """
         Initialize the article repository.
 
         Args:
             db_path: Path to SQLite database file (created if doesn't exist)
+            read_pool_size: Number of reader connections kept open by the pool
+            compression: Codec for stored article text ("none", "zlib" or "zstd")
+            compress_description: Also compress the description column
+            read_only: Open an existing file read-only and never migrate it
+                (used by replicas serving a shipped snapshot)
+
+        Raises:
+            ValueError: If the compression codec is unknown or unavailable
         """
+        check_codec(compression)
         self.db_path = db_path
+        self.read_pool_size = max(1, read_pool_size)
+        self.compression = compression
+        self.compress_description = compress_description
+        self.read_only = read_only
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+
+        # Cached copies of the small sources/locales lookup tables. Sources map
+        # id -> (name, source_id, locale, source_category)
+        self._sources: dict[int, tuple[str, str, str, str]] = {}
+        self._source_refs: dict[tuple[str, str], int] = {}
+        self._locale_refs: dict[str, int] = {}
+
+    @property
+    def is_memory(self) -> bool:
+        """Whether the repository uses a private in-memory database."""
+        return self.db_path == ":memory:"
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """
+        Open a connection configured with the repository pragmas.
+
+        Returns:
+            Open aiosqlite connection with Row factory enabled
+        """
+        if self.read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            db = await aiosqlite.connect(uri, uri=True)
+        else:
+            db = await aiosqlite.connect(self.db_path)
+        db.row_factory = aiosqlite.Row
+        await self._register_functions(db)
+        for pragma in self.READ_ONLY_PRAGMAS if self.read_only else self.CONNECTION_PRAGMAS:
+            await db.execute(pragma)
+        return db
+
+    @staticmethod
+    async def _register_functions(db: aiosqlite.Connection) -> None:
+        """
+        Register the SQL functions the schema's triggers and views call.
+
+        Args:
+            db: Connection to register the functions on
+        """
+        await db.create_function("decompress_text", 1, decompress_text, deterministic=True)
+
+    async def _open_pool(self) -> None:
+        """
+        Open the writer and reader connections if not already open.
+
+        In-memory databases are private to a single connection, so the
+        writer doubles as the only reader in that case.
+        """
+        if self._writer is not None:
+            return
+
+        # Open the writer first so journal_mode=WAL is set before readers attach
+        self._writer = await self._connect()
+
+        if not self.is_memory:
+            for _ in range(self.read_pool_size):
+                reader = await self._connect()
+                self._readers.append(reader)
+                self._idle_readers.put_nowait(reader)
+
+        logger.debug(
+            f"Opened connection pool for {self.db_path} "
+            f"(1 writer, {len(self._readers)} readers)"
+        )
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Check out a reader connection from the pool.
+
+        Falls back to a short-lived connection when the pool has not been
+        opened (initialize() not called).
+
+        Yields:
+            aiosqlite connection for read-only queries
+        """
+        if self._writer is None:
+            async with aiosqlite.connect(self.db_path) as db:
+                db.row_factory = aiosqlite.Row
+                await self._register_functions(db)
+                yield db
+            return
+
+        if not self._readers:
+            async with self._write_lock:
+                yield self._writer
+            return
+
+        db = await self._idle_readers.get()
+        try:
+            yield db
+        finally:
+            # Skip connections that close() already tore down while checked out
+            if db in self._readers:
+                self._idle_readers.put_nowait(db)
+
+    @asynccontextmanager
+    async def _writer_conn(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Acquire exclusive use of the writer connection.
+
+        Any transaction left open by a failing block is rolled back before
+        the writer is released. Falls back to a short-lived connection when
+        the pool has not been opened.
+
+        Yields:
+            aiosqlite connection for write statements
+        """
+        if self._writer is None:
+            async with aiosqlite.connect(self.db_path) as db:
+                db.row_factory = aiosqlite.Row
+                await self._register_functions(db)
+                yield db
+            return
+
+        async with self._write_lock:
+            try:
+                yield self._writer
+            except BaseException:
+                await self._writer.rollback()
+                raise
+
     async def initialize(self) -> None:
         """
-        Create database schema and indexes.
+        Open the connection pool and bring the schema up to date.
 
-        This method creates the articles table if it doesn't exist and
-        sets up indexes for optimal query performance. Automatically
-        runs migrations if needed.
+        When the database is already at SCHEMA_VERSION this costs a single
+        version read; otherwise the pending migrations are applied in order.
+        A read-only repository is never migrated: its file must already be
+        at SCHEMA_VERSION.
+
+        Raises:
+            RuntimeError: If a read-only database is at another schema version
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            # Create schema_version table FIRST (needed by migrate_to_v2)
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS schema_version (
-                    version INTEGER PRIMARY KEY
+        await self._open_pool()
+        if self.read_only:
+            version = await self.get_schema_version()
+            if version != self.SCHEMA_VERSION:
+                await self.close()
+                raise RuntimeError(
+                    f"Read-only database {self.db_path} is at schema v{version}, "
+                    f"expected v{self.SCHEMA_VERSION}"
                 )
+        else:
+            version = await self.migrate()
+        logger.info(f"Database initialized at {self.db_path} (schema v{version})")
+
+    async def get_schema_version(self) -> int:
+        """
+        Get the schema version recorded in the database.
+
+        Returns:
+            Highest applied migration version (0 for a new database)
+        """
+        async with self._reader() as db:
+            return await self._read_schema_version(db)
+
+    @staticmethod
+    async def _read_schema_version(db: aiosqlite.Connection) -> int:
+        """
+        Read the recorded schema version on a connection.
+
+        Args:
+            db: Connection to read from
+
+        Returns:
+            Highest applied migration version (0 if schema_version is missing)
+        """
+        try:
+            cursor = await db.execute("SELECT MAX(version) FROM schema_version")
+        except aiosqlite.OperationalError:
+            # No schema_version table yet: brand new database
+            return 0
+        row = await cursor.fetchone()
+        return int(row[0]) if row and row[0] else 0
+
+    async def migrate(self) -> int:
+        """
+        Apply pending schema migrations in version order.
+
+        Each migration runs in its own transaction together with the
+        schema_version row that records it, so a failed migration leaves the
+        database at the previous version. Migrations are written to tolerate
+        databases created before versions were tracked reliably.
+
+        Returns:
+            Schema version after migrating
+        """
+        async with self._writer_conn() as db:
+            current = await self._read_schema_version(db)
+            if current >= self.SCHEMA_VERSION:
+                return current
+
+            for version, name in self.MIGRATIONS:
+                if version <= current:
+                    continue
+
+                migration = getattr(self, name)
+                await db.execute("BEGIN IMMEDIATE")
+                await migration(db)
+                await db.execute(
+                    "INSERT OR REPLACE INTO schema_version (version) VALUES (?)", (version,)
+                )
+                await db.commit()
+                logger.info(f"Applied database migration v{version} ({name})")
+
+            return self.SCHEMA_VERSION
+
+    async def _migrate_v1_base_schema(self, db: aiosqlite.Connection) -> None:
+        """
+        v1: create the schema_version and articles tables with base indexes.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY
+            )
+        """
+        )
+        await db.execute(
             """
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guid TEXT UNIQUE NOT NULL,
+                title TEXT NOT NULL,
+                url TEXT UNIQUE NOT NULL,
+                pub_date DATETIME NOT NULL,
+                description TEXT,
+                content TEXT,
+                image_url TEXT,
+                author TEXT,
+                categories TEXT,
+                source TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
+        """
+        )
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_pub_date ON articles(pub_date DESC)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_guid ON articles(guid)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_source ON articles(source)")
 
-            # Create articles table
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guid TEXT UNIQUE NOT NULL,
-                    title TEXT NOT NULL,
-                    url TEXT UNIQUE NOT NULL,
-                    pub_date DATETIME NOT NULL,
-                    description TEXT,
-                    content TEXT,
-                    image_url TEXT,
-                    author TEXT,
-                    categories TEXT,
-                    source TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    locale TEXT DEFAULT 'en-us',
-                    source_category TEXT,
-                    canonical_url TEXT
-                )
+    async def _migrate_v2_multi_locale(self, db: aiosqlite.Connection) -> None:
+        """
+        v2: add multi-source, multi-locale columns and their indexes.
+
+        Adds locale tracking, source categorization and the canonical URL
+        used for deduplication across sources.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        cursor = await db.execute("PRAGMA table_info(articles)")
+        columns = [row[1] for row in await cursor.fetchall()]
+
+        # Add locale column if missing
+        if "locale" not in columns:
+            await db.execute("ALTER TABLE articles ADD COLUMN locale TEXT DEFAULT 'en-us'")
+
+        # Add source_category column if missing
+        if "source_category" not in columns:
+            await db.execute("ALTER TABLE articles ADD COLUMN source_category TEXT")
+
+        # Add canonical_url column if missing
+        if "canonical_url" not in columns:
+            await db.execute("ALTER TABLE articles ADD COLUMN canonical_url TEXT")
+
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_locale ON articles(locale)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_source_locale ON articles(source, locale)")
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pub_date_locale ON articles(pub_date DESC, locale)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_source_category ON articles(source_category)"
+        )
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_canonical_url ON articles(canonical_url)")
+
+    async def _migrate_v3_article_categories(self, db: aiosqlite.Connection) -> None:
+        """
+        v3: create the normalized article_categories table and backfill it.
+
+        Each (article, category) pair gets its own row carrying the article's
+        pub_date, so category feeds read newest-first straight off the
+        (category, pub_date) index instead of scanning the CSV column.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.execute(
             """
+            CREATE TABLE IF NOT EXISTS article_categories (
+                article_id INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                pub_date DATETIME NOT NULL,
+                PRIMARY KEY (article_id, category)
+            )
+        """
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_article_categories_category_date "
+            "ON article_categories(category, pub_date DESC)"
+        )
+        # Keep category rows in step with article deletions from any code path
+        await db.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_articles_delete_categories
+            AFTER DELETE ON articles
+            BEGIN
+                DELETE FROM article_categories WHERE article_id = OLD.id;
+            END
+        """
+        )
+
+        cursor = await db.execute(
+            "SELECT id, pub_date, categories FROM articles "
+            "WHERE categories IS NOT NULL AND categories != ''"
+        )
+        rows = list(await cursor.fetchall())
+        category_rows = [
+            entry for row in rows for entry in self._category_rows(row[0], row[1], row[2])
+        ]
+        await db.executemany(
+            "INSERT OR IGNORE INTO article_categories (article_id, category, pub_date) "
+            "VALUES (?, ?, ?)",
+            category_rows,
+        )
+        if rows:
+            logger.info(
+                f"Backfilled {len(category_rows)} article_categories rows "
+                f"from {len(rows)} articles"
             )
 
-        # Run migration if needed (handles existing tables with old schema)
-        # This must run outside the connection block above since migrate_to_v2 opens its own connection
-        await self.migrate_to_v2()
+    async def _migrate_v4_source_id(self, db: aiosqlite.Connection) -> None:
+        """
+        v4: add the indexed source_id column and backfill it.
 
-        # Now create indexes in a new connection
-        async with aiosqlite.connect(self.db_path) as db:
-            # Create indexes for better query performance
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_pub_date ON articles(pub_date DESC)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_guid ON articles(guid)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_source ON articles(source)")
+        source_id is the game/site part of ``source`` (e.g. "lol" for
+        "lol:en-us"), indexed together with locale and pub_date so per-source
+        locale feeds are filtered in SQL. Legacy "lol-en-us" style values are
+        parsed the same way Article.from_dict() does.
 
-            # Multi-language/multi-source indexes (these will succeed after migrate_to_v2)
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_locale ON articles(locale)")
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_source_locale ON articles(source, locale)"
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        cursor = await db.execute("PRAGMA table_info(articles)")
+        columns = [row[1] for row in await cursor.fetchall()]
+
+        if "source_id" not in columns:
+            await db.execute("ALTER TABLE articles ADD COLUMN source_id TEXT")
+
+        cursor = await db.execute("SELECT id, source, locale FROM articles WHERE source_id IS NULL")
+        updates = [
+            (self._source_id(row["source"], row["locale"]), row["id"])
+            for row in await cursor.fetchall()
+        ]
+        await db.executemany("UPDATE articles SET source_id = ? WHERE id = ?", updates)
+        if updates:
+            logger.info(f"Backfilled source_id for {len(updates)} articles")
+
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_source_id_locale_date "
+            "ON articles(source_id, locale, pub_date DESC)"
+        )
+
+    async def _migrate_v5_compact_rows(self, db: aiosqlite.Connection) -> None:
+        """
+        v5: store timestamps as epoch milliseconds and intern sources/locales.
+
+        Rebuilds articles so pub_date/created_at are INTEGER epoch
+        milliseconds and source/locale/source_category/source_id live once in
+        the ``sources`` and ``locales`` lookup tables, referenced by integer
+        id. Each sources row also records the locale its source string names,
+        which per-source locale feeds filter on. The ``article_view`` view
+        joins them back into the legacy column names for queries and ad-hoc
+        SQL.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.create_function("epoch_ms", 1, _iso_to_epoch_ms, deterministic=True)
+        await db.create_function("source_locale", 2, self._source_locale, deterministic=True)
+
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sources (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                locale TEXT NOT NULL,
+                source_category TEXT NOT NULL DEFAULT '',
+                UNIQUE (name, source_category)
             )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_pub_date_locale ON articles(pub_date DESC, locale)"
+        """
+        )
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS locales (
+                id INTEGER PRIMARY KEY,
+                code TEXT UNIQUE NOT NULL
             )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_source_category ON articles(source_category)"
+        """
+        )
+        await db.execute(
+            "INSERT OR IGNORE INTO sources (name, source_id, locale, source_category) "
+            "SELECT DISTINCT source, source_id, source_locale(source, locale), "
+            "COALESCE(source_category, '') FROM articles"
+        )
+        await db.execute(
+            "INSERT OR IGNORE INTO locales (code) "
+            "SELECT DISTINCT COALESCE(locale, 'en-us') FROM articles"
+        )
+
+        await db.execute(
+            """
+            CREATE TABLE articles_v5 (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guid TEXT UNIQUE NOT NULL,
+                title TEXT NOT NULL,
+                url TEXT UNIQUE NOT NULL,
+                pub_date INTEGER NOT NULL,
+                description TEXT,
+                content TEXT,
+                image_url TEXT,
+                author TEXT,
+                categories TEXT,
+                source_ref INTEGER NOT NULL REFERENCES sources(id),
+                created_at INTEGER NOT NULL,
+                locale_ref INTEGER NOT NULL REFERENCES locales(id),
+                canonical_url TEXT
+            )
+        """
+        )
+        await db.execute(
+            """
+            INSERT INTO articles_v5 (
+                id, guid, title, url, pub_date, description, content, image_url,
+                author, categories, source_ref, created_at, locale_ref, canonical_url
+            )
+            SELECT
+                a.id, a.guid, a.title, a.url, epoch_ms(a.pub_date), a.description,
+                a.content, a.image_url, a.author, a.categories, s.id,
+                COALESCE(epoch_ms(a.created_at), epoch_ms(a.pub_date)), l.id,
+                a.canonical_url
+            FROM articles a
+            JOIN sources s
+                ON s.name = a.source AND s.source_category = COALESCE(a.source_category, '')
+            JOIN locales l ON l.code = COALESCE(a.locale, 'en-us')
+        """
+        )
+
+        # Dropping the old table also drops its indexes and delete trigger
+        await db.execute("DROP TABLE articles")
+        await db.execute("ALTER TABLE articles_v5 RENAME TO articles")
+
+        await db.execute("CREATE INDEX idx_pub_date ON articles(pub_date DESC)")
+        await db.execute("CREATE INDEX idx_source_ref_date ON articles(source_ref, pub_date DESC)")
+        await db.execute("CREATE INDEX idx_locale_ref_date ON articles(locale_ref, pub_date DESC)")
+        await db.execute("CREATE INDEX idx_canonical_url ON articles(canonical_url)")
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_delete_categories
+            AFTER DELETE ON articles
+            BEGIN
+                DELETE FROM article_categories WHERE article_id = OLD.id;
+            END
+        """
+        )
+
+        # Category rows carry a copy of pub_date for their index
+        await db.execute(
+            "DELETE FROM article_categories " "WHERE article_id NOT IN (SELECT id FROM articles)"
+        )
+        await db.execute(
+            "UPDATE article_categories SET pub_date = "
+            "(SELECT pub_date FROM articles WHERE articles.id = article_categories.article_id)"
+        )
+
+        await db.execute(
+            """
+            CREATE VIEW article_view AS
+            SELECT
+                a.id, a.guid, a.title, a.url, a.pub_date, a.description, a.content,
+                a.image_url, a.author, a.categories, s.name AS source, a.created_at,
+                l.code AS locale, NULLIF(s.source_category, '') AS source_category,
+                a.canonical_url, s.source_id AS source_id, a.source_ref, a.locale_ref
+            FROM articles a
+            JOIN sources s ON s.id = a.source_ref
+            JOIN locales l ON l.id = a.locale_ref
+        """
+        )
+
+    async def _migrate_v6_fulltext_search(self, db: aiosqlite.Connection) -> None:
+        """
+        v6: add the articles_fts full-text index over title and description.
+
+        articles_fts is an external-content FTS5 table: it stores only the
+        inverted index and reads the text back from articles, so searchable
+        text is not duplicated. Triggers keep it in step with every write
+        path, and BM25 ranking weights title matches over description ones.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.execute(
+            """
+            CREATE VIRTUAL TABLE articles_fts USING fts5(
+                title,
+                description,
+                content='articles',
+                content_rowid='id',
+                prefix='3',
+                tokenize='unicode61 remove_diacritics 2'
             )
+        """
+        )
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_fts_insert AFTER INSERT ON articles
+            BEGIN
+                INSERT INTO articles_fts (rowid, title, description)
+                VALUES (NEW.id, NEW.title, NEW.description);
+            END
+        """
+        )
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_fts_delete AFTER DELETE ON articles
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, description)
+                VALUES ('delete', OLD.id, OLD.title, OLD.description);
+            END
+        """
+        )
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_fts_update AFTER UPDATE OF title, description ON articles
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, description)
+                VALUES ('delete', OLD.id, OLD.title, OLD.description);
+                INSERT INTO articles_fts (rowid, title, description)
+                VALUES (NEW.id, NEW.title, NEW.description);
+            END
+        """
+        )
+        # Persist the ranking so ORDER BY rank uses FTS5's top-N fast path
+        await db.execute(
+            "INSERT INTO articles_fts (articles_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')"
+        )
+        await db.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+    async def _migrate_v7_compressed_text(self, db: aiosqlite.Connection) -> None:
+        """
+        v7: index decompressed text so description can be stored compressed.
+
+        The full-text index now reads its external content through the
+        ``article_search_text`` view, which decodes compressed descriptions
+        with the ``decompress_text`` SQL function, and the sync triggers
+        decode the values they index the same way. The update trigger also
+        skips rewrites that leave the decoded text unchanged, such as
+        compressing a row in place.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.execute(
+            """
+            CREATE VIEW article_search_text AS
+            SELECT id, title, decompress_text(description) AS description FROM articles
+        """
+        )
+
+        for trigger in ("insert", "delete", "update"):
+            await db.execute(f"DROP TRIGGER IF EXISTS trg_articles_fts_{trigger}")
+        await db.execute("DROP TABLE IF EXISTS articles_fts")
+        await db.execute(
+            """
+            CREATE VIRTUAL TABLE articles_fts USING fts5(
+                title,
+                description,
+                content='article_search_text',
+                content_rowid='id',
+                prefix='3',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """
+        )
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_fts_insert AFTER INSERT ON articles
+            BEGIN
+                INSERT INTO articles_fts (rowid, title, description)
+                VALUES (NEW.id, NEW.title, decompress_text(NEW.description));
+            END
+        """
+        )
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_fts_delete AFTER DELETE ON articles
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, description)
+                VALUES ('delete', OLD.id, OLD.title, decompress_text(OLD.description));
+            END
+        """
+        )
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_fts_update AFTER UPDATE OF title, description ON articles
+            WHEN OLD.title IS NOT NEW.title
+                OR decompress_text(OLD.description) IS NOT decompress_text(NEW.description)
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, description)
+                VALUES ('delete', OLD.id, OLD.title, decompress_text(OLD.description));
+                INSERT INTO articles_fts (rowid, title, description)
+                VALUES (NEW.id, NEW.title, decompress_text(NEW.description));
+            END
+        """
+        )
+        await db.execute(
+            "INSERT INTO articles_fts (articles_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')"
+        )
+        await db.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+    async def _migrate_v8_shared_bodies(self, db: aiosqlite.Connection) -> None:
+        """
+        v8: store each distinct article body once, addressed by its hash.
+
+        Locale variants of the same Riot article carry identical bodies, so
+        ``content`` moves into ``article_bodies`` keyed by the SHA-256 of the
+        decoded text and articles reference it through ``body_ref``. A
+        delete trigger drops a body once its last article is gone, and
+        ``article_view`` joins it back as ``content``.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.create_function("body_hash", 1, body_hash, deterministic=True)
+
+        await db.execute(
+            """
+            CREATE TABLE article_bodies (
+                id INTEGER PRIMARY KEY,
+                hash BLOB UNIQUE NOT NULL,
+                content
+            )
+        """
+        )
+        await db.execute(
+            "ALTER TABLE articles ADD COLUMN body_ref INTEGER REFERENCES article_bodies(id)"
+        )
+        await db.execute(
+            "INSERT OR IGNORE INTO article_bodies (hash, content) "
+            "SELECT body_hash(content), content FROM articles "
+            "WHERE body_hash(content) IS NOT NULL ORDER BY id"
+        )
+        await db.execute(
+            "UPDATE articles SET body_ref = "
+            "(SELECT id FROM article_bodies WHERE hash = body_hash(articles.content))"
+        )
+
+        # The view reads content, so it has to go before the column does
+        await db.execute("DROP VIEW article_view")
+        await db.execute("ALTER TABLE articles DROP COLUMN content")
+        await db.execute(
+            """
+            CREATE VIEW article_view AS
+            SELECT
+                a.id, a.guid, a.title, a.url, a.pub_date, a.description,
+                COALESCE(b.content, '') AS content,
+                a.image_url, a.author, a.categories, s.name AS source, a.created_at,
+                l.code AS locale, NULLIF(s.source_category, '') AS source_category,
+                a.canonical_url, s.source_id AS source_id, a.source_ref, a.locale_ref
+            FROM articles a
+            JOIN sources s ON s.id = a.source_ref
+            JOIN locales l ON l.id = a.locale_ref
+            LEFT JOIN article_bodies b ON b.id = a.body_ref
+        """
+        )
+
+        await db.execute("CREATE INDEX idx_body_ref ON articles(body_ref)")
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_delete_body
+            AFTER DELETE ON articles
+            WHEN OLD.body_ref IS NOT NULL
+            BEGIN
+                DELETE FROM article_bodies
+                WHERE id = OLD.body_ref
+                    AND NOT EXISTS (SELECT 1 FROM articles WHERE body_ref = OLD.body_ref);
+            END
+        """
+        )
+
+    async def _migrate_v9_near_duplicate_clusters(self, db: aiosqlite.Connection) -> None:
+        """
+        v9: add MinHash signatures and an LSH index for near-duplicate clusters.
+
+        Each article stores the MinHash signature of its title and
+        description, and ``article_lsh`` maps every LSH band key to the
+        articles carrying it. ``cluster_id`` points at the first article of
+        the story the row duplicates (NULL when it starts its own cluster);
+        ``article_view`` exposes the resolved cluster as ``cluster_id``.
+        Existing articles are signed and clustered in id order.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.execute("ALTER TABLE articles ADD COLUMN minhash BLOB")
+        await db.execute("ALTER TABLE articles ADD COLUMN cluster_id INTEGER")
+        await db.execute(
+            """
+            CREATE TABLE article_lsh (
+                key INTEGER NOT NULL,
+                article_id INTEGER NOT NULL,
+                PRIMARY KEY (key, article_id)
+            ) WITHOUT ROWID
+        """
+        )
+        await db.execute("CREATE INDEX idx_lsh_article ON article_lsh(article_id)")
+        await db.execute(
+            """
+            CREATE TRIGGER trg_articles_delete_lsh
+            AFTER DELETE ON articles
+            BEGIN
+                DELETE FROM article_lsh WHERE article_id = OLD.id;
+            END
+        """
+        )
+
+        await db.execute("DROP VIEW article_view")
+        await db.execute(
+            """
+            CREATE VIEW article_view AS
+            SELECT
+                a.id, a.guid, a.title, a.url, a.pub_date, a.description,
+                COALESCE(b.content, '') AS content,
+                a.image_url, a.author, a.categories, s.name AS source, a.created_at,
+                l.code AS locale, NULLIF(s.source_category, '') AS source_category,
+                a.canonical_url, s.source_id AS source_id, a.source_ref, a.locale_ref,
+                COALESCE(a.cluster_id, a.id) AS cluster_id
+            FROM articles a
+            JOIN sources s ON s.id = a.source_ref
+            JOIN locales l ON l.id = a.locale_ref
+            LEFT JOIN article_bodies b ON b.id = a.body_ref
+        """
+        )
+
+        last_id = 0
+        while True:
+            cursor = await db.execute(
+                "SELECT id, title, description, pub_date FROM articles "
+                "WHERE id > ? ORDER BY id LIMIT 1000",
+                (last_id,),
+            )
+            rows = list(await cursor.fetchall())
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            signed = [
+                (row[0], self._signature(row[1], decompress_text(row[2])), row[3]) for row in rows
+            ]
+            await db.executemany(
+                "UPDATE articles SET minhash = ? WHERE id = ?",
+                [(signature, article_id) for article_id, signature, _ in signed if signature],
+            )
+            await self._assign_clusters(db, signed)
+
+    async def _migrate_v10_article_stats(self, db: aiosqlite.Connection) -> None:
+        """
+        v10: keep per-source/per-locale article counts in ``article_stats``.
+
+        One row per (source_ref, locale_ref) pair holds the number of
+        articles, the newest pub_date and the newest created_at. Triggers
+        maintain it on every insert, delete and re-keying update, so health
+        and discovery queries no longer scan articles. Rows are dropped when
+        their count reaches zero; ``max_pub_date`` is only recomputed (via
+        idx_source_ref_date) when the newest article of a pair is deleted.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.execute(
+            """
+            CREATE TABLE article_stats (
+                source_ref INTEGER NOT NULL,
+                locale_ref INTEGER NOT NULL,
+                article_count INTEGER NOT NULL,
+                max_pub_date INTEGER,
+                last_write_at INTEGER,
+                PRIMARY KEY (source_ref, locale_ref)
+            ) WITHOUT ROWID
+        """
+        )
+        await db.execute(
+            """
+            INSERT INTO article_stats
+            SELECT source_ref, locale_ref, COUNT(*), MAX(pub_date), MAX(created_at)
+            FROM articles
+            GROUP BY source_ref, locale_ref
+        """
+        )
+
+        add_new = """
+                INSERT INTO article_stats (
+                    source_ref, locale_ref, article_count, max_pub_date, last_write_at
+                )
+                VALUES (NEW.source_ref, NEW.locale_ref, 1, NEW.pub_date, NEW.created_at)
+                ON CONFLICT (source_ref, locale_ref) DO UPDATE SET
+                    article_count = article_count + 1,
+                    max_pub_date = MAX(max_pub_date, excluded.max_pub_date),
+                    last_write_at = MAX(last_write_at, excluded.last_write_at);"""
+        remove_old = """
+                UPDATE article_stats SET
+                    article_count = article_count - 1,
+                    max_pub_date = CASE
+                        WHEN OLD.pub_date < max_pub_date THEN max_pub_date
+                        ELSE (
+                            SELECT MAX(pub_date) FROM articles
+                            WHERE source_ref = OLD.source_ref AND locale_ref = OLD.locale_ref
+                        )
+                    END
+                WHERE source_ref = OLD.source_ref AND locale_ref = OLD.locale_ref;
+                DELETE FROM article_stats
+                WHERE source_ref = OLD.source_ref AND locale_ref = OLD.locale_ref
+                    AND article_count <= 0;"""
+
+        await db.execute(
+            f"""
+            CREATE TRIGGER trg_articles_stats_insert
+            AFTER INSERT ON articles
+            BEGIN{add_new}
+            END
+        """
+        )
+        await db.execute(
+            f"""
+            CREATE TRIGGER trg_articles_stats_delete
+            AFTER DELETE ON articles
+            BEGIN{remove_old}
+            END
+        """
+        )
+        await db.execute(
+            f"""
+            CREATE TRIGGER trg_articles_stats_update
+            AFTER UPDATE OF source_ref, locale_ref, pub_date ON articles
+            WHEN OLD.source_ref IS NOT NEW.source_ref
+                OR OLD.locale_ref IS NOT NEW.locale_ref
+                OR OLD.pub_date IS NOT NEW.pub_date
+            BEGIN{remove_old}{add_new}
+            END
+        """
+        )
+
+    async def _migrate_v11_storage_meta(self, db: aiosqlite.Connection) -> None:
+        """
+        v11: add the ``storage_meta`` key/value table.
+
+        Records facts about how rows are stored that would otherwise take a
+        full scan to establish, such as the text codec every stored body and
+        description was last brought in line with. Starts empty, so the
+        first recompress_stored_text() still scans.
+
+        Args:
+            db: Writer connection inside the migration transaction
+        """
+        await db.execute(
+            """
+            CREATE TABLE storage_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            ) WITHOUT ROWID
+        """
+        )
+
+    @staticmethod
+    def _parse_source(source: str | None, locale: str | None) -> ArticleSource:
+        """
+        Parse a stored source string into an ArticleSource.
+
+        Args:
+            source: Stored source string (e.g., "lol:en-us" or legacy "lol-en-us")
+            locale: Stored locale, used for the legacy fallback
+
+        Returns:
+            Parsed ArticleSource
+        """
+        try:
+            return ArticleSource.from_string(source or "")
+        except ValueError:
+            # Same fallback Article.from_dict() applies to unparseable legacy rows
+            return ArticleSource.create("lol", locale or "en-us")
+
+    @classmethod
+    def _source_id(cls, source: str | None, locale: str | None) -> str:
+        """
+        Derive the source_id column value from a stored source string.
+
+        Args:
+            source: Stored source string (e.g., "lol:en-us" or legacy "lol-en-us")
+            locale: Stored locale, used for the legacy fallback
+
+        Returns:
+            Source identifier (e.g., "lol", "u-gg")
+        """
+        return cls._parse_source(source, locale).source_id
+
+    @classmethod
+    def _source_locale(cls, source: str | None, locale: str | None) -> str:
+        """
+        Derive the locale named by a stored source string.
+
+        Args:
+            source: Stored source string (e.g., "lol:en-us" or legacy "lol-en-us")
+            locale: Stored locale, used for the legacy fallback
+
+        Returns:
+            Locale code of the source (e.g., "en-us")
+        """
+        return cls._parse_source(source, locale).locale
+
+    async def _to_row(self, db: aiosqlite.Connection, article: Article) -> dict[str, Any]:
+        """
+        Serialize an article into the column values used by INSERT statements.
+
+        Timestamps become epoch milliseconds and source/locale are replaced by
+        their interned lookup ids. Must be called with the writer held and
+        before the caller opens its own transaction.
+
+        Args:
+            db: Writer connection
+            article: Article to serialize
+
+        Returns:
+            Article.to_dict() with epoch timestamps, the description compressed
+            per the repository codec, plus body_hash/minhash/source_ref/locale_ref
+        """
+        data = article.to_dict()
+        data["body_hash"] = body_hash(article.content)
+        data["minhash"] = self._signature(article.title, article.description)
+        if self.compress_description:
+            data["description"] = compress_text(data["description"], self.compression)
+        data["pub_date"] = to_epoch_ms(article.pub_date)
+        data["created_at"] = to_epoch_ms(article.created_at)
+        data["source_ref"] = await self._source_ref(
+            db,
+            data["source"],
+            article.source.source_id,
+            article.source.locale,
+            data["source_category"] or "",
+        )
+        data["locale_ref"] = await self._locale_ref(db, data["locale"])
+        return data
+
+    async def _source_ref(
+        self,
+        db: aiosqlite.Connection,
+        name: str,
+        source_id: str,
+        locale: str,
+        source_category: str,
+    ) -> int:
+        """
+        Get the sources row id for a source, inserting it on first use.
+
+        Args:
+            db: Writer connection
+            name: Source string (e.g., "lol:en-us")
+            source_id: Source identifier (e.g., "lol")
+            locale: Locale named by the source string (e.g., "en-us")
+            source_category: Source category ('' when unset)
+
+        Returns:
+            Integer id of the sources row
+
+        Raises:
+            RuntimeError: If the row cannot be read back after inserting it
+        """
+        key = (name, source_category)
+        ref = self._source_refs.get(key)
+        if ref is None:
             await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_canonical_url ON articles(canonical_url)"
+                "INSERT OR IGNORE INTO sources (name, source_id, locale, source_category) "
+                "VALUES (?, ?, ?, ?)",
+                (name, source_id, locale, source_category),
+            )
+            # Commit right away so a later rollback cannot orphan a cached id
+            await db.commit()
+            cursor = await db.execute(
+                "SELECT id, source_id, locale FROM sources WHERE name = ? AND source_category = ?",
+                key,
             )
+            row = await cursor.fetchone()
+            if row is None:
+                raise RuntimeError(f"Source {name!r} missing right after insert")
+            ref = self._source_refs[key] = int(row[0])
+            self._sources[ref] = (name, row[1], row[2], source_category)
+        return ref
+
+    @staticmethod
+    def _signature(title: str, description: str | None) -> bytes | None:
+        """
+        Compute the near-duplicate signature of an article.
+
+        Args:
+            title: Article title
+            description: Decoded article description
 
-            # Check if we need to insert initial version
-            cursor = await db.execute("SELECT MAX(version) as v FROM schema_version")
+        Returns:
+            MinHash signature of title and description, or None if empty
+        """
+        return minhash(f"{title} {description or ''}")
+
+    async def _assign_clusters(
+        self, db: aiosqlite.Connection, articles: list[tuple[int, bytes | None, int]]
+    ) -> int:
+        """
+        Index new articles in article_lsh and join them to near-duplicate clusters.
+
+        Candidates are the articles sharing at least one LSH band key and
+        published within CLUSTER_WINDOW_DAYS; the most similar one at or
+        above SIMILARITY_THRESHOLD lends its cluster. Articles of the same
+        call are matched against each other too, in the given order.
+
+        Args:
+            db: Writer connection
+            articles: (id, signature, pub_date) of the articles to index
+
+        Returns:
+            Number of articles that joined an existing cluster
+        """
+        pending = [
+            (article_id, signature, pub_date, lsh_keys(signature))
+            for article_id, signature, pub_date in articles
+            if signature
+        ]
+        if not pending:
+            return 0
+
+        window = CLUSTER_WINDOW_DAYS * MS_PER_DAY
+        earliest = min(entry[2] for entry in pending) - window
+        latest = max(entry[2] for entry in pending) + window
+        keys = list({key for entry in pending for key in entry[3]})
+
+        # LSH key -> (id, signature, pub_date, cluster) of the articles carrying it
+        buckets: dict[int, list[tuple[int, bytes, int, int]]] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            # nosec B608 - safe: placeholders only contains ? characters
+            cursor = await db.execute(
+                "SELECT l.key, a.id, a.minhash, a.pub_date, COALESCE(a.cluster_id, a.id) "
+                "FROM article_lsh l JOIN articles a ON a.id = l.article_id "
+                f"WHERE l.key IN ({placeholders}) AND a.pub_date BETWEEN ? AND ?",
+                [*chunk, earliest, latest],
+            )
+            for key, *member in await cursor.fetchall():
+                buckets.setdefault(key, []).append(tuple(member))
+
+        lsh_rows: list[tuple[int, int]] = []
+        clustered: list[tuple[int, int]] = []
+        for article_id, signature, pub_date, article_keys in pending:
+            cluster, best = article_id, SIMILARITY_THRESHOLD
+            compared: set[int] = set()
+            for key in article_keys:
+                for other_id, other_signature, other_date, other_cluster in buckets.get(key, ()):
+                    if other_id in compared or abs(other_date - pub_date) > window:
+                        continue
+                    compared.add(other_id)
+                    score = similarity(signature, other_signature)
+                    if score >= best:
+                        cluster, best = other_cluster, score
+
+            if cluster != article_id:
+                clustered.append((cluster, article_id))
+            for key in article_keys:
+                buckets.setdefault(key, []).append((article_id, signature, pub_date, cluster))
+                lsh_rows.append((key, article_id))
+
+        await db.executemany(
+            "INSERT OR IGNORE INTO article_lsh (key, article_id) VALUES (?, ?)", lsh_rows
+        )
+        if clustered:
+            await db.executemany("UPDATE articles SET cluster_id = ? WHERE id = ?", clustered)
+        return len(clustered)
+
+    async def _assign_body_refs(
+        self, db: aiosqlite.Connection, rows: list[dict[str, Any]]
+    ) -> list[int]:
+        """
+        Point rows at their article_bodies entries, storing new bodies once.
+
+        Bodies already stored under the same hash (typically the other
+        locale variants of an article) are reused without compressing or
+        writing them again.
+
+        Args:
+            db: Writer connection
+            rows: Rows from _to_row(); ``body_ref`` is set on each
+
+        Returns:
+            Ids of the article_bodies rows inserted by this call
+        """
+        bodies = {row["body_hash"]: row["content"] for row in rows if row["body_hash"]}
+        refs = await self._body_ids(db, list(bodies))
+        missing = [digest for digest in bodies if digest not in refs]
+        if missing:
+            await db.executemany(
+                "INSERT INTO article_bodies (hash, content) VALUES (?, ?)",
+                [(digest, compress_text(bodies[digest], self.compression)) for digest in missing],
+            )
+            refs.update(await self._body_ids(db, missing))
+
+        for row in rows:
+            row["body_ref"] = refs.get(row["body_hash"])
+        return [refs[digest] for digest in missing]
+
+    @staticmethod
+    async def _body_ids(db: aiosqlite.Connection, hashes: list[bytes]) -> dict[bytes, int]:
+        """
+        Look up the article_bodies ids of body hashes.
+
+        Args:
+            db: Connection to read from
+            hashes: Body hashes to resolve
+
+        Returns:
+            Mapping of hash to id for the hashes already stored
+        """
+        ids: dict[bytes, int] = {}
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            # nosec B608 - safe: placeholders only contains ? characters
+            cursor = await db.execute(
+                f"SELECT id, hash FROM article_bodies WHERE hash IN ({placeholders})", chunk
+            )
+            ids.update({row[1]: int(row[0]) for row in await cursor.fetchall()})
+        return ids
+
+    async def _locale_ref(self, db: aiosqlite.Connection, code: str) -> int:
+        """
+        Get the locales row id for a locale code, inserting it on first use.
+
+        Args:
+            db: Writer connection
+            code: Locale code (e.g., "en-us")
+
+        Returns:
+            Integer id of the locales row
+
+        Raises:
+            RuntimeError: If the row cannot be read back after inserting it
+        """
+        ref = self._locale_refs.get(code)
+        if ref is None:
+            await db.execute("INSERT OR IGNORE INTO locales (code) VALUES (?)", (code,))
+            await db.commit()
+            cursor = await db.execute("SELECT id FROM locales WHERE code = ?", (code,))
             row = await cursor.fetchone()
-            current_version = row[0] if row and row[0] else 0
+            if row is None:
+                raise RuntimeError(f"Locale {code!r} missing right after insert")
+            ref = self._locale_refs[code] = int(row[0])
+        return ref
 
-            if current_version < self.SCHEMA_VERSION:
-                await db.execute(
-                    "INSERT OR REPLACE INTO schema_version (version) VALUES (?)",
-                    (self.SCHEMA_VERSION,),
+    async def _load_lookups(self, db: aiosqlite.Connection) -> None:
+        """
+        Reload the cached copies of the sources and locales tables.
+
+        Args:
+            db: Connection to read from
+        """
+        cursor = await db.execute(
+            "SELECT id, name, source_id, locale, source_category FROM sources"
+        )
+        sources = {int(row[0]): (row[1], row[2], row[3], row[4]) for row in await cursor.fetchall()}
+        cursor = await db.execute("SELECT id, code FROM locales")
+        locales = {row[1]: int(row[0]) for row in await cursor.fetchall()}
+
+        self._sources = sources
+        self._source_refs = {
+            (name, category): ref for ref, (name, _, _, category) in sources.items()
+        }
+        self._locale_refs = locales
+
+    async def _match_sources(
+        self,
+        db: aiosqlite.Connection,
+        name: str | None = None,
+        source_id: str | None = None,
+        locale: str | None = None,
+        source_category: str | None = None,
+    ) -> list[int]:
+        """
+        Resolve source filters to the ids of the matching sources rows.
+
+        The lookup table is reloaded once on a miss, in case another
+        connection added sources since it was last read.
+
+        Args:
+            db: Connection to read from
+            name: Optional source string (e.g., "lol:en-us")
+            source_id: Optional source identifier (e.g., "lol")
+            locale: Optional locale named by the source string
+            source_category: Optional source category
+
+        Returns:
+            Matching sources row ids (empty if none match)
+        """
+        criteria = (name, source_id, locale, source_category)
+
+        def match() -> list[int]:
+            return [
+                ref
+                for ref, entry in self._sources.items()
+                if all(
+                    want is None or want == have for want, have in zip(criteria, entry, strict=True)
                 )
+            ]
+
+        refs = match()
+        if not refs:
+            await self._load_lookups(db)
+            refs = match()
+        return refs
+
+    async def _match_locales(self, db: aiosqlite.Connection, codes: list[str]) -> list[int]:
+        """
+        Resolve locale codes to the ids of their locales rows.
+
+        Args:
+            db: Connection to read from
+            codes: Locale codes (e.g., ["en-us", "en-gb"])
+
+        Returns:
+            Ids of the codes that exist (empty if none do)
+        """
+        if any(code not in self._locale_refs for code in codes):
+            await self._load_lookups(db)
+        return [
+            self._locale_refs[code] for code in dict.fromkeys(codes) if code in self._locale_refs
+        ]
+
+    async def _lookup_conditions(
+        self,
+        db: aiosqlite.Connection,
+        alias: str = "",
+        source: str | None = None,
+        source_id: str | None = None,
+        source_locale: str | None = None,
+        source_category: str | None = None,
+        locales: list[str] | None = None,
+    ) -> tuple[list[str], list[Any]] | None:
+        """
+        Translate text filters into conditions on the interned id columns.
+
+        Ids are bound as literals so the planner can seek the
+        (source_ref, pub_date) and (locale_ref, pub_date) indexes directly.
+
+        Args:
+            db: Connection to read from
+            alias: Optional table alias to qualify the columns with
+            source: Optional source string filter
+            source_id: Optional source identifier filter
+            source_locale: Optional filter on the locale named by the source string
+            source_category: Optional source category filter
+            locales: Optional locale codes filter
+
+        Returns:
+            Tuple of (conditions, params), or None if a filter matches nothing
+        """
+        prefix = f"{alias}." if alias else ""
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        if source or source_id or source_locale or source_category:
+            refs = await self._match_sources(
+                db,
+                name=source,
+                source_id=source_id,
+                locale=source_locale,
+                source_category=source_category,
+            )
+            if not refs:
+                return None
+            conditions.append(_id_condition(f"{prefix}source_ref", len(refs)))
+            params.extend(refs)
+
+        if locales:
+            refs = await self._match_locales(db, locales)
+            if not refs:
+                return None
+            # With a source filter, unary + keeps the planner on the narrower
+            # (source_ref, pub_date) index
+            unary = "+" if conditions else ""
+            conditions.append(_id_condition(f"{unary}{prefix}locale_ref", len(refs)))
+            params.extend(refs)
+
+        return conditions, params
+
+    @staticmethod
+    def _category_rows(
+        article_id: int, pub_date: int, categories: str | None
+    ) -> list[tuple[int, str, int]]:
+        """
+        Expand an article's stored CSV categories into article_categories rows.
+
+        Args:
+            article_id: Row id of the article
+            pub_date: Stored pub_date value of the article
+            categories: Comma-separated categories as stored in articles
+
+        Returns:
+            List of (article_id, category, pub_date) tuples, one per distinct category
+        """
+        if not categories:
+            return []
+        names = dict.fromkeys(name for name in categories.split(",") if name)
+        return [(article_id, name, pub_date) for name in names]
+
+    @staticmethod
+    def _select_columns(projection: str, table: str = "article_view") -> str:
+        """
+        Build the SELECT column list for a projection.
+
+        Args:
+            projection: Projection name from PROJECTIONS ("full" or "summary")
+            table: Table name or alias to qualify the columns with
+
+        Returns:
+            Comma-separated, table-qualified column list
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        try:
+            columns = PROJECTIONS[projection]
+        except KeyError:
+            raise ValueError(f"Unknown projection: {projection!r}") from None
+        return ", ".join(f"{table}.{column}" for column in columns)
+
+    @staticmethod
+    def _row_to_article(row: aiosqlite.Row, projection: str) -> Article:
+        """
+        Build an Article from a row read with the given projection.
+
+        Args:
+            row: Result row
+            projection: Projection the row was selected with
+
+        Returns:
+            Article instance; content_loaded is False if content was skipped
+        """
+        data = dict(row)
+        for column in COMPRESSIBLE_COLUMNS:
+            if isinstance(data.get(column), bytes):
+                data[column] = decompress_text(data[column])
+        article = Article.from_dict(data)
+        if projection != "full":
+            article.content_loaded = False
+        return article
+
+    async def load_content(self, articles: list[Article]) -> list[Article]:
+        """
+        Load the content column for articles read with a lighter projection.
+
+        Articles that already have their content are left untouched, and all
+        missing bodies are fetched with a single query.
+
+        Args:
+            articles: Articles to complete (modified in place)
+
+        Returns:
+            The same list of articles, with content populated
+        """
+        pending = {a.guid: a for a in articles if not a.content_loaded}
+        if not pending:
+            return articles
+
+        placeholders = ",".join("?" * len(pending))
+        # nosec B608 - safe: placeholders only contains ? characters
+        query = (
+            "SELECT a.guid, b.content FROM articles a "
+            "JOIN article_bodies b ON b.id = a.body_ref "
+            f"WHERE a.guid IN ({placeholders})"
+        )
+
+        async with self._reader() as db:
+            cursor = await db.execute(query, list(pending))
+            rows = await cursor.fetchall()
+
+        for row in rows:
+            pending[row["guid"]].content = decompress_text(row["content"]) or ""
+        for article in pending.values():
+            article.content_loaded = True
+        return articles
+
+    async def save(self, article: Article) -> bool:
+        """
+        Save a single article to the database.
+
+        Args:
+            article: Article instance to save
+
+        Returns:
+            True if article was saved, False if duplicate (already exists)
+        """
+        try:
+            async with self._writer_conn() as db:
+                data = await self._to_row(db, article)
+                # A duplicate rolls the new body back together with the article
+                await self._assign_body_refs(db, [data])
+                cursor = await db.execute(
+                    """
+                    INSERT INTO articles (
+                        guid, title, url, pub_date, description,
+                        body_ref, image_url, author, categories, source_ref,
+                        created_at, locale_ref, canonical_url, minhash
+                    )
+                    VALUES (
+                        :guid, :title, :url, :pub_date, :description,
+                        :body_ref, :image_url, :author, :categories, :source_ref,
+                        :created_at, :locale_ref, :canonical_url, :minhash
+                    )
+                """,
+                    data,
+                )
+                article_id = cursor.lastrowid
+                if article_id is None:
+                    raise RuntimeError(f"No row id returned for article {data['guid']!r}")
+                await db.executemany(
+                    "INSERT OR IGNORE INTO article_categories (article_id, category, pub_date) "
+                    "VALUES (?, ?, ?)",
+                    self._category_rows(article_id, data["pub_date"], data["categories"]),
+                )
+                await self._assign_clusters(db, [(article_id, data["minhash"], data["pub_date"])])
                 await db.commit()
+                logger.info(f"Saved article: {article.title[:50]}...")
+                return True
+        except aiosqlite.IntegrityError:
+            logger.debug(f"Duplicate article skipped: {article.guid}")
+            return False
+
+    async def save_batch(self, articles: list[Article]) -> list[str]:
+        """
+        Save a batch of articles in a single transaction.
+
+        Rows are written with ``INSERT OR IGNORE`` via ``executemany`` so
+        duplicates (by GUID or URL) are skipped without aborting the batch,
+        and the whole batch costs one commit.
+
+        Args:
+            articles: List of Article instances to save
+
+        Returns:
+            GUIDs of the articles that were newly inserted, in insertion order
+        """
+        if not articles:
+            return []
+
+        async with self._writer_conn() as db:
+            # Interning new sources/locales commits, so serialize rows first
+            rows = [await self._to_row(db, article) for article in articles]
+
+            # Take SQLite's write lock before reading the high-water mark: no
+            # other connection or process (an import script, another node)
+            # can insert until commit, and AUTOINCREMENT ids are monotonic, so
+            # every row above the mark was inserted by this batch
+            await db.execute("BEGIN IMMEDIATE")
+            cursor = await db.execute("SELECT COALESCE(MAX(id), 0) FROM articles")
+            row = await cursor.fetchone()
+            high_water = int(row[0]) if row else 0
+            new_bodies = await self._assign_body_refs(db, rows)
+
+            await db.executemany(
+                """
+                INSERT OR IGNORE INTO articles (
+                    guid, title, url, pub_date, description,
+                    body_ref, image_url, author, categories, source_ref,
+                    created_at, locale_ref, canonical_url, minhash
+                )
+                VALUES (
+                    :guid, :title, :url, :pub_date, :description,
+                    :body_ref, :image_url, :author, :categories, :source_ref,
+                    :created_at, :locale_ref, :canonical_url, :minhash
+                )
+            """,
+                rows,
+            )
+
+            cursor = await db.execute(
+                "SELECT id, guid, pub_date, categories, minhash FROM articles "
+                "WHERE id > ? ORDER BY id",
+                (high_water,),
+            )
+            inserted = await cursor.fetchall()
+            new_guids = [r["guid"] for r in inserted]
+
+            await self._assign_clusters(
+                db, [(r["id"], r["minhash"], r["pub_date"]) for r in inserted]
+            )
+
+            if new_bodies:
+                # Drop bodies stored only for articles skipped as duplicates
+                placeholders = ",".join("?" * len(new_bodies))
+                # nosec B608 - safe: placeholders only contains ? characters
+                await db.execute(
+                    f"DELETE FROM article_bodies WHERE id IN ({placeholders}) "
+                    "AND NOT EXISTS (SELECT 1 FROM articles WHERE body_ref = article_bodies.id)",
+                    new_bodies,
+                )
+
+            await db.executemany(
+                "INSERT OR IGNORE INTO article_categories (article_id, category, pub_date) "
+                "VALUES (?, ?, ?)",
+                [
+                    entry
+                    for r in inserted
+                    for entry in self._category_rows(r["id"], r["pub_date"], r["categories"])
+                ],
+            )
+            await db.commit()
+
+        logger.debug(f"Saved batch: {len(new_guids)} new, {len(rows) - len(new_guids)} duplicates")
+        return new_guids
+
+    async def save_many(self, articles: list[Article]) -> int:
+        """
+        Save multiple articles to the database in one transaction.
+
+        Args:
+            articles: List of Article instances to save
+
+        Returns:
+            Count of new articles saved (excludes duplicates)
+        """
+        return len(await self.save_batch(articles))
+
+    async def get_page(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        source: str | None = None,
+        locale: str | None = None,
+        source_category: str | None = None,
+        projection: str = "full",
+    ) -> tuple[list[Article], str | None]:
+        """
+        Get one page of articles using keyset pagination on (pub_date, id).
+
+        Each page seeks directly past the previous page's last row via the
+        pub_date indexes, so deep pages cost the same as the first one.
+
+        Args:
+            limit: Maximum number of articles on the page
+            cursor: Cursor returned with the previous page (None = first page)
+            source: Optional source filter (e.g., "lol:en-us")
+            locale: Optional locale filter (e.g., "en-us", "it-it")
+            source_category: Optional source category filter
+            projection: Column projection ("full" or "summary" without content)
 
-            await db.commit()
-            logger.info(f"Database initialized at {self.db_path} (schema v{self.SCHEMA_VERSION})")
+        Returns:
+            Tuple of (articles newest first, cursor for the next page or None)
 
-    async def migrate_to_v2(self) -> None:
+        Raises:
+            ValueError: If the cursor is malformed or the projection is unknown
         """
-        Migrate database from v1 to v2 for multi-source, multi-locale support.
+        async with self._reader() as db:
+            lookup = await self._lookup_conditions(
+                db,
+                source=source,
+                source_category=source_category,
+                locales=[locale] if locale else None,
+            )
+            if lookup is None:
+                return [], None
+            conditions, params = lookup
+
+            if cursor:
+                # Seek past (pub_date, id) in index order: pub_date DESC, then id ASC
+                pub_date, article_id = decode_cursor(cursor)
+                conditions.append("pub_date <= ? AND (pub_date < ? OR id > ?)")
+                params.extend([pub_date, pub_date, article_id])
+
+            # Fetch one extra row to learn whether another page exists. Ties on
+            # pub_date are broken by ascending id, matching the index rowid order
+            # nosec B608 - safe: conditions only contain column names and ? placeholders
+            query = f"""
+                SELECT {self._select_columns(projection)} FROM article_view
+                WHERE {" AND ".join(conditions) or "1=1"}
+                ORDER BY pub_date DESC, id ASC LIMIT ?
+            """
+            result = await db.execute(query, [*params, limit + 1])
+            rows = list(await result.fetchall())
 
-        This method adds new columns for locale tracking, source categorization,
-        and deduplication across sources. Idempotent - can be run multiple times.
-        """
-        async with aiosqlite.connect(self.db_path) as db:
-            # Check if migration is needed
-            cursor = await db.execute("PRAGMA table_info(articles)")
-            columns = [row[1] for row in await cursor.fetchall()]
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit and page:
+            last = page[-1]
+            next_cursor = encode_cursor(last["pub_date"], last["id"])
 
-            # Add locale column if missing
-            if "locale" not in columns:
-                await db.execute(
-                    """
-                    ALTER TABLE articles ADD COLUMN locale TEXT DEFAULT 'en-us'
-                """
-                )
-                logger.info("Added locale column to articles table")
+        return [self._row_to_article(row, projection) for row in page], next_cursor
 
-            # Add source_category column if missing
-            if "source_category" not in columns:
-                await db.execute(
-                    """
-                    ALTER TABLE articles ADD COLUMN source_category TEXT
-                """
-                )
-                logger.info("Added source_category column to articles table")
+    async def _export_chunks(
+        self,
+        select: str,
+        chunk_size: int,
+        locale: str | None,
+        source: str | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> AsyncIterator[list[aiosqlite.Row]]:
+        """
+        Read filtered article_view rows in id order, one id range at a time.
 
-            # Add canonical_url column if missing
-            if "canonical_url" not in columns:
-                await db.execute(
-                    """
-                    ALTER TABLE articles ADD COLUMN canonical_url TEXT
-                """
-                )
-                logger.info("Added canonical_url column to articles table")
+        The id space present when the export starts is cut into ranges of
+        ``chunk_size`` ids. Each range is a short read of its own, so memory
+        stays constant and writers are never blocked for the length of an
+        export, and up to one range per pooled reader is read concurrently
+        (SQLite renders rows without holding the GIL). Articles inserted
+        after the export started are not included.
 
-            # Create new indexes
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_locale ON articles(locale)")
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_source_locale ON articles(source, locale)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_pub_date_locale ON articles(pub_date DESC, locale)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_source_category ON articles(source_category)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_canonical_url ON articles(canonical_url)"
-            )
+        Args:
+            select: Column list to select after the leading id column
+            chunk_size: Ids per range (the most rows a chunk can hold)
+            locale: Optional locale filter
+            source: Optional source filter
+            since: Only articles published at or after this time
+            until: Only articles published before this time
 
-            # Update schema version
-            await db.execute(
-                "INSERT OR REPLACE INTO schema_version (version) VALUES (?)", (self.SCHEMA_VERSION,)
+        Yields:
+            Non-empty lists of rows whose first column is the article id
+        """
+        async with self._reader() as db:
+            lookup = await self._lookup_conditions(
+                db, source=source, locales=[locale] if locale else None
             )
+            cursor = await db.execute("SELECT MIN(id), MAX(id) FROM articles")
+            bounds = await cursor.fetchone()
+        if lookup is None or bounds is None or bounds[0] is None:
+            return
+
+        conditions, params = lookup
+        if since is not None:
+            conditions.append("pub_date >= ?")
+            params.append(to_epoch_ms(since))
+        if until is not None:
+            conditions.append("pub_date < ?")
+            params.append(to_epoch_ms(until))
+        # nosec B608 - safe: select and conditions are built from constants
+        query = f"""
+            SELECT id, {select} FROM article_view
+            WHERE {" AND ".join(["id BETWEEN ? AND ?", *conditions])}
+            ORDER BY id
+        """
 
-            await db.commit()
-            logger.info("Database migrated to v2 (multi-source, multi-locale support)")
+        async def read(first_id: int) -> list[aiosqlite.Row]:
+            async with self._reader() as db:
+                cursor = await db.execute(query, [first_id, first_id + chunk_size - 1, *params])
+                return list(await cursor.fetchall())
 
-    async def save(self, article: Article) -> bool:
+        starts = iter(range(bounds[0], bounds[1] + 1, chunk_size))
+        pending = deque(
+            asyncio.create_task(read(first_id))
+            for first_id in islice(starts, max(1, len(self._readers)))
+        )
+        try:
+            while pending:
+                rows = await pending.popleft()
+                first_id = next(starts, None)
+                if first_id is not None:
+                    pending.append(asyncio.create_task(read(first_id)))
+                if rows:
+                    yield rows
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def export_rows(
+        self,
+        chunk_size: int = 5000,
+        locale: str | None = None,
+        source: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        include_content: bool = True,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
         """
-        Save a single article to the database.
+        Stream stored articles as plain rows, in chunks of ``chunk_size``.
 
         Args:
-            article: Article instance to save
+            chunk_size: Rows per chunk
+            locale: Optional locale filter (e.g., "en-us")
+            source: Optional source filter (e.g., "lol:en-us")
+            since: Only articles published at or after this time
+            until: Only articles published before this time
+            include_content: False to export an empty content column
 
-        Returns:
-            True if article was saved, False if duplicate (already exists)
+        Yields:
+            Lists of dicts keyed by EXPORT_COLUMNS, with decompressed text and
+            timestamps in epoch milliseconds, in id order
         """
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                data = article.to_dict()
-                await db.execute(
-                    """
-                    INSERT INTO articles (
-                        guid, title, url, pub_date, description,
-                        content, image_url, author, categories, source,
-                        created_at, locale, source_category, canonical_url
-                    )
-                    VALUES (
-                        :guid, :title, :url, :pub_date, :description,
-                        :content, :image_url, :author, :categories, :source,
-                        :created_at, :locale, :source_category, :canonical_url
-                    )
-                """,
-                    data,
-                )
-                await db.commit()
-                logger.info(f"Saved article: {article.title[:50]}...")
-                return True
-        except aiosqlite.IntegrityError:
-            logger.debug(f"Duplicate article skipped: {article.guid}")
-            return False
-
-    async def save_many(self, articles: list[Article]) -> int:
+        select = ", ".join(
+            column if include_content or column != "content" else "'' AS content"
+            for column in EXPORT_COLUMNS
+        )
+        async for rows in self._export_chunks(select, chunk_size, locale, source, since, until):
+            chunk = []
+            for row in rows:
+                data = dict(zip(EXPORT_COLUMNS, tuple(row)[1:], strict=True))
+                for column in COMPRESSIBLE_COLUMNS:
+                    if isinstance(data[column], bytes):
+                        data[column] = decompress_text(data[column])
+                chunk.append(data)
+            yield chunk
+
+    async def export_json_lines(
+        self,
+        chunk_size: int = 5000,
+        locale: str | None = None,
+        source: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        include_content: bool = True,
+    ) -> AsyncIterator[list[str]]:
         """
-        Save multiple articles to the database.
+        Stream stored articles as JSON objects rendered by SQLite.
+
+        Same rows as export_rows(), but each one is encoded by the json_object()
+        SQL function on the reader thread, which is several times faster than
+        encoding dicts in Python. Timestamps are ISO 8601 UTC strings with
+        millisecond precision.
 
         Args:
-            articles: List of Article instances to save
+            chunk_size: Rows per chunk
+            locale: Optional locale filter (e.g., "en-us")
+            source: Optional source filter (e.g., "lol:en-us")
+            since: Only articles published at or after this time
+            until: Only articles published before this time
+            include_content: False to export an empty content column
 
-        Returns:
-            Count of new articles saved (excludes duplicates)
+        Yields:
+            Lists of JSON object strings keyed by EXPORT_COLUMNS, in id order
         """
-        count = 0
-        for article in articles:
-            if await self.save(article):
-                count += 1
-        return count
+        fields = []
+        for column in EXPORT_COLUMNS:
+            if column in ("pub_date", "created_at"):
+                value = f"strftime('%Y-%m-%dT%H:%M:%f', {column} / 1000.0, 'unixepoch') || '+00:00'"
+            elif column == "content" and not include_content:
+                value = "''"
+            elif column in COMPRESSIBLE_COLUMNS:
+                # Only compressed BLOBs pay for the Python function call
+                value = (
+                    f"CASE WHEN typeof({column}) = 'blob' "
+                    f"THEN decompress_text({column}) ELSE {column} END"
+                )
+            else:
+                value = column
+            fields.append(f"'{column}', {value}")
+        select = f"json_object({', '.join(fields)})"
+
+        async for rows in self._export_chunks(select, chunk_size, locale, source, since, until):
+            yield [row[1] for row in rows]
 
     async def get_latest(
-        self, limit: int = 50, source: str | None = None, locale: str | None = None
+        self,
+        limit: int = 50,
+        source: str | None = None,
+        locale: str | None = None,
+        projection: str = "full",
     ) -> list[Article]:
         """
         Get latest articles, optionally filtered by source and/or locale.
@@ -249,36 +2106,41 @@ class ArticleRepository:
             limit: Maximum number of articles to return
             source: Optional source filter (e.g., "lol:en-us")
             locale: Optional locale filter (e.g., "en-us", "it-it")
+            projection: Column projection ("full" or "summary" without content)
 
         Returns:
             List of Article instances, ordered by publication date (newest first)
-        """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-
-            query = "SELECT * FROM articles WHERE 1=1"
-            params: list[Any] = []
 
-            if source:
-                query += " AND source = ?"
-                params.append(source)
-
-            if locale:
-                query += " AND locale = ?"
-                params.append(locale)
-
-            query += " ORDER BY pub_date DESC LIMIT ?"
-            params.append(limit)
-
-            cursor = await db.execute(query, params)
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        async with self._reader() as db:
+            lookup = await self._lookup_conditions(
+                db,
+                source=source,
+                locales=[locale] if locale else None,
+            )
+            if lookup is None:
+                return []
+            conditions, params = lookup
+
+            # nosec B608 - safe: conditions only contain column names and ? placeholders
+            query = f"""
+                SELECT {self._select_columns(projection)} FROM article_view
+                WHERE {" AND ".join(conditions) or "1=1"}
+                ORDER BY pub_date DESC LIMIT ?
+            """
+            cursor = await db.execute(query, [*params, limit])
             rows = await cursor.fetchall()
-            return [Article.from_dict(dict(row)) for row in rows]
+            return [self._row_to_article(row, projection) for row in rows]
 
     async def get_latest_by_locale(
         self,
         locale: str,
         limit: int = 50,
         source_category: str | None = None,
+        source_id: str | None = None,
+        projection: str = "full",
     ) -> list[Article]:
         """
         Get latest articles for a specific locale, optionally filtered by source category.
@@ -287,34 +2149,44 @@ class ArticleRepository:
             locale: Locale code (e.g., "en-us", "it-it")
             limit: Maximum number of articles to return
             source_category: Optional source category filter (e.g., "official_riot", "analytics")
+            source_id: Optional source identifier filter (e.g., "lol", "u-gg"),
+                served by the (source_ref, pub_date) index
+            projection: Column projection ("full" or "summary" without content)
 
         Returns:
             List of Article instances for the locale, ordered by publication date
-        """
-        query = """
-            SELECT * FROM articles
-            WHERE locale = ?
-        """
-        params: list[Any] = [locale]
-
-        if source_category:
-            query += " AND source_category = ?"
-            params.append(source_category)
 
-        query += " ORDER BY pub_date DESC LIMIT ?"
-        params.append(limit)
-
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(query, params)
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        async with self._reader() as db:
+            lookup = await self._lookup_conditions(
+                db,
+                source_id=source_id,
+                source_locale=locale if source_id else None,
+                source_category=source_category,
+                locales=[locale],
+            )
+            if lookup is None:
+                return []
+            conditions, params = lookup
+
+            # nosec B608 - safe: conditions only contain column names and ? placeholders
+            query = f"""
+                SELECT {self._select_columns(projection)} FROM article_view
+                WHERE {" AND ".join(conditions) or "1=1"}
+                ORDER BY pub_date DESC LIMIT ?
+            """
+            cursor = await db.execute(query, [*params, limit])
             rows = await cursor.fetchall()
-            return [Article.from_dict(dict(row)) for row in rows]
+            return [self._row_to_article(row, projection) for row in rows]
 
     async def get_by_locale_group(
         self,
         locale_group: list[str],
         limit: int = 50,
         source_category: str | None = None,
+        projection: str = "full",
     ) -> list[Article]:
         """
         Get latest articles for a group of locales.
@@ -323,36 +2195,40 @@ class ArticleRepository:
             locale_group: List of locale codes (e.g., ["en-us", "en-gb"])
             limit: Maximum number of articles to return
             source_category: Optional source category filter
+            projection: Column projection ("full" or "summary" without content)
 
         Returns:
             List of Article instances for the locale group
-        """
-        placeholders = ",".join("?" * len(locale_group))
-        # nosec B608 - safe: placeholders only contains ? characters
-        query = f"""
-            SELECT * FROM articles
-            WHERE locale IN ({placeholders})
-        """
-        params: list[Any] = list(locale_group)
-
-        if source_category:
-            query += " AND source_category = ?"
-            params.append(source_category)
-
-        query += " ORDER BY pub_date DESC LIMIT ?"
-        params.append(limit)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(query, params)
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        async with self._reader() as db:
+            lookup = await self._lookup_conditions(
+                db,
+                source_category=source_category,
+                locales=locale_group,
+            )
+            if lookup is None:
+                return []
+            conditions, params = lookup
+
+            # nosec B608 - safe: conditions only contain column names and ? placeholders
+            query = f"""
+                SELECT {self._select_columns(projection)} FROM article_view
+                WHERE {" AND ".join(conditions) or "1=1"}
+                ORDER BY pub_date DESC LIMIT ?
+            """
+            cursor = await db.execute(query, [*params, limit])
             rows = await cursor.fetchall()
-            return [Article.from_dict(dict(row)) for row in rows]
+            return [self._row_to_article(row, projection) for row in rows]
 
     async def get_by_source_category(
         self,
         source_category: str,
         locale: str | None = None,
         limit: int = 50,
+        projection: str = "full",
     ) -> list[Article]:
         """
         Get latest articles by source category.
@@ -361,28 +2237,151 @@ class ArticleRepository:
             source_category: Category to filter by (e.g., "official_riot", "analytics")
             locale: Optional locale filter
             limit: Maximum number of articles to return
+            projection: Column projection ("full" or "summary" without content)
 
         Returns:
             List of Article instances matching the category
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        async with self._reader() as db:
+            lookup = await self._lookup_conditions(
+                db,
+                source_category=source_category,
+                locales=[locale] if locale else None,
+            )
+            if lookup is None:
+                return []
+            conditions, params = lookup
+
+            # nosec B608 - safe: conditions only contain column names and ? placeholders
+            query = f"""
+                SELECT {self._select_columns(projection)} FROM article_view
+                WHERE {" AND ".join(conditions) or "1=1"}
+                ORDER BY pub_date DESC LIMIT ?
+            """
+            cursor = await db.execute(query, [*params, limit])
+            rows = await cursor.fetchall()
+            return [self._row_to_article(row, projection) for row in rows]
+
+    async def get_by_category(
+        self,
+        category: str,
+        limit: int = 50,
+        source: str | None = None,
+        locale: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles tagged with a category.
+
+        Reads the (category, pub_date) index on article_categories, so rare
+        categories return full feeds without scanning unrelated articles.
+
+        Args:
+            category: Article category (e.g., "Game Updates", "Dev")
+            limit: Maximum number of articles to return
+            source: Optional source filter (e.g., "lol:en-us")
+            locale: Optional locale filter (e.g., "en-us", "it-it")
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances in the category, ordered by publication date
+
+        Raises:
+            ValueError: If the projection is unknown
         """
-        query = """
-            SELECT * FROM articles
-            WHERE source_category = ?
+        async with self._reader() as db:
+            lookup = await self._lookup_conditions(
+                db,
+                alias="a",
+                source=source,
+                locales=[locale] if locale else None,
+            )
+            if lookup is None:
+                return []
+            conditions, params = lookup
+
+            # nosec B608 - safe: conditions only contain column names and ? placeholders
+            query = f"""
+                SELECT {self._select_columns(projection, "a")} FROM article_categories c
+                JOIN article_view a ON a.id = c.article_id
+                WHERE {" AND ".join(["c.category = ?", *conditions])}
+                ORDER BY c.pub_date DESC LIMIT ?
+            """
+            cursor = await db.execute(query, [category, *params, limit])
+            rows = await cursor.fetchall()
+            return [self._row_to_article(row, projection) for row in rows]
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 50,
+        locale: str | None = None,
+        source: str | None = None,
+        source_category: str | None = None,
+        category: str | None = None,
+        projection: str = "summary",
+    ) -> list[Article]:
         """
-        params: list[Any] = [source_category]
+        Full-text search over article titles and descriptions.
+
+        Results are ranked by BM25 (title matches weigh more than
+        description matches), best match first.
+
+        Args:
+            query: Free-form search text; every word must match, the last as a prefix
+            limit: Maximum number of articles to return
+            locale: Optional locale filter (e.g., "en-us")
+            source: Optional source filter (e.g., "lol:en-us")
+            source_category: Optional source category filter (e.g., "analytics")
+            category: Optional article category filter (e.g., "Dev")
+            projection: Column projection ("summary" without content, or "full")
 
-        if locale:
-            query += " AND locale = ?"
-            params.append(locale)
+        Returns:
+            Matching Article instances, best match first
 
-        query += " ORDER BY pub_date DESC LIMIT ?"
-        params.append(limit)
+        Raises:
+            ValueError: If the query has no searchable terms or the projection is unknown
+        """
+        match = fts_query(query)
+        columns = self._select_columns(projection, "a")
+
+        async with self._reader() as db:
+            lookup = await self._lookup_conditions(
+                db,
+                alias="a",
+                source=source,
+                source_category=source_category,
+                locales=[locale] if locale else None,
+            )
+            if lookup is None:
+                return []
+            conditions, params = lookup
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(query, params)
+            if category:
+                conditions.append(
+                    "a.id IN (SELECT article_id FROM article_categories WHERE category = ?)"
+                )
+                params.append(category)
+
+            # Rank on the FTS table (joined to the integer filter columns only)
+            # and read the wide row columns for the top ``limit`` hits alone
+            join = "JOIN articles a ON a.id = f.rowid" if conditions else ""
+            # nosec B608 - safe: conditions only contain column names and ? placeholders
+            sql = f"""
+                SELECT {columns} FROM (
+                    SELECT f.rowid AS id, f.rank AS rank FROM articles_fts f {join}
+                    WHERE {" AND ".join(["articles_fts MATCH ?", *conditions])}
+                    ORDER BY f.rank LIMIT ?
+                ) hits
+                JOIN article_view a ON a.id = hits.id
+                ORDER BY hits.rank
+            """
+            cursor = await db.execute(sql, [match, *params, limit])
             rows = await cursor.fetchall()
-            return [Article.from_dict(dict(row)) for row in rows]
+            return [self._row_to_article(row, projection) for row in rows]
 
     async def get_by_guid(self, guid: str) -> Article | None:
         """
@@ -394,11 +2393,10 @@ class ArticleRepository:
         Returns:
             Article instance if found, None otherwise
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT * FROM articles WHERE guid = ?", (guid,))
+        async with self._reader() as db:
+            cursor = await db.execute("SELECT * FROM article_view WHERE guid = ?", (guid,))
             row = await cursor.fetchone()
-            return Article.from_dict(dict(row)) if row else None
+            return self._row_to_article(row, "full") if row else None
 
     async def get_by_canonical_url(self, canonical_url: str) -> Article | None:
         """
@@ -410,31 +2408,40 @@ class ArticleRepository:
         Returns:
             Article instance if found, None otherwise
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._reader() as db:
             cursor = await db.execute(
-                "SELECT * FROM articles WHERE canonical_url = ?", (canonical_url,)
+                "SELECT * FROM article_view WHERE canonical_url = ?", (canonical_url,)
             )
             row = await cursor.fetchone()
-            return Article.from_dict(dict(row)) if row else None
+            return self._row_to_article(row, "full") if row else None
 
     async def count(self, locale: str | None = None) -> int:
         """
         Get total count of articles in database, optionally filtered by locale.
 
+        Reads the trigger-maintained ``article_stats`` table, so the cost does
+        not grow with the number of articles.
+
         Args:
             locale: Optional locale filter
 
         Returns:
             Total number of articles stored
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._reader() as db:
             if locale:
+                refs = await self._match_locales(db, [locale])
+                if not refs:
+                    return 0
                 cursor = await db.execute(
-                    "SELECT COUNT(*) FROM articles WHERE locale = ?", (locale,)
+                    "SELECT COALESCE(SUM(article_count), 0) FROM article_stats "
+                    "WHERE locale_ref = ?",
+                    (refs[0],),
                 )
             else:
-                cursor = await db.execute("SELECT COUNT(*) FROM articles")
+                cursor = await db.execute(
+                    "SELECT COALESCE(SUM(article_count), 0) FROM article_stats"
+                )
             row = await cursor.fetchone()
             return int(row[0]) if row else 0
 
@@ -445,8 +2452,12 @@ class ArticleRepository:
         Returns:
             List of locale codes
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("SELECT DISTINCT locale FROM articles ORDER BY locale")
+        async with self._reader() as db:
+            # article_stats only keeps pairs that still have articles
+            cursor = await db.execute(
+                "SELECT DISTINCT l.code FROM article_stats st "
+                "JOIN locales l ON l.id = st.locale_ref ORDER BY l.code"
+            )
             rows = await cursor.fetchall()
             return [row[0] for row in rows if row[0]]
 
@@ -457,16 +2468,51 @@ class ArticleRepository:
         Returns:
             List of source category names
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._reader() as db:
             cursor = await db.execute(
-                "SELECT DISTINCT source_category FROM articles WHERE source_category IS NOT NULL ORDER BY source_category"
+                "SELECT DISTINCT s.source_category FROM article_stats st "
+                "JOIN sources s ON s.id = st.source_ref "
+                "WHERE s.source_category != '' ORDER BY s.source_category"
             )
             rows = await cursor.fetchall()
             return [row[0] for row in rows if row[0]]
 
+    async def get_article_stats(self) -> list[dict[str, Any]]:
+        """
+        Get article counts per source and locale.
+
+        Returns:
+            List of dicts with source_id, locale, source_category, count,
+            last_pub_date and last_write_at (datetimes, or None), ordered by
+            source_id and locale
+        """
+        async with self._reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT s.source_id, l.code, NULLIF(s.source_category, ''),
+                    st.article_count, st.max_pub_date, st.last_write_at
+                FROM article_stats st
+                JOIN sources s ON s.id = st.source_ref
+                JOIN locales l ON l.id = st.locale_ref
+                ORDER BY s.source_id, l.code
+            """
+            )
+            rows = await cursor.fetchall()
+            return [
+                {
+                    "source_id": row[0],
+                    "locale": row[1],
+                    "source_category": row[2],
+                    "count": int(row[3]),
+                    "last_pub_date": from_epoch_ms(int(row[4])) if row[4] is not None else None,
+                    "last_write_at": from_epoch_ms(int(row[5])) if row[5] is not None else None,
+                }
+                for row in rows
+            ]
+
     async def execute(self, sql: str, params: tuple[Any, ...] = ()) -> aiosqlite.Cursor:
         """
-        Execute a raw SQL statement.
+        Execute a raw SQL statement on the writer and commit it.
 
         Args:
             sql: SQL statement to execute
@@ -475,8 +2521,10 @@ class ArticleRepository:
         Returns:
             aiosqlite cursor
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            return await db.execute(sql, params)
+        async with self._writer_conn() as db:
+            cursor = await db.execute(sql, params)
+            await db.commit()
+            return cursor
 
     async def fetch_all(self, sql: str, params: tuple[Any, ...] = ()) -> list[Any]:
         """
@@ -489,42 +2537,474 @@ class ArticleRepository:
         Returns:
             List of result rows
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._reader() as db:
             cursor = await db.execute(sql, params)
             rows = await cursor.fetchall()
             return list(rows)
 
+    async def apply_retention(
+        self,
+        policies: list[RetentionPolicy],
+        archive_path: str | None = None,
+        now: datetime | None = None,
+        batch_size: int = 500,
+    ) -> dict[str, int]:
+        """
+        Remove articles that fall outside the retention policies.
+
+        Expired ids are collected on a reader, then removed in batches of
+        ``batch_size`` per write transaction so ingestion is not blocked for
+        the whole run. With ``archive_path`` the rows are first copied into
+        that SQLite file (table ``articles``) instead of being dropped.
+
+        Args:
+            policies: Retention policies; an article expired by any policy is removed
+            archive_path: Optional archive database file for expired rows
+            now: Reference time for max_age_days (defaults to current UTC time)
+            batch_size: Maximum number of articles removed per transaction
+
+        Returns:
+            Dictionary with "deleted" and "archived" row counts
+        """
+        now_ms = to_epoch_ms(now or datetime.now(timezone.utc))
+        expired: set[int] = set()
+
+        async with self._reader() as db:
+            for policy in policies:
+                lookup = await self._lookup_conditions(
+                    db,
+                    source_category=policy.source_category,
+                    locales=[policy.locale] if policy.locale else None,
+                )
+                if lookup is None:
+                    continue
+                conditions, params = lookup
+                scope = " AND ".join(conditions) or "1=1"
+
+                if policy.max_age_days is not None:
+                    # nosec B608 - safe: scope only contains column names and ? placeholders
+                    cursor = await db.execute(
+                        f"SELECT id FROM articles WHERE {scope} AND pub_date < ?",
+                        [*params, now_ms - policy.max_age_days * MS_PER_DAY],
+                    )
+                    expired.update(row[0] for row in await cursor.fetchall())
+
+                if policy.max_count is not None:
+                    # Everything past the newest max_count rows of the scope
+                    # nosec B608 - safe: scope only contains column names and ? placeholders
+                    cursor = await db.execute(
+                        f"SELECT id FROM articles WHERE {scope} "
+                        "ORDER BY pub_date DESC, id ASC LIMIT -1 OFFSET ?",
+                        [*params, policy.max_count],
+                    )
+                    expired.update(row[0] for row in await cursor.fetchall())
+
+        ids = sorted(expired)
+        for start in range(0, len(ids), batch_size):
+            await self._remove_articles(ids[start : start + batch_size], archive_path)
+
+        removed = len(ids)
+        if removed:
+            action = f"archived to {archive_path}" if archive_path else "deleted"
+            logger.info(f"Retention: {removed} articles {action}")
+        if archive_path:
+            return {"deleted": 0, "archived": removed}
+        return {"deleted": removed, "archived": 0}
+
+    async def _remove_articles(self, ids: list[int], archive_path: str | None) -> None:
+        """
+        Delete articles in one transaction, optionally archiving them first.
+
+        Args:
+            ids: Row ids of the articles to remove
+            archive_path: Optional archive database file
+        """
+        placeholders = ",".join("?" * len(ids))
+        async with self._writer_conn() as db:
+            if archive_path:
+                await db.execute("ATTACH DATABASE ? AS archive", (archive_path,))
+            try:
+                await db.execute("BEGIN IMMEDIATE")
+                if archive_path:
+                    await self._copy_to_archive(db, placeholders, ids)
+                # nosec B608 - safe: placeholders only contains ? characters
+                await db.execute(f"DELETE FROM articles WHERE id IN ({placeholders})", ids)
+                await db.commit()
+            except BaseException:
+                # DETACH is refused while the transaction is still open
+                await db.rollback()
+                raise
+            finally:
+                if archive_path:
+                    await db.execute("DETACH DATABASE archive")
+
+    @staticmethod
+    async def _copy_to_archive(db: aiosqlite.Connection, placeholders: str, ids: list[int]) -> None:
+        """
+        Copy articles into the attached archive database.
+
+        Args:
+            db: Writer connection with the archive attached as ``archive``
+            placeholders: Placeholder list matching ``ids``
+            ids: Row ids of the articles to copy
+        """
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS archive.articles (
+                id INTEGER PRIMARY KEY,
+                guid TEXT UNIQUE NOT NULL,
+                title TEXT NOT NULL,
+                url TEXT NOT NULL,
+                pub_date INTEGER NOT NULL,
+                description TEXT,
+                content TEXT,
+                image_url TEXT,
+                author TEXT,
+                categories TEXT,
+                source TEXT NOT NULL,
+                created_at INTEGER,
+                locale TEXT,
+                source_category TEXT,
+                canonical_url TEXT,
+                source_id TEXT,
+                archived_at INTEGER NOT NULL
+            )
+        """
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS archive.idx_pub_date ON articles(pub_date DESC)"
+        )
+        columns = ", ".join(ARCHIVE_COLUMNS)
+        # Archived text is stored decoded so the archive needs no codec to read
+        values = ", ".join(
+            f"decompress_text({column})" if column in COMPRESSIBLE_COLUMNS else column
+            for column in ARCHIVE_COLUMNS
+        )
+        # nosec B608 - safe: columns are constants, placeholders only contains ? characters
+        await db.execute(
+            f"INSERT OR IGNORE INTO archive.articles ({columns}, archived_at) "
+            f"SELECT {values}, ? FROM article_view WHERE id IN ({placeholders})",
+            [to_epoch_ms(datetime.now(timezone.utc)), *ids],
+        )
+
+    async def recompress_stored_text(self, batch_size: int = 500) -> int:
+        """
+        Rewrite stored article text to match the repository codec.
+
+        With a codec set, long TEXT bodies (and descriptions, if enabled)
+        are compressed in place; with ``compression="none"`` compressed
+        values are decoded back to TEXT. Rows are walked in id order and
+        rewritten ``batch_size`` per write transaction so ingestion keeps
+        running between batches. Pages freed by the smaller rows are
+        returned by run_maintenance().
+
+        A completed pass records the codec in ``storage_meta``. Rows this
+        repository writes already use that codec, so later calls return
+        immediately until the compression settings change.
+
+        Args:
+            batch_size: Maximum number of rows rewritten per transaction
+
+        Returns:
+            Number of rows rewritten
+        """
+        codec = self.stored_text_codec
+        async with self._reader() as db:
+            cursor = await db.execute("SELECT value FROM storage_meta WHERE key = 'text_codec'")
+            row = await cursor.fetchone()
+        if row is not None and row[0] == codec:
+            logger.debug(f"Stored text already uses codec {codec}, skipping the scan")
+            return 0
+
+        targets = [("article_bodies", "content")]
+        if self.compress_description or self.compression == "none":
+            targets.append(("articles", "description"))
+
+        rewritten = 0
+        for table, column in targets:
+            rewritten += await self._recompress_column(table, column, batch_size)
+
+        async with self._writer_conn() as db:
+            await db.execute(
+                "INSERT OR REPLACE INTO storage_meta (key, value) VALUES ('text_codec', ?)",
+                (codec,),
+            )
+            await db.commit()
+
+        if rewritten:
+            logger.info(f"Rewrote {rewritten} stored text values (codec {self.compression})")
+        return rewritten
+
+    @property
+    def stored_text_codec(self) -> str:
+        """Codec recorded in storage_meta once all stored text matches the settings."""
+        if self.compress_description and self.compression != "none":
+            return f"{self.compression}+description"
+        return self.compression
+
+    async def _recompress_column(self, table: str, column: str, batch_size: int) -> int:
+        """
+        Re-encode one text column in batches of ``batch_size`` rows.
+
+        Args:
+            table: Table holding the column
+            column: Column to re-encode
+            batch_size: Maximum number of rows rewritten per transaction
+
+        Returns:
+            Number of rows rewritten
+        """
+        stored_type = "blob" if self.compression == "none" else "text"
+        rewritten = 0
+        last_id = 0
+        while True:
+            async with self._reader() as db:
+                # nosec B608 - safe: table and column names are constants
+                cursor = await db.execute(
+                    f"SELECT id, {column} FROM {table} "
+                    f"WHERE id > ? AND typeof({column}) = ? ORDER BY id LIMIT ?",
+                    (last_id, stored_type, batch_size),
+                )
+                rows = list(await cursor.fetchall())
+            if not rows:
+                return rewritten
+            last_id = rows[-1][0]
+
+            updates = []
+            for row_id, stored in rows:
+                encoded = compress_text(decompress_text(stored), self.compression)
+                if encoded != stored:
+                    updates.append((encoded, row_id))
+            if not updates:
+                continue
+
+            async with self._writer_conn() as db:
+                # nosec B608 - safe: table and column names are constants
+                await db.executemany(f"UPDATE {table} SET {column} = ? WHERE id = ?", updates)
+                await db.commit()
+            rewritten += len(updates)
+
+    async def run_maintenance(
+        self, vacuum_pages: int = 0, convert_auto_vacuum: bool = False
+    ) -> dict[str, int]:
+        """
+        Return free pages to the filesystem and refresh planner statistics.
+
+        Runs ``PRAGMA incremental_vacuum`` followed by a bounded ``ANALYZE``
+        and a WAL checkpoint so the main file actually shrinks. Databases
+        created before auto_vacuum was enabled can only be converted by a
+        full VACUUM, which rewrites the whole file while holding the writer;
+        that only happens when ``convert_auto_vacuum`` is set (see
+        scripts/maintain_database.py), otherwise their vacuum step is skipped.
+
+        Args:
+            vacuum_pages: Maximum free pages to release (0 releases all of them)
+            convert_auto_vacuum: Convert a database without incremental
+                auto_vacuum with a full VACUUM
+
+        Returns:
+            Dictionary with page_size, page counts before/after, remaining
+            freelist pages and bytes_reclaimed
+        """
+        async with self._writer_conn() as db:
+            page_size = await self._pragma_int(db, "page_size")
+            pages_before = await self._pragma_int(db, "page_count")
+
+            if await self._pragma_int(db, "auto_vacuum") != 2:
+                if convert_auto_vacuum:
+                    # auto_vacuum can only be switched on by rebuilding the file
+                    logger.info("Converting database to incremental auto_vacuum (full VACUUM)")
+                    await db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                    await db.execute("VACUUM")
+                else:
+                    logger.info(
+                        "Incremental auto_vacuum is off, skipping the vacuum step; run "
+                        "scripts/maintain_database.py --convert-auto-vacuum to enable it"
+                    )
+            else:
+                cursor = await db.execute(f"PRAGMA incremental_vacuum({int(vacuum_pages)})")
+                await cursor.fetchall()
+
+            # Sample at most ~1000 rows per index so ANALYZE stays cheap on big tables
+            await db.execute("PRAGMA analysis_limit=1000")
+            await db.execute("ANALYZE")
+            await db.commit()
+
+            cursor = await db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            await cursor.fetchall()
+
+            pages_after = await self._pragma_int(db, "page_count")
+            freelist = await self._pragma_int(db, "freelist_count")
+
+        stats = {
+            "page_size": page_size,
+            "pages_before": pages_before,
+            "pages_after": pages_after,
+            "freelist_pages": freelist,
+            "bytes_reclaimed": max(0, pages_before - pages_after) * page_size,
+        }
+        logger.info(f"Database maintenance reclaimed {stats['bytes_reclaimed']} bytes")
+        return stats
+
+    async def backup(
+        self, backup_dir: str, keep: int = 7, pages_per_step: int = 1024
+    ) -> dict[str, Any]:
+        """
+        Write a consistent snapshot of the database with the online backup API.
+
+        The copy runs ``pages_per_step`` pages at a time on a dedicated
+        connection's worker thread, sleeping briefly between steps, so the
+        event loop, the reader pool and the writer keep serving while it
+        runs. That connection holds one read transaction for the whole copy:
+        under WAL this pins a single snapshot, so commits made meanwhile
+        neither block on the backup nor force it to restart. The file is
+        written under a temporary name and renamed once complete, then all
+        but the newest ``keep`` snapshots are removed.
+
+        A private ``:memory:`` database is only reachable through the writer
+        connection, which also serves its reads, so there the backup holds
+        the writer from the first page to the last: every write and read
+        waits for the whole copy. The copy cannot be released between steps
+        either, because any write to an in-memory source restarts it.
+
+        Args:
+            backup_dir: Directory receiving the snapshots (created if missing)
+            keep: Number of snapshots to retain, newest first
+            pages_per_step: Database pages copied per backup step
+
+        Returns:
+            Dictionary with the snapshot path, pages, bytes, duration_ms and
+            the number of old snapshots removed
+
+        Raises:
+            ValueError: If keep or pages_per_step is not positive
+        """
+        if keep < 1 or pages_per_step < 1:
+            raise ValueError("keep and pages_per_step must be positive")
+
+        directory = Path(backup_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = "memory" if self.is_memory else Path(self.db_path).stem
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        path = directory / f"{stem}-{stamp}.db"
+        partial = path.with_name(f"{path.name}.partial")
+
+        progress: dict[str, int] = {"pages": 0}
+
+        def on_progress(status: int, remaining: int, total: int) -> None:
+            progress["pages"] = total
+
+        started = time.perf_counter()
+        # The target is only touched from worker threads, never the event loop
+        target = await asyncio.to_thread(sqlite3.connect, partial, check_same_thread=False)
+        try:
+            if self.is_memory:
+                # A private in-memory database is only reachable via the writer
+                async with self._writer_conn() as db:
+                    await db.backup(
+                        target, pages=pages_per_step, progress=on_progress, sleep=0.001
+                    )
+            else:
+                async with aiosqlite.connect(self.db_path) as db:
+                    await db.execute("PRAGMA busy_timeout=5000")
+                    await db.execute("BEGIN")
+                    await db.execute("SELECT COUNT(*) FROM schema_version")
+                    await db.backup(
+                        target, pages=pages_per_step, progress=on_progress, sleep=0.001
+                    )
+                    await db.rollback()
+        except BaseException:
+            await asyncio.to_thread(target.close)
+            partial.unlink(missing_ok=True)
+            raise
+        # The copied header says WAL; make the snapshot a self-contained file
+        await asyncio.to_thread(self._finish_snapshot, target)
+        partial.replace(path)
+
+        snapshots = sorted(directory.glob(f"{stem}-*.db"), reverse=True)
+        for old in snapshots[keep:]:
+            old.unlink(missing_ok=True)
+
+        stats = {
+            "path": str(path),
+            "pages": progress["pages"],
+            "bytes": path.stat().st_size,
+            "duration_ms": round((time.perf_counter() - started) * 1000),
+            "removed": len(snapshots[keep:]),
+        }
+        logger.info(
+            f"Database backup written to {path} "
+            f"({stats['bytes']} bytes in {stats['duration_ms']} ms)"
+        )
+        return stats
+
+    @staticmethod
+    def _finish_snapshot(target: sqlite3.Connection) -> None:
+        """
+        Switch a finished snapshot to rollback journaling and close it.
+
+        Args:
+            target: Connection to the snapshot file
+        """
+        try:
+            target.execute("PRAGMA journal_mode=DELETE").fetchall()
+        finally:
+            target.close()
+
+    @staticmethod
+    async def _pragma_int(db: aiosqlite.Connection, name: str) -> int:
+        """
+        Read an integer-valued pragma.
+
+        Args:
+            db: Connection to read from
+            name: Pragma name (e.g., "page_count")
+
+        Returns:
+            Pragma value
+        """
+        cursor = await db.execute(f"PRAGMA {name}")
+        row = await cursor.fetchone()
+        return int(row[0]) if row else 0
+
     async def close(self) -> None:
         """
-        Close database connections.
+        Close all pooled database connections.
 
-        This method is called during application shutdown.
-        Since we use context managers for all DB operations,
-        no explicit cleanup is needed.
+        This method is called during application shutdown. The repository
+        can be re-opened afterwards by calling initialize() again.
         """
+        async with self._write_lock:
+            connections = list(self._readers)
+            if self._writer is not None:
+                connections.append(self._writer)
+
+            self._writer = None
+            self._readers = []
+            self._idle_readers = asyncio.Queue()
+            self._sources = {}
+            self._source_refs = {}
+            self._locale_refs = {}
+
+            for db in connections:
+                await db.close()
+
         logger.info("Database repository closed")
 
     async def get_last_write_timestamp(self) -> datetime | None:
         """
         Get the timestamp of the most recent article write.
 
-        Queries the database for the latest publication date, which
+        Reads the newest publication date from ``article_stats``, which
         represents the most recent article stored.
 
         Returns:
             Datetime of most recent article, or None if database is empty
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("SELECT MAX(pub_date) as last_date FROM articles")
+        async with self._reader() as db:
+            cursor = await db.execute("SELECT MAX(max_pub_date) FROM article_stats")
             row = await cursor.fetchone()
-            if row and row[0]:
-                # Parse ISO string back to datetime
-                last_date_str = row[0]
-                try:
-                    # SQLite returns ISO format strings
-                    return datetime.fromisoformat(last_date_str.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    logger.warning(f"Could not parse timestamp: {last_date_str}")
-                    return None
+            if row and row[0] is not None:
+                # pub_date is stored as epoch milliseconds
+                return from_epoch_ms(int(row[0]))
             return None
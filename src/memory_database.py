@@ -0,0 +1,814 @@
+"""
+In-memory article repository with the same semantics as the SQLite engine.
+
+InMemoryArticleRepository implements the Repository protocol on plain
+Python structures: one row dict per article plus sorted (pub_date DESC,
+id ASC) indexes per locale, source, source identifier, source category and
+article category. It performs no I/O, so it isolates feed rendering and
+the update pipeline in benchmarks, and it backs the conformance suite
+that every engine must pass. Data lives only as long as the instance.
+"""
+
+import heapq
+import logging
+import math
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from src.database import (
+    CLUSTER_WINDOW_DAYS,
+    FTS_MIN_PREFIX,
+    FTS_TERM_PATTERN,
+    MS_PER_DAY,
+    PROJECTIONS,
+    decode_cursor,
+    encode_cursor,
+    fts_query,
+)
+from src.models import Article, from_epoch_ms, to_epoch_ms
+from src.utils.minhash import SIMILARITY_THRESHOLD, lsh_keys, minhash, similarity
+
+logger = logging.getLogger(__name__)
+
+# Index key of an article: newest first, ties broken by ascending id
+IndexKey = tuple[int, int]
+
+# Tokens as split by the FTS5 unicode61 tokenizer (underscore separates words)
+SEARCH_TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+# FTS5 bm25() parameters and the column weights set by the v6 migration
+BM25_K1 = 1.2
+BM25_B = 0.75
+SEARCH_WEIGHTS: tuple[float, float] = (10.0, 1.0)
+
+
+def search_tokens(text: str | None) -> list[str]:
+    """
+    Split text into search tokens the way the FTS5 index does.
+
+    Tokens are lower-cased with diacritics removed, as with the
+    ``unicode61 remove_diacritics 2`` tokenizer.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in text order
+    """
+    if not text:
+        return []
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return SEARCH_TOKEN_PATTERN.findall(stripped)
+
+
+class InMemoryArticleRepository:
+    """
+    Repository engine keeping every article in process memory.
+
+    Attributes:
+        db_path: Always ":memory:" (kept for status reporting)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty in-memory repository."""
+        self.db_path = ":memory:"
+        self._rows: dict[int, dict[str, Any]] = {}
+        self._next_id = 1
+        self._guids: dict[str, int] = {}
+        self._urls: dict[str, int] = {}
+        self._canonical: dict[str, int] = {}
+        self._all: list[IndexKey] = []
+        # (column, value) -> sorted index keys of the matching articles
+        self._indexes: dict[tuple[str, str], list[IndexKey]] = {}
+        self._lsh: dict[int, list[int]] = {}
+        # (source_id, source, source_category, locale) -> [count, max_pub_date, last_write_at]
+        self._stats: dict[tuple[str, str, str, str], list[int]] = {}
+        # Full-text index: token -> {id: (title_tf, description_tf)}
+        self._postings: dict[str, dict[int, tuple[int, int]]] = {}
+        self._vocabulary: list[str] = []
+        self._lengths: dict[int, int] = {}
+        self._total_length = 0
+
+    @property
+    def is_memory(self) -> bool:
+        """Whether the repository is backed by an in-memory database."""
+        return True
+
+    async def initialize(self) -> None:
+        """Prepare the repository for use (nothing to set up)."""
+        logger.info("In-memory article repository initialized")
+
+    async def close(self) -> None:
+        """Close the repository. Stored articles are kept until it is dropped."""
+        logger.info("In-memory article repository closed")
+
+    def _to_row(self, article: Article) -> dict[str, Any]:
+        """
+        Serialize an article the way the SQLite engine stores it.
+
+        Args:
+            article: Article to serialize
+
+        Returns:
+            Article.to_dict() with epoch timestamps and the source filter columns
+        """
+        data = article.to_dict()
+        data["pub_date"] = to_epoch_ms(article.pub_date)
+        data["created_at"] = to_epoch_ms(article.created_at)
+        data["content"] = article.content or ""
+        data["source_id"] = article.source.source_id
+        data["source_locale"] = article.source.locale
+        data["source_category"] = data["source_category"] or None
+        data["minhash"] = minhash(f"{article.title} {article.description or ''}")
+        return data
+
+    def _insert(self, article: Article) -> int | None:
+        """
+        Store an article and update every index.
+
+        Args:
+            article: Article to store
+
+        Returns:
+            Id of the new article, or None if its GUID or URL already exists
+        """
+        if article.guid in self._guids or article.url in self._urls:
+            return None
+
+        row = self._to_row(article)
+        article_id = row["id"] = self._next_id
+        self._next_id += 1
+        row["cluster_id"] = self._cluster_for(article_id, row["minhash"], row["pub_date"])
+
+        self._rows[article_id] = row
+        self._guids[row["guid"]] = article_id
+        self._urls[row["url"]] = article_id
+        if row["canonical_url"]:
+            self._canonical.setdefault(row["canonical_url"], article_id)
+
+        key = (-row["pub_date"], article_id)
+        insort(self._all, key)
+        categories = dict.fromkeys(name for name in row["categories"].split(",") if name)
+        for column, value in (
+            ("locale", row["locale"]),
+            ("source", row["source"]),
+            ("source_id", row["source_id"]),
+            ("source_category", row["source_category"]),
+            *(("category", name) for name in categories),
+        ):
+            if value:
+                insort(self._indexes.setdefault((column, value), []), key)
+
+        stats_key = (row["source_id"], row["source"], row["source_category"] or "", row["locale"])
+        stats = self._stats.setdefault(stats_key, [0, row["pub_date"], row["created_at"]])
+        stats[0] += 1
+        stats[1] = max(stats[1], row["pub_date"])
+        stats[2] = max(stats[2], row["created_at"])
+
+        self._index_text(article_id, row["title"], row["description"])
+        return article_id
+
+    def _cluster_for(self, article_id: int, signature: bytes | None, pub_date: int) -> int | None:
+        """
+        Index an article's LSH keys and find the cluster it joins.
+
+        Mirrors ArticleRepository._assign_clusters(): the most similar
+        article at or above SIMILARITY_THRESHOLD published within
+        CLUSTER_WINDOW_DAYS lends its cluster.
+
+        Args:
+            article_id: Id of the new article
+            signature: MinHash signature (None for articles without words)
+            pub_date: Stored pub_date of the new article
+
+        Returns:
+            Cluster id to store, or None if the article starts its own cluster
+        """
+        if not signature:
+            return None
+
+        window = CLUSTER_WINDOW_DAYS * MS_PER_DAY
+        cluster, best = article_id, SIMILARITY_THRESHOLD
+        compared: set[int] = set()
+        keys = lsh_keys(signature)
+        for key in keys:
+            for other_id in self._lsh.get(key, ()):
+                other = self._rows[other_id]
+                if other_id in compared or abs(other["pub_date"] - pub_date) > window:
+                    continue
+                compared.add(other_id)
+                score = similarity(signature, other["minhash"])
+                if score >= best:
+                    cluster, best = other["cluster_id"] or other_id, score
+
+        for key in keys:
+            self._lsh.setdefault(key, []).append(article_id)
+        return cluster if cluster != article_id else None
+
+    def _index_text(self, article_id: int, title: str, description: str | None) -> None:
+        """
+        Add an article's title and description to the full-text index.
+
+        Args:
+            article_id: Id of the article
+            title: Article title
+            description: Article description
+        """
+        columns = (Counter(search_tokens(title)), Counter(search_tokens(description)))
+        for token in columns[0].keys() | columns[1].keys():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                insort(self._vocabulary, token)
+            postings[article_id] = (columns[0][token], columns[1][token])
+
+        length = columns[0].total() + columns[1].total()
+        self._lengths[article_id] = length
+        self._total_length += length
+
+    async def save(self, article: Article) -> bool:
+        """
+        Save a single article.
+
+        Args:
+            article: Article instance to save
+
+        Returns:
+            True if article was saved, False if duplicate (already exists)
+        """
+        if self._insert(article) is None:
+            logger.debug(f"Duplicate article skipped: {article.guid}")
+            return False
+        return True
+
+    async def save_batch(self, articles: list[Article]) -> list[str]:
+        """
+        Save a batch of articles, skipping duplicates by GUID or URL.
+
+        Args:
+            articles: List of Article instances to save
+
+        Returns:
+            GUIDs of the articles that were newly inserted, in insertion order
+        """
+        new_guids = [a.guid for a in articles if self._insert(a) is not None]
+        logger.debug(
+            f"Saved batch: {len(new_guids)} new, {len(articles) - len(new_guids)} duplicates"
+        )
+        return new_guids
+
+    async def save_many(self, articles: list[Article]) -> int:
+        """
+        Save multiple articles.
+
+        Args:
+            articles: List of Article instances to save
+
+        Returns:
+            Count of new articles saved (excludes duplicates)
+        """
+        return len(await self.save_batch(articles))
+
+    @staticmethod
+    def _check_projection(projection: str) -> None:
+        """
+        Validate a projection name.
+
+        Args:
+            projection: Projection name from PROJECTIONS
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        if projection not in PROJECTIONS:
+            raise ValueError(f"Unknown projection: {projection!r}")
+
+    def _to_article(self, article_id: int, projection: str) -> Article:
+        """
+        Build an Article from a stored row.
+
+        Args:
+            article_id: Id of the stored article
+            projection: "full", or "summary" to leave content unloaded
+
+        Returns:
+            New Article instance; content_loaded is False if content was skipped
+        """
+        data = dict(self._rows[article_id])
+        data["cluster_id"] = data["cluster_id"] or article_id
+        if projection != "full":
+            del data["content"]
+        article = Article.from_dict(data)
+        if projection != "full":
+            article.content_loaded = False
+        return article
+
+    def _scan(
+        self,
+        after: IndexKey | None = None,
+        source: str | None = None,
+        source_id: str | None = None,
+        source_locale: str | None = None,
+        source_category: str | None = None,
+        locales: list[str] | None = None,
+        category: str | None = None,
+    ) -> Iterator[int]:
+        """
+        Iterate the ids of matching articles, newest first.
+
+        The narrowest single-value index among the filters drives the scan
+        and the remaining filters are checked per row; a multi-locale
+        filter alone merges the per-locale indexes.
+
+        Args:
+            after: Only yield articles sorting after this index key
+            source: Optional source string filter
+            source_id: Optional source identifier filter
+            source_locale: Optional filter on the locale named by the source string
+            source_category: Optional source category filter
+            locales: Optional locale codes filter
+            category: Optional article category filter
+
+        Yields:
+            Article ids in (pub_date DESC, id ASC) order
+        """
+        equal = {
+            column: value
+            for column, value in (
+                ("source", source),
+                ("source_id", source_id),
+                ("source_locale", source_locale),
+                ("source_category", source_category),
+                ("category", category),
+            )
+            if value
+        }
+        wanted_locales = set(locales) if locales else None
+        if wanted_locales is not None and len(wanted_locales) == 1:
+            equal["locale"] = next(iter(wanted_locales))
+
+        indexed = [
+            self._indexes.get((column, value), [])
+            for column, value in equal.items()
+            if column != "source_locale"
+        ]
+        if indexed:
+            streams: list[list[IndexKey]] = [min(indexed, key=len)]
+        elif wanted_locales is not None:
+            streams = [self._indexes.get(("locale", code), []) for code in wanted_locales]
+        else:
+            streams = [self._all]
+
+        def seek(index: list[IndexKey]) -> Iterable[IndexKey]:
+            start = bisect_right(index, after) if after else 0
+            return (index[i] for i in range(start, len(index)))
+
+        keys: Iterable[IndexKey] = (
+            seek(streams[0]) if len(streams) == 1 else heapq.merge(*map(seek, streams))
+        )
+        for _, article_id in keys:
+            row = self._rows[article_id]
+            if wanted_locales is not None and row["locale"] not in wanted_locales:
+                continue
+            if category and category not in row["categories"].split(","):
+                continue
+            if all(row[column] == value for column, value in equal.items() if column != "category"):
+                yield article_id
+
+    def _fetch(self, limit: int, projection: str, **filters: Any) -> list[Article]:
+        """
+        Get the newest articles matching the filters.
+
+        Args:
+            limit: Maximum number of articles to return
+            projection: Column projection ("full" or "summary" without content)
+            **filters: Filters accepted by _scan()
+
+        Returns:
+            List of Article instances, newest first
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        self._check_projection(projection)
+        ids = islice(self._scan(**filters), limit)
+        return [self._to_article(article_id, projection) for article_id in ids]
+
+    async def load_content(self, articles: list[Article]) -> list[Article]:
+        """
+        Load the content for articles read with a lighter projection.
+
+        Args:
+            articles: Articles to complete (modified in place)
+
+        Returns:
+            The same list of articles, with content populated
+        """
+        for article in articles:
+            if article.content_loaded:
+                continue
+            article_id = self._guids.get(article.guid)
+            if article_id is not None:
+                article.content = self._rows[article_id]["content"]
+            article.content_loaded = True
+        return articles
+
+    async def get_page(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        source: str | None = None,
+        locale: str | None = None,
+        source_category: str | None = None,
+        projection: str = "full",
+    ) -> tuple[list[Article], str | None]:
+        """
+        Get one page of articles using keyset pagination on (pub_date, id).
+
+        Args:
+            limit: Maximum number of articles on the page
+            cursor: Cursor returned with the previous page (None = first page)
+            source: Optional source filter (e.g., "lol:en-us")
+            locale: Optional locale filter (e.g., "en-us", "it-it")
+            source_category: Optional source category filter
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            Tuple of (articles newest first, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed or the projection is unknown
+        """
+        self._check_projection(projection)
+        after = None
+        if cursor:
+            pub_date, article_id = decode_cursor(cursor)
+            after = (-pub_date, article_id)
+
+        ids = self._scan(
+            after=after,
+            source=source,
+            source_category=source_category,
+            locales=[locale] if locale else None,
+        )
+        # One extra id tells whether another page exists
+        page = list(islice(ids, limit + 1))
+
+        next_cursor = None
+        if len(page) > limit and limit > 0:
+            last = self._rows[page[limit - 1]]
+            next_cursor = encode_cursor(last["pub_date"], last["id"])
+        articles = [self._to_article(article_id, projection) for article_id in page[:limit]]
+        return articles, next_cursor
+
+    async def get_latest(
+        self,
+        limit: int = 50,
+        source: str | None = None,
+        locale: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles, optionally filtered by source and/or locale.
+
+        Args:
+            limit: Maximum number of articles to return
+            source: Optional source filter (e.g., "lol:en-us")
+            locale: Optional locale filter (e.g., "en-us", "it-it")
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances, ordered by publication date (newest first)
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        return self._fetch(limit, projection, source=source, locales=[locale] if locale else None)
+
+    async def get_latest_by_locale(
+        self,
+        locale: str,
+        limit: int = 50,
+        source_category: str | None = None,
+        source_id: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles for a specific locale, optionally filtered by source.
+
+        Args:
+            locale: Locale code (e.g., "en-us", "it-it")
+            limit: Maximum number of articles to return
+            source_category: Optional source category filter
+            source_id: Optional source identifier filter (e.g., "lol", "u-gg")
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances for the locale, ordered by publication date
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        return self._fetch(
+            limit,
+            projection,
+            source_id=source_id,
+            source_locale=locale if source_id else None,
+            source_category=source_category,
+            locales=[locale],
+        )
+
+    async def get_by_locale_group(
+        self,
+        locale_group: list[str],
+        limit: int = 50,
+        source_category: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles for a group of locales.
+
+        Args:
+            locale_group: List of locale codes (e.g., ["en-us", "en-gb"])
+            limit: Maximum number of articles to return
+            source_category: Optional source category filter
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances for the locale group
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        return self._fetch(limit, projection, source_category=source_category, locales=locale_group)
+
+    async def get_by_source_category(
+        self,
+        source_category: str,
+        locale: str | None = None,
+        limit: int = 50,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles by source category.
+
+        Args:
+            source_category: Category to filter by (e.g., "official_riot", "analytics")
+            locale: Optional locale filter
+            limit: Maximum number of articles to return
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances matching the category
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        return self._fetch(
+            limit,
+            projection,
+            source_category=source_category,
+            locales=[locale] if locale else None,
+        )
+
+    async def get_by_category(
+        self,
+        category: str,
+        limit: int = 50,
+        source: str | None = None,
+        locale: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles tagged with a category.
+
+        Args:
+            category: Article category (e.g., "Game Updates", "Dev")
+            limit: Maximum number of articles to return
+            source: Optional source filter (e.g., "lol:en-us")
+            locale: Optional locale filter (e.g., "en-us", "it-it")
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances in the category, ordered by publication date
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        if not category:
+            self._check_projection(projection)
+            return []
+        return self._fetch(
+            limit,
+            projection,
+            category=category,
+            source=source,
+            locales=[locale] if locale else None,
+        )
+
+    def _term_frequencies(self, term: str, prefix: bool) -> dict[int, tuple[int, int]]:
+        """
+        Get the per-column frequencies of a search term.
+
+        Args:
+            term: Normalised search token
+            prefix: Whether the term also matches longer tokens starting with it
+
+        Returns:
+            Mapping of article id to (title_tf, description_tf)
+        """
+        if not prefix:
+            return self._postings.get(term, {})
+
+        merged: dict[int, tuple[int, int]] = {}
+        # Tokens sharing the prefix are contiguous in the sorted vocabulary
+        for token in self._vocabulary[bisect_left(self._vocabulary, term) :]:
+            if not token.startswith(term):
+                break
+            for article_id, (title_tf, description_tf) in self._postings[token].items():
+                previous = merged.get(article_id, (0, 0))
+                merged[article_id] = (previous[0] + title_tf, previous[1] + description_tf)
+        return merged
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 50,
+        locale: str | None = None,
+        source: str | None = None,
+        source_category: str | None = None,
+        category: str | None = None,
+        projection: str = "summary",
+    ) -> list[Article]:
+        """
+        Full-text search over article titles and descriptions.
+
+        Matching follows fts_query(): every word must match and the last one
+        also matches as a prefix once it is FTS_MIN_PREFIX characters long.
+        Results are ranked like the FTS5 bm25() rank with the same column weights.
+
+        Args:
+            query: Free-form search text; every word must match, the last as a prefix
+            limit: Maximum number of articles to return
+            locale: Optional locale filter (e.g., "en-us")
+            source: Optional source filter (e.g., "lol:en-us")
+            source_category: Optional source category filter (e.g., "analytics")
+            category: Optional article category filter (e.g., "Dev")
+            projection: Column projection ("summary" without content, or "full")
+
+        Returns:
+            Matching Article instances, best match first
+
+        Raises:
+            ValueError: If the query has no searchable terms or the projection is unknown
+        """
+        fts_query(query)
+        self._check_projection(projection)
+
+        words = FTS_TERM_PATTERN.findall(query)
+        terms = [(token, False) for word in words for token in search_tokens(word)]
+        if terms and len(words[-1]) >= FTS_MIN_PREFIX:
+            terms[-1] = (terms[-1][0], True)
+        if not terms:
+            return []
+
+        frequencies = [self._term_frequencies(term, prefix) for term, prefix in terms]
+        frequencies.sort(key=len)
+        candidates = set(frequencies[0])
+        for matches in frequencies[1:]:
+            candidates.intersection_update(matches)
+        if not candidates:
+            return []
+
+        wanted = None
+        if locale or source or source_category or category:
+            wanted = set(
+                self._scan(
+                    source=source,
+                    source_category=source_category,
+                    locales=[locale] if locale else None,
+                    category=category,
+                )
+            )
+
+        # Same computation as the FTS5 bm25() function: column-weighted term
+        # frequencies, normalised by the whole row's token count
+        total = len(self._rows)
+        average = self._total_length / total or 1.0
+        idfs = [
+            max(math.log((total - len(matches) + 0.5) / (len(matches) + 0.5)), 0.0) or 1e-6
+            for matches in frequencies
+        ]
+        scored: list[tuple[float, int]] = []
+        for article_id in candidates:
+            if wanted is not None and article_id not in wanted:
+                continue
+            norm = 1 - BM25_B + BM25_B * self._lengths[article_id] / average
+            score = 0.0
+            for idf, matches in zip(idfs, frequencies, strict=True):
+                title_tf, description_tf = matches[article_id]
+                freq = SEARCH_WEIGHTS[0] * title_tf + SEARCH_WEIGHTS[1] * description_tf
+                score += idf * freq * (BM25_K1 + 1) / (freq + BM25_K1 * norm)
+            scored.append((-score, article_id))
+
+        # Best score first, ties in id order
+        scored.sort()
+        return [self._to_article(article_id, projection) for _, article_id in scored[:limit]]
+
+    async def get_by_guid(self, guid: str) -> Article | None:
+        """
+        Get article by its unique GUID.
+
+        Args:
+            guid: Globally unique identifier for the article
+
+        Returns:
+            Article instance if found, None otherwise
+        """
+        article_id = self._guids.get(guid)
+        return self._to_article(article_id, "full") if article_id is not None else None
+
+    async def get_by_canonical_url(self, canonical_url: str) -> Article | None:
+        """
+        Get article by canonical URL (for deduplication across sources).
+
+        Args:
+            canonical_url: Primary URL to search for
+
+        Returns:
+            Article instance if found, None otherwise
+        """
+        article_id = self._canonical.get(canonical_url)
+        return self._to_article(article_id, "full") if article_id is not None else None
+
+    async def count(self, locale: str | None = None) -> int:
+        """
+        Get total count of articles, optionally filtered by locale.
+
+        Args:
+            locale: Optional locale filter
+
+        Returns:
+            Total number of articles stored
+        """
+        if locale:
+            return sum(stats[0] for key, stats in self._stats.items() if key[3] == locale)
+        return len(self._rows)
+
+    async def get_locales(self) -> list[str]:
+        """
+        Get list of all locales that have articles.
+
+        Returns:
+            List of locale codes
+        """
+        return sorted({key[3] for key in self._stats if key[3]})
+
+    async def get_source_categories(self) -> list[str]:
+        """
+        Get list of all source categories that have articles.
+
+        Returns:
+            List of source category names
+        """
+        return sorted({key[2] for key in self._stats if key[2]})
+
+    async def get_article_stats(self) -> list[dict[str, Any]]:
+        """
+        Get article counts per source and locale.
+
+        Returns:
+            List of dicts with source_id, locale, source_category, count,
+            last_pub_date and last_write_at (datetimes), ordered by
+            source_id and locale
+        """
+        entries = [
+            {
+                "source_id": source_id,
+                "locale": locale,
+                "source_category": category or None,
+                "count": count,
+                "last_pub_date": from_epoch_ms(max_pub_date),
+                "last_write_at": from_epoch_ms(last_write_at),
+            }
+            for (source_id, _, category, locale), (count, max_pub_date, last_write_at) in (
+                self._stats.items()
+            )
+        ]
+        return sorted(entries, key=lambda entry: (entry["source_id"], entry["locale"]))
+
+    async def get_last_write_timestamp(self) -> datetime | None:
+        """
+        Get the timestamp of the most recent article write.
+
+        Returns:
+            Publication date of the newest article, or None if empty
+        """
+        return from_epoch_ms(-self._all[0][0]) if self._all else None
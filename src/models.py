@@ -7,11 +7,58 @@ multi-source, multi-locale support.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from functools import lru_cache
 
 
+def to_epoch_ms(value: datetime) -> int:
+    """
+    Convert a datetime to integer milliseconds since the Unix epoch.
+
+    Naive datetimes are treated as UTC, matching how feeds render them.
+
+    Args:
+        value: Datetime to convert
+
+    Returns:
+        Milliseconds since 1970-01-01T00:00:00Z
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def from_epoch_ms(value: int) -> datetime:
+    """
+    Convert integer epoch milliseconds back to a UTC datetime.
+
+    Args:
+        value: Milliseconds since the Unix epoch
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+
+
+def _parse_timestamp(value: datetime | int | str) -> datetime:
+    """
+    Parse a stored timestamp in any supported representation.
+
+    Args:
+        value: Epoch milliseconds (current schema), ISO string (legacy) or datetime
+
+    Returns:
+        Parsed datetime
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, int):
+        return from_epoch_ms(value)
+    return datetime.fromisoformat(value)
+
+
 class SourceCategory(str, Enum):
     """Categories of news sources for organization and filtering."""
 
@@ -288,6 +335,12 @@ class Article:
         locale: Locale code for the article (e.g., "en-us", "it-it")
         source_category: Category of the source (for filtering/grouping)
         canonical_url: Primary URL for deduplication across sources
+        content_loaded: False when the article was read with a projection that
+            skipped ``content`` (see ArticleRepository.load_content())
+        cluster_id: Near-duplicate cluster the article belongs to (set by the
+            repository; articles of the same story share it)
+        alternates: Other articles of the same cluster, attached when a feed
+            collapses near-duplicates into one item
     """
 
     # Required fields
@@ -312,6 +365,13 @@ class Article:
     source_category: str | None = None
     canonical_url: str | None = None
 
+    # Set by the repository for projections that skip the content column
+    content_loaded: bool = field(default=True, repr=False, compare=False)
+
+    # Near-duplicate clustering (see ArticleRepository and collapse_clusters())
+    cluster_id: int | None = field(default=None, repr=False, compare=False)
+    alternates: list["Article"] = field(default_factory=list, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """
         Validate article data after initialization.
@@ -368,7 +428,8 @@ class Article:
         Create Article instance from dictionary.
 
         This is the inverse of to_dict() and is used when loading
-        articles from the database.
+        articles from the database. Timestamps may be ISO strings or the
+        integer epoch milliseconds stored by the current schema.
 
         Args:
             data: Dictionary containing article data
@@ -387,7 +448,7 @@ class Article:
         return cls(
             title=data["title"],
             url=data["url"],
-            pub_date=datetime.fromisoformat(data["pub_date"]),
+            pub_date=_parse_timestamp(data["pub_date"]),
             guid=data["guid"],
             source=source,
             description=data.get("description", ""),
@@ -396,11 +457,49 @@ class Article:
             author=data.get("author", "Riot Games"),
             categories=data.get("categories", "").split(",") if data.get("categories") else [],
             created_at=(
-                datetime.fromisoformat(data["created_at"])
+                _parse_timestamp(data["created_at"])
                 if data.get("created_at")
                 else datetime.utcnow()
             ),
             locale=data.get("locale", "en-us"),
             source_category=data.get("source_category"),
             canonical_url=data.get("canonical_url"),
+            cluster_id=data.get("cluster_id"),
         )
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    Rule for aging stored articles out of the articles table.
+
+    A policy applies to articles in its scope: the optional source category
+    and locale, where an unset field matches every article. Articles in
+    scope that are older than ``max_age_days`` or fall outside the newest
+    ``max_count`` are expired.
+
+    Attributes:
+        source_category: Source category scope (e.g., "analytics"), None for all
+        locale: Locale scope (e.g., "en-us"), None for all
+        max_age_days: Maximum article age by publication date, in days
+        max_count: Maximum number of articles kept in scope
+    """
+
+    source_category: str | None = None
+    locale: str | None = None
+    max_age_days: int | None = None
+    max_count: int | None = None
+
+    def __post_init__(self) -> None:
+        """
+        Validate the policy limits.
+
+        Raises:
+            ValueError: If no limit is set or a limit is negative
+        """
+        if self.max_age_days is None and self.max_count is None:
+            raise ValueError("Retention policy needs max_age_days or max_count")
+        if (self.max_age_days is not None and self.max_age_days < 0) or (
+            self.max_count is not None and self.max_count < 0
+        ):
+            raise ValueError("Retention policy limits cannot be negative")
@@ -0,0 +1,395 @@
+"""
+Storage interface shared by the article repository engines.
+
+Feed rendering and ingestion only depend on the methods declared by
+``Repository``. It is implemented by the SQLite engine
+(src.database.ArticleRepository, also behind ShardedArticleRepository) and
+by the in-memory engine (src.memory_database.InMemoryArticleRepository)
+used for benchmarks and tests. Maintenance operations such as retention,
+VACUUM and backups stay specific to the SQLite engines and are declared
+separately by ``MaintainedRepository``.
+"""
+
+from datetime import datetime
+from typing import Any, Protocol, runtime_checkable
+
+from src.models import Article, RetentionPolicy
+
+
+@runtime_checkable
+class Repository(Protocol):
+    """
+    Article storage operations used by the feed and update services.
+
+    Every engine must behave identically for these methods; the shared
+    conformance suite (tests/unit/test_repository_conformance.py) checks it.
+    """
+
+    async def initialize(self) -> None:
+        """Prepare the storage for use."""
+        ...
+
+    async def close(self) -> None:
+        """Release the storage's resources."""
+        ...
+
+    async def save(self, article: Article) -> bool:
+        """
+        Save a single article.
+
+        Args:
+            article: Article instance to save
+
+        Returns:
+            True if saved, False if the GUID or URL already exists
+        """
+        ...
+
+    async def save_batch(self, articles: list[Article]) -> list[str]:
+        """
+        Save a batch of articles, skipping duplicates by GUID or URL.
+
+        Args:
+            articles: Articles to save
+
+        Returns:
+            GUIDs of the newly inserted articles, in insertion order
+        """
+        ...
+
+    async def save_many(self, articles: list[Article]) -> int:
+        """
+        Save a batch of articles.
+
+        Args:
+            articles: Articles to save
+
+        Returns:
+            Count of newly inserted articles
+        """
+        ...
+
+    async def load_content(self, articles: list[Article]) -> list[Article]:
+        """
+        Load the content of articles read with the "summary" projection.
+
+        Args:
+            articles: Articles to complete (modified in place)
+
+        Returns:
+            The same list of articles, with content populated
+        """
+        ...
+
+    async def get_page(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        source: str | None = None,
+        locale: str | None = None,
+        source_category: str | None = None,
+        projection: str = "full",
+    ) -> tuple[list[Article], str | None]:
+        """
+        Get one page of articles ordered by (pub_date DESC, id ASC).
+
+        Args:
+            limit: Maximum number of articles on the page
+            cursor: Cursor returned with the previous page (None = first page)
+            source: Optional source filter
+            locale: Optional locale filter
+            source_category: Optional source category filter
+            projection: Column projection ("full" or "summary")
+
+        Returns:
+            Tuple of (articles newest first, cursor for the next page or None)
+        """
+        ...
+
+    async def get_latest(
+        self,
+        limit: int = 50,
+        source: str | None = None,
+        locale: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles, optionally filtered by source and/or locale.
+
+        Args:
+            limit: Maximum number of articles to return
+            source: Optional source filter
+            locale: Optional locale filter
+            projection: Column projection ("full" or "summary")
+
+        Returns:
+            Articles ordered by publication date (newest first)
+        """
+        ...
+
+    async def get_latest_by_locale(
+        self,
+        locale: str,
+        limit: int = 50,
+        source_category: str | None = None,
+        source_id: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles for a locale.
+
+        Args:
+            locale: Locale code
+            limit: Maximum number of articles to return
+            source_category: Optional source category filter
+            source_id: Optional source identifier filter
+            projection: Column projection ("full" or "summary")
+
+        Returns:
+            Articles for the locale, newest first
+        """
+        ...
+
+    async def get_by_locale_group(
+        self,
+        locale_group: list[str],
+        limit: int = 50,
+        source_category: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles for a group of locales.
+
+        Args:
+            locale_group: Locale codes
+            limit: Maximum number of articles to return
+            source_category: Optional source category filter
+            projection: Column projection ("full" or "summary")
+
+        Returns:
+            Articles for the locale group, newest first
+        """
+        ...
+
+    async def get_by_source_category(
+        self,
+        source_category: str,
+        locale: str | None = None,
+        limit: int = 50,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles by source category.
+
+        Args:
+            source_category: Source category to filter by
+            locale: Optional locale filter
+            limit: Maximum number of articles to return
+            projection: Column projection ("full" or "summary")
+
+        Returns:
+            Articles in the source category, newest first
+        """
+        ...
+
+    async def get_by_category(
+        self,
+        category: str,
+        limit: int = 50,
+        source: str | None = None,
+        locale: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles tagged with a category.
+
+        Args:
+            category: Article category
+            limit: Maximum number of articles to return
+            source: Optional source filter
+            locale: Optional locale filter
+            projection: Column projection ("full" or "summary")
+
+        Returns:
+            Articles in the category, newest first
+        """
+        ...
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 50,
+        locale: str | None = None,
+        source: str | None = None,
+        source_category: str | None = None,
+        category: str | None = None,
+        projection: str = "summary",
+    ) -> list[Article]:
+        """
+        Full-text search over article titles and descriptions.
+
+        Args:
+            query: Free-form search text; every word must match, the last as a prefix
+            limit: Maximum number of articles to return
+            locale: Optional locale filter
+            source: Optional source filter
+            source_category: Optional source category filter
+            category: Optional article category filter
+            projection: Column projection ("summary" or "full")
+
+        Returns:
+            Matching articles, best match first
+        """
+        ...
+
+    async def get_by_guid(self, guid: str) -> Article | None:
+        """
+        Get article by its unique GUID.
+
+        Args:
+            guid: Globally unique identifier for the article
+
+        Returns:
+            Article instance if found, None otherwise
+        """
+        ...
+
+    async def get_by_canonical_url(self, canonical_url: str) -> Article | None:
+        """
+        Get article by canonical URL.
+
+        Args:
+            canonical_url: Primary URL to search for
+
+        Returns:
+            Article instance if found, None otherwise
+        """
+        ...
+
+    async def count(self, locale: str | None = None) -> int:
+        """
+        Get the number of stored articles.
+
+        Args:
+            locale: Optional locale filter
+
+        Returns:
+            Number of articles
+        """
+        ...
+
+    async def get_locales(self) -> list[str]:
+        """
+        Get the locales that have articles.
+
+        Returns:
+            Sorted locale codes
+        """
+        ...
+
+    async def get_source_categories(self) -> list[str]:
+        """
+        Get the source categories that have articles.
+
+        Returns:
+            Sorted source category names
+        """
+        ...
+
+    async def get_article_stats(self) -> list[dict[str, Any]]:
+        """
+        Get article counts per source and locale.
+
+        Returns:
+            List of dicts with source_id, locale, source_category, count,
+            last_pub_date and last_write_at, ordered by source_id and locale
+        """
+        ...
+
+    async def get_last_write_timestamp(self) -> datetime | None:
+        """
+        Get the publication date of the newest stored article.
+
+        Returns:
+            Datetime of the newest article, or None if there are none
+        """
+        ...
+
+
+@runtime_checkable
+class MaintainedRepository(Repository, Protocol):
+    """
+    Repository with the maintenance operations run by the scheduler.
+
+    Implemented by the SQLite engines (ArticleRepository and
+    ShardedArticleRepository), which the API serves from.
+    """
+
+    async def apply_retention(
+        self,
+        policies: list[RetentionPolicy],
+        archive_path: str | None = None,
+        now: datetime | None = None,
+        batch_size: int = 500,
+    ) -> dict[str, int]:
+        """
+        Remove articles that fall outside the retention policies.
+
+        Args:
+            policies: Retention policies to apply
+            archive_path: Optional database receiving the removed articles
+            now: Reference time (default: current UTC time)
+            batch_size: Maximum number of rows removed per transaction
+
+        Returns:
+            Dict with the number of deleted and archived articles
+        """
+        ...
+
+    async def recompress_stored_text(self, batch_size: int = 500) -> int:
+        """
+        Rewrite stored article text to match the repository codec.
+
+        Implementations should skip the scan when the codec has not changed
+        since their last completed pass, since maintenance calls this on
+        every run.
+
+        Args:
+            batch_size: Maximum number of rows rewritten per transaction
+
+        Returns:
+            Number of rows rewritten
+        """
+        ...
+
+    async def run_maintenance(
+        self, vacuum_pages: int = 0, convert_auto_vacuum: bool = False
+    ) -> dict[str, int]:
+        """
+        Return free pages to the filesystem and refresh planner statistics.
+
+        Args:
+            vacuum_pages: Maximum free pages to release (0 releases all)
+            convert_auto_vacuum: Rebuild a database without incremental
+                auto_vacuum with a full VACUUM
+
+        Returns:
+            Maintenance statistics
+        """
+        ...
+
+    async def backup(
+        self, backup_dir: str, keep: int = 7, pages_per_step: int = 1024
+    ) -> dict[str, Any]:
+        """
+        Write a consistent snapshot of the stored articles.
+
+        Args:
+            backup_dir: Directory receiving the snapshot
+            keep: Number of snapshots retained
+            pages_per_step: Pages copied per backup step
+
+        Returns:
+            Backup statistics
+        """
+        ...
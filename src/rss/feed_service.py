@@ -6,19 +6,235 @@ with intelligent caching to reduce database load and improve performance.
 
 Also provides FeedServiceV2 with dynamic generator registry for multi-locale
 RSS feeds supporting all 20 Riot locales.
+
+Cached feeds keep their ETag, Last-Modified date and gzip and brotli
+encodings next to the document, so the API can answer conditional
+requests and serve compressed bodies without per-request work. The
+validators come from a cheap version of the stored data (DataVersion), so
+a conditional request can be answered before any feed is rendered.
 """
 
+import asyncio
+import hashlib
 import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, cast
+from urllib.parse import urlencode
 
 from src.config import get_settings
-from src.database import ArticleRepository
-from src.models import ArticleSource
-from src.rss.generator import RSSFeedGenerator
+from src.models import Article, ArticleSource
+from src.repository import Repository
+from src.rss.generator import ItemFragmentCache, RSSFeedGenerator
 from src.utils.cache import TTLCache
+from src.utils.compression import precompress
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# URL extension of each output format
+FEED_EXTENSIONS = {"rss": "xml", "atom": "atom", "json": "json"}
+
+# Articles fetched per requested item when collapsing near-duplicates, so a
+# collapsed feed still fills up to its limit
+COLLAPSE_OVERFETCH = 3
+
+
+def collapse_clusters(articles: list[Article]) -> list[Article]:
+    """
+    Collapse near-duplicate articles into one item per cluster.
+
+    The earliest published article of each cluster is kept at its own
+    position in the list; the other members become its ``alternates``.
+
+    Args:
+        articles: Articles in feed order (each with its cluster_id)
+
+    Returns:
+        Articles with one entry per cluster, in the original order
+    """
+    first_by_cluster: dict[int, Article] = {}
+    for article in sorted(articles, key=lambda a: a.pub_date):
+        if article.cluster_id is None:
+            continue
+        first = first_by_cluster.setdefault(article.cluster_id, article)
+        if first is not article:
+            first.alternates.append(article)
+
+    kept = {id(article) for article in first_by_cluster.values()}
+    return [a for a in articles if a.cluster_id is None or id(a) in kept]
+
+
+def entity_tag(body: bytes) -> str:
+    """
+    Compute the strong HTTP entity tag of a response body.
+
+    Args:
+        body: Uncompressed response body
+
+    Returns:
+        Quoted content hash, e.g. '"3f1c..."'
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    """
+    Cheap version of the stored articles one feed is rendered from.
+
+    Articles are never edited once stored, so the per-source, per-locale
+    counts and newest dates in the repository's article stats change
+    whenever a write or deletion could change a feed. A feed reads only
+    the stats rows its own filters can select, so writes elsewhere leave
+    its version alone. Feeds rendered at the same version are identical,
+    which lets the API answer a conditional request from the version alone.
+
+    Attributes:
+        tag: Digest of the feed's scope and its article stats
+        last_modified: Newest created_at of the articles the feed can show, if any
+    """
+
+    tag: str
+    last_modified: datetime | None
+
+    def etag(self, fmt: str, coding: str | None = None) -> str:
+        """
+        Get the entity tag of a feed rendered at this version.
+
+        Args:
+            fmt: Feed format ("rss", "atom" or "json")
+            coding: Content coding ("gzip", "br"), or None for no coding
+
+        Returns:
+            Quoted entity tag, e.g. '"3f1c...-rss-gzip"'
+        """
+        return f'"{self.tag}-{fmt}"' if coding is None else f'"{self.tag}-{fmt}-{coding}"'
+
+
+async def data_version(
+    repository: Repository,
+    locale: str | None = None,
+    source_id: str | None = None,
+    source_category: str | None = None,
+    **params: object,
+) -> DataVersion:
+    """
+    Read the current version of the stored articles behind one feed.
+
+    Only the trigger-maintained article stats are read, so the cost does
+    not grow with the number of articles. Rows outside the feed's locale,
+    source and source category are skipped. Feeds filtered on something
+    the stats do not record (article categories, search terms) digest
+    every row their other filters keep, and tell those filter values
+    apart through ``params``.
+
+    Args:
+        repository: Repository the feed is rendered from
+        locale: Locale the feed is restricted to (None or empty for all)
+        source_id: Source the feed is restricted to (None or empty for all)
+        source_category: Source category the feed is restricted to (None or empty for all)
+        **params: Other request parameters the document depends on
+            (e.g., limit, collapse), mixed into the digest
+
+    Returns:
+        Version of the stored articles the feed can show
+    """
+    scope = (locale, source_id, source_category, sorted(params.items()))
+    digest = hashlib.blake2b(repr(scope).encode("utf-8"), digest_size=16)
+    last_write: datetime | None = None
+    for entry in await repository.get_article_stats():
+        if (
+            (locale and entry["locale"] != locale)
+            or (source_id and entry["source_id"] != source_id)
+            or (source_category and entry["source_category"] != source_category)
+        ):
+            continue
+        fields = (
+            entry["source_id"],
+            entry["locale"],
+            entry["count"],
+            entry["last_pub_date"],
+            entry["last_write_at"],
+        )
+        digest.update(repr(fields).encode("utf-8"))
+        if entry["last_write_at"] is not None and (
+            last_write is None or entry["last_write_at"] > last_write
+        ):
+            last_write = entry["last_write_at"]
+    return DataVersion(digest.hexdigest(), last_write)
+
+
+class RenderedFeed(str):
+    """
+    A rendered feed document with its HTTP validators and encodings.
+
+    Subclasses str, so callers that only need the document are unaffected;
+    the API answers conditional requests from ``etag`` and
+    ``last_modified`` and serves ``encodings`` to clients that accept gzip
+    or brotli.
+
+    Attributes:
+        encodings: Encoded body per HTTP content coding ("gzip", "br")
+        etag: Entity tag of the uncompressed document (by default a hash
+            of it; the feed services use the DataVersion it was rendered at)
+        last_modified: Newest created_at of the stored articles, if any
+    """
+
+    encodings: dict[str, bytes]
+    etag: str
+    last_modified: datetime | None
+
+    def __new__(
+        cls,
+        document: str,
+        encodings: dict[str, bytes] | None = None,
+        etag: str | None = None,
+        last_modified: datetime | None = None,
+    ) -> "RenderedFeed":
+        feed = super().__new__(cls, document)
+        feed.encodings = encodings or {}
+        feed.etag = etag or entity_tag(document.encode("utf-8"))
+        feed.last_modified = last_modified
+        return feed
+
+    def etag_for(self, coding: str | None) -> str:
+        """
+        Get the entity tag of the document as sent with a content coding.
+
+        Every coding is a different byte sequence, so each gets its own
+        strong tag derived from the document's.
+
+        Args:
+            coding: Content coding ("gzip", "br"), or None for no coding
+
+        Returns:
+            Quoted entity tag
+        """
+        return self.etag if coding is None else f'{self.etag[:-1]}-{coding}"'
+
+
+async def encode_feed(document: str, version: DataVersion, fmt: str) -> RenderedFeed:
+    """
+    Attach validators and precompressed encodings to a rendered feed.
+
+    Compression runs in a worker thread so a large feed does not block the
+    event loop; with feed_precompression disabled no encodings are stored.
+
+    Args:
+        document: Rendered feed document
+        version: Data version read before the feed's articles were fetched
+        fmt: Format the feed was rendered in
+
+    Returns:
+        The document with its ETag, Last-Modified date and gzip (and
+        brotli) encodings attached
+    """
+    encodings: dict[str, bytes] = {}
+    if settings.feed_precompression:
+        encodings = await asyncio.to_thread(precompress, document.encode("utf-8"))
+    return RenderedFeed(document, encodings, version.etag(fmt), version.last_modified)
+
 
 class FeedService:
     """
@@ -31,12 +247,16 @@ class FeedService:
     Attributes:
         repository: Article repository for database access
         cache: TTLCache instance for feed caching
+        item_cache: Rendered RSS items shared by the generators
         generator_en: English language feed generator
         generator_it: Italian language feed generator
     """
 
     def __init__(
-        self, repository: ArticleRepository, cache_ttl: int = 300  # 5 minutes default
+        self,
+        repository: Repository,
+        cache_ttl: int = 300,  # 5 minutes default
+        item_cache: ItemFragmentCache | None = None,
     ) -> None:
         """
         Initialize feed service.
@@ -44,9 +264,14 @@ class FeedService:
         Args:
             repository: Article repository instance
             cache_ttl: Cache TTL in seconds (default: 300 = 5 minutes)
+            item_cache: Rendered item cache, shared with other services
+                (default: a new cache sized by rss_item_cache_size)
         """
         self.repository = repository
         self.cache = TTLCache(default_ttl_seconds=cache_ttl)
+        if item_cache is None:
+            item_cache = ItemFragmentCache(settings.rss_item_cache_size)
+        self.item_cache = item_cache
 
         # Initialize generators for different languages using locale-based settings
         self.generator_en = RSSFeedGenerator(
@@ -55,6 +280,7 @@ class FeedService:
             feed_description=settings.feed_descriptions.get(
                 "en-us", "Latest League of Legends news and updates"
             ),
+            item_cache=self.item_cache,
         )
         self.generator_it = RSSFeedGenerator(
             language="it",
@@ -62,9 +288,28 @@ class FeedService:
             feed_description=settings.feed_descriptions.get(
                 "it-it", "Ultime notizie e aggiornamenti di League of Legends"
             ),
+            item_cache=self.item_cache,
         )
 
-    async def get_main_feed(self, feed_url: str, limit: int = 50) -> str:
+    async def get_data_version(self, **scope: Any) -> DataVersion:
+        """
+        Read the current version of the stored articles behind one feed.
+
+        Args:
+            **scope: Filters and parameters of the feed (see data_version())
+
+        Returns:
+            Version the feed would be rendered at now
+        """
+        return await data_version(self.repository, **scope)
+
+    async def get_main_feed(
+        self,
+        feed_url: str,
+        limit: int = 50,
+        collapse_duplicates: bool = False,
+        fmt: str = "rss",
+    ) -> str:
         """
         Get main RSS feed (all sources, all categories).
 
@@ -74,23 +319,37 @@ class FeedService:
         Args:
             feed_url: Self URL for the feed (for rel='self' link)
             limit: Maximum number of articles to include
+            collapse_duplicates: Show each near-duplicate story once, with
+                the other sources listed as alternates
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
 
         Returns:
-            RSS 2.0 XML string
+            RSS 2.0 XML string (or Atom / JSON Feed document)
         """
-        cache_key = f"feed_main_{limit}"
+        cache_key = f"feed_main_{limit}_collapsed" if collapse_duplicates else f"feed_main_{limit}"
+        if fmt != "rss":
+            cache_key += f"_{fmt}"
 
         # Check cache
         cached = self.cache.get(cache_key)
         if cached:
             logger.info("Returning cached main feed")
-            return str(cached)
+            return cast(RenderedFeed, cached)
+
+        # Read the version first: a write during the fetch then only makes
+        # the feed's validators older than its content, never newer
+        version = await self.get_data_version(limit=limit, collapse=collapse_duplicates)
 
         # Fetch articles from database
-        articles = await self.repository.get_latest(limit=limit)
+        if collapse_duplicates:
+            articles = await self.repository.get_latest(limit=limit * COLLAPSE_OVERFETCH)
+            articles = collapse_clusters(articles)[:limit]
+        else:
+            articles = await self.repository.get_latest(limit=limit)
 
         # Generate feed (use EN generator for mixed content)
-        feed_xml = self.generator_en.generate_feed(articles, feed_url)
+        feed_xml = self.generator_en.generate_feed(articles, feed_url, fmt)
+        feed_xml = await encode_feed(feed_xml, version, fmt)
 
         # Cache the result
         self.cache.set(cache_key, feed_xml)
@@ -100,7 +359,7 @@ class FeedService:
         return feed_xml
 
     async def get_feed_by_source(
-        self, source: ArticleSource, feed_url: str, limit: int = 50
+        self, source: ArticleSource, feed_url: str, limit: int = 50, fmt: str = "rss"
     ) -> str:
         """
         Get RSS feed filtered by source.
@@ -112,17 +371,24 @@ class FeedService:
             source: Article source to filter by
             feed_url: Self URL for the feed
             limit: Maximum number of articles to include
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
 
         Returns:
             RSS 2.0 XML string with source-filtered articles
         """
         cache_key = f"feed_source_{str(source)}_{limit}"
+        if fmt != "rss":
+            cache_key += f"_{fmt}"
 
         # Check cache
         cached = self.cache.get(cache_key)
         if cached:
             logger.info(f"Returning cached feed for {str(source)}")
-            return str(cached)
+            return cast(RenderedFeed, cached)
+
+        version = await self.get_data_version(
+            locale=source.locale, source_id=source.source_id, limit=limit
+        )
 
         # Fetch articles for specific source
         articles = await self.repository.get_latest(limit=limit, source=str(source))
@@ -131,7 +397,8 @@ class FeedService:
         generator = self.generator_it if source.locale == "it-it" else self.generator_en
 
         # Generate feed
-        feed_xml = generator.generate_feed_by_source(articles, source, feed_url)
+        feed_xml = generator.generate_feed_by_source(articles, source, feed_url, fmt)
+        feed_xml = await encode_feed(feed_xml, version, fmt)
 
         # Cache the result
         self.cache.set(cache_key, feed_xml)
@@ -140,42 +407,48 @@ class FeedService:
 
         return feed_xml
 
-    async def get_feed_by_category(self, category: str, feed_url: str, limit: int = 50) -> str:
+    async def get_feed_by_category(
+        self, category: str, feed_url: str, limit: int = 50, fmt: str = "rss"
+    ) -> str:
         """
         Get RSS feed filtered by category.
 
-        Fetches articles containing the specified category and generates
-        a topic-specific RSS feed.
+        Fetches the latest articles tagged with the category from the
+        indexed article_categories table and generates a topic-specific
+        RSS feed.
 
         Args:
             category: Category name to filter by
             feed_url: Self URL for the feed
             limit: Maximum number of articles to include
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
 
         Returns:
             RSS 2.0 XML string with category-filtered articles
         """
         cache_key = f"feed_category_{category}_{limit}"
+        if fmt != "rss":
+            cache_key += f"_{fmt}"
 
         # Check cache
         cached = self.cache.get(cache_key)
         if cached:
             logger.info(f"Returning cached feed for category {category}")
-            return str(cached)
+            return cast(RenderedFeed, cached)
+
+        version = await self.get_data_version(category=category, limit=limit)
 
-        # Fetch more articles than needed since we filter by category
-        # This ensures we have enough articles after filtering
-        articles = await self.repository.get_latest(limit=limit * 2)
+        # Fetch articles by category (filtered in the database)
+        articles = await self.repository.get_by_category(category, limit=limit)
 
-        # Generate feed with category filter
-        feed_xml = self.generator_en.generate_feed_by_category(articles, category, feed_url)
+        # Generate feed with category title
+        feed_xml = self.generator_en.generate_feed_by_category(articles, category, feed_url, fmt)
+        feed_xml = await encode_feed(feed_xml, version, fmt)
 
         # Cache the result
         self.cache.set(cache_key, feed_xml)
 
-        # Log the actual count after filtering
-        filtered_count = len([a for a in articles if category in a.categories])
-        logger.info(f"Generated feed for category {category} with {filtered_count} articles")
+        logger.info(f"Generated feed for category {category} with {len(articles)} articles")
 
         return feed_xml
 
@@ -185,6 +458,8 @@ class FeedService:
 
         Clears all cached feeds. Should be called after updating
         articles in the database to ensure feeds reflect the latest data.
+        Rendered items are kept: they are only reused while the article
+        renders identically, so rebuilt feeds render just the new items.
         """
         self.cache.clear()
         logger.info("Feed cache invalidated")
@@ -201,12 +476,16 @@ class FeedServiceV2:
     Attributes:
         repository: Article repository for database access
         cache: TTLCache instance for feed caching
+        item_cache: Rendered RSS items shared by all locale generators
         generators: Dictionary mapping locale codes to RSSFeedGenerator instances
         supported_locales: List of supported locale codes
     """
 
     def __init__(
-        self, repository: ArticleRepository, cache_ttl: int = 300  # 5 minutes default
+        self,
+        repository: Repository,
+        cache_ttl: int = 300,  # 5 minutes default
+        item_cache: ItemFragmentCache | None = None,
     ) -> None:
         """
         Initialize feed service V2 with dynamic generator registry.
@@ -214,9 +493,14 @@ class FeedServiceV2:
         Args:
             repository: Article repository instance
             cache_ttl: Cache TTL in seconds (default: 300 = 5 minutes)
+            item_cache: Rendered item cache, shared with other services
+                (default: a new cache sized by rss_item_cache_size)
         """
         self.repository = repository
         self.cache = TTLCache(default_ttl_seconds=cache_ttl)
+        if item_cache is None:
+            item_cache = ItemFragmentCache(settings.rss_item_cache_size)
+        self.item_cache = item_cache
         self.supported_locales = settings.supported_locales
 
         # Dynamic generator registry
@@ -253,6 +537,7 @@ class FeedServiceV2:
                 feed_link=feed_link,
                 feed_description=description,
                 language=language,
+                item_cache=self.item_cache,
             )
 
         logger.info(f"Initialized generators for locales: {list(self.generators.keys())}")
@@ -277,7 +562,21 @@ class FeedServiceV2:
             )
         return self.generators[locale]
 
-    async def get_feed_by_locale(self, locale: str, limit: int = 50) -> str:
+    async def get_data_version(self, **scope: Any) -> DataVersion:
+        """
+        Read the current version of the stored articles behind one feed.
+
+        Args:
+            **scope: Filters and parameters of the feed (see data_version())
+
+        Returns:
+            Version the feed would be rendered at now
+        """
+        return await data_version(self.repository, **scope)
+
+    async def get_feed_by_locale(
+        self, locale: str, limit: int = 50, collapse_duplicates: bool = False, fmt: str = "rss"
+    ) -> str:
         """
         Get RSS feed XML for a specific locale.
 
@@ -287,6 +586,9 @@ class FeedServiceV2:
         Args:
             locale: Locale code (e.g., "en-us", "it-it")
             limit: Maximum number of articles to include
+            collapse_duplicates: Show each near-duplicate story once, with
+                the other sources listed as alternates
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
 
         Returns:
             RSS 2.0 XML string with locale-specific feed
@@ -298,21 +600,36 @@ class FeedServiceV2:
         generator = self._get_generator(locale)
 
         cache_key = f"feed_v2_locale_{locale}_{limit}"
+        if collapse_duplicates:
+            cache_key += "_collapsed"
+        if fmt != "rss":
+            cache_key += f"_{fmt}"
 
         # Check cache
         cached = self.cache.get(cache_key)
         if cached:
             logger.info(f"Returning cached feed for locale {locale}")
-            return str(cached)
+            return cast(RenderedFeed, cached)
+
+        version = await self.get_data_version(
+            locale=locale, limit=limit, collapse=collapse_duplicates
+        )
 
         # Fetch articles from database for this locale
-        articles = await self.repository.get_latest_by_locale(locale=locale, limit=limit)
+        if collapse_duplicates:
+            articles = await self.repository.get_latest_by_locale(
+                locale=locale, limit=limit * COLLAPSE_OVERFETCH
+            )
+            articles = collapse_clusters(articles)[:limit]
+        else:
+            articles = await self.repository.get_latest_by_locale(locale=locale, limit=limit)
 
         # Generate feed URL
-        feed_url = f"{settings.base_url}/rss/{locale}.xml"
+        feed_url = f"{settings.base_url}/rss/{locale}.{FEED_EXTENSIONS[fmt]}"
 
         # Generate feed
-        feed_xml = generator.generate_feed(articles, feed_url)
+        feed_xml = generator.generate_feed(articles, feed_url, fmt)
+        feed_xml = await encode_feed(feed_xml, version, fmt)
 
         # Cache the result
         self.cache.set(cache_key, feed_xml)
@@ -322,7 +639,7 @@ class FeedServiceV2:
         return feed_xml
 
     async def get_feed_by_source_and_locale(
-        self, source_id: str, locale: str, limit: int = 50
+        self, source_id: str, locale: str, limit: int = 50, fmt: str = "rss"
     ) -> str:
         """
         Get RSS feed for a specific source and locale.
@@ -334,6 +651,7 @@ class FeedServiceV2:
             source_id: Source identifier (e.g., "lol", "u-gg")
             locale: Locale code (e.g., "en-us", "it-it")
             limit: Maximum number of articles to include
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
 
         Returns:
             RSS 2.0 XML string with source and locale filtered feed
@@ -345,29 +663,31 @@ class FeedServiceV2:
         generator = self._get_generator(locale)
 
         cache_key = f"feed_v2_source_{source_id}_{locale}_{limit}"
+        if fmt != "rss":
+            cache_key += f"_{fmt}"
 
         # Check cache
         cached = self.cache.get(cache_key)
         if cached:
             logger.info(f"Returning cached feed for source {source_id}, locale {locale}")
-            return str(cached)
+            return cast(RenderedFeed, cached)
 
-        # Fetch articles by locale first
-        articles = await self.repository.get_latest_by_locale(locale=locale, limit=limit)
+        version = await self.get_data_version(locale=locale, source_id=source_id, limit=limit)
 
-        # Filter by source pattern (source LIKE 'source_id:%')
-        filtered_articles = [
-            a for a in articles if a.source.source_id == source_id and a.source.locale == locale
-        ]
+        # Fetch articles by source and locale (filtered in the database)
+        filtered_articles = await self.repository.get_latest_by_locale(
+            locale=locale, source_id=source_id, limit=limit
+        )
 
         # Generate feed URL
-        feed_url = f"{settings.base_url}/rss/{source_id}/{locale}.xml"
+        feed_url = f"{settings.base_url}/rss/{source_id}/{locale}.{FEED_EXTENSIONS[fmt]}"
 
         # Create source for title modification
         source = ArticleSource.create(source_id, locale)
 
         # Generate feed with source-specific title
-        feed_xml = generator.generate_feed_by_source(filtered_articles, source, feed_url)
+        feed_xml = generator.generate_feed_by_source(filtered_articles, source, feed_url, fmt)
+        feed_xml = await encode_feed(feed_xml, version, fmt)
 
         # Cache the result
         self.cache.set(cache_key, feed_xml)
@@ -380,7 +700,7 @@ class FeedServiceV2:
         return feed_xml
 
     async def get_feed_by_category_and_locale(
-        self, category: str, locale: str, limit: int = 50
+        self, category: str, locale: str, limit: int = 50, fmt: str = "rss"
     ) -> str:
         """
         Get RSS feed for a specific category and locale.
@@ -392,6 +712,7 @@ class FeedServiceV2:
             category: Category name to filter by (e.g., "official_riot", "analytics")
             locale: Locale code (e.g., "en-us", "it-it")
             limit: Maximum number of articles to include
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
 
         Returns:
             RSS 2.0 XML string with category and locale filtered feed
@@ -403,12 +724,16 @@ class FeedServiceV2:
         generator = self._get_generator(locale)
 
         cache_key = f"feed_v2_category_{category}_{locale}_{limit}"
+        if fmt != "rss":
+            cache_key += f"_{fmt}"
 
         # Check cache
         cached = self.cache.get(cache_key)
         if cached:
             logger.info(f"Returning cached feed for category {category}, locale {locale}")
-            return str(cached)
+            return cast(RenderedFeed, cached)
+
+        version = await self.get_data_version(locale=locale, source_category=category, limit=limit)
 
         # Fetch articles by locale and category
         articles = await self.repository.get_latest_by_locale(
@@ -416,11 +741,12 @@ class FeedServiceV2:
         )
 
         # Generate feed URL
-        feed_url = f"{settings.base_url}/rss/{category}/{locale}.xml"
+        feed_url = f"{settings.base_url}/rss/{category}/{locale}.{FEED_EXTENSIONS[fmt]}"
 
         # Generate feed with category-specific title
         # Use generate_feed_by_source_category() since DB already filtered by source_category
-        feed_xml = generator.generate_feed_by_source_category(articles, category, feed_url)
+        feed_xml = generator.generate_feed_by_source_category(articles, category, feed_url, fmt)
+        feed_xml = await encode_feed(feed_xml, version, fmt)
 
         # Cache the result
         self.cache.set(cache_key, feed_xml)
@@ -432,6 +758,48 @@ class FeedServiceV2:
 
         return feed_xml
 
+    async def get_search_feed(
+        self, query: str, locale: str | None = None, limit: int = 50, fmt: str = "rss"
+    ) -> str:
+        """
+        Get RSS feed of full-text search results.
+
+        Searches article titles and descriptions (BM25 ranked, best match
+        first), optionally within one locale.
+
+        Args:
+            query: Search text
+            locale: Optional locale code to search within (e.g., "en-us")
+            limit: Maximum number of articles to include
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
+
+        Returns:
+            RSS 2.0 XML string with the search results
+
+        Raises:
+            ValueError: If locale is not supported or the query has no searchable terms
+        """
+        # Validate locale; searches across all locales use the English channel
+        generator = self._get_generator(locale or "en-us")
+
+        # Search feeds are not cached: the query is free text, so every
+        # one-off search would take a slot in the shared feed cache
+        version = await self.get_data_version(locale=locale, query=query, limit=limit)
+        articles = await self.repository.search(
+            query, limit=limit, locale=locale, projection="full"
+        )
+
+        # Generate feed URL
+        params = urlencode({k: v for k, v in {"q": query, "locale": locale}.items() if v})
+        feed_url = f"{settings.base_url}/rss/search.{FEED_EXTENSIONS[fmt]}?{params}"
+
+        feed_xml = generator.generate_search_feed(articles, query, feed_url, fmt)
+        feed_xml = await encode_feed(feed_xml, version, fmt)
+
+        logger.info(f"Generated search feed for {query!r} with {len(articles)} articles")
+
+        return feed_xml
+
     async def get_available_locales(self) -> list[str]:
         """
         Get list of available locales that have articles.
@@ -459,6 +827,8 @@ class FeedServiceV2:
 
         Clears all cached feeds. Should be called after updating
         articles in the database to ensure feeds reflect the latest data.
+        Rendered items are kept: they are only reused while the article
+        renders identically, so rebuilt feeds render just the new items.
         """
         self.cache.clear()
         logger.info("FeedServiceV2 cache invalidated")
@@ -2,18 +2,309 @@
 RSS 2.0 feed generator for League of Legends news.
 
 This module provides the RSSFeedGenerator class which transforms Article objects
-into RSS 2.0 compliant XML feeds using the feedgen library.
+into RSS 2.0 compliant XML feeds. Items are escaped and written straight into
+the output rather than built as an XML tree; the markup matches what feedgen
+produced (pretty-printed, same element order), so existing readers and caches
+see identical feeds. The same articles can also be written as Atom 1.0 or
+JSON Feed 1.1 documents.
 """
 
+import hashlib
+import html
+import json
 import logging
+import re
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import datetime, timezone
-
-from feedgen.feed import FeedGenerator
+from typing import Any
 
 from src.models import Article, ArticleSource
 
 logger = logging.getLogger(__name__)
 
+# Characters XML 1.0 does not allow anywhere in a document
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+# Anything _escape() has to change; most short fields contain none of these
+_NEEDS_ESCAPE = re.compile("[&<>\r]")
+
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+_RSS_OPEN = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    '<rss xmlns:atom="http://www.w3.org/2005/Atom" '
+    'xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">\n'
+    "  <channel>\n"
+)
+_RSS_CLOSE = "  </channel>\n</rss>\n"
+
+# RSS 2.0 author format is "email (name)"; we don't have real emails
+_AUTHOR_EMAIL = "noreply@riotgames.com"
+
+_GENERATOR = "LoL Stonks RSS Generator"
+
+# Output formats: RSS 2.0, Atom 1.0 and JSON Feed 1.1
+FEED_FORMATS = ("rss", "atom", "json")
+
+FEED_MEDIA_TYPES = {
+    "rss": "application/rss+xml; charset=utf-8",
+    "atom": "application/atom+xml; charset=utf-8",
+    "json": "application/feed+json; charset=utf-8",
+}
+
+_ATOM_CLOSE = "</feed>\n"
+_JSON_CLOSE = "]}\n"
+
+
+def _escape(text: str) -> str:
+    """
+    Escape text for an XML element body.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Text with markup characters escaped
+    """
+    if not _NEEDS_ESCAPE.search(text):
+        return text
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    return text
+
+
+def _escape_attr(text: str) -> str:
+    """
+    Escape text for a double-quoted XML attribute value.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Escaped attribute value
+    """
+    text = _escape(text).replace('"', "&quot;")
+    if "\n" in text or "\t" in text:
+        text = text.replace("\n", "&#10;").replace("\t", "&#9;")
+    return text
+
+
+def _strip_invalid(xml: str) -> str:
+    """
+    Remove characters that XML 1.0 does not allow.
+
+    Escaping neither adds nor removes them, so this runs once on rendered
+    markup instead of on every field.
+
+    Args:
+        xml: Rendered XML fragment
+
+    Returns:
+        The fragment without invalid characters
+    """
+    # isprintable() is much cheaper than the regex and false for every
+    # invalid character; it is also false for some valid ones (non-breaking
+    # spaces, format characters), which then take the regex path
+    if xml.replace("\n", "").replace("\t", "").isprintable():
+        return xml
+    return _INVALID_XML_CHARS.sub("", xml)
+
+
+def _rfc822(value: datetime) -> str:
+    """
+    Format a datetime as an RFC 822 date, treating naive values as UTC.
+
+    Day and month names are always English, whatever the process locale.
+
+    Args:
+        value: Datetime to format
+
+    Returns:
+        Date string (e.g., "Sat, 28 Dec 2025 10:00:00 +0000")
+    """
+    offset = value.utcoffset()
+    minutes = int(offset.total_seconds()) // 60 if offset else 0
+    sign = "-" if minutes < 0 else "+"
+    hours, minutes = divmod(abs(minutes), 60)
+    return (
+        f"{_DAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} "
+        f"{value.year:04d} {value.hour:02d}:{value.minute:02d}:{value.second:02d} "
+        f"{sign}{hours:02d}{minutes:02d}"
+    )
+
+
+def _rfc3339(value: datetime) -> str:
+    """
+    Format a datetime as an RFC 3339 timestamp, treating naive values as UTC.
+
+    Args:
+        value: Datetime to format
+
+    Returns:
+        Timestamp string (e.g., "2025-12-28T10:00:00+00:00")
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat(timespec="seconds")
+
+
+def _atom_id(guid: str) -> str:
+    """
+    Turn an article GUID into an Atom entry ID, which must be an IRI.
+
+    Args:
+        guid: Article GUID
+
+    Returns:
+        The GUID itself if it already has a scheme, else a tag: URI
+    """
+    if ":" in guid:
+        return guid
+    return f"tag:lolstonks-rss,2025:{guid}"
+
+
+def last_updated(articles: list[Article]) -> datetime | None:
+    """
+    Get the time a feed's content last changed: its newest article's date.
+
+    Args:
+        articles: Feed articles (naive dates are taken as UTC)
+
+    Returns:
+        Timezone-aware publication date of the newest article, or None
+    """
+    if not articles:
+        return None
+    return max(
+        a.pub_date if a.pub_date.tzinfo else a.pub_date.replace(tzinfo=timezone.utc)
+        for a in articles
+    )
+
+
+def item_version(article: Article) -> bytes:
+    """
+    Build the content version of an article's rendered RSS item.
+
+    The version is a digest of every value the item markup depends on, so
+    a cached fragment is reused only when it would render identically
+    without the cache holding a second copy of the article content.
+    Alternates are included because the same article can be collapsed
+    differently in different feeds.
+
+    Args:
+        article: Article to version
+
+    Returns:
+        16-byte BLAKE2b digest of the rendered fields
+    """
+    fields = (
+        article.title,
+        article.url,
+        article.pub_date,
+        article.description,
+        article.content,
+        article.author,
+        article.image_url,
+        tuple(article.categories),
+        str(article.source),
+        tuple((alt.url, alt.source.source_id) for alt in article.alternates),
+    )
+    return hashlib.blake2b(repr(fields).encode("utf-8"), digest_size=16).digest()
+
+
+class ItemFragmentCache:
+    """
+    LRU cache of rendered feed item fragments shared between feeds.
+
+    The same article appears in the main feed, its locale, source and
+    category feeds; with a shared cache each of them reuses the item
+    rendered first, so rebuilding every feed after an update renders
+    roughly one item per new article. Entries are keyed by format and GUID
+    and only reused while the article's item_version() is unchanged.
+
+    Attributes:
+        max_items: Maximum number of cached fragments (0 disables caching)
+        hits: Number of fragments served from the cache
+        misses: Number of fragments rendered
+    """
+
+    def __init__(self, max_items: int = 5000) -> None:
+        """
+        Initialize the fragment cache.
+
+        Args:
+            max_items: Maximum number of cached fragments (0 disables caching)
+        """
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self._fragments: OrderedDict[tuple[str, str], tuple[bytes, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached fragments."""
+        return len(self._fragments)
+
+    def get(self, guid: str, version: bytes, fmt: str = "rss") -> str | None:
+        """
+        Get a cached fragment.
+
+        Args:
+            guid: Article GUID
+            version: Current item_version() of the article
+            fmt: Feed format the fragment was rendered for
+
+        Returns:
+            The fragment, or None if missing or rendered from other content
+        """
+        key = (fmt, guid)
+        entry = self._fragments.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._fragments.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, guid: str, version: bytes, fragment: str, fmt: str = "rss") -> None:
+        """
+        Store a fragment, evicting the least recently used one when full.
+
+        Args:
+            guid: Article GUID
+            version: item_version() the fragment was rendered from
+            fragment: Rendered item markup
+            fmt: Feed format the fragment was rendered for
+        """
+        if self.max_items <= 0:
+            return
+        key = (fmt, guid)
+        self._fragments[key] = (version, fragment)
+        self._fragments.move_to_end(key)
+        if len(self._fragments) > self.max_items:
+            self._fragments.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached fragments."""
+        self._fragments.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, max_items, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._fragments),
+            "max_items": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
 
 class RSSFeedGenerator:
     """
@@ -28,6 +319,8 @@ class RSSFeedGenerator:
         feed_link: Website URL associated with the feed
         feed_description: Description of the feed content
         language: Feed language code (e.g., 'en', 'it')
+        item_cache: Optional cache of rendered items, usually shared by all
+            generators of a service
     """
 
     def __init__(
@@ -36,6 +329,7 @@ class RSSFeedGenerator:
         feed_link: str = "https://www.leagueoflegends.com/news",
         feed_description: str = "Latest news from League of Legends",
         language: str = "en",
+        item_cache: ItemFragmentCache | None = None,
     ) -> None:
         """
         Initialize RSS feed generator.
@@ -45,13 +339,15 @@ class RSSFeedGenerator:
             feed_link: Feed website URL
             feed_description: Feed description
             language: Feed language (en, it, etc.)
+            item_cache: Optional cache of rendered items to reuse across feeds
         """
         self.feed_title = feed_title
         self.feed_link = feed_link
         self.feed_description = feed_description
         self.language = language
+        self.item_cache = item_cache
 
-    def generate_feed(self, articles: list[Article], feed_url: str) -> str:
+    def generate_feed(self, articles: list[Article], feed_url: str, fmt: str = "rss") -> str:
         """
         Generate RSS 2.0 XML feed from articles.
 
@@ -61,42 +357,101 @@ class RSSFeedGenerator:
         Args:
             articles: List of Article objects to include in the feed
             feed_url: Self URL of the feed (for rel='self' link)
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
 
         Returns:
-            RSS 2.0 XML string with proper encoding and structure
+            RSS 2.0 XML string with proper encoding and structure (or the
+            Atom / JSON Feed document when requested)
+
+        Raises:
+            ValueError: If the format is not one of FEED_FORMATS
         """
-        fg = FeedGenerator()
+        feed_xml = "".join(self.iter_feed(articles, feed_url, fmt))
 
-        # Feed metadata (required channel elements)
-        fg.id(feed_url)
-        fg.title(self.feed_title)
-        fg.link(href=self.feed_link, rel="alternate")
-        fg.link(href=feed_url, rel="self")
-        fg.description(self.feed_description)
-        fg.language(self.language)
+        logger.info(f"Generated {fmt} feed with {len(articles)} items")
 
-        # Optional channel elements
-        fg.lastBuildDate(datetime.now(timezone.utc))
-        fg.generator("LoL Stonks RSS Generator")
+        return feed_xml
 
-        # Add articles as feed entries
-        # NOTE: feedgen.add_entry() prepends entries (adds to beginning of feed)
-        # rather than appending. Since database returns [Newest, ..., Oldest],
-        # we iterate in reverse so oldest is added first (and ends up at bottom).
-        # Result: [Newest, ..., Oldest] in final RSS feed.
-        for article in reversed(articles):
-            self._add_article_entry(fg, article)
+    def iter_feed(self, articles: list[Article], feed_url: str, fmt: str = "rss") -> Iterator[str]:
+        """
+        Generate a feed as a sequence of text chunks.
 
-        # Generate RSS 2.0 XML
-        rss_bytes = fg.rss_str(pretty=True)
+        Yields the channel header, one chunk per item (in the given order,
+        newest first as returned by the repository) and the closing tags,
+        so a response can be streamed without building the whole document.
 
-        logger.info(f"Generated RSS feed with {len(articles)} items")
+        Args:
+            articles: List of Article objects to include in the feed
+            feed_url: Self URL of the feed
+            fmt: Output format: "rss", "atom" or "json" (JSON Feed)
 
-        return str(rss_bytes.decode("utf-8"))
+        Yields:
+            Consecutive pieces of the feed document
 
-    def _add_article_entry(self, fg: FeedGenerator, article: Article) -> None:
+        Raises:
+            ValueError: If the format is not one of FEED_FORMATS
+        """
+        if fmt == "rss":
+            header = self._channel_header(articles, feed_url)
+            render, close = self._render_item, _RSS_CLOSE
+        elif fmt == "atom":
+            header = self._atom_header(articles, feed_url)
+            render, close = self._render_atom_entry, _ATOM_CLOSE
+        elif fmt == "json":
+            header, render, close = self._json_header(feed_url), self._render_json_item, _JSON_CLOSE
+        else:
+            raise ValueError(f"Unknown feed format: {fmt!r} (expected one of {FEED_FORMATS})")
+
+        yield header
+        cache = self.item_cache
+        for index, article in enumerate(articles):
+            if cache is None:
+                fragment = render(article)
+            else:
+                version = item_version(article)
+                cached = cache.get(article.guid, version, fmt)
+                if cached is None:
+                    cached = render(article)
+                    cache.set(article.guid, version, cached, fmt)
+                fragment = cached
+            # JSON array elements need separators; XML items are self-delimiting
+            yield f",{fragment}" if index and fmt == "json" else fragment
+        yield close
+
+    def _channel_header(self, articles: list[Article], feed_url: str) -> str:
         """
-        Add article as RSS feed entry.
+        Render the XML declaration and channel metadata.
+
+        The channel <link> is the feed's own URL, as it always was with
+        feedgen (its rel='self' link replaced the alternate one).
+        <lastBuildDate> is when the content last changed (the newest
+        article), so re-rendering unchanged data gives the same document.
+
+        Args:
+            articles: Feed articles (the newest sets <lastBuildDate>)
+            feed_url: Self URL of the feed
+
+        Returns:
+            Document start up to and including <lastBuildDate>
+        """
+        link = _escape(feed_url)
+        updated = last_updated(articles) or datetime.now(timezone.utc)
+        header = (
+            f"{_RSS_OPEN}"
+            f"    <title>{_escape(self.feed_title)}</title>\n"
+            f"    <link>{link}</link>\n"
+            f"    <description>{_escape(self.feed_description)}</description>\n"
+            f'    <atom:link href="{_escape_attr(feed_url)}" rel="self"/>\n'
+            "    <docs>http://www.rssboard.org/rss-specification</docs>\n"
+            f"    <generator>{_GENERATOR}</generator>\n"
+            f"    <language>{_escape(self.language)}</language>\n"
+            f"    <lastBuildDate>{_rfc822(updated)}</lastBuildDate>\n"
+        )
+        return _strip_invalid(header)
+
+    def _render_item(self, article: Article) -> str:
+        """
+        Render an article as an RSS item.
 
         Creates a complete RSS item with all available metadata.
 
@@ -104,65 +459,221 @@ class RSSFeedGenerator:
         <item>
           <title>Article Title</title>
           <link>https://...</link>
-          <guid isPermaLink="true">unique-id</guid>
-          <pubDate>Sat, 28 Dec 2025 10:00:00 +0000</pubDate>
           <description>Article description...</description>
           <content:encoded>Full HTML content</content:encoded>
           <author>author@example.com (Author Name)</author>
+          <guid isPermaLink="false">unique-id</guid>
           <category>Category</category>
-          <enclosure url="image.jpg" type="image/jpeg" length="0"/>
+          <enclosure url="image.jpg" length="0" type="image/jpeg"/>
+          <pubDate>Sat, 28 Dec 2025 10:00:00 +0000</pubDate>
         </item>
 
         Args:
-            fg: FeedGenerator instance to add entry to
             article: Article object to convert to RSS item
+
+        Returns:
+            Indented <item> element followed by a newline
         """
-        fe = fg.add_entry()
+        parts = ["    <item>\n"]
+        append = parts.append
 
-        # Required fields
-        fe.id(article.guid)
-        fe.title(article.title)
-        fe.link(href=article.url)
+        if article.title:
+            append(f"      <title>{_escape(article.title)}</title>\n")
+        if article.url:
+            append(f"      <link>{_escape(article.url)}</link>\n")
 
-        # Ensure pub_date is timezone-aware
-        pub_date = article.pub_date
-        if pub_date.tzinfo is None:
-            pub_date = pub_date.replace(tzinfo=timezone.utc)
-        fe.pubDate(pub_date)
+        content = self._item_content(article)
 
-        # Optional fields
+        # Full HTML goes in content:encoded; without a description it
+        # stands in as the description
         if article.description:
-            fe.description(article.description)
-
-        if article.content:
-            # Use content:encoded for full HTML content
-            fe.content(article.content, type="html")
+            append(f"      <description>{_escape(article.description)}</description>\n")
+            if content:
+                append(f"      <content:encoded>{_escape(content)}</content:encoded>\n")
+        elif content:
+            append(f"      <description>{_escape(content)}</description>\n")
 
         if article.author:
-            # RSS 2.0 author format: email (name)
-            # Use generic email since we don't have real emails
-            fe.author(name=article.author, email="noreply@riotgames.com")
+            append(f"      <author>{_AUTHOR_EMAIL} ({_escape(article.author)})</author>\n")
+        if article.guid:
+            append(f'      <guid isPermaLink="false">{_escape(article.guid)}</guid>\n')
 
-        # Categories
         for category in article.categories:
             if category:  # Skip empty categories
-                fe.category(term=category)
-
+                append(f"      <category>{_escape(category)}</category>\n")
         # Add source as a category
-        fe.category(term=str(article.source))
+        append(f"      <category>{_escape(str(article.source))}</category>\n")
+
+        if article.image_url:
+            # length is required by RSS; '0' is a valid placeholder.
+            # Assume JPEG, could be enhanced
+            append(
+                f'      <enclosure url="{_escape_attr(article.image_url)}" '
+                'length="0" type="image/jpeg"/>\n'
+            )
+
+        append(f"      <pubDate>{_rfc822(article.pub_date)}</pubDate>\n")
+        append("    </item>\n")
+        return _strip_invalid("".join(parts))
+
+    def _item_content(self, article: Article) -> str:
+        """
+        Get the HTML body of an article, with alternates appended.
+
+        Args:
+            article: Article to render
+
+        Returns:
+            HTML content (empty if the article has neither content nor alternates)
+        """
+        if not article.alternates:
+            return article.content
+        # Feed items have a single link, so other coverage goes in the body
+        return (article.content or html.escape(article.description)) + self._alternates_html(
+            article.alternates
+        )
+
+    def _atom_header(self, articles: list[Article], feed_url: str) -> str:
+        """
+        Render the XML declaration and Atom feed metadata.
+
+        Args:
+            articles: Feed articles (the newest sets the feed's <updated>)
+            feed_url: Self URL of the feed
+
+        Returns:
+            Document start up to the first <entry>
+        """
+        updated = last_updated(articles) or datetime.now(timezone.utc)
+        header = (
+            "<?xml version='1.0' encoding='UTF-8'?>\n"
+            f'<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="{_escape_attr(self.language)}">\n'
+            f"  <id>{_escape(feed_url)}</id>\n"
+            f"  <title>{_escape(self.feed_title)}</title>\n"
+            f"  <subtitle>{_escape(self.feed_description)}</subtitle>\n"
+            f'  <link href="{_escape_attr(self.feed_link)}" rel="alternate"/>\n'
+            f'  <link href="{_escape_attr(feed_url)}" rel="self"/>\n'
+            f"  <updated>{_rfc3339(updated)}</updated>\n"
+            f"  <author>\n    <name>{_escape(self.feed_title)}</name>\n  </author>\n"
+            f"  <generator>{_GENERATOR}</generator>\n"
+        )
+        return _strip_invalid(header)
+
+    def _render_atom_entry(self, article: Article) -> str:
+        """
+        Render an article as an Atom entry.
+
+        The description becomes the <summary> and the HTML body the
+        <content>; categories and the source become <category> terms and
+        the image an enclosure link.
+
+        Args:
+            article: Article object to convert
+
+        Returns:
+            Indented <entry> element followed by a newline
+        """
+        published = _rfc3339(article.pub_date)
+        parts = [
+            "  <entry>\n",
+            f"    <id>{_escape(_atom_id(article.guid))}</id>\n",
+            f"    <title>{_escape(article.title)}</title>\n",
+            f'    <link href="{_escape_attr(article.url)}" rel="alternate"/>\n',
+            f"    <published>{published}</published>\n",
+            f"    <updated>{published}</updated>\n",
+        ]
+        append = parts.append
+
+        if article.author:
+            append(f"    <author>\n      <name>{_escape(article.author)}</name>\n    </author>\n")
+        if article.description:
+            append(f'    <summary type="html">{_escape(article.description)}</summary>\n')
+        content = self._item_content(article)
+        if content:
+            append(f'    <content type="html">{_escape(content)}</content>\n')
+
+        for category in article.categories:
+            if category:
+                append(f'    <category term="{_escape_attr(category)}"/>\n')
+        append(f'    <category term="{_escape_attr(str(article.source))}"/>\n')
 
-        # Enclosure (image)
         if article.image_url:
-            # feedgen requires length parameter
-            # Use '0' as placeholder (valid per RSS spec)
-            fe.enclosure(
-                url=article.image_url,
-                length="0",
-                type="image/jpeg",  # Assume JPEG, could be enhanced
+            append(
+                f'    <link href="{_escape_attr(article.image_url)}" rel="enclosure" '
+                'type="image/jpeg"/>\n'
             )
 
+        append("  </entry>\n")
+        return _strip_invalid("".join(parts))
+
+    def _json_header(self, feed_url: str) -> str:
+        """
+        Render the JSON Feed top-level object up to its items array.
+
+        Args:
+            feed_url: Self URL of the feed
+
+        Returns:
+            Document start, ending with the opening bracket of "items"
+        """
+        metadata = {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": self.feed_title,
+            "home_page_url": self.feed_link,
+            "feed_url": feed_url,
+            "description": self.feed_description,
+            "language": self.language,
+        }
+        # Drop the closing brace so items can follow
+        return _strip_invalid(json.dumps(metadata, ensure_ascii=False)[:-1] + ', "items": [')
+
+    def _render_json_item(self, article: Article) -> str:
+        """
+        Render an article as a JSON Feed item.
+
+        Args:
+            article: Article object to convert
+
+        Returns:
+            JSON object text (without a separator)
+        """
+        item: dict[str, Any] = {"id": article.guid, "url": article.url, "title": article.title}
+        content = self._item_content(article)
+        if content:
+            item["content_html"] = content
+        else:
+            item["content_text"] = article.description
+        if article.description:
+            item["summary"] = article.description
+        if article.image_url:
+            item["image"] = article.image_url
+        item["date_published"] = _rfc3339(article.pub_date)
+        if article.author:
+            item["authors"] = [{"name": article.author}]
+        item["tags"] = [category for category in article.categories if category] + [
+            str(article.source)
+        ]
+        return _strip_invalid(json.dumps(item, ensure_ascii=False))
+
+    @staticmethod
+    def _alternates_html(alternates: list[Article]) -> str:
+        """
+        Render the other articles of a collapsed story as an HTML paragraph.
+
+        Args:
+            alternates: Near-duplicate articles from other sources
+
+        Returns:
+            HTML paragraph linking each alternate by its source
+        """
+        links = ", ".join(
+            f'<a href="{html.escape(alt.url)}">{html.escape(alt.source.source_id)}</a>'
+            for alt in alternates
+        )
+        return f"<p>Also covered by: {links}</p>"
+
     def generate_feed_by_source(
-        self, articles: list[Article], source: ArticleSource, feed_url: str
+        self, articles: list[Article], source: ArticleSource, feed_url: str, fmt: str = "rss"
     ) -> str:
         """
         Generate RSS feed filtered by source.
@@ -174,6 +685,7 @@ class RSSFeedGenerator:
             articles: All available articles
             source: Source to filter by (e.g., LOL_EN_US)
             feed_url: Self URL of the feed
+            fmt: Output format: "rss", "atom" or "json"
 
         Returns:
             RSS 2.0 XML string with filtered articles
@@ -185,7 +697,7 @@ class RSSFeedGenerator:
         self.feed_title = f"{original_title} - {str(source)}"
 
         try:
-            feed_xml = self.generate_feed(filtered, feed_url)
+            feed_xml = self.generate_feed(filtered, feed_url, fmt)
         finally:
             # Restore original title
             self.feed_title = original_title
@@ -193,7 +705,7 @@ class RSSFeedGenerator:
         return feed_xml
 
     def generate_feed_by_category(
-        self, articles: list[Article], category: str, feed_url: str
+        self, articles: list[Article], category: str, feed_url: str, fmt: str = "rss"
     ) -> str:
         """
         Generate RSS feed filtered by category.
@@ -205,6 +717,7 @@ class RSSFeedGenerator:
             articles: All available articles
             category: Category name to filter by
             feed_url: Self URL of the feed
+            fmt: Output format: "rss", "atom" or "json"
 
         Returns:
             RSS 2.0 XML string with filtered articles
@@ -216,7 +729,36 @@ class RSSFeedGenerator:
         self.feed_title = f"{original_title} - {category}"
 
         try:
-            feed_xml = self.generate_feed(filtered, feed_url)
+            feed_xml = self.generate_feed(filtered, feed_url, fmt)
+        finally:
+            # Restore original title
+            self.feed_title = original_title
+
+        return feed_xml
+
+    def generate_search_feed(
+        self, articles: list[Article], query: str, feed_url: str, fmt: str = "rss"
+    ) -> str:
+        """
+        Generate RSS feed for full-text search results.
+
+        Articles are kept in relevance order as returned by the repository;
+        only the feed title changes to show the search query.
+
+        Args:
+            articles: Search results, best match first
+            query: Search query for title display
+            feed_url: Self URL of the feed
+            fmt: Output format: "rss", "atom" or "json"
+
+        Returns:
+            RSS 2.0 XML string with search-specific title
+        """
+        original_title = self.feed_title
+        self.feed_title = f"{original_title} - Search: {query}"
+
+        try:
+            feed_xml = self.generate_feed(articles, feed_url, fmt)
         finally:
             # Restore original title
             self.feed_title = original_title
@@ -224,7 +766,7 @@ class RSSFeedGenerator:
         return feed_xml
 
     def generate_feed_by_source_category(
-        self, articles: list[Article], source_category: str, feed_url: str
+        self, articles: list[Article], source_category: str, feed_url: str, fmt: str = "rss"
     ) -> str:
         """
         Generate RSS feed for articles already filtered by source_category.
@@ -240,6 +782,7 @@ class RSSFeedGenerator:
             articles: Pre-filtered articles (by source_category)
             source_category: Source category name for title display
             feed_url: Self URL of the feed
+            fmt: Output format: "rss", "atom" or "json"
 
         Returns:
             RSS 2.0 XML string with category-specific title
@@ -250,7 +793,7 @@ class RSSFeedGenerator:
         self.feed_title = f"{original_title} - {source_category}"
 
         try:
-            feed_xml = self.generate_feed(articles, feed_url)
+            feed_xml = self.generate_feed(articles, feed_url, fmt)
         finally:
             # Restore original title
             self.feed_title = original_title
@@ -0,0 +1,318 @@
+"""
+Bulk export and import of stored articles.
+
+Exports stream the articles table through ArticleRepository.export_rows()
+into NDJSON (optionally gzipped) or Parquet files, one chunk at a time, so
+memory use does not grow with the table. Imports read the same formats in
+batches and write them with save_batch(), which skips articles whose GUID
+or URL is already stored.
+"""
+
+import gzip
+import json
+import logging
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, cast
+
+from src.database import EXPORT_COLUMNS, ArticleRepository
+from src.models import Article
+from src.repository import Repository
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional dependency: pip install lolstonksrss[parquet]
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("ndjson", "parquet")
+
+# Columns exported as UTC timestamps
+TIMESTAMP_COLUMNS = ("pub_date", "created_at")
+
+
+def detect_format(path: str) -> str:
+    """
+    Infer the file format from a path's extension.
+
+    Args:
+        path: File path (e.g., "articles.ndjson.gz", "articles.parquet")
+
+    Returns:
+        "ndjson" or "parquet"
+
+    Raises:
+        ValueError: If the extension is not recognised
+    """
+    suffixes = Path(path).suffixes
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes = suffixes[:-1]
+    if suffixes and suffixes[-1] in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    if suffixes and suffixes[-1] == ".parquet":
+        return "parquet"
+    raise ValueError(f"Cannot infer the format of {path!r}; pass one of {FORMATS}")
+
+
+def _check_format(fmt: str) -> None:
+    """
+    Validate a format name and that its library is available.
+
+    Args:
+        fmt: Format name
+
+    Raises:
+        ValueError: If the format is unknown or pyarrow is missing for Parquet
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt!r} (expected one of {FORMATS})")
+    if fmt == "parquet" and pyarrow is None:
+        raise ValueError("Parquet support requires the 'pyarrow' package")
+
+
+def _open_text(path: str, mode: str, compressed: bool) -> IO[str]:
+    """
+    Open a UTF-8 text file, optionally gzip-compressed.
+
+    Args:
+        path: File path
+        mode: "r" or "w"
+        compressed: Whether the file is gzipped
+
+    Returns:
+        Text file object
+    """
+    if compressed:
+        return cast(IO[str], gzip.open(path, f"{mode}t", encoding="utf-8", compresslevel=6))
+    return open(path, mode, encoding="utf-8")
+
+
+def _parquet_schema() -> Any:
+    """
+    Build the Parquet schema of exported articles.
+
+    Returns:
+        pyarrow schema with UTC millisecond timestamps and string columns
+    """
+    return pyarrow.schema(
+        [
+            (
+                column,
+                (
+                    pyarrow.timestamp("ms", tz="UTC")
+                    if column in TIMESTAMP_COLUMNS
+                    else pyarrow.string()
+                ),
+            )
+            for column in EXPORT_COLUMNS
+        ]
+    )
+
+
+async def export_articles(
+    repository: ArticleRepository,
+    path: str,
+    fmt: str | None = None,
+    chunk_size: int = 5000,
+    locale: str | None = None,
+    source: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    include_content: bool = True,
+) -> int:
+    """
+    Export articles to an NDJSON or Parquet file.
+
+    NDJSON lines are rendered by SQLite (see export_json_lines()) with ISO
+    8601 timestamps; Parquet stores UTC millisecond timestamps and writes one
+    row group per chunk. The file is written under a temporary name and
+    renamed once complete.
+
+    Args:
+        repository: Repository to export from
+        path: Output file path (".gz" gzips NDJSON)
+        fmt: "ndjson" or "parquet" (default: inferred from the extension)
+        chunk_size: Rows read and written per chunk
+        locale: Optional locale filter
+        source: Optional source filter (e.g., "lol:en-us")
+        since: Only articles published at or after this time
+        until: Only articles published before this time
+        include_content: False to leave the content column empty
+
+    Returns:
+        Number of exported articles
+
+    Raises:
+        ValueError: If the format is unknown or unavailable
+    """
+    fmt = fmt or detect_format(path)
+    _check_format(fmt)
+
+    filters: dict[str, Any] = {
+        "chunk_size": chunk_size,
+        "locale": locale,
+        "source": source,
+        "since": since,
+        "until": until,
+        "include_content": include_content,
+    }
+    partial = f"{path}.partial"
+    try:
+        if fmt == "parquet":
+            count = await _write_parquet(repository.export_rows(**filters), partial)
+        else:
+            count = await _write_ndjson(
+                repository.export_json_lines(**filters), partial, path.endswith(".gz")
+            )
+    except BaseException:
+        Path(partial).unlink(missing_ok=True)
+        raise
+
+    Path(partial).replace(path)
+    logger.info(f"Exported {count} articles to {path}")
+    return count
+
+
+async def _write_ndjson(chunks: AsyncIterator[list[str]], path: str, compressed: bool) -> int:
+    """
+    Write JSON object chunks as NDJSON.
+
+    Args:
+        chunks: Chunks yielded by ArticleRepository.export_json_lines()
+        path: File to create
+        compressed: Whether to gzip the output
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    with _open_text(path, "w", compressed) as handle:
+        async for chunk in chunks:
+            handle.write("\n".join(chunk))
+            handle.write("\n")
+            count += len(chunk)
+    return count
+
+
+async def _write_parquet(chunks: AsyncIterator[list[dict[str, Any]]], path: str) -> int:
+    """
+    Write row chunks as Parquet, one row group per chunk.
+
+    Args:
+        chunks: Chunks yielded by ArticleRepository.export_rows()
+        path: File to create
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    schema = _parquet_schema()
+    with pyarrow.parquet.ParquetWriter(path, schema, compression="zstd") as writer:
+        async for chunk in chunks:
+            columns = {column: [row[column] for row in chunk] for column in EXPORT_COLUMNS}
+            writer.write_table(pyarrow.table(columns, schema=schema))
+            count += len(chunk)
+    return count
+
+
+def _read_ndjson(path: str, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """
+    Read an NDJSON file in batches of parsed rows.
+
+    Args:
+        path: Input file path (".gz" for gzipped files)
+        batch_size: Rows per batch
+
+    Yields:
+        Lists of row dicts
+
+    Raises:
+        ValueError: If a line is not a JSON object
+    """
+    batch: list[dict[str, Any]] = []
+    with _open_text(path, "r", path.endswith(".gz")) as handle:
+        for number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{number}: invalid JSON: {e}") from e
+            if not isinstance(row, dict):
+                raise ValueError(f"{path}:{number}: expected a JSON object")
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _read_parquet(path: str, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """
+    Read a Parquet file in batches of rows.
+
+    Args:
+        path: Input file path
+        batch_size: Rows per batch
+
+    Yields:
+        Lists of row dicts (timestamps as datetimes)
+    """
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield record_batch.to_pylist()
+
+
+async def import_articles(
+    repository: Repository,
+    path: str,
+    fmt: str | None = None,
+    batch_size: int = 1000,
+) -> dict[str, int]:
+    """
+    Import articles from an NDJSON or Parquet export.
+
+    Rows are saved in batches through save_batch(), so articles whose GUID
+    (or URL) is already stored are skipped and re-running an import is
+    harmless. Rows missing a required field are skipped and counted.
+
+    Args:
+        repository: Repository to import into
+        path: Input file path
+        fmt: "ndjson" or "parquet" (default: inferred from the extension)
+        batch_size: Articles per save_batch() call
+
+    Returns:
+        Dictionary with read, imported, duplicates and invalid counts
+
+    Raises:
+        ValueError: If the format is unknown or unavailable, or an NDJSON
+            line is not a JSON object
+    """
+    fmt = fmt or detect_format(path)
+    _check_format(fmt)
+
+    reader = _read_parquet if fmt == "parquet" else _read_ndjson
+    stats = {"read": 0, "imported": 0, "duplicates": 0, "invalid": 0}
+    for rows in reader(path, batch_size):
+        articles: list[Article] = []
+        for row in rows:
+            try:
+                articles.append(Article.from_dict(row))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid row {row.get('guid')!r}: {e}")
+                stats["invalid"] += 1
+        new = await repository.save_batch(articles)
+        stats["read"] += len(rows)
+        stats["imported"] += len(new)
+        stats["duplicates"] += len(articles) - len(new)
+
+    logger.info(
+        f"Imported {stats['imported']} of {stats['read']} articles from {path} "
+        f"({stats['duplicates']} duplicates, {stats['invalid']} invalid)"
+    )
+    return stats
@@ -0,0 +1,271 @@
+"""
+Single-writer ingest queue for concurrent update workers.
+
+This module provides the ArticleIngestQueue class which decouples network
+concurrency from SQLite write contention. Update workers submit parsed
+articles to an asyncio queue; one dedicated writer task coalesces pending
+submissions into batches (bounded by size and time), commits each batch with
+a single save_batch() call, and reports per-submission new-article counts
+back to the waiting workers. If a batch fails, its submissions are retried
+one by one, and a failing submission one article at a time, so a bad
+article only costs its own write.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from src.models import Article
+from src.repository import Repository
+
+logger = logging.getLogger(__name__)
+
+
+async def save_articles(
+    repository: Repository, articles: list[Article], label: str, strict: bool = False
+) -> int:
+    """
+    Save articles in one batch, falling back to one at a time if it fails.
+
+    A batch is a single transaction, so one bad article would otherwise
+    lose every other new article of its source.
+
+    Args:
+        repository: Article repository to write to
+        articles: Articles to save
+        label: Source description for log messages (e.g., "lol:en-us")
+        strict: Raise instead of returning 0 when no article could be written
+
+    Returns:
+        Number of new articles saved
+
+    Raises:
+        Exception: With ``strict``, the last write error if no article was written
+    """
+    try:
+        return len(await repository.save_batch(articles))
+    except Exception as e:
+        if len(articles) <= 1:
+            logger.error(f"Error saving articles for {label}: {e}")
+            if strict:
+                raise
+            return 0
+        error = e
+        logger.warning(
+            f"Batch save of {len(articles)} articles for {label} failed ({e}), "
+            "saving them one at a time"
+        )
+
+    new_count, written = 0, 0
+    for article in articles:
+        try:
+            new_count += len(await repository.save_batch([article]))
+            written += 1
+        except Exception as e:
+            error = e
+            logger.error(f"Error saving article {article.guid} for {label}: {e}")
+    if strict and not written:
+        raise error
+    return new_count
+
+
+@dataclass
+class _Submission:
+    """
+    Articles submitted by one worker, awaiting their new-article count.
+
+    Attributes:
+        articles: Articles to persist
+        result: Future resolved with the number of new articles saved
+    """
+
+    articles: list[Article]
+    result: asyncio.Future[int] = field(repr=False)
+
+
+class ArticleIngestQueue:
+    """
+    Queue feeding a single writer task that batches article inserts.
+
+    Workers call submit() and await the number of their articles that were
+    new. The writer drains the queue, waiting up to ``max_batch_delay``
+    seconds for more submissions until ``max_batch_size`` articles are
+    pending, then writes them in one transaction.
+
+    Attributes:
+        repository: Article repository used for batched writes
+        max_batch_size: Article count that triggers an immediate flush
+        max_batch_delay: Seconds to wait for more submissions before flushing
+    """
+
+    def __init__(
+        self,
+        repository: Repository,
+        max_batch_size: int = 500,
+        max_batch_delay: float = 0.05,
+    ) -> None:
+        """
+        Initialize the ingest queue.
+
+        Args:
+            repository: Article repository used for batched writes
+            max_batch_size: Article count that triggers an immediate flush
+            max_batch_delay: Seconds to wait for more submissions before flushing
+        """
+        self.repository = repository
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_delay = max_batch_delay
+        self._queue: asyncio.Queue[_Submission | None] = asyncio.Queue()
+        self._writer_task: asyncio.Task[None] | None = None
+        self.batches_written: int = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the writer task is active."""
+        return self._writer_task is not None and not self._writer_task.done()
+
+    def start(self) -> None:
+        """Start the writer task on the running event loop."""
+        if self.is_running:
+            return
+        self._writer_task = asyncio.create_task(self._run(), name="article-ingest-writer")
+
+    async def stop(self) -> None:
+        """
+        Flush pending submissions and stop the writer task.
+
+        Submissions queued before stop() is called are still written.
+        """
+        if self._writer_task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._writer_task
+        self._writer_task = None
+
+    async def __aenter__(self) -> "ArticleIngestQueue":
+        """Start the writer when entering an async context."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Flush and stop the writer when leaving an async context."""
+        await self.stop()
+
+    async def submit(self, articles: list[Article]) -> int:
+        """
+        Queue articles for the writer and wait for them to be committed.
+
+        Args:
+            articles: Articles to persist
+
+        Returns:
+            Number of submitted articles that were new
+
+        Raises:
+            RuntimeError: If the writer task is not running
+            Exception: Propagates the error raised while writing the batch
+        """
+        if not articles:
+            return 0
+        if not self.is_running:
+            raise RuntimeError("Ingest queue writer is not running")
+
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_Submission(articles=articles, result=future))
+        return await future
+
+    async def _run(self) -> None:
+        """Writer loop: collect submissions into batches and flush them."""
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            pending = len(first.articles)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.max_batch_delay
+
+            # Coalesce more submissions until the batch is full or the window closes
+            while pending < self.max_batch_size:
+                timeout = deadline - loop.time()
+                try:
+                    if timeout > 0:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    else:
+                        item = self._queue.get_nowait()
+                except (TimeoutError, asyncio.QueueEmpty):
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                pending += len(item.articles)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[_Submission]) -> None:
+        """
+        Write one coalesced batch and resolve each submission's future.
+
+        A failed batch is retried one submission at a time, so one worker's
+        bad article does not fail the other workers' submissions.
+
+        Args:
+            batch: Submissions to write together
+        """
+        if len(batch) == 1:
+            await self._write_submission(batch[0])
+            return
+
+        articles = [article for submission in batch for article in submission.articles]
+        try:
+            new_guids = set(await self.repository.save_batch(articles))
+        except Exception as e:
+            logger.warning(
+                f"Ingest batch of {len(articles)} articles failed ({e}), "
+                f"retrying its {len(batch)} submissions separately"
+            )
+            for submission in batch:
+                await self._write_submission(submission)
+            return
+
+        self.batches_written += 1
+        logger.debug(
+            f"Ingest batch written: {len(batch)} submissions, "
+            f"{len(articles)} articles, {len(new_guids)} new"
+        )
+
+        for submission in batch:
+            new_count = 0
+            for article in submission.articles:
+                # Credit each new GUID once, to the first submission that carried it
+                if article.guid in new_guids:
+                    new_guids.discard(article.guid)
+                    new_count += 1
+            if not submission.result.done():
+                submission.result.set_result(new_count)
+
+    async def _write_submission(self, submission: _Submission) -> None:
+        """
+        Write one submission on its own and resolve its future.
+
+        The submission resolves with the number of new articles among those
+        that could be written; it fails only if none of them could.
+
+        Args:
+            submission: Submission to write
+        """
+        try:
+            new_count = await save_articles(
+                self.repository, submission.articles, "ingest submission", strict=True
+            )
+        except Exception as e:
+            if not submission.result.done():
+                submission.result.set_exception(e)
+            return
+
+        self.batches_written += 1
+        if not submission.result.done():
+            submission.result.set_result(new_count)
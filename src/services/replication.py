@@ -0,0 +1,321 @@
+"""
+Snapshot shipping between an ingest node and read-only API replicas.
+
+The primary (ingest) node periodically writes an online backup into a
+shared directory and points ``latest.json`` at it. Replica nodes poll that
+manifest, copy each new snapshot to local disk, open it read-only and swap
+it in for feed serving. Replication lag is the age of the snapshot a
+replica is serving.
+
+Every shipment is a full copy of the database, not a log of the pages
+that changed since the last one: each interval the primary backs up, and
+every replica copies, the whole file. That keeps replicas trivially
+consistent but costs O(database size) disk I/O per interval on both ends,
+so large databases need a longer REPLICATION_INTERVAL_SECONDS.
+"""
+
+import asyncio
+import json
+import logging
+import shutil
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from src.database import ArticleRepository
+
+logger = logging.getLogger(__name__)
+
+# Manifest naming the newest complete snapshot in the shared directory
+MANIFEST_NAME = "latest.json"
+
+# Local database served until the first snapshot arrives
+EMPTY_REPLICA_NAME = "empty.db"
+
+
+class SnapshotPublisher:
+    """
+    Ships snapshots of the primary database to the shared directory.
+
+    Attributes:
+        repository: Repository of the primary database
+        directory: Shared replication directory
+        keep: Number of snapshots retained in the shared directory
+        pages_per_step: Database pages copied per backup step
+    """
+
+    def __init__(
+        self,
+        repository: ArticleRepository,
+        directory: str,
+        keep: int = 3,
+        pages_per_step: int = 1024,
+    ) -> None:
+        """
+        Initialize the snapshot publisher.
+
+        Args:
+            repository: Repository of the primary database
+            directory: Shared replication directory (created if missing)
+            keep: Number of snapshots retained (older ones may still be
+                being copied by a replica, so keep at least 2)
+            pages_per_step: Database pages copied per backup step
+        """
+        self.repository = repository
+        self.directory = Path(directory)
+        self.keep = keep
+        self.pages_per_step = pages_per_step
+        self.last_manifest: dict[str, Any] | None = None
+
+    async def publish(self) -> dict[str, Any]:
+        """
+        Write a new snapshot and point the manifest at it.
+
+        The manifest is replaced atomically after the snapshot is complete,
+        so replicas never see a partially written file.
+
+        Returns:
+            Backup statistics of the shipped snapshot
+        """
+        stats = await self.repository.backup(
+            str(self.directory), keep=self.keep, pages_per_step=self.pages_per_step
+        )
+        manifest = {
+            "snapshot": Path(stats["path"]).name,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "schema_version": ArticleRepository.SCHEMA_VERSION,
+            "bytes": stats["bytes"],
+        }
+        partial = self.directory / f"{MANIFEST_NAME}.partial"
+        partial.write_text(json.dumps(manifest), encoding="utf-8")
+        partial.replace(self.directory / MANIFEST_NAME)
+
+        self.last_manifest = manifest
+        logger.info(f"Shipped snapshot {manifest['snapshot']} to {self.directory}")
+        return stats
+
+    def get_status(self) -> dict[str, Any]:
+        """
+        Get publisher status.
+
+        Returns:
+            Status dictionary with the role and last shipped snapshot
+        """
+        return {
+            "role": "primary",
+            "directory": str(self.directory),
+            "snapshot": self.last_manifest["snapshot"] if self.last_manifest else None,
+            "snapshot_created_at": (
+                self.last_manifest["created_at"] if self.last_manifest else None
+            ),
+        }
+
+
+class ReplicaSync:
+    """
+    Keeps a read-only replica in step with the shipped snapshots.
+
+    Each new snapshot is copied to ``local_dir`` and opened as a fresh
+    read-only ArticleRepository, then handed to ``on_swap``. Snapshots
+    written at another schema version are refused, since a replica never
+    migrates what it serves. The previous repository
+    is kept open until the next swap, so requests still holding one of its
+    connections can finish.
+
+    Attributes:
+        directory: Shared replication directory
+        local_dir: Local directory holding the served copies
+        repository: Repository currently served (None before open())
+        on_swap: Callback receiving each newly opened repository
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        local_dir: str,
+        read_pool_size: int = 4,
+        on_swap: Callable[[ArticleRepository], None] | None = None,
+    ) -> None:
+        """
+        Initialize the replica synchroniser.
+
+        Args:
+            directory: Shared replication directory written by the primary
+            local_dir: Local directory for the served copies (created if missing)
+            read_pool_size: Reader connections per opened repository
+            on_swap: Callback receiving each newly opened repository
+        """
+        self.directory = Path(directory)
+        self.local_dir = Path(local_dir)
+        self.read_pool_size = read_pool_size
+        self.on_swap = on_swap
+        self.repository: ArticleRepository | None = None
+        self.snapshot: str | None = None
+        self.snapshot_created_at: datetime | None = None
+        self.last_sync: datetime | None = None
+        self._retired: ArticleRepository | None = None
+        self.local_dir.mkdir(parents=True, exist_ok=True)
+
+    async def open(self) -> ArticleRepository:
+        """
+        Open the newest available snapshot, or an empty database if none exists.
+
+        Returns:
+            Repository to serve until the next swap
+        """
+        if await self.sync() and self.repository is not None:
+            return self.repository
+        logger.warning(f"No snapshot in {self.directory} yet, serving an empty replica")
+        empty = self.local_dir / EMPTY_REPLICA_NAME
+        if not empty.exists():
+            # Create the schema once; the replica itself only ever opens it read-only
+            created = ArticleRepository(str(empty))
+            await created.initialize()
+            await created.close()
+        return await self._swap(str(empty))
+
+    async def sync(self) -> bool:
+        """
+        Swap in the snapshot named by the manifest if it is new.
+
+        Returns:
+            True if a new snapshot was swapped in
+        """
+        manifest = self._read_manifest()
+        if manifest is None or manifest["snapshot"] == self.snapshot:
+            return False
+
+        # Only ever a bare file name inside the shared directory
+        name = Path(manifest["snapshot"]).name
+        if manifest.get("schema_version") != ArticleRepository.SCHEMA_VERSION:
+            logger.error(
+                f"Refusing snapshot {name}: schema v{manifest.get('schema_version')}, "
+                f"this node serves v{ArticleRepository.SCHEMA_VERSION}"
+            )
+            return False
+
+        local = self.local_dir / name
+        try:
+            await asyncio.to_thread(self._copy, self.directory / name, local)
+        except FileNotFoundError:
+            # Rotated away between reading the manifest and copying it
+            logger.warning(f"Snapshot {name} disappeared before it could be copied")
+            return False
+
+        try:
+            await self._swap(str(local))
+        except RuntimeError as e:
+            # The file itself disagrees with its manifest
+            logger.error(f"Refusing snapshot {name}: {e}")
+            local.unlink(missing_ok=True)
+            return False
+        self.snapshot = name
+        self.snapshot_created_at = datetime.fromisoformat(manifest["created_at"])
+        self.last_sync = datetime.now(timezone.utc)
+        logger.info(f"Replica now serving snapshot {name}")
+        return True
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        """
+        Read the shared manifest.
+
+        Returns:
+            Parsed manifest, or None if it is missing or unreadable
+        """
+        try:
+            manifest = json.loads((self.directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read replication manifest: {e}")
+            return None
+        return manifest if isinstance(manifest, dict) and "snapshot" in manifest else None
+
+    @staticmethod
+    def _copy(source: Path, target: Path) -> None:
+        """
+        Copy a snapshot to local disk under a temporary name, then rename it.
+
+        Args:
+            source: Snapshot in the shared directory
+            target: Local path to create
+        """
+        partial = target.with_name(f"{target.name}.partial")
+        shutil.copyfile(source, partial)
+        partial.replace(target)
+
+    async def _swap(self, path: str) -> ArticleRepository:
+        """
+        Open a local database read-only and make it the served repository.
+
+        Args:
+            path: Local database file to open
+
+        Returns:
+            The newly served repository
+
+        Raises:
+            RuntimeError: If the database is not at the current schema version
+        """
+        repository = ArticleRepository(path, read_pool_size=self.read_pool_size, read_only=True)
+        await repository.initialize()
+
+        previous, self.repository = self.repository, repository
+        if self.on_swap:
+            self.on_swap(repository)
+
+        await self._discard(self._retired)
+        self._retired = previous
+        return repository
+
+    @staticmethod
+    async def _discard(repository: ArticleRepository | None) -> None:
+        """
+        Close a retired repository and delete its local files.
+
+        Args:
+            repository: Repository to discard (None does nothing)
+        """
+        if repository is None:
+            return
+        await repository.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{repository.db_path}{suffix}").unlink(missing_ok=True)
+
+    def lag_seconds(self) -> float | None:
+        """
+        Get the age of the snapshot being served.
+
+        Returns:
+            Seconds since the primary shipped the served snapshot, or None
+            before the first snapshot arrives
+        """
+        if self.snapshot_created_at is None:
+            return None
+        return (datetime.now(timezone.utc) - self.snapshot_created_at).total_seconds()
+
+    def get_status(self) -> dict[str, Any]:
+        """
+        Get replica status.
+
+        Returns:
+            Status dictionary with the served snapshot and replication lag
+        """
+        return {
+            "role": "replica",
+            "directory": str(self.directory),
+            "snapshot": self.snapshot,
+            "snapshot_created_at": (
+                self.snapshot_created_at.isoformat() if self.snapshot_created_at else None
+            ),
+            "last_sync": self.last_sync.isoformat() if self.last_sync else None,
+            "lag_seconds": self.lag_seconds(),
+        }
+
+    async def close(self) -> None:
+        """Close the served and retired repositories."""
+        await self._discard(self._retired)
+        self._retired = None
+        if self.repository is not None:
+            await self.repository.close()
@@ -13,9 +13,11 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from src.config import get_settings
-from src.database import ArticleRepository
 from src.integrations.github_dispatcher import GitHubWorkflowDispatcher
+from src.repository import MaintainedRepository
+from src.services.replication import ReplicaSync, SnapshotPublisher
 from src.services.update_service import UpdateServiceV2
+from src.utils.metrics import record_database_backup, record_database_maintenance
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -27,19 +29,51 @@ class NewsScheduler:
 
     Uses APScheduler to trigger updates at configured intervals.
     Prevents overlapping updates and provides manual trigger capability.
+    Optionally runs a periodic database maintenance job (retention,
+    incremental vacuum and ANALYZE) and a periodic online backup job. On a
+    replication primary it also ships snapshots; on a replica it only polls
+    for new snapshots and never runs updates.
     """
 
-    def __init__(self, repository: ArticleRepository, interval_minutes: int = 30) -> None:
+    def __init__(
+        self,
+        repository: MaintainedRepository,
+        interval_minutes: int = 30,
+        maintenance_interval_hours: float = 0,
+        backup_interval_hours: float = 0,
+        publisher: SnapshotPublisher | None = None,
+        replica: ReplicaSync | None = None,
+        replication_interval_seconds: int = 60,
+    ) -> None:
         """
         Initialize scheduler.
 
         Args:
             repository: Article repository
             interval_minutes: Update interval in minutes (default: 30)
+            maintenance_interval_hours: Database maintenance interval in hours
+                (default: 0, no maintenance job)
+            backup_interval_hours: Database backup interval in hours
+                (default: 0, no backup job)
+            publisher: Snapshot publisher of a replication primary
+            replica: Snapshot synchroniser of a read-only replica (replaces
+                the update job)
+            replication_interval_seconds: Seconds between snapshot shipments
+                or replica polls
         """
         self.repository = repository
         self.interval_minutes = interval_minutes
-        self.update_service = UpdateServiceV2(repository)
+        self.maintenance_interval_hours = maintenance_interval_hours
+        self.backup_interval_hours = backup_interval_hours
+        self.publisher = publisher
+        self.replica = replica
+        self.replication_interval_seconds = replication_interval_seconds
+        self.update_service = UpdateServiceV2(
+            repository,
+            max_concurrent=settings.update_max_concurrent,
+            ingest_batch_size=settings.ingest_batch_size,
+            ingest_batch_delay=settings.ingest_batch_delay_ms / 1000,
+        )
         self.scheduler = AsyncIOScheduler()
         self.is_running = False
 
@@ -51,15 +85,56 @@ class NewsScheduler:
 
         logger.info(f"Starting scheduler with {self.interval_minutes} minute interval")
 
-        # Add job for periodic updates
-        self.scheduler.add_job(
-            self._update_job,
-            trigger=IntervalTrigger(minutes=self.interval_minutes),
-            id="update_news",
-            name="Update LoL News",
-            replace_existing=True,
-            max_instances=1,  # Prevent overlapping runs
-        )
+        if self.replica is None:
+            # Add job for periodic updates
+            self.scheduler.add_job(
+                self._update_job,
+                trigger=IntervalTrigger(minutes=self.interval_minutes),
+                id="update_news",
+                name="Update LoL News",
+                replace_existing=True,
+                max_instances=1,  # Prevent overlapping runs
+            )
+        else:
+            # Replicas never write: they only pick up shipped snapshots
+            self.scheduler.add_job(
+                self._replica_sync_job,
+                trigger=IntervalTrigger(seconds=self.replication_interval_seconds),
+                id="replica_sync",
+                name="Replica Sync",
+                replace_existing=True,
+                max_instances=1,
+            )
+
+        if self.publisher is not None:
+            self.scheduler.add_job(
+                self._ship_snapshot_job,
+                trigger=IntervalTrigger(seconds=self.replication_interval_seconds),
+                id="ship_snapshot",
+                name="Ship Snapshot",
+                replace_existing=True,
+                max_instances=1,
+            )
+
+        if self.maintenance_interval_hours > 0:
+            self.scheduler.add_job(
+                self._maintenance_job,
+                trigger=IntervalTrigger(hours=self.maintenance_interval_hours),
+                id="database_maintenance",
+                name="Database Maintenance",
+                replace_existing=True,
+                max_instances=1,
+            )
+
+        if self.backup_interval_hours > 0:
+            self.scheduler.add_job(
+                self._backup_job,
+                trigger=IntervalTrigger(hours=self.backup_interval_hours),
+                id="database_backup",
+                name="Database Backup",
+                replace_existing=True,
+                max_instances=1,
+            )
 
         # Start scheduler
         self.scheduler.start()
@@ -132,6 +207,112 @@ class NewsScheduler:
             logger.error(f"Update job failed: {e}")
             return {"error": str(e), "timestamp": datetime.utcnow().isoformat()}
 
+    async def trigger_maintenance_now(self) -> dict[str, Any]:
+        """
+        Manually trigger an immediate database maintenance run.
+
+        Returns:
+            Maintenance statistics dictionary
+        """
+        logger.info("Manual database maintenance triggered")
+        return await self._maintenance_job()
+
+    async def _maintenance_job(self) -> dict[str, Any]:
+        """
+        Job function for database maintenance.
+
+        Applies the configured retention policies, brings stored article text
+        in line with the compression setting, then reclaims free pages and
+        refreshes planner statistics.
+
+        Returns:
+            Maintenance statistics dictionary
+        """
+        try:
+            retention = {"deleted": 0, "archived": 0}
+            if settings.retention_policies:
+                retention = await self.repository.apply_retention(
+                    settings.retention_policies,
+                    archive_path=settings.archive_database_path,
+                )
+
+            # Compress rows stored before compression was enabled (or decode
+            # them again after it was turned off) before reclaiming pages; a
+            # no-op without a full scan unless the codec changed since last run
+            recompressed = await self.repository.recompress_stored_text()
+
+            stats = await self.repository.run_maintenance(
+                vacuum_pages=settings.maintenance_vacuum_pages
+            )
+            record_database_maintenance(stats, retention)
+            return {**stats, **retention, "recompressed": recompressed}
+        except Exception as e:
+            logger.error(f"Maintenance job failed: {e}")
+            return {"error": str(e), "timestamp": datetime.utcnow().isoformat()}
+
+    async def trigger_backup_now(self) -> dict[str, Any]:
+        """
+        Manually trigger an immediate database backup.
+
+        Returns:
+            Backup statistics dictionary
+        """
+        logger.info("Manual database backup triggered")
+        return await self._backup_job()
+
+    async def _backup_job(self) -> dict[str, Any]:
+        """
+        Job function for online database backups.
+
+        Writes a snapshot to the configured backup directory and rotates
+        old ones. The copy runs alongside updates and feed requests.
+
+        Returns:
+            Backup statistics dictionary
+        """
+        try:
+            stats = await self.repository.backup(
+                settings.backup_directory,
+                keep=settings.backup_keep,
+                pages_per_step=settings.backup_pages_per_step,
+            )
+            record_database_backup("success", stats["bytes"])
+            return stats
+        except Exception as e:
+            logger.error(f"Backup job failed: {e}")
+            record_database_backup("failure")
+            return {"error": str(e), "timestamp": datetime.utcnow().isoformat()}
+
+    async def _ship_snapshot_job(self) -> dict[str, Any]:
+        """
+        Job function shipping a snapshot to the replication directory.
+
+        Returns:
+            Backup statistics dictionary of the shipped snapshot
+        """
+        if self.publisher is None:
+            return {}
+        try:
+            return await self.publisher.publish()
+        except Exception as e:
+            logger.error(f"Snapshot shipping failed: {e}")
+            return {"error": str(e), "timestamp": datetime.utcnow().isoformat()}
+
+    async def _replica_sync_job(self) -> dict[str, Any]:
+        """
+        Job function swapping in the newest shipped snapshot on a replica.
+
+        Returns:
+            Dictionary with whether a snapshot was swapped in
+        """
+        if self.replica is None:
+            return {}
+        try:
+            return {"swapped": await self.replica.sync()}
+        except Exception as e:
+            logger.error(f"Replica sync failed: {e}")
+            return {"error": str(e), "timestamp": datetime.utcnow().isoformat()}
+
     def get_status(self) -> dict[str, Any]:
         """
         Get scheduler status.
@@ -149,9 +330,14 @@ class NewsScheduler:
                 }
             )
 
-        return {
+        status: dict[str, Any] = {
             "running": self.is_running,
             "interval_minutes": self.interval_minutes,
             "jobs": jobs,
             "update_service": self.update_service.get_status(),
         }
+        if self.publisher is not None:
+            status["replication"] = self.publisher.get_status()
+        elif self.replica is not None:
+            status["replication"] = self.replica.get_status()
+        return status
@@ -17,9 +17,10 @@ from typing import Any
 
 from src.api_client import LoLNewsAPIClient
 from src.config import GAME_CATEGORIES, GAME_DOMAINS, RIOT_LOCALES, get_settings
-from src.database import ArticleRepository
 from src.models import Article, ArticleSource, SourceCategory
+from src.repository import Repository
 from src.scrapers import ALL_SCRAPER_SOURCES, get_scraper
+from src.services.ingest_queue import ArticleIngestQueue, save_articles
 from src.utils.circuit_breaker import CircuitBreakerOpenError, get_circuit_breaker_registry
 from src.utils.metrics import (
     active_update_tasks,
@@ -47,7 +48,7 @@ class UpdateService:
     Tracks update statistics and handles errors gracefully.
     """
 
-    def __init__(self, repository: ArticleRepository) -> None:
+    def __init__(self, repository: Repository) -> None:
         """
         Initialize update service.
 
@@ -132,16 +133,9 @@ class UpdateService:
 
         stats = {"fetched": len(articles), "new": 0, "duplicates": 0}
 
-        # Save to database
-        for article in articles:
-            try:
-                saved = await self.repository.save(article)
-                if saved:
-                    stats["new"] += 1
-                else:
-                    stats["duplicates"] += 1
-            except Exception as e:
-                logger.error(f"Error saving article {article.guid}: {e}")
+        # Save to database in a single batched transaction
+        stats["new"] = await save_articles(self.repository, articles, locale)
+        stats["duplicates"] = len(articles) - stats["new"]
 
         logger.info(
             f"{locale}: {stats['fetched']} fetched, "
@@ -268,16 +262,26 @@ class UpdateServiceV2:
     # Base rate limit for unknown domains
     BASE_RATE_LIMIT: float = 2.0
 
-    def __init__(self, repository: ArticleRepository, max_concurrent: int = 10) -> None:
+    def __init__(
+        self,
+        repository: Repository,
+        max_concurrent: int = 10,
+        ingest_batch_size: int = 500,
+        ingest_batch_delay: float = 0.05,
+    ) -> None:
         """
         Initialize the update service.
 
         Args:
             repository: Article repository for database operations
             max_concurrent: Maximum number of concurrent update tasks
+            ingest_batch_size: Article count that flushes an ingest batch immediately
+            ingest_batch_delay: Seconds the ingest writer waits to coalesce submissions
         """
         self.repository = repository
         self.max_concurrent = max_concurrent
+        self.ingest_batch_size = ingest_batch_size
+        self.ingest_batch_delay = ingest_batch_delay
         self.domain_rate_limits: dict[str, asyncio.Semaphore] = {}
         self.last_update: datetime | None = None
         self.update_count: int = 0
@@ -388,7 +392,9 @@ class UpdateServiceV2:
         """
         return await self._fetch_game_news("lol", locale)
 
-    async def _update_source(self, task: UpdateTask) -> int:
+    async def _update_source(
+        self, task: UpdateTask, ingest: ArticleIngestQueue | None = None
+    ) -> int:
         """
         Update articles for a single source-locale combination.
 
@@ -398,6 +404,8 @@ class UpdateServiceV2:
 
         Args:
             task: Update task containing source_id, locale, and priority
+            ingest: Optional shared ingest queue; when given, articles are
+                    handed to its single writer instead of written directly
 
         Returns:
             Number of new articles saved
@@ -448,15 +456,16 @@ class UpdateServiceV2:
             # Update scraper last success timestamp
             update_scraper_last_success(task.source_id, task.locale)
 
-            # Save articles and count new ones
+            # Save articles in one batched transaction and count new ones
             new_count = 0
-            for article in articles:
-                try:
-                    saved = await self.repository.save(article)
-                    if saved:
-                        new_count += 1
-                except Exception as e:
-                    logger.error(f"Error saving article {article.guid}: {e}")
+            try:
+                if ingest is not None:
+                    new_count = await ingest.submit(articles)
+                else:
+                    label = f"{task.source_id}:{task.locale}"
+                    new_count = await save_articles(self.repository, articles, label)
+            except Exception as e:
+                logger.error(f"Error saving articles for {task.source_id}:{task.locale}: {e}")
 
             logger.info(
                 f"Updated {task.source_id}:{task.locale}: "
@@ -559,6 +568,10 @@ class UpdateServiceV2:
         """
         Execute update tasks with concurrency control.
 
+        Workers only fetch and parse; all writes go through one shared
+        ArticleIngestQueue so concurrent tasks never contend for the
+        SQLite write lock.
+
         Args:
             tasks: List of UpdateTask instances to execute
 
@@ -567,13 +580,18 @@ class UpdateServiceV2:
         """
         semaphore = asyncio.Semaphore(self.max_concurrent)
         stats = {"success": 0, "failed": 0, "total": len(tasks), "new_articles": 0}
+        ingest = ArticleIngestQueue(
+            self.repository,
+            max_batch_size=self.ingest_batch_size,
+            max_batch_delay=self.ingest_batch_delay,
+        )
 
         async def worker(task: UpdateTask) -> int:
             """Worker coroutine that processes a single task."""
             async with semaphore:
                 active_update_tasks.inc()
                 try:
-                    new_count = await self._update_source(task)
+                    new_count = await self._update_source(task, ingest)
                     stats["success"] += 1
                     stats["new_articles"] += new_count
                     return new_count
@@ -587,10 +605,11 @@ class UpdateServiceV2:
         update_all_circuit_breaker_metrics(self.cb_registry)
 
         # Execute all tasks concurrently with semaphore limiting
-        await asyncio.gather(
-            *[worker(task) for task in tasks],
-            return_exceptions=False,
-        )
+        async with ingest:
+            await asyncio.gather(
+                *[worker(task) for task in tasks],
+                return_exceptions=False,
+            )
 
         # Update circuit breaker metrics after execution
         update_all_circuit_breaker_metrics(self.cb_registry)
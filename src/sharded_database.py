@@ -0,0 +1,776 @@
+"""
+Per-locale-group sharding of the article database.
+
+ShardedArticleRepository keeps one SQLite file per locale group and exposes
+the ArticleRepository API on top of them. Writes are routed to the shard of
+the article's locale, so shards commit in parallel. Single-locale reads go
+to one shard. Cross-locale reads query every shard concurrently and merge
+the results newest first.
+"""
+
+import asyncio
+import heapq
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.database import ArticleRepository, encode_cursor
+from src.models import Article, ArticleSource, RetentionPolicy, to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+# Shard receiving locales that belong to no configured group
+DEFAULT_SHARD = "other"
+
+# Groups that span other groups and therefore never become shards
+SKIPPED_GROUPS = ("all",)
+
+# Each shard allocates article ids from its own range (shard index << 40), so
+# ids, cluster ids and pagination cursors stay unique across shards and
+# ascending ids sort shards in index order
+SHARD_ID_BITS = 40
+
+
+def build_shard_map(locale_groups: dict[str, list[str]]) -> dict[str, str]:
+    """
+    Assign every grouped locale to exactly one shard.
+
+    Groups overlap (en-gb is both "english" and "eu"), so a locale belongs to
+    the first group listing it, in configuration order. Groups left without
+    locales of their own get no shard.
+
+    Args:
+        locale_groups: Locale groups from settings (group name -> locale codes)
+
+    Returns:
+        Mapping of locale code to shard name
+    """
+    shard_of: dict[str, str] = {}
+    for group, locales in locale_groups.items():
+        if group in SKIPPED_GROUPS:
+            continue
+        for locale in locales:
+            shard_of.setdefault(locale.lower(), group)
+    return shard_of
+
+
+class ShardedArticleRepository:
+    """
+    Article repository split into one SQLite database per locale group.
+
+    Exposes the same public methods as ArticleRepository.
+
+    - Writes go to the shard of each article's locale. A mixed batch is
+      split and the per-shard batches are committed in parallel.
+    - Reads scoped to one locale are routed to its shard.
+    - Other reads fan out to all shards and are merged by pub_date.
+    - Ties on pub_date are broken by shard order, which matches the global
+      id order, so keyset cursors work unchanged.
+    - Full-text search results from several shards are interleaved by rank
+      position, because BM25 scores from different shards are not comparable.
+    - Retention policies scoped to a locale run on that shard only. Policies
+      without a locale scope apply their max_count per shard.
+
+    Attributes:
+        shard_dir: Directory holding the shard files
+        shard_of: Mapping of locale code to shard name
+        shards: Repository per shard name, in shard order
+    """
+
+    def __init__(
+        self,
+        shard_dir: str,
+        locale_groups: dict[str, list[str]],
+        read_pool_size: int = 4,
+        compression: str = "none",
+        compress_description: bool = False,
+    ) -> None:
+        """
+        Initialize the sharded repository.
+
+        Args:
+            shard_dir: Directory for the shard files (``articles-<group>.db``)
+            locale_groups: Locale groups defining the shards
+            read_pool_size: Reader connections per shard
+            compression: Codec for stored article text ("none", "zlib" or "zstd")
+            compress_description: Also compress the description column
+
+        Raises:
+            ValueError: If the compression codec is unknown or unavailable
+        """
+        self.shard_dir = shard_dir
+        self.shard_of = build_shard_map(locale_groups)
+        names = list(dict.fromkeys(self.shard_of.values())) + [DEFAULT_SHARD]
+        self.shards: dict[str, ArticleRepository] = {
+            name: ArticleRepository(
+                str(Path(shard_dir) / f"articles-{name}.db"),
+                read_pool_size=read_pool_size,
+                compression=compression,
+                compress_description=compress_description,
+            )
+            for name in names
+        }
+
+    def shard_for(self, locale: str | None) -> ArticleRepository:
+        """
+        Get the shard storing a locale.
+
+        Args:
+            locale: Locale code (e.g., "en-us")
+
+        Returns:
+            Repository of the locale's shard
+        """
+        return self.shards[self.shard_of.get((locale or "").lower(), DEFAULT_SHARD)]
+
+    def _shards_for(
+        self, locales: Iterable[str] | None = None, source: str | None = None
+    ) -> list[ArticleRepository]:
+        """
+        Get the shards a read has to query, in shard order.
+
+        Args:
+            locales: Locale filter (None for every locale)
+            source: Source filter (e.g., "lol:en-us"), which implies a locale
+
+        Returns:
+            Repositories to query
+        """
+        if source and not locales:
+            try:
+                locales = [ArticleSource.from_string(source).locale]
+            except ValueError:
+                locales = None
+        if not locales:
+            return list(self.shards.values())
+        wanted = {id(self.shard_for(locale)) for locale in locales}
+        return [shard for shard in self.shards.values() if id(shard) in wanted]
+
+    async def initialize(self) -> None:
+        """
+        Open and migrate every shard, reserving each shard's id range.
+
+        Raises:
+            RuntimeError: If a shard's ids fall outside its reserved range
+        """
+        await asyncio.gather(*(shard.initialize() for shard in self.shards.values()))
+        for index, shard in enumerate(self.shards.values()):
+            base = index << SHARD_ID_BITS
+            await shard.execute(
+                "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'articles'", (base,)
+            )
+            await shard.execute(
+                "INSERT INTO sqlite_sequence (name, seq) SELECT 'articles', ? "
+                "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'articles')",
+                (base,),
+            )
+            rows = await shard.fetch_all("SELECT MIN(id) FROM articles")
+            lowest = rows[0][0] if rows else None
+            if index and lowest is not None and lowest <= base:
+                raise RuntimeError(
+                    f"Shard {shard.db_path} holds ids below its range; "
+                    "it was not created by ShardedArticleRepository"
+                )
+        logger.info(f"Sharded database initialized in {self.shard_dir} ({len(self.shards)} shards)")
+
+    async def get_schema_version(self) -> int:
+        """
+        Get the schema version shared by all shards.
+
+        Returns:
+            Lowest schema version recorded across the shards
+        """
+        versions = await asyncio.gather(
+            *(shard.get_schema_version() for shard in self.shards.values())
+        )
+        return min(versions)
+
+    async def close(self) -> None:
+        """Close every shard."""
+        await asyncio.gather(*(shard.close() for shard in self.shards.values()))
+
+    async def save(self, article: Article) -> bool:
+        """
+        Save a single article to its locale's shard.
+
+        Args:
+            article: Article instance to save
+
+        Returns:
+            True if article was saved, False if duplicate (already exists)
+        """
+        return await self.shard_for(article.locale).save(article)
+
+    async def save_batch(self, articles: list[Article]) -> list[str]:
+        """
+        Save a batch of articles, one parallel transaction per shard.
+
+        Args:
+            articles: List of Article instances to save
+
+        Returns:
+            GUIDs of the articles that were newly inserted, in input order
+        """
+        batches: dict[int, tuple[ArticleRepository, list[Article]]] = {}
+        for article in articles:
+            shard = self.shard_for(article.locale)
+            batches.setdefault(id(shard), (shard, []))[1].append(article)
+
+        results = await asyncio.gather(
+            *(shard.save_batch(batch) for shard, batch in batches.values())
+        )
+        inserted = {guid for guids in results for guid in guids}
+
+        new_guids: list[str] = []
+        for article in articles:
+            if article.guid in inserted:
+                new_guids.append(article.guid)
+                inserted.discard(article.guid)
+        return new_guids
+
+    async def save_many(self, articles: list[Article]) -> int:
+        """
+        Save multiple articles, one parallel transaction per shard.
+
+        Args:
+            articles: List of Article instances to save
+
+        Returns:
+            Count of new articles saved (excludes duplicates)
+        """
+        return len(await self.save_batch(articles))
+
+    async def load_content(self, articles: list[Article]) -> list[Article]:
+        """
+        Load the content column for articles read with a lighter projection.
+
+        Args:
+            articles: Articles to complete (modified in place)
+
+        Returns:
+            The same list of articles, with content populated
+        """
+        by_shard: dict[int, tuple[ArticleRepository, list[Article]]] = {}
+        for article in articles:
+            shard = self.shard_for(article.locale)
+            by_shard.setdefault(id(shard), (shard, []))[1].append(article)
+        await asyncio.gather(*(shard.load_content(batch) for shard, batch in by_shard.values()))
+        return articles
+
+    @staticmethod
+    def _merge_newest(results: list[list[Article]], limit: int) -> list[Article]:
+        """
+        K-way merge per-shard result lists, newest first.
+
+        heapq.merge is stable, so equal pub_dates keep shard order.
+
+        Args:
+            results: Per-shard lists, each newest first, in shard order
+            limit: Maximum number of articles to return
+
+        Returns:
+            Merged articles, newest first
+        """
+        merged = heapq.merge(*results, key=lambda a: a.pub_date, reverse=True)
+        return [article for _, article in zip(range(limit), merged, strict=False)]
+
+    async def get_page(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        source: str | None = None,
+        locale: str | None = None,
+        source_category: str | None = None,
+        projection: str = "full",
+    ) -> tuple[list[Article], str | None]:
+        """
+        Get one page of articles using keyset pagination on (pub_date, id).
+
+        Every shard seeks past the same cursor. Shard id ranges are ordered,
+        so the merged order matches ``pub_date DESC, id ASC``.
+
+        Args:
+            limit: Maximum number of articles on the page
+            cursor: Cursor returned with the previous page (None = first page)
+            source: Optional source filter (e.g., "lol:en-us")
+            locale: Optional locale filter (e.g., "en-us", "it-it")
+            source_category: Optional source category filter
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            Tuple of (articles newest first, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed or the projection is unknown
+        """
+        shards = self._shards_for([locale] if locale else None, source)
+        pages = await asyncio.gather(
+            *(
+                shard.get_page(
+                    limit=limit,
+                    cursor=cursor,
+                    source=source,
+                    locale=locale,
+                    source_category=source_category,
+                    projection=projection,
+                )
+                for shard in shards
+            )
+        )
+        if len(shards) == 1:
+            return pages[0]
+
+        tagged = [
+            [(article, shard) for article in page]
+            for shard, (page, _) in zip(shards, pages, strict=True)
+        ]
+        merged = list(heapq.merge(*tagged, key=lambda pair: pair[0].pub_date, reverse=True))
+        page = merged[:limit]
+        more = len(merged) > limit or any(next_cursor for _, next_cursor in pages)
+        if not more or not page:
+            return [article for article, _ in page], None
+
+        last, shard = page[-1]
+        rows = await shard.fetch_all("SELECT id FROM articles WHERE guid = ?", (last.guid,))
+        next_cursor = encode_cursor(to_epoch_ms(last.pub_date), int(rows[0][0])) if rows else None
+        return [article for article, _ in page], next_cursor
+
+    async def get_latest(
+        self,
+        limit: int = 50,
+        source: str | None = None,
+        locale: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles, optionally filtered by source and/or locale.
+
+        Args:
+            limit: Maximum number of articles to return
+            source: Optional source filter (e.g., "lol:en-us")
+            locale: Optional locale filter (e.g., "en-us", "it-it")
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances, ordered by publication date (newest first)
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        shards = self._shards_for([locale] if locale else None, source)
+        results = await asyncio.gather(
+            *(
+                shard.get_latest(limit=limit, source=source, locale=locale, projection=projection)
+                for shard in shards
+            )
+        )
+        return self._merge_newest(list(results), limit)
+
+    async def get_latest_by_locale(
+        self,
+        locale: str,
+        limit: int = 50,
+        source_category: str | None = None,
+        source_id: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles for a specific locale from its shard.
+
+        Args:
+            locale: Locale code (e.g., "en-us", "it-it")
+            limit: Maximum number of articles to return
+            source_category: Optional source category filter
+            source_id: Optional source identifier filter (e.g., "lol", "u-gg")
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances for the locale, ordered by publication date
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        return await self.shard_for(locale).get_latest_by_locale(
+            locale,
+            limit=limit,
+            source_category=source_category,
+            source_id=source_id,
+            projection=projection,
+        )
+
+    async def get_by_locale_group(
+        self,
+        locale_group: list[str],
+        limit: int = 50,
+        source_category: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles for a group of locales from the shards holding them.
+
+        Args:
+            locale_group: List of locale codes (e.g., ["en-us", "en-gb"])
+            limit: Maximum number of articles to return
+            source_category: Optional source category filter
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances for the locale group
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        results = await asyncio.gather(
+            *(
+                shard.get_by_locale_group(
+                    locale_group,
+                    limit=limit,
+                    source_category=source_category,
+                    projection=projection,
+                )
+                for shard in self._shards_for(locale_group)
+            )
+        )
+        return self._merge_newest(list(results), limit)
+
+    async def get_by_source_category(
+        self,
+        source_category: str,
+        locale: str | None = None,
+        limit: int = 50,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles by source category.
+
+        Args:
+            source_category: Category to filter by (e.g., "official_riot", "analytics")
+            locale: Optional locale filter
+            limit: Maximum number of articles to return
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances matching the category
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        results = await asyncio.gather(
+            *(
+                shard.get_by_source_category(
+                    source_category, locale=locale, limit=limit, projection=projection
+                )
+                for shard in self._shards_for([locale] if locale else None)
+            )
+        )
+        return self._merge_newest(list(results), limit)
+
+    async def get_by_category(
+        self,
+        category: str,
+        limit: int = 50,
+        source: str | None = None,
+        locale: str | None = None,
+        projection: str = "full",
+    ) -> list[Article]:
+        """
+        Get latest articles tagged with a category.
+
+        Args:
+            category: Article category (e.g., "Game Updates", "Dev")
+            limit: Maximum number of articles to return
+            source: Optional source filter (e.g., "lol:en-us")
+            locale: Optional locale filter (e.g., "en-us", "it-it")
+            projection: Column projection ("full" or "summary" without content)
+
+        Returns:
+            List of Article instances in the category, ordered by publication date
+
+        Raises:
+            ValueError: If the projection is unknown
+        """
+        results = await asyncio.gather(
+            *(
+                shard.get_by_category(
+                    category, limit=limit, source=source, locale=locale, projection=projection
+                )
+                for shard in self._shards_for([locale] if locale else None, source)
+            )
+        )
+        return self._merge_newest(list(results), limit)
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 50,
+        locale: str | None = None,
+        source: str | None = None,
+        source_category: str | None = None,
+        category: str | None = None,
+        projection: str = "summary",
+    ) -> list[Article]:
+        """
+        Full-text search over article titles and descriptions.
+
+        BM25 scores depend on each shard's own term statistics, so results
+        from several shards are interleaved by rank position.
+
+        Args:
+            query: Free-form search text; every word must match, the last as a prefix
+            limit: Maximum number of articles to return
+            locale: Optional locale filter (e.g., "en-us")
+            source: Optional source filter (e.g., "lol:en-us")
+            source_category: Optional source category filter (e.g., "analytics")
+            category: Optional article category filter (e.g., "Dev")
+            projection: Column projection ("summary" without content, or "full")
+
+        Returns:
+            Matching Article instances, best match first
+
+        Raises:
+            ValueError: If the query has no searchable terms or the projection is unknown
+        """
+        results = await asyncio.gather(
+            *(
+                shard.search(
+                    query,
+                    limit=limit,
+                    locale=locale,
+                    source=source,
+                    source_category=source_category,
+                    category=category,
+                    projection=projection,
+                )
+                for shard in self._shards_for([locale] if locale else None, source)
+            )
+        )
+        interleaved: list[Article] = []
+        for rank in range(max((len(hits) for hits in results), default=0)):
+            interleaved.extend(hits[rank] for hits in results if rank < len(hits))
+        return interleaved[:limit]
+
+    async def get_by_guid(self, guid: str) -> Article | None:
+        """
+        Get article by its unique GUID.
+
+        Args:
+            guid: Globally unique identifier for the article
+
+        Returns:
+            Article instance if found, None otherwise
+        """
+        results = await asyncio.gather(*(shard.get_by_guid(guid) for shard in self.shards.values()))
+        return next((article for article in results if article), None)
+
+    async def get_by_canonical_url(self, canonical_url: str) -> Article | None:
+        """
+        Get article by canonical URL (for deduplication across sources).
+
+        Args:
+            canonical_url: Primary URL to search for
+
+        Returns:
+            Article instance if found, None otherwise
+        """
+        results = await asyncio.gather(
+            *(shard.get_by_canonical_url(canonical_url) for shard in self.shards.values())
+        )
+        return next((article for article in results if article), None)
+
+    async def count(self, locale: str | None = None) -> int:
+        """
+        Get total count of articles, optionally filtered by locale.
+
+        Args:
+            locale: Optional locale filter
+
+        Returns:
+            Total number of articles stored
+        """
+        if locale:
+            return await self.shard_for(locale).count(locale=locale)
+        counts = await asyncio.gather(*(shard.count() for shard in self.shards.values()))
+        return sum(counts)
+
+    async def get_locales(self) -> list[str]:
+        """
+        Get list of all locales that have articles.
+
+        Returns:
+            List of locale codes
+        """
+        results = await asyncio.gather(*(shard.get_locales() for shard in self.shards.values()))
+        return sorted({locale for locales in results for locale in locales})
+
+    async def get_source_categories(self) -> list[str]:
+        """
+        Get list of all source categories that have articles.
+
+        Returns:
+            List of source category names
+        """
+        results = await asyncio.gather(
+            *(shard.get_source_categories() for shard in self.shards.values())
+        )
+        return sorted({category for categories in results for category in categories})
+
+    async def get_article_stats(self) -> list[dict[str, Any]]:
+        """
+        Get article counts per source and locale across all shards.
+
+        Returns:
+            List of stats dicts (see ArticleRepository.get_article_stats()),
+            ordered by source_id and locale
+        """
+        results = await asyncio.gather(
+            *(shard.get_article_stats() for shard in self.shards.values())
+        )
+        return sorted(
+            (entry for stats in results for entry in stats),
+            key=lambda entry: (entry["source_id"], entry["locale"]),
+        )
+
+    async def get_last_write_timestamp(self) -> datetime | None:
+        """
+        Get the timestamp of the most recent article write across shards.
+
+        Returns:
+            Datetime of most recent article, or None if every shard is empty
+        """
+        results = await asyncio.gather(
+            *(shard.get_last_write_timestamp() for shard in self.shards.values())
+        )
+        return max((ts for ts in results if ts is not None), default=None)
+
+    async def execute(self, sql: str, params: tuple[Any, ...] = ()) -> None:
+        """
+        Execute a raw SQL statement on every shard and commit it.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+        """
+        for shard in self.shards.values():
+            await shard.execute(sql, params)
+
+    async def fetch_all(self, sql: str, params: tuple[Any, ...] = ()) -> list[Any]:
+        """
+        Run a raw query on every shard and concatenate the rows in shard order.
+
+        Args:
+            sql: SQL query
+            params: Query parameters
+
+        Returns:
+            Rows from all shards
+        """
+        results = await asyncio.gather(
+            *(shard.fetch_all(sql, params) for shard in self.shards.values())
+        )
+        return [row for rows in results for row in rows]
+
+    async def apply_retention(
+        self,
+        policies: list[RetentionPolicy],
+        archive_path: str | None = None,
+        now: datetime | None = None,
+        batch_size: int = 500,
+    ) -> dict[str, int]:
+        """
+        Apply retention policies shard by shard.
+
+        Shards run one after another because they may share the archive file.
+
+        Args:
+            policies: Retention policies; an article expired by any policy is removed
+            archive_path: Optional archive database file for expired rows
+            now: Reference time for max_age_days (defaults to current UTC time)
+            batch_size: Maximum number of articles removed per transaction
+
+        Returns:
+            Dictionary with "deleted" and "archived" row counts summed over shards
+        """
+        totals = {"deleted": 0, "archived": 0}
+        for shard in self.shards.values():
+            scoped = [
+                policy
+                for policy in policies
+                if policy.locale is None or self.shard_for(policy.locale) is shard
+            ]
+            if not scoped:
+                continue
+            result = await shard.apply_retention(
+                scoped, archive_path=archive_path, now=now, batch_size=batch_size
+            )
+            for key in totals:
+                totals[key] += result.get(key, 0)
+        return totals
+
+    async def recompress_stored_text(self, batch_size: int = 500) -> int:
+        """
+        Rewrite stored article text to match the codec on every shard.
+
+        Args:
+            batch_size: Maximum number of rows rewritten per transaction
+
+        Returns:
+            Number of rows rewritten across shards
+        """
+        results = await asyncio.gather(
+            *(shard.recompress_stored_text(batch_size) for shard in self.shards.values())
+        )
+        return sum(results)
+
+    async def run_maintenance(
+        self, vacuum_pages: int = 0, convert_auto_vacuum: bool = False
+    ) -> dict[str, int]:
+        """
+        Run incremental vacuum and ANALYZE on every shard.
+
+        Args:
+            vacuum_pages: Maximum free pages to release per shard (0 releases all)
+            convert_auto_vacuum: Convert shards without incremental
+                auto_vacuum with a full VACUUM
+
+        Returns:
+            Page counts and bytes summed over shards (page_size of the first shard)
+        """
+        results = await asyncio.gather(
+            *(
+                shard.run_maintenance(vacuum_pages, convert_auto_vacuum)
+                for shard in self.shards.values()
+            )
+        )
+        totals = {
+            key: sum(stats[key] for stats in results)
+            for key in ("pages_before", "pages_after", "freelist_pages", "bytes_reclaimed")
+        }
+        totals["page_size"] = results[0]["page_size"] if results else 0
+        return totals
+
+    async def backup(
+        self, backup_dir: str, keep: int = 7, pages_per_step: int = 1024
+    ) -> dict[str, Any]:
+        """
+        Snapshot every shard into its own subdirectory of ``backup_dir``.
+
+        Args:
+            backup_dir: Directory receiving one subdirectory per shard
+            keep: Number of snapshots retained per shard
+            pages_per_step: Database pages copied per backup step
+
+        Returns:
+            Dictionary with the directory, total bytes and per-shard stats
+        """
+        shard_stats = {}
+        for name, shard in self.shards.items():
+            shard_stats[name] = await shard.backup(
+                str(Path(backup_dir) / name), keep=keep, pages_per_step=pages_per_step
+            )
+        return {
+            "path": backup_dir,
+            "bytes": sum(stats["bytes"] for stats in shard_stats.values()),
+            "shards": shard_stats,
+        }
@@ -0,0 +1,148 @@
+"""
+Compression codecs for article text stored in SQLite and for HTTP bodies.
+
+Compressed values are stored as BLOBs whose first byte names the codec;
+plain text stays TEXT, so the two forms can coexist in one column while
+existing rows are converted in the background.
+
+Rendered feeds are precompressed once with every available HTTP content
+coding (gzip, and brotli when installed) so responses never compress per
+request.
+"""
+
+import gzip
+import zlib
+from typing import cast
+
+try:
+    import zstandard
+except ImportError:  # optional dependency: pip install lolstonksrss[compression]
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # optional dependency: pip install lolstonksrss[compression]
+    brotli = None
+
+# One-byte format markers prefixed to every compressed value
+ZLIB_MARKER = b"\x01"
+ZSTD_MARKER = b"\x02"
+
+CODECS = ("none", "zlib", "zstd")
+
+# Values shorter than this (in UTF-8 bytes) are left as TEXT: the codec
+# framing would eat most of the saving
+MIN_COMPRESS_BYTES = 256
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Feed bodies are compressed once per render, so they can afford higher
+# levels; brotli quality 10-11 is an order of magnitude slower again
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+def check_codec(codec: str) -> None:
+    """
+    Validate that a codec name is known and usable.
+
+    Args:
+        codec: Codec name ("none", "zlib" or "zstd")
+
+    Raises:
+        ValueError: If the codec is unknown or its library is not installed
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression codec {codec!r}, expected one of {CODECS}")
+    if codec == "zstd" and zstandard is None:
+        raise ValueError("zstd compression requires the 'zstandard' package")
+
+
+def compress_text(text: str | None, codec: str) -> str | bytes | None:
+    """
+    Encode text for storage with the given codec.
+
+    Short values, and values that do not shrink, are returned unchanged.
+
+    Args:
+        text: Text to store
+        codec: Codec name ("none", "zlib" or "zstd")
+
+    Returns:
+        Marker-prefixed compressed bytes, or the original text
+    """
+    if not text or codec == "none":
+        return text
+
+    raw = text.encode("utf-8")
+    if len(raw) < MIN_COMPRESS_BYTES:
+        return text
+
+    if codec == "zstd":
+        packed = ZSTD_MARKER + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    else:
+        packed = ZLIB_MARKER + zlib.compress(raw, ZLIB_LEVEL)
+    return packed if len(packed) < len(raw) else text
+
+
+def decompress_text(value: str | bytes | None) -> str | None:
+    """
+    Decode a stored value back to text.
+
+    Also registered as the ``decompress_text`` SQL function, so triggers and
+    views can read compressed columns.
+
+    Args:
+        value: Stored column value (TEXT, compressed BLOB or NULL)
+
+    Returns:
+        Decoded text (None for NULL)
+
+    Raises:
+        ValueError: If a BLOB carries an unknown format marker
+    """
+    if value is None or isinstance(value, str):
+        return value
+
+    marker, payload = value[:1], value[1:]
+    if marker == ZLIB_MARKER:
+        return zlib.decompress(payload).decode("utf-8")
+    if marker == ZSTD_MARKER:
+        if zstandard is None:
+            raise ValueError("zstd-compressed value found but 'zstandard' is not installed")
+        return cast(str, zstandard.ZstdDecompressor().decompress(payload).decode("utf-8"))
+    raise ValueError(f"Unknown compression marker {marker!r}")
+
+
+def content_encodings() -> tuple[str, ...]:
+    """
+    List the HTTP content codings this installation can produce.
+
+    Returns:
+        Coding names in order of preference ("br" first when available)
+    """
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def precompress(body: bytes) -> dict[str, bytes]:
+    """
+    Compress an HTTP body with every available content coding.
+
+    Bodies shorter than MIN_COMPRESS_BYTES are not worth encoding and get
+    no entries. The gzip header carries no timestamp, so the same body
+    always compresses to the same bytes.
+
+    Args:
+        body: Uncompressed response body
+
+    Returns:
+        Mapping of coding name ("gzip", "br") to the encoded body
+    """
+    if len(body) < MIN_COMPRESS_BYTES:
+        return {}
+
+    encodings = {"gzip": gzip.compress(body, GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        encodings["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+    return encodings
@@ -80,6 +80,23 @@ feed_generation_requests_total = Counter(
     ["locale", "status"],
 )
 
+database_bytes_reclaimed_total = Counter(
+    "database_bytes_reclaimed_total",
+    "Total bytes returned to the filesystem by database maintenance",
+)
+
+database_retention_rows_total = Counter(
+    "database_retention_rows_total",
+    "Total number of articles removed by retention policies",
+    ["action"],  # action: deleted/archived
+)
+
+database_backups_total = Counter(
+    "database_backups_total",
+    "Total number of online database backups",
+    ["status"],  # status: success/failure
+)
+
 cache_operations_total = Counter(
     "cache_operations_total",
     "Total number of cache operations",
@@ -151,6 +168,16 @@ circuit_breaker_failure_count = Gauge(
     ["source"],
 )
 
+database_size_bytes = Gauge(
+    "database_size_bytes",
+    "Size of the SQLite database after the last maintenance run",
+)
+
+database_backup_size_bytes = Gauge(
+    "database_backup_size_bytes",
+    "Size of the most recent database snapshot",
+)
+
 active_update_tasks = Gauge(
     "active_update_tasks",
     "Number of active update tasks",
@@ -266,6 +293,35 @@ def update_scraper_last_success(source: str, locale: str) -> None:
     scraper_last_success_timestamp.labels(source=source, locale=locale).set(timestamp)
 
 
+def record_database_maintenance(
+    maintenance: dict[str, int], retention: dict[str, int] | None = None
+) -> None:
+    """
+    Record the outcome of a database maintenance run.
+
+    Args:
+        maintenance: Stats returned by ArticleRepository.run_maintenance()
+        retention: Optional counts returned by ArticleRepository.apply_retention()
+    """
+    database_bytes_reclaimed_total.inc(maintenance.get("bytes_reclaimed", 0))
+    database_size_bytes.set(maintenance.get("pages_after", 0) * maintenance.get("page_size", 0))
+    for action, count in (retention or {}).items():
+        database_retention_rows_total.labels(action=action).inc(count)
+
+
+def record_database_backup(status: str, size_bytes: int = 0) -> None:
+    """
+    Record the outcome of an online database backup.
+
+    Args:
+        status: Backup status (success/failure)
+        size_bytes: Size of the written snapshot (successful backups only)
+    """
+    database_backups_total.labels(status=status).inc()
+    if status == "success":
+        database_backup_size_bytes.set(size_bytes)
+
+
 # =============================================================================
 # Context Managers for Timing
 # =============================================================================
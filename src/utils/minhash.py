@@ -0,0 +1,108 @@
+"""
+MinHash signatures for near-duplicate article detection.
+
+Each article gets a MinHash signature over the word bigrams of its title
+and description; the share of equal signature slots estimates the Jaccard
+similarity of the two bigram sets. Splitting the signature into LSH bands
+turns candidate search into exact index lookups: articles sharing any
+whole band are compared, which finds pairs above roughly
+SIMILARITY_THRESHOLD with high probability while skipping everything
+else.
+"""
+
+import hashlib
+import re
+import struct
+
+NUM_PERMUTATIONS = 32
+LSH_BANDS = 8
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+# Estimated Jaccard similarity at which two articles count as the same story
+SIMILARITY_THRESHOLD = 0.5
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+_SLOT = struct.Struct(">I")
+_SIGNATURE = struct.Struct(f">{NUM_PERMUTATIONS}I")
+
+
+def shingles(text: str) -> set[str]:
+    """
+    Split text into the features that signatures are built from.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Distinct lower-cased word bigrams (the single word for one-word texts)
+    """
+    words = TOKEN_PATTERN.findall(text.lower())
+    if len(words) < 2:
+        return set(words)
+    return {f"{a} {b}" for a, b in zip(words, words[1:], strict=False)}
+
+
+def minhash(text: str) -> bytes | None:
+    """
+    Compute the MinHash signature of a text.
+
+    Args:
+        text: Text to fingerprint (typically title and description)
+
+    Returns:
+        Signature of NUM_PERMUTATIONS 32-bit slots packed into bytes, or
+        None if the text has no words
+    """
+    features = shingles(text)
+    if not features:
+        return None
+    # One SHAKE-128 output per feature yields all NUM_PERMUTATIONS independent
+    # 32-bit hashes at once; each slot keeps its minimum across features
+    hashed = (
+        _SIGNATURE.unpack(hashlib.shake_128(feature.encode("utf-8")).digest(_SIGNATURE.size))
+        for feature in features
+    )
+    return _SIGNATURE.pack(*map(min, zip(*hashed, strict=True)))
+
+
+def similarity(a: bytes, b: bytes) -> float:
+    """
+    Estimate the Jaccard similarity of two signatures.
+
+    Args:
+        a: First signature from minhash()
+        b: Second signature from minhash()
+
+    Returns:
+        Share of equal slots (0.0-1.0)
+    """
+    pairs = zip(_SIGNATURE.unpack(a), _SIGNATURE.unpack(b), strict=True)
+    equal = sum(1 for x, y in pairs if x == y)
+    return equal / NUM_PERMUTATIONS
+
+
+def lsh_keys(signature: bytes) -> list[int]:
+    """
+    Hash each band of a signature into an LSH key.
+
+    The band number is part of the hashed value, so one integer column
+    indexes every band without collisions between bands.
+
+    Args:
+        signature: Signature from minhash()
+
+    Returns:
+        One signed 64-bit key per band
+    """
+    width = LSH_ROWS * _SLOT.size
+    return [
+        int.from_bytes(
+            hashlib.blake2b(
+                bytes([band]) + signature[band * width : (band + 1) * width], digest_size=8
+            ).digest(),
+            "big",
+            signed=True,
+        )
+        for band in range(LSH_BANDS)
+    ]
@@ -0,0 +1,90 @@
+"""
+Unchanged feed polls answered with 304 Not Modified.
+
+Feed readers poll the same URL every few minutes; a reader sending back
+the ETag it was given should get an empty 304 instead of the whole feed,
+also after the feed cache has expired, without the feed being rebuilt.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.app import app, app_state
+from src.memory_database import InMemoryArticleRepository
+from src.models import Article, ArticleSource
+from src.rss.feed_service import FeedServiceV2
+
+# Override with CONDITIONAL_GET_POLLS for a longer run
+POLLS = int(os.environ.get("CONDITIONAL_GET_POLLS", "100"))
+ITEMS = 500
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _article(i: int) -> Article:
+    """Build the i-th article of a single locale feed."""
+    return Article(
+        title=f"Patch {i} notes & balance changes",
+        url=f"https://example.com/news/{i}",
+        pub_date=BASE + timedelta(minutes=i),
+        guid=f"guid-{i}",
+        source=ArticleSource.create("lol", "en-us"),
+        description=f"Champion {i % 170} changes in update {i}",
+        content=f"<p>Full article body {i} with <a href='#'>links</a></p>" * 20,
+        categories=["Game Updates"],
+    )
+
+
+async def _poll(
+    client: AsyncClient, headers: dict[str, str], expire: FeedServiceV2 | None = None
+) -> tuple[float, int]:
+    """
+    Poll the feed POLLS times; return mean milliseconds and body bytes sent per poll.
+
+    With ``expire`` the service's feed cache is cleared before every poll.
+    """
+    received = 0
+    start = time.perf_counter()
+    for _ in range(POLLS):
+        if expire is not None:
+            expire.invalidate_cache()
+        response = await client.get(f"/rss/en-us.xml?limit={ITEMS}", headers=headers)
+        received += response.num_bytes_downloaded
+    return (time.perf_counter() - start) / POLLS * 1000, received // POLLS
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_unchanged_polls_get_304():
+    repo = InMemoryArticleRepository()
+    await repo.initialize()
+    await repo.save_batch([_article(i) for i in range(ITEMS)])
+    app_state.clear()
+    service = FeedServiceV2(repo)
+    app_state["feed_service_v2"] = service
+    transport = ASGITransport(app=app)  # type: ignore[arg-type]
+    try:
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get(f"/rss/en-us.xml?limit={ITEMS}")
+            etag = first.headers["ETag"]
+            full_ms, full_bytes = await _poll(client, {})
+            current_ms, current_bytes = await _poll(client, {"If-None-Match": etag})
+            rebuild_ms, _ = await _poll(client, {}, expire=service)
+            expired_ms, expired_bytes = await _poll(client, {"If-None-Match": etag}, service)
+            status = (await client.get(first.url, headers={"If-None-Match": etag})).status_code
+    finally:
+        app_state.clear()
+        await repo.close()
+
+    print(
+        f"{ITEMS}-item feed poll: full {full_ms:.2f}ms / {full_bytes / 1024:.0f}KB, "
+        f"not modified {current_ms:.2f}ms / {current_bytes}B; after cache expiry: "
+        f"full {rebuild_ms:.2f}ms, not modified {expired_ms:.2f}ms"
+    )
+    assert status == 304
+    assert current_bytes == expired_bytes == 0
+    assert current_ms < full_ms
+    assert expired_ms < rebuild_ms
@@ -0,0 +1,82 @@
+"""Connection pool benchmark: per-call connect vs pooled connections."""
+
+import time
+from datetime import datetime
+
+import aiosqlite
+import pytest
+
+from src.database import ArticleRepository
+from src.models import Article, ArticleSource
+
+ITERATIONS = 200
+
+
+async def _seed(repo: ArticleRepository, count: int = 200) -> None:
+    articles = [
+        Article(
+            title=f"Article {i}",
+            url=f"https://example.com/{i}",
+            pub_date=datetime(2025, 1, 1, 0, i % 60, i % 60),
+            guid=f"guid-{i}",
+            source=ArticleSource.create("lol", "en-us"),
+            description=f"Description {i}",
+            categories=["News"],
+        )
+        for i in range(count)
+    ]
+    await repo.save_many(articles)
+
+
+async def _per_call_count(db_path: str) -> int:
+    """Reproduce the previous behaviour: open a fresh connection per query."""
+    async with aiosqlite.connect(db_path) as db:
+        cursor = await db.execute("SELECT COUNT(*) FROM articles")
+        row = await cursor.fetchone()
+        return int(row[0]) if row else 0
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_pooled_count_faster_than_per_call_connect(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    repo = ArticleRepository(db_path)
+    await repo.initialize()
+    try:
+        await _seed(repo)
+
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            assert await _per_call_count(db_path) == 200
+        per_call_ms = (time.perf_counter() - start) * 1000 / ITERATIONS
+
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            assert await repo.count() == 200
+        pooled_ms = (time.perf_counter() - start) * 1000 / ITERATIONS
+
+        print(f"COUNT(*): per-call connect {per_call_ms:.3f}ms, pooled {pooled_ms:.3f}ms")
+        assert pooled_ms < per_call_ms
+    finally:
+        await repo.close()
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_pooled_get_latest_latency(tmp_path):
+    repo = ArticleRepository(str(tmp_path / "test.db"))
+    await repo.initialize()
+    try:
+        await _seed(repo)
+
+        times = []
+        for _ in range(50):
+            start = time.perf_counter()
+            result = await repo.get_latest(limit=50)
+            times.append((time.perf_counter() - start) * 1000)
+            assert len(result) == 50
+        avg_query = sum(times) / len(times)
+        print(f"Pooled get_latest(limit=50): {avg_query:.2f}ms")
+        assert avg_query < 50
+    finally:
+        await repo.close()
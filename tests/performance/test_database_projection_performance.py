@@ -0,0 +1,49 @@
+"""Projection benchmark: full rows vs the summary shape without content."""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from src.database import ArticleRepository
+from src.models import Article, ArticleSource
+
+ITERATIONS = 50
+CONTENT = "<p>" + "Patch notes body text. " * 2000 + "</p>"  # ~46 KB of HTML
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_summary_projection_faster_than_full_rows(tmp_path):
+    repo = ArticleRepository(str(tmp_path / "test.db"))
+    await repo.initialize()
+    try:
+        await repo.save_batch(
+            [
+                Article(
+                    title=f"Article {i}",
+                    url=f"https://example.com/{i}",
+                    pub_date=datetime(2025, 1, 1, i // 60, i % 60),
+                    guid=f"guid-{i}",
+                    source=ArticleSource.create("lol", "en-us"),
+                    description=f"Description {i}",
+                    content=CONTENT,
+                )
+                for i in range(200)
+            ]
+        )
+
+        timings = {}
+        for projection in ("full", "summary"):
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                assert len(await repo.get_latest(limit=200, projection=projection)) == 200
+            timings[projection] = (time.perf_counter() - start) * 1000 / ITERATIONS
+
+        print(
+            f"get_latest(limit=200): full {timings['full']:.2f}ms, "
+            f"summary {timings['summary']:.2f}ms"
+        )
+        assert timings["summary"] < timings["full"]
+    finally:
+        await repo.close()
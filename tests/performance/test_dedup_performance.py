@@ -0,0 +1,81 @@
+"""Near-duplicate check on the ingest path: MinHash + LSH lookup per article."""
+
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.database import ArticleRepository
+from src.models import Article, ArticleSource
+
+# Override with DEDUP_BENCHMARK_ROWS for a quicker local run
+ROWS = int(os.environ.get("DEDUP_BENCHMARK_ROWS", "50000"))
+BATCH = 500
+SOURCES = ("lol", "dexerto", "dotesports", "pcgamesn")
+
+
+def _articles(start: int, count: int, rng: random.Random) -> list[Article]:
+    """Build articles with 30-word random texts, one story per four sources."""
+    vocabulary = [f"w{i}" for i in range(3000)]
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    articles = []
+    for i in range(start, start + count):
+        story = rng.sample(vocabulary, 30)
+        articles.append(
+            Article(
+                title=" ".join(story[:8]),
+                url=f"https://example.com/{i}",
+                pub_date=base + timedelta(minutes=10 * i),
+                guid=f"guid-{i}",
+                source=ArticleSource.create(SOURCES[i % len(SOURCES)], "en-us"),
+                description=" ".join(story[8:]),
+            )
+        )
+    return articles
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_near_duplicate_check_is_sub_millisecond(tmp_path):
+    repo = ArticleRepository(str(tmp_path / "dedup.db"))
+    await repo.initialize()
+    rng = random.Random(7)
+    try:
+        for start in range(0, ROWS, BATCH):
+            await repo.save_batch(_articles(start, BATCH, rng))
+
+        # Fresh articles, half of them light rewrites of stories already stored
+        incoming = _articles(ROWS, BATCH, rng)
+        stored = await repo.get_latest(limit=BATCH // 2, projection="summary")
+        for article, original in zip(incoming, stored, strict=False):
+            article.title = f"LoL {original.title}"
+            article.description = original.description
+            article.pub_date = original.pub_date + timedelta(hours=1)
+
+        async with repo._writer_conn() as db:
+            start = time.perf_counter()
+            rows = [
+                (ROWS + 1 + i, repo._signature(a.title, a.description), 0)
+                for i, a in enumerate(incoming)
+            ]
+            signing_ms = (time.perf_counter() - start) * 1000 / BATCH
+            rows = [
+                (article_id, signature, int(a.pub_date.timestamp() * 1000))
+                for (article_id, signature, _), a in zip(rows, incoming, strict=True)
+            ]
+
+            start = time.perf_counter()
+            clustered = await repo._assign_clusters(db, rows)
+            lookup_ms = (time.perf_counter() - start) * 1000 / BATCH
+            await db.rollback()
+
+        print(
+            f"{ROWS} stored: MinHash {signing_ms:.3f}ms + LSH clustering {lookup_ms:.3f}ms "
+            f"per article, {clustered}/{BATCH // 2} rewrites clustered"
+        )
+        assert clustered >= 0.9 * (BATCH // 2)
+        assert signing_ms + lookup_ms < 1.0
+    finally:
+        await repo.close()
@@ -0,0 +1,75 @@
+"""Streaming export throughput to NDJSON and Parquet."""
+
+import importlib.util
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config import RIOT_LOCALES
+from src.database import ArticleRepository
+from src.models import Article, ArticleSource
+from src.services.article_transfer import export_articles, import_articles
+
+# Override with EXPORT_BENCHMARK_ROWS for a larger or quicker run
+ROWS = int(os.environ.get("EXPORT_BENCHMARK_ROWS", "20000"))
+BATCH = 1000
+
+# NDJSON lines are rendered by SQLite; a few million rows should take
+# well under a minute even on a single core
+MIN_ROWS_PER_SECOND = 40_000
+
+
+def _articles(start: int, count: int) -> list[Article]:
+    """Build articles spread round-robin over every Riot locale."""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        Article(
+            title=f"Patch {i} notes and balance changes",
+            url=f"https://example.com/{i}",
+            pub_date=base + timedelta(minutes=i),
+            guid=f"guid-{i}",
+            source=ArticleSource.create("lol", RIOT_LOCALES[i % len(RIOT_LOCALES)]),
+            description=f"Champion {i % 170} changes in update {i}",
+            content=f"<p>Full article body {i}</p>" * 10,
+            categories=["Game Updates"],
+        )
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_export_throughput(tmp_path):
+    repo = ArticleRepository(str(tmp_path / "export.db"))
+    await repo.initialize()
+    formats = ["articles.ndjson", "articles.ndjson.gz"]
+    if importlib.util.find_spec("pyarrow"):
+        formats.append("articles.parquet")
+
+    try:
+        for offset in range(0, ROWS, BATCH):
+            await repo.save_batch(_articles(offset, BATCH))
+
+        rates = {}
+        for name in formats:
+            path = str(tmp_path / name)
+            start = time.perf_counter()
+            assert await export_articles(repo, path) == ROWS
+            rates[name] = ROWS / (time.perf_counter() - start)
+            print(f"Export {ROWS} rows to {name}: {rates[name]:.0f} rows/s")
+
+        target = ArticleRepository(str(tmp_path / "import.db"))
+        await target.initialize()
+        try:
+            start = time.perf_counter()
+            stats = await import_articles(target, str(tmp_path / "articles.ndjson.gz"))
+            print(f"Import {ROWS} rows: {ROWS / (time.perf_counter() - start):.0f} rows/s")
+            assert stats["imported"] == ROWS
+        finally:
+            await target.close()
+    finally:
+        await repo.close()
+
+    assert rates["articles.ndjson"] > MIN_ROWS_PER_SECOND
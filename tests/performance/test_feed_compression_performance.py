@@ -0,0 +1,70 @@
+"""
+Precompressed feed bodies compared to compressing on every request.
+
+A cached feed carries its gzip (and brotli) encodings, so serving a poll
+costs a dictionary lookup instead of a compression pass, and ships a
+fraction of the uncompressed bytes.
+"""
+
+import gzip
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.memory_database import InMemoryArticleRepository
+from src.models import Article, ArticleSource
+from src.rss.feed_service import FeedServiceV2
+
+# Override with FEED_COMPRESSION_REQUESTS for a longer run
+REQUESTS = int(os.environ.get("FEED_COMPRESSION_REQUESTS", "50"))
+ITEMS = 500
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _article(i: int) -> Article:
+    """Build the i-th article of a single locale feed."""
+    return Article(
+        title=f"Patch {i} notes & balance changes",
+        url=f"https://example.com/news/{i}",
+        pub_date=BASE + timedelta(minutes=i),
+        guid=f"guid-{i}",
+        source=ArticleSource.create("lol", "en-us"),
+        description=f"Champion {i % 170} changes in update {i}",
+        content=f"<p>Full article body {i} with <a href='#'>links</a></p>" * 20,
+        image_url=f"https://images.example.com/{i}.jpg",
+        categories=["Game Updates"],
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_precompressed_feed_polls():
+    repo = InMemoryArticleRepository()
+    await repo.initialize()
+    await repo.save_batch([_article(i) for i in range(ITEMS)])
+    service = FeedServiceV2(repo)
+    feed = await service.get_feed_by_locale("en-us", limit=ITEMS)
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        body = gzip.compress((await service.get_feed_by_locale("en-us", limit=ITEMS)).encode())
+    per_request_ms = (time.perf_counter() - start) / REQUESTS * 1000
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        cached = await service.get_feed_by_locale("en-us", limit=ITEMS)
+        body = cached.encodings["gzip"]
+    precompressed_ms = (time.perf_counter() - start) / REQUESTS * 1000
+    await repo.close()
+
+    raw_kb = len(feed.encode()) / 1024
+    print(
+        f"{ITEMS}-item feed: {raw_kb:.0f}KB raw, "
+        + ", ".join(f"{name} {len(data) / 1024:.0f}KB" for name, data in feed.encodings.items())
+        + f"; per-request gzip {per_request_ms:.2f}ms, precompressed {precompressed_ms:.3f}ms"
+    )
+    assert gzip.decompress(body) == feed.encode()
+    assert len(body) < len(feed.encode()) / 5
+    assert precompressed_ms < per_request_ms
@@ -0,0 +1,92 @@
+"""
+Feed rebuilds after an update cycle, with and without the item cache.
+
+Every update invalidates the feed cache, so each feed is rebuilt on its
+next request. With rendered items shared between feeds, a rebuild should
+render only the articles that arrived in the cycle.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.memory_database import InMemoryArticleRepository
+from src.models import Article, ArticleSource
+from src.rss.feed_service import FeedServiceV2
+from src.rss.generator import ItemFragmentCache
+
+# Override with FEED_REBUILD_CYCLES for a longer run
+CYCLES = int(os.environ.get("FEED_REBUILD_CYCLES", "10"))
+LOCALES = ["en-us", "en-gb", "it-it", "fr-fr", "de-de"]
+SOURCES = ["lol", "u-gg", "op-gg"]
+NEW_PER_CYCLE = 10
+LIMIT = 50
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _article(i: int) -> Article:
+    """Build the i-th article, spread over LOCALES and SOURCES."""
+    return Article(
+        title=f"Patch {i} notes & balance changes",
+        url=f"https://example.com/news/{i}",
+        pub_date=BASE + timedelta(minutes=i),
+        guid=f"guid-{i}",
+        source=ArticleSource.create(SOURCES[i % len(SOURCES)], LOCALES[i % len(LOCALES)]),
+        description=f"Champion {i % 170} changes in update {i}",
+        content=f"<p>Full article body {i} with <a href='#'>links</a></p>" * 20,
+        image_url=f"https://images.example.com/{i}.jpg",
+        categories=["Game Updates"],
+    )
+
+
+async def _rebuild_all(service: FeedServiceV2) -> None:
+    """Request every locale feed and every source feed of each locale."""
+    for locale in LOCALES:
+        await service.get_feed_by_locale(locale, limit=LIMIT)
+        for source_id in SOURCES:
+            await service.get_feed_by_source_and_locale(source_id, locale, limit=LIMIT)
+
+
+async def _cycle_seconds(item_cache_size: int) -> tuple[float, int]:
+    """Run CYCLES update cycles and return rebuild time and items rendered."""
+    repo = InMemoryArticleRepository()
+    await repo.initialize()
+    await repo.save_batch([_article(i) for i in range(1000)])
+    cache = ItemFragmentCache(item_cache_size)
+    service = FeedServiceV2(repo, item_cache=cache)
+    await _rebuild_all(service)
+
+    start_misses = cache.misses
+    elapsed = 0.0
+    next_id = 1000
+    for _ in range(CYCLES):
+        await repo.save_batch([_article(i) for i in range(next_id, next_id + NEW_PER_CYCLE)])
+        next_id += NEW_PER_CYCLE
+        service.invalidate_cache()
+        start = time.perf_counter()
+        await _rebuild_all(service)
+        elapsed += time.perf_counter() - start
+    await repo.close()
+    return elapsed, cache.misses - start_misses
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_feed_rebuild_renders_only_new_items(monkeypatch):
+    # Measure rendering alone; compressing each rebuilt feed costs the same either way
+    monkeypatch.setattr("src.rss.feed_service.settings.feed_precompression", False)
+    uncached, _ = await _cycle_seconds(0)
+    cached, rendered = await _cycle_seconds(5000)
+    feeds = len(LOCALES) * (1 + len(SOURCES))
+
+    print(
+        f"Rebuild of {feeds} feeds after {NEW_PER_CYCLE} new articles: "
+        f"{uncached / CYCLES * 1000:.1f}ms without item cache, "
+        f"{cached / CYCLES * 1000:.1f}ms with ({rendered / CYCLES:.0f} items rendered per cycle)"
+    )
+    # Each new article appears in its locale feed and its source feed but
+    # is rendered once
+    assert rendered == NEW_PER_CYCLE * CYCLES
+    assert cached < uncached
@@ -0,0 +1,128 @@
+"""
+Feed rendering and ingestion with storage taken out of the picture.
+
+The in-memory engine does no I/O, so its timings are the cost of the
+feed and ingest code itself; the SQLite timings next to them show how
+much of each operation is spent in storage.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.database import ArticleRepository
+from src.memory_database import InMemoryArticleRepository
+from src.models import Article, ArticleSource
+from src.repository import Repository
+from src.rss.feed_service import FeedServiceV2
+from src.services.ingest_queue import ArticleIngestQueue
+
+# Override with REPOSITORY_BENCHMARK_ROWS for a quicker local run
+ROWS = int(os.environ.get("REPOSITORY_BENCHMARK_ROWS", "5000"))
+LOCALES = ["en-us", "en-gb", "it-it", "fr-fr", "de-de"]
+RENDERS = 50
+ROUNDS = 3
+
+
+def _articles(count: int) -> list[Article]:
+    """Build articles spread round-robin over LOCALES."""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        Article(
+            title=f"Patch {i} notes and balance changes",
+            url=f"https://example.com/{i}",
+            pub_date=base + timedelta(minutes=i),
+            guid=f"guid-{i}",
+            source=ArticleSource.create("lol", LOCALES[i % len(LOCALES)]),
+            description=f"Champion {i % 170} changes in update {i}",
+            content=f"<p>Full article body {i}</p>" * 20,
+            categories=["Game Updates"],
+        )
+        for i in range(count)
+    ]
+
+
+async def _render_ms(repo: Repository) -> float:
+    """Render uncached locale feeds and return the best mean time per feed."""
+    service = FeedServiceV2(repo)
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for i in range(RENDERS):
+            service.invalidate_cache()
+            feed = await service.get_feed_by_locale(LOCALES[i % len(LOCALES)], limit=50)
+            assert feed.count("<item>") == 50
+        best = min(best, (time.perf_counter() - start) * 1000 / RENDERS)
+    return best
+
+
+async def _ingest_seconds(repo: Repository) -> float:
+    """Push ROWS articles through the ingest queue from concurrent workers."""
+    articles = _articles(ROWS)
+    chunk = 50
+    async with ArticleIngestQueue(repo) as queue:
+        start = time.perf_counter()
+        new = await asyncio.gather(
+            *(queue.submit(articles[offset : offset + chunk]) for offset in range(0, ROWS, chunk))
+        )
+        elapsed = time.perf_counter() - start
+    assert sum(new) == ROWS
+    return elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_feed_rendering_without_storage(tmp_path, monkeypatch):
+    # Precompression is the same work for both engines; leave it out
+    monkeypatch.setattr("src.rss.feed_service.settings.feed_precompression", False)
+    sqlite = ArticleRepository(str(tmp_path / "render.db"))
+    memory = InMemoryArticleRepository()
+    timings = {}
+    try:
+        for name, repo in (("sqlite", sqlite), ("memory", memory)):
+            await repo.initialize()
+            await repo.save_batch(_articles(ROWS))
+            timings[name] = await _render_ms(repo)
+    finally:
+        await sqlite.close()
+        await memory.close()
+
+    print(
+        f"Uncached 50-item locale feed over {ROWS} articles: "
+        f"sqlite {timings['sqlite']:.2f}ms, in-memory {timings['memory']:.2f}ms "
+        f"(storage share {1 - timings['memory'] / timings['sqlite']:.0%})"
+    )
+    # Without I/O the in-memory engine can only be as fast or faster,
+    # give or take timer noise
+    assert timings["memory"] < timings["sqlite"] * 1.1
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_ingest_pipeline_without_storage(tmp_path):
+    timings = {"sqlite": float("inf"), "memory": float("inf")}
+    # Alternate the engines and keep each one's best round, so a burst of
+    # machine load does not land on one side only
+    for round_number in range(ROUNDS):
+        engines: tuple[tuple[str, Repository], ...] = (
+            ("sqlite", ArticleRepository(str(tmp_path / f"ingest-{round_number}.db"))),
+            ("memory", InMemoryArticleRepository()),
+        )
+        for name, repo in engines:
+            try:
+                await repo.initialize()
+                timings[name] = min(timings[name], await _ingest_seconds(repo))
+                assert await repo.count() == ROWS
+            finally:
+                await repo.close()
+
+    print(
+        f"Ingest of {ROWS} articles from {ROWS // 50} submissions: "
+        f"sqlite {ROWS / timings['sqlite']:.0f}/s, in-memory {ROWS / timings['memory']:.0f}/s"
+    )
+    # Signature computation is shared by both engines; only storage differs,
+    # so allow the same timer noise
+    assert timings["memory"] < timings["sqlite"] * 1.1
@@ -0,0 +1,121 @@
+"""
+RSS rendering with the built-in writer compared to the feedgen XML tree.
+
+The reference renderer below is the feedgen implementation the writer
+replaced; both must produce the same document, and the writer must be
+faster at every feed size.
+"""
+
+import html
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models import Article, ArticleSource
+from src.rss.generator import RSSFeedGenerator
+
+feedgen_feed = pytest.importorskip("feedgen.feed")
+
+SIZES = (50, 200, 500)
+# Override with RSS_BENCHMARK_ROUNDS for steadier numbers
+ROUNDS = int(os.environ.get("RSS_BENCHMARK_ROUNDS", "5"))
+FEED_URL = "http://localhost:8000/feed/en-us.xml"
+
+_BUILD_DATE = re.compile(r"<lastBuildDate>[^<]*</lastBuildDate>")
+
+
+def _articles(count: int) -> list[Article]:
+    """Build articles with every optional RSS element populated."""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    articles = [
+        Article(
+            title=f"Patch {i} notes & balance changes",
+            url=f"https://www.leagueoflegends.com/news/patch-{i}?utm=rss&id={i}",
+            pub_date=base + timedelta(minutes=i),
+            guid=f"guid-{i}",
+            source=ArticleSource.create("lol", "en-us"),
+            description=f"Champion {i % 170} <b>changes</b> in update {i}",
+            content=f"<p>Full article body {i} with <a href='#'>links</a></p>" * 20,
+            image_url=f"https://images.example.com/{i}.jpg",
+            categories=["Game Updates", "Patch Notes"],
+        )
+        for i in range(count)
+    ]
+    for i in range(0, count, 10):
+        articles[i].alternates = [articles[(i + 1) % count]]
+    return articles
+
+
+def _feedgen_render(generator: RSSFeedGenerator, articles: list[Article], feed_url: str) -> str:
+    """Render a feed the way RSSFeedGenerator did with feedgen."""
+    fg = feedgen_feed.FeedGenerator()
+    fg.id(feed_url)
+    fg.title(generator.feed_title)
+    fg.link(href=generator.feed_link, rel="alternate")
+    fg.link(href=feed_url, rel="self")
+    fg.description(generator.feed_description)
+    fg.language(generator.language)
+    fg.lastBuildDate(datetime.now(timezone.utc))
+    fg.generator("LoL Stonks RSS Generator")
+
+    for article in reversed(articles):
+        fe = fg.add_entry()
+        fe.id(article.guid)
+        fe.title(article.title)
+        fe.link(href=article.url)
+        pub_date = article.pub_date
+        if pub_date.tzinfo is None:
+            pub_date = pub_date.replace(tzinfo=timezone.utc)
+        fe.pubDate(pub_date)
+        if article.description:
+            fe.description(article.description)
+        content = article.content
+        if article.alternates:
+            content = (content or html.escape(article.description)) + (
+                generator._alternates_html(article.alternates)
+            )
+        if content:
+            fe.content(content, type="html")
+        if article.author:
+            fe.author(name=article.author, email="noreply@riotgames.com")
+        for category in article.categories:
+            if category:
+                fe.category(term=category)
+        fe.category(term=str(article.source))
+        if article.image_url:
+            fe.enclosure(url=article.image_url, length="0", type="image/jpeg")
+
+    return str(fg.rss_str(pretty=True).decode("utf-8"))
+
+
+def _best_ms(render, articles: list[Article]) -> float:
+    """Return the fastest of ROUNDS renders in milliseconds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        render(articles)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("size", SIZES)
+def test_rss_writer_vs_feedgen(size):
+    generator = RSSFeedGenerator()
+    articles = _articles(size)
+
+    written = generator.generate_feed(articles, FEED_URL)
+    reference = _feedgen_render(generator, articles, FEED_URL)
+    # Same document apart from the build timestamp
+    assert _BUILD_DATE.sub("", written) == _BUILD_DATE.sub("", reference)
+
+    writer_ms = _best_ms(lambda items: generator.generate_feed(items, FEED_URL), articles)
+    feedgen_ms = _best_ms(lambda items: _feedgen_render(generator, items, FEED_URL), articles)
+    print(
+        f"{size}-item feed: writer {writer_ms:.2f}ms, feedgen {feedgen_ms:.2f}ms "
+        f"({feedgen_ms / writer_ms:.1f}x)"
+    )
+    assert writer_ms < feedgen_ms
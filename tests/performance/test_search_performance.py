@@ -0,0 +1,100 @@
+"""Full-text search benchmark: FTS5 + BM25 vs a LIKE scan at 1M articles."""
+
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from src.database import ArticleRepository
+
+# Override with FTS_BENCHMARK_ROWS for a quicker local run
+ROWS = int(os.environ.get("FTS_BENCHMARK_ROWS", "1000000"))
+VOCABULARY = 5000
+ITERATIONS = 20
+
+
+def _words(count: int) -> str:
+    """SQL expression joining ``count`` random vocabulary words for row ``i``."""
+    picks = ",".join(f"abs(random()) % {VOCABULARY}" for _ in range(count))
+    return f"(SELECT group_concat(word, ' ') FROM temp.vocab WHERE id IN ({picks}) AND i > 0)"
+
+
+async def _seed(repo: ArticleRepository, rows: int) -> None:
+    """Generate rows in SQL so the insert triggers index them like real writes."""
+    await repo.execute(
+        "INSERT INTO sources (name, source_id, locale, source_category) VALUES "
+        "('lol:en-us', 'lol', 'en-us', 'official_riot'), "
+        "('lol:it-it', 'lol', 'it-it', 'official_riot')"
+    )
+    await repo.execute("INSERT INTO locales (code) VALUES ('en-us'), ('it-it')")
+    await repo.execute("CREATE TEMP TABLE vocab (id INTEGER PRIMARY KEY, word TEXT)")
+    await repo.execute(
+        "INSERT INTO temp.vocab (id, word) "
+        "WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < ?) "
+        "SELECT i, 'w' || i FROM n",
+        (VOCABULARY - 1,),
+    )
+    await repo.execute(
+        f"""
+        INSERT INTO articles (
+            guid, title, url, pub_date, description, source_ref, created_at, locale_ref
+        )
+        WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?)
+        SELECT
+            'guid-' || i, {_words(6)}, 'https://example.com/' || i,
+            1600000000000 + i * 60000, {_words(12)}, 1 + i % 2,
+            1600000000000 + i * 60000, 1 + i % 2
+        FROM n
+    """,
+        (rows,),
+    )
+
+
+async def _average_ms(
+    coro_factory: Callable[[], Awaitable[Any]], iterations: int = ITERATIONS
+) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await coro_factory()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_fts_search_at_one_million_rows(tmp_path):
+    repo = ArticleRepository(str(tmp_path / "search.db"))
+    await repo.initialize()
+    try:
+        start = time.perf_counter()
+        await _seed(repo, ROWS)
+        print(f"Seeded {ROWS} articles in {time.perf_counter() - start:.1f}s")
+
+        queries = {
+            "two terms": lambda: repo.search("w12 w57", limit=20),
+            "term + locale": lambda: repo.search("w4321", limit=20, locale="it-it"),
+            "prefix": lambda: repo.search("w250", limit=20),
+        }
+        timings = {name: await _average_ms(query) for name, query in queries.items()}
+
+        # Rare term combinations force the LIKE baseline to scan every row
+        like_ms = await _average_ms(
+            lambda: repo.fetch_all(
+                "SELECT id FROM article_view "
+                "WHERE (title || ' ' || description) LIKE '%w12 %' "
+                "AND (title || ' ' || description) LIKE '%w57 %' "
+                "ORDER BY pub_date DESC LIMIT 20"
+            ),
+            iterations=3,
+        )
+
+        print(
+            ", ".join(f"{name} {ms:.2f}ms" for name, ms in timings.items())
+            + f"; LIKE scan {like_ms:.2f}ms"
+        )
+        assert len(await repo.search("w4321", limit=20, locale="it-it")) == 20
+        assert timings["two terms"] < like_ms
+        assert max(timings.values()) < 250
+    finally:
+        await repo.close()
@@ -5,15 +5,25 @@ This module tests all HTTP endpoints including feed generation, health checks,
 and error handling.
 """
 
+import gzip
 from collections.abc import AsyncGenerator
-from datetime import timezone
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from src.api.app import app, app_state
+from src.api.app import (
+    app,
+    app_state,
+    negotiate_content_encoding,
+    negotiate_feed_format,
+    settings,
+    use_repository,
+)
+from src.memory_database import InMemoryArticleRepository
 from src.models import Article, ArticleSource
+from src.rss.feed_service import DataVersion, FeedServiceV2, RenderedFeed
 
 
 @pytest.fixture(autouse=True)
@@ -55,6 +65,7 @@ def mock_feed_service() -> AsyncMock:
     service.get_feed_by_source = AsyncMock(return_value='<?xml version="1.0"?><rss></rss>')
     service.get_feed_by_category = AsyncMock(return_value='<?xml version="1.0"?><rss></rss>')
     service.invalidate_cache = MagicMock()
+    service.get_data_version = AsyncMock(return_value=DataVersion("0", None))
 
     # Store in app_state
     app_state["feed_service"] = service
@@ -72,6 +83,7 @@ def mock_repository() -> AsyncMock:
     """
     repo = AsyncMock()
     repo.get_latest = AsyncMock(return_value=[])
+    repo.get_page = AsyncMock(return_value=([], None))
     repo.initialize = AsyncMock()
     repo.close = AsyncMock()
 
@@ -242,6 +254,53 @@ async def test_health_check_no_articles(client: AsyncClient) -> None:
     assert data["database"]["total_articles"] == 0
 
 
+@pytest.mark.asyncio
+async def test_health_check_reports_replication_lag(client: AsyncClient) -> None:
+    """
+    Test that a replica reports its lag and degrades when snapshots go stale.
+
+    Args:
+        client: Test client fixture
+    """
+    repo = AsyncMock()
+    repo.count = AsyncMock(return_value=100)
+    repo.get_last_write_timestamp = AsyncMock(return_value=None)
+    repo.get_locales = AsyncMock(return_value=["en-us"])
+    repo.get_source_categories = AsyncMock(return_value=["official_riot"])
+
+    service = AsyncMock()
+    service.cache = MagicMock()
+    service.cache.get_stats = MagicMock(
+        return_value={"total_entries": 0, "size_bytes_estimate": 0, "ttl_seconds": 300}
+    )
+
+    scheduler = MagicMock()
+    scheduler.get_status = MagicMock(
+        return_value={
+            "running": True,
+            "interval_minutes": 30,
+            "jobs": [{"id": "replica_sync", "name": "Replica Sync", "next_run": None}],
+            "update_service": {"update_count": 0, "error_count": 0},
+        }
+    )
+    replica = MagicMock()
+    replica.lag_seconds = MagicMock(return_value=30.0)
+
+    app_state["repository"] = repo
+    app_state["feed_service"] = service
+    app_state["scheduler"] = scheduler
+    app_state["replica"] = replica
+
+    data = (await client.get("/health")).json()
+    assert data["database"]["replication_lag_seconds"] == 30.0
+    assert data["status"] == "healthy"
+
+    # Far beyond the replication interval: the primary stopped shipping
+    replica.lag_seconds.return_value = 3600.0
+    data = (await client.get("/health")).json()
+    assert data["status"] == "degraded"
+
+
 @pytest.mark.asyncio
 async def test_ping_endpoint(client: AsyncClient) -> None:
     """
@@ -498,6 +557,235 @@ async def test_content_type_headers(client: AsyncClient, mock_feed_service: Asyn
     assert content_type == "application/rss+xml; charset=utf-8"
 
 
+@pytest.mark.asyncio
+async def test_feed_format_from_extension(
+    client: AsyncClient, mock_feed_service: AsyncMock
+) -> None:
+    """
+    Test .atom and .json URLs render their format with its own media type.
+
+    Args:
+        client: Test client fixture
+        mock_feed_service: Mocked feed service fixture
+    """
+    response = await client.get("/feed/en-us.json")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/feed+json; charset=utf-8"
+    assert response.headers["Vary"].startswith("Accept-Encoding")
+    call_args = mock_feed_service.get_feed_by_source.call_args
+    assert call_args[1]["fmt"] == "json"
+    assert call_args[0][1].endswith("/feed/en-us.json")
+
+    response = await client.get("/feed.atom")
+
+    assert response.headers["content-type"] == "application/atom+xml; charset=utf-8"
+    assert mock_feed_service.get_main_feed.call_args[1]["fmt"] == "atom"
+
+
+@pytest.mark.asyncio
+async def test_feed_format_from_accept_header(
+    client: AsyncClient, mock_feed_service: AsyncMock
+) -> None:
+    """
+    Test .xml URLs negotiate the format and vary on Accept.
+
+    Args:
+        client: Test client fixture
+        mock_feed_service: Mocked feed service fixture
+    """
+    response = await client.get("/feed.xml", headers={"Accept": "application/atom+xml"})
+
+    assert response.headers["content-type"] == "application/atom+xml; charset=utf-8"
+    assert "Accept" in response.headers["Vary"]
+    assert mock_feed_service.get_main_feed.call_args[1]["fmt"] == "atom"
+
+    response = await client.get("/feed.xml", headers={"Accept": "text/html,*/*"})
+
+    assert response.headers["content-type"] == "application/rss+xml; charset=utf-8"
+    assert "Accept" in response.headers["Vary"]
+
+
+def test_negotiate_feed_format() -> None:
+    """Test Accept negotiation picks the preferred known feed type."""
+    assert negotiate_feed_format(None) == "rss"
+    assert negotiate_feed_format("*/*") == "rss"
+    assert negotiate_feed_format("application/feed+json") == "json"
+    assert negotiate_feed_format("application/rss+xml;q=0.5, application/atom+xml") == "atom"
+    assert negotiate_feed_format("application/atom+xml;q=0.8, application/json;q=0.9") == "json"
+    assert negotiate_feed_format("application/atom+xml, application/feed+json") == "atom"
+    assert negotiate_feed_format("application/atom+xml;q=0") == "rss"
+
+
+@pytest.mark.asyncio
+async def test_feed_served_precompressed(client: AsyncClient, mock_feed_service: AsyncMock) -> None:
+    """
+    Test that a stored encoding is sent when the client accepts it.
+
+    Args:
+        client: Test client fixture
+        mock_feed_service: Mocked feed service fixture
+    """
+    document = '<?xml version="1.0"?><rss>' + "<item/>" * 100 + "</rss>"
+    mock_feed_service.get_main_feed.return_value = RenderedFeed(
+        document, {"gzip": gzip.compress(document.encode())}
+    )
+
+    response = await client.get("/feed.xml", headers={"Accept-Encoding": "gzip, deflate"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.text == document
+
+    response = await client.get("/feed.xml", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == document
+
+
+@pytest.mark.asyncio
+async def test_feed_conditional_get(client: AsyncClient, mock_feed_service: AsyncMock) -> None:
+    """
+    Test that current ETags and dates get 304 Not Modified without a body.
+
+    Args:
+        client: Test client fixture
+        mock_feed_service: Mocked feed service fixture
+    """
+    document = '<?xml version="1.0"?><rss>' + "<item/>" * 100 + "</rss>"
+    feed = RenderedFeed(
+        document,
+        {"gzip": gzip.compress(document.encode())},
+        last_modified=datetime(2025, 12, 28, 10, 0, 0, 500000, tzinfo=timezone.utc),
+    )
+    mock_feed_service.get_main_feed.return_value = feed
+
+    response = await client.get("/feed.xml", headers={"Accept-Encoding": "identity"})
+
+    assert response.headers["ETag"] == feed.etag
+    assert response.headers["Last-Modified"] == "Sun, 28 Dec 2025 10:00:00 GMT"
+    gzipped = await client.get("/feed.xml", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["ETag"] == feed.etag_for("gzip") != feed.etag
+
+    for headers in (
+        {"If-None-Match": feed.etag},
+        {"If-None-Match": f'"other", W/{feed.etag_for("gzip")}'},
+        {"If-Modified-Since": "Sun, 28 Dec 2025 10:00:00 GMT"},
+    ):
+        response = await client.get("/feed.xml", headers={**headers, "Accept-Encoding": "identity"})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == feed.etag
+
+    for headers in (
+        {"If-None-Match": '"other"'},
+        {"If-Modified-Since": "Sun, 28 Dec 2025 09:59:59 GMT"},
+        {"If-Modified-Since": "not a date"},
+        # If-None-Match wins over a current If-Modified-Since
+        {"If-None-Match": '"other"', "If-Modified-Since": "Mon, 29 Dec 2025 00:00:00 GMT"},
+    ):
+        response = await client.get("/feed.xml", headers=headers)
+        assert response.status_code == 200
+        assert response.text == document
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_skips_the_feed_service(
+    client: AsyncClient, mock_feed_service: AsyncMock
+) -> None:
+    """
+    Test that a feed of the current data version gets 304 before it is fetched.
+
+    Args:
+        client: Test client fixture
+        mock_feed_service: Mocked feed service fixture
+    """
+    version = DataVersion("v1", datetime(2025, 12, 28, 10, 0, 0, tzinfo=timezone.utc))
+    mock_feed_service.get_data_version.return_value = version
+
+    for headers in (
+        {"If-None-Match": version.etag("rss", "gzip")},
+        {"If-Modified-Since": "Sun, 28 Dec 2025 10:00:00 GMT"},
+    ):
+        response = await client.get("/feed.xml", headers=headers)
+        assert response.status_code == 304
+        assert response.headers["Last-Modified"] == "Sun, 28 Dec 2025 10:00:00 GMT"
+        assert response.headers.get("ETag") == headers.get("If-None-Match")
+    mock_feed_service.get_main_feed.assert_not_awaited()
+
+    # A tag of another format or an older version needs the feed
+    for etag in (version.etag("atom"), DataVersion("v0", None).etag("rss")):
+        response = await client.get("/feed.xml", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+    assert mock_feed_service.get_main_feed.await_count == 2
+
+    # Unconditional requests do not read the version at all
+    mock_feed_service.get_data_version.reset_mock()
+    await client.get("/feed.xml")
+    mock_feed_service.get_data_version.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_feed_not_modified_by_writes_to_other_locales(client: AsyncClient) -> None:
+    """
+    Test that a write to one locale keeps the other locales' feeds at 304.
+
+    Args:
+        client: Test client fixture
+    """
+
+    def article(guid: str, locale: str) -> Article:
+        return Article(
+            title=f"Article {guid}",
+            url=f"https://example.com/{guid}",
+            pub_date=datetime(2025, 12, 28, tzinfo=timezone.utc),
+            guid=guid,
+            source=ArticleSource.create("lol", locale),
+        )
+
+    repo = InMemoryArticleRepository()
+    await repo.initialize()
+    await repo.save_batch([article("en-1", "en-us"), article("it-1", "it-it")])
+    service = FeedServiceV2(repo)
+    app_state["feed_service_v2"] = service
+
+    italian = await client.get("/rss/it-it.xml")
+    english = await client.get("/rss/en-us.xml")
+    # An update writes to one locale, then drops every cached feed
+    await repo.save(article("en-2", "en-us"))
+    service.invalidate_cache()
+
+    response = await client.get(
+        "/rss/it-it.xml",
+        headers={
+            "If-None-Match": italian.headers["ETag"],
+            "If-Modified-Since": italian.headers["Last-Modified"],
+        },
+    )
+    assert response.status_code == 304
+    response = await client.get(
+        "/rss/en-us.xml", headers={"If-None-Match": english.headers["ETag"]}
+    )
+    assert response.status_code == 200
+
+    # The same locale with another limit is a different document
+    response = await client.get(
+        "/rss/it-it.xml?limit=10", headers={"If-None-Match": italian.headers["ETag"]}
+    )
+    assert response.status_code == 200
+
+
+def test_negotiate_content_encoding() -> None:
+    """Test Accept-Encoding negotiation over the stored encodings."""
+    available = ("br", "gzip")
+    assert negotiate_content_encoding(None, available) is None
+    assert negotiate_content_encoding("gzip, deflate, br", available) == "br"
+    assert negotiate_content_encoding("gzip, br;q=0.5", available) == "gzip"
+    assert negotiate_content_encoding("br;q=0, *", available) == "gzip"
+    assert negotiate_content_encoding("identity", available) is None
+    assert negotiate_content_encoding("br", ("gzip",)) is None
+
+
 @pytest.mark.asyncio
 async def test_feed_error_handling(client: AsyncClient) -> None:
     """
@@ -605,9 +893,9 @@ async def test_get_articles_default(client: AsyncClient, mock_repository: AsyncM
             image_url=None,
         ),
     ]
-    mock_repository.get_latest = AsyncMock(return_value=articles)
+    mock_repository.get_page = AsyncMock(return_value=(articles, None))
 
-    response = await client.get("/api/articles")
+    response = await client.get("/api/articles?include_content=false")
 
     assert response.status_code == 200
     data = response.json()
@@ -615,6 +903,40 @@ async def test_get_articles_default(client: AsyncClient, mock_repository: AsyncM
     assert len(data) == 2
     assert data[0]["title"] == "Test Article 1"
     assert data[1]["title"] == "Test Article 2"
+    assert "content" not in data[0]
+    assert mock_repository.get_page.call_args.kwargs["projection"] == "summary"
+
+
+@pytest.mark.asyncio
+async def test_get_articles_include_content(
+    client: AsyncClient, mock_repository: AsyncMock
+) -> None:
+    """
+    Test that articles keep their full content by default.
+
+    Args:
+        client: Test client fixture
+        mock_repository: Mocked repository fixture
+    """
+    from datetime import datetime, timezone
+
+    article = Article(
+        guid="test-1",
+        title="Test Article",
+        url="https://example.com/article",
+        pub_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        source=ArticleSource.create("lol", "en-us"),
+        content="<p>Full body</p>",
+    )
+    mock_repository.get_page = AsyncMock(return_value=([article], None))
+
+    response = await client.get("/api/articles")
+
+    assert response.status_code == 200
+    assert response.json()[0]["content"] == "<p>Full body</p>"
+    mock_repository.get_page.assert_called_once_with(
+        limit=50, cursor=None, source=None, locale=None, projection="full"
+    )
 
 
 @pytest.mark.asyncio
@@ -638,12 +960,14 @@ async def test_get_articles_with_limit(client: AsyncClient, mock_repository: Asy
         categories=["News"],
         image_url=None,
     )
-    mock_repository.get_latest = AsyncMock(return_value=[article])
+    mock_repository.get_page = AsyncMock(return_value=([article], None))
 
     response = await client.get("/api/articles?limit=10")
 
     assert response.status_code == 200
-    mock_repository.get_latest.assert_called_once_with(limit=10, source=None)
+    mock_repository.get_page.assert_called_once_with(
+        limit=10, cursor=None, source=None, locale=None, projection="full"
+    )
 
 
 @pytest.mark.asyncio
@@ -667,12 +991,55 @@ async def test_get_articles_with_source(client: AsyncClient, mock_repository: As
         categories=["News"],
         image_url=None,
     )
-    mock_repository.get_latest = AsyncMock(return_value=[article])
+    mock_repository.get_page = AsyncMock(return_value=([article], None))
 
     response = await client.get("/api/articles?source=it-it")
 
     assert response.status_code == 200
-    mock_repository.get_latest.assert_called_once_with(limit=50, source="it-it")
+    mock_repository.get_page.assert_called_once_with(
+        limit=50, cursor=None, source="it-it", locale=None, projection="full"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_articles_returns_next_cursor(
+    client: AsyncClient, mock_repository: AsyncMock
+) -> None:
+    """
+    Test that a next-page cursor is exposed in pagination headers.
+
+    Args:
+        client: Test client fixture
+        mock_repository: Mocked repository fixture
+    """
+    mock_repository.get_page = AsyncMock(return_value=([], "next-token"))
+
+    response = await client.get("/api/articles?limit=5&cursor=abc&include_content=false")
+
+    assert response.status_code == 200
+    assert response.headers["X-Next-Cursor"] == "next-token"
+    assert 'rel="next"' in response.headers["Link"]
+    assert "cursor=next-token" in response.headers["Link"]
+    assert "include_content=false" in response.headers["Link"]
+    mock_repository.get_page.assert_called_once_with(
+        limit=5, cursor="abc", source=None, locale=None, projection="summary"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_articles_invalid_cursor(client: AsyncClient, mock_repository: AsyncMock) -> None:
+    """
+    Test that a malformed cursor yields 400.
+
+    Args:
+        client: Test client fixture
+        mock_repository: Mocked repository fixture
+    """
+    mock_repository.get_page = AsyncMock(side_effect=ValueError("Invalid cursor"))
+
+    response = await client.get("/api/articles?cursor=garbage")
+
+    assert response.status_code == 400
 
 
 @pytest.mark.asyncio
@@ -693,6 +1060,84 @@ async def test_get_articles_repository_not_initialized(client: AsyncClient) -> N
     assert "not initialized" in data["detail"].lower()
 
 
+@pytest.mark.asyncio
+async def test_search_articles(client: AsyncClient, mock_repository: AsyncMock) -> None:
+    """
+    Test that /api/search forwards the query and filters to the repository.
+
+    Args:
+        client: Test client fixture
+        mock_repository: Mocked repository fixture
+    """
+    from datetime import datetime, timezone
+
+    article = Article(
+        guid="test-1",
+        title="Patch 14.1 notes",
+        url="https://example.com/patch",
+        pub_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        source=ArticleSource.create("lol", "en-us"),
+        content="<p>Full body</p>",
+    )
+    mock_repository.search = AsyncMock(return_value=[article])
+
+    response = await client.get("/api/search?q=patch%20notes&locale=en-us&limit=10")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [a["title"] for a in data] == ["Patch 14.1 notes"]
+    assert "content" not in data[0]
+    mock_repository.search.assert_called_once_with(
+        "patch notes",
+        limit=10,
+        locale="en-us",
+        source=None,
+        source_category=None,
+        category=None,
+        projection="summary",
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_articles_rejects_unsearchable_query(
+    client: AsyncClient, mock_repository: AsyncMock
+) -> None:
+    """
+    Test that queries without searchable terms yield 400 and a missing q 422.
+
+    Args:
+        client: Test client fixture
+        mock_repository: Mocked repository fixture
+    """
+    mock_repository.search = AsyncMock(side_effect=ValueError("No searchable terms"))
+
+    assert (await client.get("/api/search?q=%22%2A")).status_code == 400
+    assert (await client.get("/api/search")).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_feed(client: AsyncClient) -> None:
+    """
+    Test that /rss/search.xml is served by the search feed, not the locale route.
+
+    Args:
+        client: Test client fixture
+    """
+    service = MagicMock()
+    service.get_supported_locales = MagicMock(return_value=["en-us", "it-it"])
+    service.get_search_feed = AsyncMock(return_value='<?xml version="1.0"?><rss></rss>')
+    app_state["feed_service_v2"] = service
+
+    response = await client.get("/rss/search.xml?q=arena&locale=it-it")
+
+    assert response.status_code == 200
+    assert "<rss>" in response.text
+    service.get_search_feed.assert_called_once_with(
+        query="arena", locale="it-it", limit=50, fmt="rss"
+    )
+    assert (await client.get("/rss/search.xml?q=arena&locale=xx-yy")).status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_get_scheduler_status(client: AsyncClient) -> None:
     """
@@ -792,6 +1237,70 @@ async def test_trigger_scheduler_update_not_initialized(client: AsyncClient) ->
     assert "not initialized" in data["detail"].lower()
 
 
+@pytest.mark.asyncio
+async def test_trigger_backup(client: AsyncClient) -> None:
+    """
+    Test manually triggering an online database backup.
+
+    Args:
+        client: Test client fixture
+    """
+    scheduler = MagicMock()
+    scheduler.trigger_backup_now = AsyncMock(
+        return_value={"path": "data/backups/articles.db", "bytes": 8192}
+    )
+    app_state["scheduler"] = scheduler
+
+    response = await client.post("/admin/backup")
+
+    assert response.status_code == 200
+    assert response.json()["bytes"] == 8192
+    scheduler.trigger_backup_now.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_replica_rejects_update_and_backup(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that a replica refuses admin actions that write to its snapshot.
+
+    Args:
+        client: Test client fixture
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(settings, "node_role", "replica")
+    scheduler = MagicMock()
+    scheduler.trigger_update_now = AsyncMock()
+    scheduler.trigger_backup_now = AsyncMock()
+    app_state["scheduler"] = scheduler
+
+    update = await client.post("/admin/scheduler/trigger")
+    backup = await client.post("/admin/backup")
+
+    assert update.status_code == 409
+    assert backup.status_code == 409
+    assert "replica" in backup.json()["detail"]
+    scheduler.trigger_update_now.assert_not_awaited()
+    scheduler.trigger_backup_now.assert_not_awaited()
+
+
+def test_use_repository_rebinds_every_service() -> None:
+    """Test that a snapshot swap reaches the feed services and the update service."""
+    repository = AsyncMock()
+    scheduler = MagicMock()
+    app_state["feed_service_v2"] = MagicMock()
+    app_state["scheduler"] = scheduler
+
+    use_repository(repository)
+
+    assert app_state["repository"] is repository
+    assert app_state["feed_service_v2"].repository is repository
+    app_state["feed_service_v2"].invalidate_cache.assert_called_once()
+    assert scheduler.repository is repository
+    assert scheduler.update_service.repository is repository
+
+
 # =============================================================================
 # Enhanced Health Check Tests (Readiness/Liveness)
 # =============================================================================
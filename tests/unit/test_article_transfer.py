@@ -0,0 +1,159 @@
+"""
+Tests for bulk article export and import.
+
+Covers NDJSON (plain and gzipped) and Parquet round trips, export filters,
+chunk boundaries and GUID de-duplication on re-import.
+"""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.database import EXPORT_COLUMNS, ArticleRepository
+from src.models import Article, ArticleSource
+from src.services.article_transfer import detect_format, export_articles, import_articles
+
+NOW = datetime(2025, 12, 28, 12, 0, tzinfo=timezone.utc)
+
+
+def _article(guid: str, days: int, locale: str = "en-us", source_id: str = "lol") -> Article:
+    """Create a test article published ``days`` before NOW."""
+    return Article(
+        title=f"Article {guid} è",
+        url=f"https://example.com/{guid}",
+        pub_date=NOW - timedelta(days=days),
+        guid=guid,
+        source=ArticleSource.create(source_id, locale),
+        description=f"Description of {guid}",
+        content=f"<p>Body of {guid}</p>",
+        categories=["Dev", "Patch Notes"],
+        created_at=NOW,
+    )
+
+
+@pytest.fixture
+async def source_repo(tmp_path):
+    """Repository holding articles across locales, sources and dates."""
+    repo = ArticleRepository(str(tmp_path / "source.db"), compress_description=True)
+    await repo.initialize()
+    await repo.save_batch(
+        [
+            _article("a", 1),
+            _article("b", 2, "it-it"),
+            _article("c", 3, "en-us", "u-gg"),
+            _article("d", 10),
+            _article("e", 20, "it-it"),
+        ]
+    )
+    yield repo
+    await repo.close()
+
+
+@pytest.fixture
+async def target_repo(tmp_path):
+    """Empty repository to import into."""
+    repo = ArticleRepository(str(tmp_path / "target.db"))
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+
+def test_detect_format():
+    """Test that formats are inferred from file extensions."""
+    assert detect_format("out/articles.ndjson") == "ndjson"
+    assert detect_format("articles.jsonl.gz") == "ndjson"
+    assert detect_format("articles.parquet") == "parquet"
+    with pytest.raises(ValueError):
+        detect_format("articles.csv")
+
+
+@pytest.mark.asyncio
+async def test_export_rows_streams_in_keyset_chunks(source_repo):
+    """Test that export_rows() yields every article once, chunk by chunk."""
+    chunks = [chunk async for chunk in source_repo.export_rows(chunk_size=2)]
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    rows = [row for chunk in chunks for row in chunk]
+    assert [row["guid"] for row in rows] == ["a", "b", "c", "d", "e"]
+    assert set(rows[0]) == set(EXPORT_COLUMNS)
+    # Compressed descriptions are exported as text
+    assert rows[0]["description"] == "Description of a"
+    assert rows[0]["categories"] == "Dev,Patch Notes"
+
+    filtered = [
+        row["guid"]
+        async for chunk in source_repo.export_rows(
+            locale="en-us", since=NOW - timedelta(days=5), include_content=False
+        )
+        for row in chunk
+    ]
+    assert filtered == ["a", "c"]
+    assert [c async for c in source_repo.export_rows(source="tft:en-us")] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", ["articles.ndjson", "articles.ndjson.gz"])
+async def test_ndjson_round_trip(source_repo, target_repo, tmp_path, name):
+    """Test that an NDJSON export imports back unchanged, and only once."""
+    path = str(tmp_path / name)
+
+    assert await export_articles(source_repo, path, chunk_size=2) == 5
+    assert not (tmp_path / f"{name}.partial").exists()
+
+    opener = gzip.open if name.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        first = json.loads(handle.readline())
+    assert first["guid"] == "a"
+    assert first["pub_date"] == "2025-12-27T12:00:00.000+00:00"
+    assert first["description"] == "Description of a"
+    assert first["source_category"] == "official_riot"
+
+    stats = await import_articles(target_repo, path, batch_size=2)
+    assert stats == {"read": 5, "imported": 5, "duplicates": 0, "invalid": 0}
+    for guid in "abcde":
+        assert await target_repo.get_by_guid(guid) == await source_repo.get_by_guid(guid)
+
+    again = await import_articles(target_repo, path)
+    assert again == {"read": 5, "imported": 0, "duplicates": 5, "invalid": 0}
+    assert await target_repo.count() == 5
+
+
+@pytest.mark.asyncio
+async def test_filtered_export_and_invalid_rows(source_repo, target_repo, tmp_path):
+    """Test export filters and that rows missing fields are skipped on import."""
+    path = tmp_path / "it.ndjson"
+    count = await export_articles(
+        source_repo, str(path), locale="it-it", until=NOW - timedelta(days=5)
+    )
+    assert count == 1
+
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('{"guid": "broken", "title": "No url or date"}\n\n')
+
+    stats = await import_articles(target_repo, str(path))
+    assert stats == {"read": 2, "imported": 1, "duplicates": 0, "invalid": 1}
+    assert (await target_repo.get_by_guid("e")).locale == "it-it"
+
+
+@pytest.mark.asyncio
+async def test_unknown_format_is_rejected(source_repo, tmp_path):
+    """Test that an unsupported format raises before anything is written."""
+    with pytest.raises(ValueError):
+        await export_articles(source_repo, str(tmp_path / "x.out"), fmt="csv")
+    assert not any(p.name.startswith("x.out") for p in tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_parquet_round_trip(source_repo, target_repo, tmp_path):
+    """Test that a Parquet export imports back unchanged."""
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "articles.parquet")
+
+    assert await export_articles(source_repo, path, chunk_size=2) == 5
+
+    stats = await import_articles(target_repo, path, batch_size=3)
+    assert stats["imported"] == 5
+    for guid in "abcde":
+        assert await target_repo.get_by_guid(guid) == await source_repo.get_by_guid(guid)
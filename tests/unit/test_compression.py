@@ -0,0 +1,81 @@
+"""
+Tests for the stored-text compression codecs and HTTP body precompression.
+"""
+
+import gzip
+
+import pytest
+
+from src.utils.compression import (
+    MIN_COMPRESS_BYTES,
+    ZLIB_MARKER,
+    check_codec,
+    compress_text,
+    content_encodings,
+    decompress_text,
+    precompress,
+)
+
+
+def test_zlib_round_trip():
+    """Test that long text is compressed with a marker and decoded back."""
+    text = "<p>Patch 14.1 — équilibrage</p>" * 50
+    packed = compress_text(text, "zlib")
+
+    assert isinstance(packed, bytes)
+    assert packed.startswith(ZLIB_MARKER)
+    assert len(packed) < len(text.encode("utf-8"))
+    assert decompress_text(packed) == text
+
+
+def test_short_text_is_kept():
+    """Test that values not worth compressing stay plain text."""
+    short = "x" * (MIN_COMPRESS_BYTES - 1)
+    assert compress_text(short, "zlib") == short
+    assert compress_text("", "zlib") == ""
+    assert compress_text(None, "zlib") is None
+    assert compress_text("long text " * 100, "none") == "long text " * 100
+
+
+def test_decompress_passes_plain_values_through():
+    """Test that TEXT and NULL values are returned unchanged."""
+    assert decompress_text("plain") == "plain"
+    assert decompress_text(None) is None
+    with pytest.raises(ValueError):
+        decompress_text(b"\x7fnot a codec")
+
+
+def test_zstd_round_trip():
+    """Test the zstd codec when the optional package is installed."""
+    pytest.importorskip("zstandard")
+    text = "<p>Arena mode returns</p>" * 50
+    assert decompress_text(compress_text(text, "zstd")) == text
+
+
+def test_check_codec_rejects_unknown_codecs():
+    """Test that only known codecs are accepted."""
+    check_codec("none")
+    check_codec("zlib")
+    with pytest.raises(ValueError):
+        check_codec("lzma")
+
+
+def test_precompress_encodes_with_every_available_coding():
+    """Test that bodies are gzipped (and brotli-encoded when installed) reproducibly."""
+    body = b"<item><title>Arena mode returns</title></item>" * 50
+
+    encodings = precompress(body)
+
+    assert set(encodings) == set(content_encodings())
+    assert gzip.decompress(encodings["gzip"]) == body
+    assert precompress(body)["gzip"] == encodings["gzip"]
+    assert precompress(b"x" * (MIN_COMPRESS_BYTES - 1)) == {}
+
+
+def test_precompress_brotli():
+    """Test the brotli encoding when the optional package is installed."""
+    brotli = pytest.importorskip("brotli")
+    body = b"<item><title>Arena mode returns</title></item>" * 50
+
+    assert content_encodings()[0] == "br"
+    assert brotli.decompress(precompress(body)["br"]) == body
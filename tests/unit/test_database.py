@@ -6,12 +6,16 @@ initialization, CRUD operations, and querying with multi-source,
 multi-locale support.
 """
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
+import aiosqlite
 import pytest
 
-from src.database import ArticleRepository
-from src.models import Article, ArticleSource
+from src.database import ArticleRepository, fts_query
+from src.models import Article, ArticleSource, RetentionPolicy
+from src.utils.compression import ZLIB_MARKER
 
 
 @pytest.fixture
@@ -455,6 +459,46 @@ async def test_get_source_categories(temp_db):
     assert set(categories) == {"official_riot", "analytics"}
 
 
+@pytest.mark.asyncio
+async def test_article_stats_follow_inserts_and_deletes(temp_db):
+    """Test that article_stats is kept in step with the articles table."""
+    source_en = ArticleSource.create("lol", "en-us")
+    source_it = ArticleSource.create("u-gg", "it-it")
+
+    articles = [
+        Article(
+            title=f"Article {i}",
+            url=f"https://example.com/{i}",
+            pub_date=datetime(2025, 12, 20 + i, tzinfo=timezone.utc),
+            guid=f"test-{i}",
+            source=source_en if i < 3 else source_it,
+        )
+        for i in range(5)
+    ]
+    await temp_db.save_many(articles)
+
+    stats = await temp_db.get_article_stats()
+    assert [(s["source_id"], s["locale"], s["count"]) for s in stats] == [
+        ("lol", "en-us", 3),
+        ("u-gg", "it-it", 2),
+    ]
+    assert stats[0]["source_category"] == "official_riot"
+    assert stats[0]["last_pub_date"] == datetime(2025, 12, 22, tzinfo=timezone.utc)
+    assert await temp_db.get_last_write_timestamp() == datetime(2025, 12, 24, tzinfo=timezone.utc)
+
+    # Deleting the newest article of a pair recomputes its max pub_date
+    await temp_db.execute("DELETE FROM articles WHERE guid = 'test-4'")
+    assert await temp_db.count() == 4
+    assert await temp_db.count(locale="it-it") == 1
+    assert await temp_db.get_last_write_timestamp() == datetime(2025, 12, 23, tzinfo=timezone.utc)
+
+    # An emptied pair disappears from the discovery lists
+    await temp_db.execute("DELETE FROM articles WHERE guid = 'test-3'")
+    assert await temp_db.get_locales() == ["en-us"]
+    assert await temp_db.get_source_categories() == ["official_riot"]
+    assert len(await temp_db.get_article_stats()) == 1
+
+
 @pytest.mark.asyncio
 async def test_get_by_canonical_url(temp_db):
     """Test retrieving article by canonical URL."""
@@ -475,3 +519,928 @@ async def test_get_by_canonical_url(temp_db):
     assert retrieved is not None
     assert retrieved.guid == "test-123"
     assert retrieved.canonical_url == "https://canonical.com/test"
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_opened_with_wal(tmp_path):
+    """Test that initialize() opens a writer plus reader pool in WAL mode."""
+    repo = ArticleRepository(str(tmp_path / "pool.db"), read_pool_size=3)
+    await repo.initialize()
+
+    try:
+        assert repo._writer is not None
+        assert len(repo._readers) == 3
+
+        rows = await repo.fetch_all("PRAGMA journal_mode")
+        assert rows[0][0] == "wal"
+    finally:
+        await repo.close()
+
+    assert repo._writer is None
+    assert repo._readers == []
+
+
+@pytest.mark.asyncio
+async def test_repository_reopens_after_close(tmp_path):
+    """Test that a closed repository can be initialized again."""
+    repo = ArticleRepository(str(tmp_path / "reopen.db"))
+    await repo.initialize()
+    await repo.save(
+        Article(
+            title="Persisted",
+            url="https://example.com/persisted",
+            pub_date=datetime(2025, 12, 28),
+            guid="persisted-1",
+            source=ArticleSource.create("lol", "en-us"),
+        )
+    )
+    await repo.close()
+
+    await repo.initialize()
+    try:
+        assert await repo.count() == 1
+    finally:
+        await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_database_shares_single_connection():
+    """Test that :memory: databases keep data across calls via the shared writer."""
+    repo = ArticleRepository(":memory:")
+    await repo.initialize()
+
+    try:
+        assert repo._readers == []
+        await repo.save(
+            Article(
+                title="In memory",
+                url="https://example.com/memory",
+                pub_date=datetime(2025, 12, 28),
+                guid="memory-1",
+                source=ArticleSource.create("lol", "en-us"),
+            )
+        )
+        assert await repo.count() == 1
+        assert (await repo.get_by_guid("memory-1")) is not None
+    finally:
+        await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_save_batch_returns_new_guids(temp_db):
+    """Test that save_batch reports exactly which GUIDs were inserted."""
+    source = ArticleSource.create("lol", "en-us")
+    existing = Article(
+        title="Existing",
+        url="https://example.com/existing",
+        pub_date=datetime(2025, 12, 28),
+        guid="existing",
+        source=source,
+    )
+    await temp_db.save(existing)
+
+    batch = [
+        existing,
+        Article(
+            title="New 1",
+            url="https://example.com/new-1",
+            pub_date=datetime(2025, 12, 28),
+            guid="new-1",
+            source=source,
+        ),
+        Article(
+            title="Same URL, new GUID",
+            url="https://example.com/existing",
+            pub_date=datetime(2025, 12, 28),
+            guid="url-duplicate",
+            source=source,
+        ),
+        Article(
+            title="New 2",
+            url="https://example.com/new-2",
+            pub_date=datetime(2025, 12, 28),
+            guid="new-2",
+            source=source,
+        ),
+    ]
+
+    new_guids = await temp_db.save_batch(batch)
+
+    assert new_guids == ["new-1", "new-2"]
+    assert await temp_db.count() == 3
+    assert await temp_db.save_batch([]) == []
+
+
+@pytest.mark.asyncio
+async def test_save_batch_locks_out_other_writers(temp_db, monkeypatch):
+    """Test that no other connection can insert between the id scan and the commit."""
+    articles = [
+        Article(
+            title=f"Article {guid}",
+            url=f"https://example.com/{guid}",
+            pub_date=datetime(2025, 12, 28),
+            guid=guid,
+            source=ArticleSource.create("lol", locale),
+        )
+        # The second locale is new, so serializing it commits its lookup row
+        for guid, locale in (("first", "en-us"), ("second", "fr-fr"))
+    ]
+    await temp_db.save_batch(articles[:1])
+    assign_body_refs = temp_db._assign_body_refs
+    intruder_errors = []
+
+    async def assign_with_intruder(db, rows):
+        # Another process trying to write mid-batch must find the database locked
+        async with aiosqlite.connect(temp_db.db_path, timeout=0) as other:
+            try:
+                await other.execute("BEGIN IMMEDIATE")
+            except aiosqlite.OperationalError as e:
+                intruder_errors.append(str(e))
+            else:
+                await other.rollback()
+        return await assign_body_refs(db, rows)
+
+    monkeypatch.setattr(temp_db, "_assign_body_refs", assign_with_intruder)
+    new_guids = await temp_db.save_batch(articles[1:])
+
+    assert new_guids == ["second"]
+    assert intruder_errors == ["database is locked"]
+
+
+@pytest.mark.asyncio
+async def test_get_page_walks_all_articles_with_cursor(temp_db):
+    """Test keyset pagination returns every article exactly once in order."""
+    articles = [
+        Article(
+            title=f"Article {i}",
+            url=f"https://example.com/page-{i}",
+            # Pairs of articles share a pub_date to exercise the id tiebreak
+            pub_date=datetime(2025, 12, 1 + i // 2),
+            guid=f"page-{i}",
+            source=ArticleSource.create("lol", "en-us" if i % 3 else "it-it"),
+        )
+        for i in range(11)
+    ]
+    await temp_db.save_many(articles)
+
+    seen: list[Article] = []
+    cursor = None
+    pages = 0
+    while True:
+        page, cursor = await temp_db.get_page(limit=4, cursor=cursor)
+        seen.extend(page)
+        pages += 1
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len({a.guid for a in seen}) == 11
+    pub_dates = [a.pub_date for a in seen]
+    assert pub_dates == sorted(pub_dates, reverse=True)
+
+    first, next_cursor = await temp_db.get_page(limit=20, locale="it-it")
+    assert {a.locale for a in first} == {"it-it"}
+    assert len(first) == 4
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_page_rejects_invalid_cursor(temp_db):
+    """Test that malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        await temp_db.get_page(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_get_by_category_uses_category_table(temp_db):
+    """Test that category queries match exact categories from save and save_batch."""
+    en = ArticleSource.create("lol", "en-us")
+    it = ArticleSource.create("lol", "it-it")
+    await temp_db.save(
+        Article(
+            title="Patch notes",
+            url="https://example.com/patch",
+            pub_date=datetime(2025, 12, 20),
+            guid="patch",
+            source=en,
+            categories=["Game Updates", "Dev"],
+        )
+    )
+    await temp_db.save_batch(
+        [
+            Article(
+                title=f"Dev blog {i}",
+                url=f"https://example.com/dev-{i}",
+                pub_date=datetime(2025, 12, 21 + i),
+                guid=f"dev-{i}",
+                source=en if i % 2 else it,
+                categories=["Dev"],
+            )
+            for i in range(3)
+        ]
+        + [
+            Article(
+                title="Uncategorized",
+                url="https://example.com/none",
+                pub_date=datetime(2025, 12, 30),
+                guid="none",
+                source=en,
+            )
+        ]
+    )
+
+    dev = await temp_db.get_by_category("Dev")
+    assert [a.guid for a in dev] == ["dev-2", "dev-1", "dev-0", "patch"]
+
+    assert [a.guid for a in await temp_db.get_by_category("Dev", limit=2)] == ["dev-2", "dev-1"]
+    assert [a.guid for a in await temp_db.get_by_category("Dev", source=str(en))] == [
+        "dev-1",
+        "patch",
+    ]
+    assert [a.guid for a in await temp_db.get_by_category("Dev", locale="it-it")] == [
+        "dev-2",
+        "dev-0",
+    ]
+    assert await temp_db.get_by_category("Game") == []
+
+    await temp_db.execute("DELETE FROM articles WHERE guid = ?", ("patch",))
+    assert await temp_db.get_by_category("Game Updates") == []
+
+
+@pytest.mark.asyncio
+async def test_get_latest_by_locale_filters_by_source_id(tmp_path):
+    """Test that source_id filtering happens in SQL."""
+    repo = ArticleRepository(str(tmp_path / "sources.db"))
+    await repo.initialize()
+    await repo.save_batch(
+        [
+            Article(
+                title=f"{source_id} {locale}",
+                url=f"https://example.com/{source_id}/{locale}",
+                pub_date=datetime(2025, 12, 20 + i),
+                guid=f"{source_id}-{locale}",
+                source=ArticleSource.create(source_id, locale),
+            )
+            for i, (source_id, locale) in enumerate(
+                [("lol", "en-us"), ("u-gg", "en-us"), ("lol", "it-it"), ("u-gg", "it-it")]
+            )
+        ]
+    )
+
+    try:
+        lol_en = await repo.get_latest_by_locale("en-us", source_id="lol")
+        assert [a.guid for a in lol_en] == ["lol-en-us"]
+
+        ugg_it = await repo.get_latest_by_locale("it-it", source_id="u-gg")
+        assert [a.guid for a in ugg_it] == ["u-gg-it-it"]
+
+        assert await repo.get_latest_by_locale("en-us", source_id="tft") == []
+        assert len(await repo.get_latest_by_locale("en-us")) == 2
+    finally:
+        await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_summary_projection_skips_content_until_loaded(temp_db):
+    """Test that summary reads omit content and load_content() fills it in."""
+    source = ArticleSource.create("lol", "en-us")
+    await temp_db.save_batch(
+        [
+            Article(
+                title=f"Article {i}",
+                url=f"https://example.com/projection-{i}",
+                pub_date=datetime(2025, 12, 20 + i),
+                guid=f"projection-{i}",
+                source=source,
+                description=f"Summary {i}",
+                content=f"<p>Body {i}</p>",
+                categories=["Dev"],
+            )
+            for i in range(3)
+        ]
+    )
+
+    full = await temp_db.get_latest(limit=3)
+    assert all(a.content_loaded and a.content for a in full)
+
+    summaries = await temp_db.get_latest(limit=3, projection="summary")
+    assert [a.description for a in summaries] == ["Summary 2", "Summary 1", "Summary 0"]
+    assert all(not a.content_loaded and a.content == "" for a in summaries)
+
+    page, _ = await temp_db.get_page(limit=2, projection="summary")
+    by_category = await temp_db.get_by_category("Dev", projection="summary")
+    assert all(not a.content_loaded for a in page + by_category)
+
+    loaded = await temp_db.load_content(summaries)
+    assert loaded is summaries
+    assert [a.content for a in summaries] == ["<p>Body 2</p>", "<p>Body 1</p>", "<p>Body 0</p>"]
+    assert all(a.content_loaded for a in summaries)
+
+    with pytest.raises(ValueError):
+        await temp_db.get_latest(projection="everything")
+
+
+@pytest.mark.asyncio
+async def test_initialize_current_schema_is_single_version_read(tmp_path):
+    """Test that startup on an up-to-date database only reads schema_version."""
+    db_path = str(tmp_path / "current.db")
+    repo = ArticleRepository(db_path)
+    await repo.initialize()
+    assert await repo.get_schema_version() == ArticleRepository.SCHEMA_VERSION
+    await repo.close()
+
+    restarted = ArticleRepository(db_path)
+    await restarted._open_pool()
+    statements: list[str] = []
+    await restarted._writer.set_trace_callback(statements.append)
+    try:
+        await restarted.initialize()
+        assert statements == ["SELECT MAX(version) FROM schema_version"]
+    finally:
+        await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_migrations_upgrade_legacy_database(tmp_path):
+    """Test that an untracked v1 database is migrated to the current schema."""
+    db_path = str(tmp_path / "legacy_v1.db")
+    async with aiosqlite.connect(db_path) as db:
+        await db.execute("""
+            CREATE TABLE articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guid TEXT UNIQUE NOT NULL,
+                title TEXT NOT NULL,
+                url TEXT UNIQUE NOT NULL,
+                pub_date DATETIME NOT NULL,
+                description TEXT,
+                content TEXT,
+                image_url TEXT,
+                author TEXT,
+                categories TEXT,
+                source TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        await db.execute(
+            "INSERT INTO articles (guid, title, url, pub_date, categories, source) "
+            "VALUES ('old', 'Old article', 'https://example.com/old', "
+            "'2024-06-01T00:00:00', 'Esports', 'lol-en-us')"
+        )
+        await db.execute(
+            "INSERT INTO articles (guid, title, url, pub_date, categories, source, created_at) "
+            "VALUES ('newer', 'Newer article', 'https://example.com/newer', "
+            "'2024-06-01T02:00:00+02:00', 'Esports', 'lol:en-us', '2024-06-02 08:00:00')"
+        )
+        await db.commit()
+
+    repo = ArticleRepository(db_path)
+    await repo.initialize()
+    try:
+        assert await repo.get_schema_version() == ArticleRepository.SCHEMA_VERSION
+        # 02:00+02:00 is 00:00 UTC, the same instant as the naive (UTC) row
+        esports = await repo.get_by_category("Esports")
+        assert {a.guid for a in esports} == {"old", "newer"}
+        assert {a.pub_date for a in esports} == {datetime(2024, 6, 1, tzinfo=timezone.utc)}
+        by_guid = {a.guid: a for a in esports}
+        assert by_guid["newer"].created_at == datetime(2024, 6, 2, 8, tzinfo=timezone.utc)
+        assert by_guid["old"].source == ArticleSource.create("lol", "en-us")
+
+        lol = await repo.get_latest_by_locale("en-us", source_id="lol")
+        assert {a.guid for a in lol} == {"old", "newer"}
+        assert await repo.get_locales() == ["en-us"]
+        assert await repo.count() == 2
+    finally:
+        await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_rows_store_epoch_ms_and_interned_refs(temp_db):
+    """Test that rows hold integer timestamps and lookup ids, not repeated text."""
+    pub_date = datetime(2025, 12, 28, 10, 30, tzinfo=timezone.utc)
+    await temp_db.save_batch(
+        [
+            Article(
+                title=f"Article {i}",
+                url=f"https://example.com/compact-{i}",
+                pub_date=pub_date,
+                guid=f"compact-{i}",
+                source=ArticleSource.create("lol", "en-us"),
+            )
+            for i in range(3)
+        ]
+    )
+
+    rows = await temp_db.fetch_all(
+        "SELECT typeof(pub_date), typeof(created_at), source_ref, locale_ref FROM articles"
+    )
+    assert {tuple(row) for row in rows} == {("integer", "integer", 1, 1)}
+    assert len(await temp_db.fetch_all("SELECT * FROM sources")) == 1
+    assert len(await temp_db.fetch_all("SELECT * FROM locales")) == 1
+
+    legacy = await temp_db.fetch_all("SELECT source, locale, source_category FROM article_view")
+    assert {tuple(row) for row in legacy} == {("lol:en-us", "en-us", "official_riot")}
+
+    article = await temp_db.get_by_guid("compact-0")
+    assert article is not None
+    assert article.pub_date == pub_date
+    assert await temp_db.get_last_write_timestamp() == pub_date
+
+
+@pytest.mark.asyncio
+async def test_failed_migration_rolls_back(tmp_path, monkeypatch):
+    """Test that a failing migration leaves the previous version in place."""
+    db_path = str(tmp_path / "rollback.db")
+
+    async def broken(self, db):
+        await db.execute("CREATE TABLE half_done (id INTEGER)")
+        raise RuntimeError("migration failed")
+
+    monkeypatch.setattr(ArticleRepository, "_migrate_v4_source_id", broken)
+    repo = ArticleRepository(db_path)
+    with pytest.raises(RuntimeError, match="migration failed"):
+        await repo.initialize()
+
+    assert await repo.get_schema_version() == 3
+    tables = await repo.fetch_all("SELECT name FROM sqlite_master WHERE name = 'half_done'")
+    assert tables == []
+    await repo.close()
+
+
+def _dated_article(guid: str, pub_date: datetime, source_id: str = "lol", locale: str = "en-us"):
+    return Article(
+        title=f"Article {guid}",
+        url=f"https://example.com/{guid}",
+        pub_date=pub_date,
+        guid=guid,
+        source=ArticleSource.create(source_id, locale),
+        categories=["Dev"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_apply_retention_by_age_and_scoped_count(temp_db):
+    """Test that age and per-scope count policies expire the right articles."""
+    now = datetime(2025, 12, 28, tzinfo=timezone.utc)
+    await temp_db.save_batch(
+        [_dated_article(f"en-{i}", now - timedelta(days=i)) for i in range(5)]
+        + [_dated_article(f"it-{i}", now - timedelta(days=i), locale="it-it") for i in range(5)]
+        + [_dated_article("ugg-old", now - timedelta(days=40), source_id="u-gg")]
+    )
+
+    result = await temp_db.apply_retention(
+        [
+            RetentionPolicy(source_category="analytics", max_age_days=30),
+            RetentionPolicy(locale="it-it", max_count=2),
+        ],
+        now=now,
+        batch_size=2,
+    )
+
+    assert result == {"deleted": 4, "archived": 0}
+    guids = {a.guid for a in await temp_db.get_latest(limit=20)}
+    assert guids == {"en-0", "en-1", "en-2", "en-3", "en-4", "it-0", "it-1"}
+    # Category rows of deleted articles go with them
+    assert len(await temp_db.get_by_category("Dev", limit=20)) == 7
+
+
+@pytest.mark.asyncio
+async def test_apply_retention_moves_rows_to_archive(temp_db, tmp_path):
+    """Test that expired articles are copied to the archive file before deletion."""
+    now = datetime(2025, 12, 28, tzinfo=timezone.utc)
+    await temp_db.save_batch([_dated_article(f"a-{i}", now - timedelta(days=i)) for i in range(4)])
+    archive_path = str(tmp_path / "archive.db")
+
+    result = await temp_db.apply_retention(
+        [RetentionPolicy(max_count=1)], archive_path=archive_path, now=now
+    )
+
+    assert result == {"deleted": 0, "archived": 3}
+    assert await temp_db.count() == 1
+    async with aiosqlite.connect(archive_path) as archive:
+        cursor = await archive.execute("SELECT guid, source, locale FROM articles ORDER BY guid")
+        rows = await cursor.fetchall()
+    assert rows == [(f"a-{i}", "lol:en-us", "en-us") for i in (1, 2, 3)]
+
+
+def test_retention_policy_requires_a_limit():
+    """Test that a policy without max_age_days or max_count is rejected."""
+    with pytest.raises(ValueError):
+        RetentionPolicy(locale="en-us")
+    with pytest.raises(ValueError):
+        RetentionPolicy(max_count=-1)
+
+
+@pytest.mark.asyncio
+async def test_run_maintenance_reclaims_freed_pages(temp_db):
+    """Test that incremental vacuum returns deleted pages and reports the bytes."""
+    now = datetime(2025, 12, 28, tzinfo=timezone.utc)
+    articles = [_dated_article(f"big-{i}", now - timedelta(minutes=i)) for i in range(200)]
+    for article in articles:
+        # Distinct bodies, since identical ones are stored only once
+        article.content = f"{article.guid} " + "x" * 4000
+    await temp_db.save_batch(articles)
+    await temp_db.apply_retention([RetentionPolicy(max_count=10)], now=now)
+
+    stats = await temp_db.run_maintenance()
+
+    assert (await temp_db.fetch_all("PRAGMA auto_vacuum"))[0][0] == 2
+    assert stats["bytes_reclaimed"] > 100 * 4000
+    assert stats["pages_after"] < stats["pages_before"]
+    assert stats["freelist_pages"] == 0
+    assert await temp_db.count() == 10
+
+
+@pytest.mark.asyncio
+async def test_run_maintenance_converts_auto_vacuum_only_on_request(tmp_path):
+    """Test that a database without auto_vacuum is rebuilt only when asked to."""
+    db_path = tmp_path / "legacy.db"
+    async with aiosqlite.connect(db_path) as legacy:
+        await legacy.execute("CREATE TABLE legacy (id INTEGER PRIMARY KEY)")
+        await legacy.commit()
+
+    async def auto_vacuum() -> int:
+        # Pooled connections keep the mode read when they opened; ask a new one
+        async with aiosqlite.connect(db_path) as db:
+            cursor = await db.execute("PRAGMA auto_vacuum")
+            row = await cursor.fetchone()
+            return int(row[0]) if row else -1
+
+    repo = ArticleRepository(str(db_path))
+    await repo.initialize()
+    try:
+        await repo.run_maintenance()
+        assert await auto_vacuum() == 0
+
+        await repo.run_maintenance(convert_auto_vacuum=True)
+        assert await auto_vacuum() == 2
+    finally:
+        await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_backup_snapshot_is_consistent_during_writes(temp_db, tmp_path):
+    """Test that a stepped backup sees one snapshot while writes continue."""
+    now = datetime(2025, 12, 28, tzinfo=timezone.utc)
+    articles = [_dated_article(f"seed-{i}", now - timedelta(minutes=i)) for i in range(300)]
+    for article in articles:
+        article.content = f"{article.guid} " + "x" * 2000
+    await temp_db.save_batch(articles)
+
+    stop = asyncio.Event()
+
+    async def keep_writing() -> int:
+        written = 0
+        while not stop.is_set():
+            await temp_db.save(_dated_article(f"live-{written}", now))
+            written += 1
+            await asyncio.sleep(0)
+        return written
+
+    writer = asyncio.create_task(keep_writing())
+    stats = await temp_db.backup(str(tmp_path / "backups"), pages_per_step=4)
+    stop.set()
+    await writer
+
+    snapshot = ArticleRepository(stats["path"])
+    await snapshot.initialize()
+    try:
+        assert (await snapshot.fetch_all("PRAGMA integrity_check"))[0][0] == "ok"
+        assert await snapshot.count() >= 300
+        assert await snapshot.count() == len(await snapshot.fetch_all("SELECT id FROM articles"))
+    finally:
+        await snapshot.close()
+    assert stats["bytes"] == Path(stats["path"]).stat().st_size
+    assert stats["pages"] > 0
+
+
+@pytest.mark.asyncio
+async def test_memory_backup_holds_writes_until_complete(tmp_path):
+    """Test that writes to a :memory: database wait for the whole backup."""
+    now = datetime(2025, 12, 28, tzinfo=timezone.utc)
+    repo = ArticleRepository(":memory:")
+    await repo.initialize()
+    try:
+        await repo.save_batch([_dated_article(f"seed-{i}", now) for i in range(50)])
+
+        backup = asyncio.create_task(repo.backup(str(tmp_path / "backups"), pages_per_step=1))
+        while not repo._write_lock.locked():
+            await asyncio.sleep(0)
+        await repo.save(_dated_article("live", now))
+        assert backup.done()
+        stats = backup.result()
+    finally:
+        await repo.close()
+
+    snapshot = ArticleRepository(stats["path"], read_only=True)
+    await snapshot.initialize()
+    try:
+        assert await snapshot.count() == 50
+    finally:
+        await snapshot.close()
+
+
+@pytest.mark.asyncio
+async def test_backup_rotates_old_snapshots(temp_db, tmp_path):
+    """Test that only the newest ``keep`` snapshots are retained."""
+    backup_dir = tmp_path / "backups"
+    paths = [(await temp_db.backup(str(backup_dir), keep=2))["path"] for _ in range(4)]
+
+    assert sorted(str(p) for p in backup_dir.iterdir()) == sorted(paths[-2:])
+
+    with pytest.raises(ValueError):
+        await temp_db.backup(str(backup_dir), keep=0)
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_filters_matches(temp_db):
+    """Test BM25 ranking (title over description) and the search filters."""
+    now = datetime(2025, 12, 28, tzinfo=timezone.utc)
+    await temp_db.save_batch(
+        [
+            Article(
+                title="Arena returns",
+                url="https://example.com/arena-en",
+                pub_date=now,
+                guid="arena-en",
+                source=ArticleSource.create("lol", "en-us"),
+                description="The arena game mode is back",
+                categories=["Game Updates"],
+            ),
+            Article(
+                title="Patch notes",
+                url="https://example.com/patch-en",
+                pub_date=now - timedelta(days=1),
+                guid="patch-en",
+                source=ArticleSource.create("lol", "en-us"),
+                description="Balance changes, plus arena tweaks",
+                categories=["Dev"],
+            ),
+            Article(
+                title="Arena è tornata",
+                url="https://example.com/arena-it",
+                pub_date=now,
+                guid="arena-it",
+                source=ArticleSource.create("lol", "it-it"),
+                description="Modalità arena",
+                categories=["Game Updates"],
+            ),
+        ]
+    )
+
+    assert [a.guid for a in await temp_db.search("arena", locale="en-us")] == [
+        "arena-en",
+        "patch-en",
+    ]
+    assert [a.guid for a in await temp_db.search("arena", category="Dev")] == ["patch-en"]
+    assert [a.guid for a in await temp_db.search("arena", source="lol:it-it")] == ["arena-it"]
+    # Diacritics are folded and the last term matches as a prefix
+    assert [a.guid for a in await temp_db.search("modalita are")] == ["arena-it"]
+    assert await temp_db.search("arena", locale="xx-yy") == []
+
+    results = await temp_db.search("balance")
+    assert results[0].content_loaded is False
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates_and_deletes(temp_db):
+    """Test that the FTS index is kept in sync by the articles triggers."""
+    await temp_db.save(_dated_article("fts-1", datetime(2025, 12, 28, tzinfo=timezone.utc)))
+    assert await temp_db.search("worlds") == []
+
+    await temp_db.execute("UPDATE articles SET title = 'Worlds recap' WHERE guid = 'fts-1'")
+    assert [a.guid for a in await temp_db.search("worlds")] == ["fts-1"]
+
+    await temp_db.execute("DELETE FROM articles WHERE guid = 'fts-1'")
+    assert await temp_db.search("worlds") == []
+    integrity = "INSERT INTO articles_fts (articles_fts) VALUES ('integrity-check')"
+    await temp_db.execute(integrity)
+
+
+def test_fts_query_quotes_terms():
+    """Test that user input cannot inject FTS5 syntax."""
+    assert fts_query('patch "14.1" OR notes') == '"patch" "14" "1" "OR" "notes"*'
+    assert fts_query("patch 14") == '"patch" "14"'
+    with pytest.raises(ValueError):
+        fts_query('" * -')
+
+
+def _long_article(guid: str, day: int) -> Article:
+    """Build an article whose description and content are worth compressing."""
+    return Article(
+        title=f"Patch notes {guid}",
+        url=f"https://example.com/{guid}",
+        pub_date=datetime(2025, 12, day, tzinfo=timezone.utc),
+        guid=guid,
+        source=ArticleSource.create("lol", "en-us"),
+        description="Champion balance changes for ranked play. " * 10,
+        content="<p>Jungle experience and objective bounties adjusted.</p>" * 40,
+    )
+
+
+@pytest.mark.asyncio
+async def test_compressed_text_round_trips_and_stays_searchable(tmp_path):
+    """Test that compressed content and descriptions read back and stay indexed."""
+    repo = ArticleRepository(
+        str(tmp_path / "compressed.db"), compression="zlib", compress_description=True
+    )
+    await repo.initialize()
+    try:
+        article = _long_article("zip-1", 20)
+        await repo.save(article)
+
+        rows = await repo.fetch_all(
+            "SELECT typeof(b.content), typeof(a.description), b.content "
+            "FROM articles a JOIN article_bodies b ON b.id = a.body_ref"
+        )
+        assert tuple(rows[0])[:2] == ("blob", "blob")
+        assert rows[0][2].startswith(ZLIB_MARKER)
+        assert len(rows[0][2]) < len(article.content)
+
+        stored = await repo.get_by_guid("zip-1")
+        assert stored.content == article.content
+        assert stored.description == article.description
+
+        summaries = await repo.get_latest(projection="summary")
+        assert summaries[0].description == article.description
+        await repo.load_content(summaries)
+        assert summaries[0].content == article.content
+
+        assert [a.guid for a in await repo.search("bounties")] == []
+        assert [a.guid for a in await repo.search("ranked")] == ["zip-1"]
+        await repo.execute("DELETE FROM articles WHERE guid = 'zip-1'")
+        assert await repo.search("ranked") == []
+        await repo.execute("INSERT INTO articles_fts (articles_fts) VALUES ('integrity-check')")
+    finally:
+        await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_recompress_stored_text_converts_existing_rows(tmp_path):
+    """Test that existing rows are compressed in batches and can be decoded again."""
+    db_path = str(tmp_path / "recompress.db")
+    plain = ArticleRepository(db_path)
+    await plain.initialize()
+    await plain.save_batch([_long_article(f"old-{i}", 10 + i) for i in range(5)])
+    await plain.close()
+
+    repo = ArticleRepository(db_path, compression="zlib", compress_description=True)
+    await repo.initialize()
+    try:
+        # One shared body plus five descriptions
+        assert await repo.recompress_stored_text(batch_size=2) == 6
+        assert await repo.recompress_stored_text(batch_size=2) == 0
+        rows = await repo.fetch_all("SELECT DISTINCT typeof(content) FROM article_view")
+        assert [row[0] for row in rows] == ["blob"]
+        assert [a.guid for a in await repo.search("ranked", limit=10)] != []
+    finally:
+        await repo.close()
+
+    plain = ArticleRepository(db_path)
+    await plain.initialize()
+    try:
+        assert await plain.recompress_stored_text() == 6
+        rows = await plain.fetch_all(
+            "SELECT DISTINCT typeof(content), typeof(description) FROM article_view"
+        )
+        assert [tuple(row) for row in rows] == [("text", "text")]
+        assert (await plain.get_by_guid("old-0")).content == _long_article("old-0", 10).content
+    finally:
+        await plain.close()
+
+
+@pytest.mark.asyncio
+async def test_recompress_stored_text_skips_scan_once_codec_recorded(tmp_path, monkeypatch):
+    """Test that stored text is only scanned again after the codec changes."""
+    db_path = str(tmp_path / "recompress.db")
+    repo = ArticleRepository(db_path, compression="zlib")
+    await repo.initialize()
+    scanned: list[str] = []
+    recompress_column = ArticleRepository._recompress_column
+
+    async def counting_recompress_column(self, table, column, batch_size):
+        scanned.append(f"{table}.{column}")
+        return await recompress_column(self, table, column, batch_size)
+
+    monkeypatch.setattr(ArticleRepository, "_recompress_column", counting_recompress_column)
+    try:
+        await repo.save_batch([_long_article(f"new-{i}", 10 + i) for i in range(3)])
+        await repo.recompress_stored_text()
+        assert scanned == ["article_bodies.content"]
+
+        # New rows are written with the recorded codec: nothing to scan
+        await repo.save_batch([_long_article("later", 20)])
+        assert await repo.recompress_stored_text() == 0
+        assert scanned == ["article_bodies.content"]
+    finally:
+        await repo.close()
+
+    repo = ArticleRepository(db_path, compression="zlib", compress_description=True)
+    await repo.initialize()
+    try:
+        assert await repo.recompress_stored_text() == 4
+        assert len(scanned) == 3
+    finally:
+        await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_archive_stores_decompressed_text(tmp_path):
+    """Test that archived rows are readable without the compression codec."""
+    repo = ArticleRepository(str(tmp_path / "live.db"), compression="zlib")
+    await repo.initialize()
+    archive_path = str(tmp_path / "archive.db")
+    try:
+        await repo.save_batch([_long_article("arc-1", 1), _long_article("arc-2", 2)])
+        await repo.apply_retention([RetentionPolicy(max_count=1)], archive_path=archive_path)
+    finally:
+        await repo.close()
+
+    async with aiosqlite.connect(archive_path) as archive:
+        cursor = await archive.execute("SELECT typeof(content), content FROM articles")
+        rows = await cursor.fetchall()
+    assert rows == [("text", _long_article("arc-1", 1).content)]
+
+
+def test_unknown_compression_codec_is_rejected(tmp_path):
+    """Test that the repository refuses codecs it cannot read back."""
+    with pytest.raises(ValueError):
+        ArticleRepository(str(tmp_path / "bad.db"), compression="lzma")
+
+
+@pytest.mark.asyncio
+async def test_identical_bodies_are_stored_once(temp_db):
+    """Test that locale variants share one article_bodies row."""
+    body = "<p>Same story in every English locale.</p>" * 20
+    articles = [
+        Article(
+            title=f"Patch notes {locale}",
+            url=f"https://example.com/{locale}/patch",
+            pub_date=datetime(2025, 12, 28, tzinfo=timezone.utc),
+            guid=f"patch-{locale}",
+            source=ArticleSource.create("lol", locale),
+            content=body,
+        )
+        for locale in ("en-us", "en-gb", "en-au")
+    ]
+    articles.append(_long_article("other-body", 27))
+    await temp_db.save_batch(articles)
+    await temp_db.save(_dated_article("no-body", datetime(2025, 12, 1, tzinfo=timezone.utc)))
+
+    rows = await temp_db.fetch_all("SELECT COUNT(*) FROM article_bodies")
+    assert rows[0][0] == 2
+    assert (await temp_db.get_by_guid("patch-en-gb")).content == body
+    assert (await temp_db.get_by_guid("no-body")).content == ""
+
+    # Re-ingesting a duplicate with a new body leaves no orphaned body behind
+    changed = _long_article("other-body", 27)
+    changed.content = "<p>Edited after publication.</p>" * 20
+    assert await temp_db.save_batch([changed]) == []
+    rows = await temp_db.fetch_all("SELECT COUNT(*) FROM article_bodies")
+    assert rows[0][0] == 2
+
+    # A shared body lives until its last article is deleted
+    await temp_db.execute("DELETE FROM articles WHERE guid IN ('patch-en-us', 'patch-en-gb')")
+    assert (await temp_db.get_by_guid("patch-en-au")).content == body
+    await temp_db.execute("DELETE FROM articles WHERE guid = 'patch-en-au'")
+    rows = await temp_db.fetch_all("SELECT COUNT(*) FROM article_bodies")
+    assert rows[0][0] == 1
+
+
+def _story(guid: str, source_id: str, title: str, hours: int = 0) -> Article:
+    """Build a third-party article published ``hours`` after a fixed time."""
+    return Article(
+        title=title,
+        url=f"https://{source_id}.example.com/{guid}",
+        pub_date=datetime(2025, 12, 10, tzinfo=timezone.utc) + timedelta(hours=hours),
+        guid=guid,
+        source=ArticleSource.create(source_id, "en-us"),
+        description="Riot nerfs Yasuo and buffs support items ahead of the ranked season start.",
+    )
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_share_a_cluster(temp_db):
+    """Test that near-identical stories from other sources join one cluster."""
+    await temp_db.save(_story("riot", "lol", "Patch 14.1 notes"))
+    await temp_db.save_batch(
+        [
+            _story("dexerto", "dexerto", "LoL Patch 14.1 notes", hours=2),
+            _story("dotesports", "dotesports", "Patch 14.1 notes are here", hours=3),
+            _story("late", "pcgamesn", "Patch 14.1 notes", hours=24 * 30),
+        ]
+    )
+    unrelated = _story("worlds", "dexerto", "Worlds final recap", hours=1)
+    unrelated.description = "T1 lift the Summoner's Cup again after a five game final in London."
+    await temp_db.save(unrelated)
+
+    clusters = {a.guid: a.cluster_id for a in await temp_db.get_latest(projection="summary")}
+    assert clusters["dexerto"] == clusters["dotesports"] == clusters["riot"]
+    assert clusters["worlds"] != clusters["riot"]
+    # Outside the clustering window a matching story starts a new cluster
+    assert clusters["late"] != clusters["riot"]
+
+    rows = await temp_db.fetch_all("SELECT COUNT(DISTINCT article_id) FROM article_lsh")
+    assert rows[0][0] == 5
+    await temp_db.execute("DELETE FROM articles WHERE guid = 'worlds'")
+    rows = await temp_db.fetch_all("SELECT COUNT(DISTINCT article_id) FROM article_lsh")
+    assert rows[0][0] == 4
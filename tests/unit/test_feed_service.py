@@ -5,14 +5,22 @@ This module tests the FeedService class to ensure proper caching,
 feed generation, and database integration.
 """
 
+import gzip
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import feedparser
 import pytest
 
+from src.memory_database import InMemoryArticleRepository
 from src.models import Article, ArticleSource
-from src.rss.feed_service import FeedService
+from src.rss.feed_service import (
+    FeedService,
+    FeedServiceV2,
+    RenderedFeed,
+    collapse_clusters,
+    data_version,
+)
 
 
 @pytest.fixture
@@ -52,6 +60,23 @@ def mock_repository() -> AsyncMock:
             ),
         ]
     )
+    repo.get_by_category = AsyncMock(
+        side_effect=lambda category, limit=50, **kwargs: [
+            a for a in repo.get_latest.return_value if category in a.categories
+        ][:limit]
+    )
+    repo.get_article_stats = AsyncMock(
+        return_value=[
+            {
+                "source_id": "lol",
+                "locale": "en-us",
+                "source_category": "official_riot",
+                "count": 3,
+                "last_pub_date": datetime(2025, 12, 28, 10, 0, 0, tzinfo=timezone.utc),
+                "last_write_at": datetime(2025, 12, 28, 11, 0, 0, tzinfo=timezone.utc),
+            }
+        ]
+    )
 
     return repo
 
@@ -130,6 +155,133 @@ async def test_different_limits_different_cache(mock_repository: AsyncMock) -> N
     assert mock_repository.get_latest.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_formats_cached_separately(mock_repository: AsyncMock) -> None:
+    """Test that each format of a feed has its own cache entry."""
+    service = FeedService(mock_repository, cache_ttl=300)
+
+    rss = await service.get_main_feed("http://localhost:8000/feed.xml")
+    atom = await service.get_main_feed("http://localhost:8000/feed.atom", fmt="atom")
+    again = await service.get_main_feed("http://localhost:8000/feed.atom", fmt="atom")
+
+    assert "<rss " in rss
+    assert atom == again and "<feed " in atom
+    assert mock_repository.get_latest.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_feed_keeps_its_encodings(mock_repository: AsyncMock) -> None:
+    """Test that feeds are precompressed once and served from cache with their encodings."""
+    service = FeedService(mock_repository, cache_ttl=300)
+
+    feed = await service.get_main_feed("http://localhost:8000/feed.xml")
+    cached = await service.get_main_feed("http://localhost:8000/feed.xml")
+
+    assert isinstance(feed, RenderedFeed)
+    assert cached is feed
+    assert gzip.decompress(feed.encodings["gzip"]).decode("utf-8") == feed
+
+    with patch("src.rss.feed_service.settings.feed_precompression", False):
+        plain = await service.get_main_feed("http://localhost:8000/feed.xml", limit=10)
+    assert isinstance(plain, RenderedFeed) and plain.encodings == {}
+
+
+@pytest.mark.asyncio
+async def test_feed_validators_survive_rebuilds(mock_repository: AsyncMock) -> None:
+    """Test that a rebuild of unchanged data keeps the ETag, and a new write changes it."""
+    service = FeedService(mock_repository, cache_ttl=300)
+
+    feed = await service.get_main_feed("http://localhost:8000/feed.xml")
+    service.invalidate_cache()
+    rebuilt = await service.get_main_feed("http://localhost:8000/feed.xml")
+    atom = await service.get_main_feed("http://localhost:8000/feed.atom", fmt="atom")
+
+    assert isinstance(feed, RenderedFeed) and isinstance(rebuilt, RenderedFeed)
+    assert rebuilt is not feed
+    assert (
+        rebuilt.etag
+        == feed.etag
+        == (await service.get_data_version(limit=50, collapse=False)).etag("rss")
+    )
+    assert isinstance(atom, RenderedFeed) and atom.etag != feed.etag
+    # Last-Modified follows the last write, not the newest publication date
+    assert feed.last_modified == datetime(2025, 12, 28, 11, 0, 0, tzinfo=timezone.utc)
+
+    mock_repository.get_article_stats.return_value[0]["count"] = 4
+    service.invalidate_cache()
+    updated = await service.get_main_feed("http://localhost:8000/feed.xml")
+    assert isinstance(updated, RenderedFeed)
+    assert updated.etag != feed.etag
+
+
+@pytest.mark.asyncio
+async def test_data_version_changes_on_import() -> None:
+    """Test that importing an article with an old created_at still changes the version."""
+    repo = InMemoryArticleRepository()
+    await repo.initialize()
+    written = datetime(2025, 12, 28, 12, 0, 0, tzinfo=timezone.utc)
+    articles = [
+        Article(
+            title=f"Article {i}",
+            url=f"https://example.com/{i}",
+            pub_date=datetime(2025, 12, 20, tzinfo=timezone.utc),
+            guid=f"guid-{i}",
+            source=ArticleSource.create("lol", "en-us"),
+            created_at=written,
+        )
+        for i in range(2)
+    ]
+    await repo.save(articles[0])
+    first = await data_version(repo)
+
+    # An imported article keeps its original, older created_at
+    articles[1].created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    await repo.save(articles[1])
+    imported = await data_version(repo)
+    await repo.close()
+
+    assert first.last_modified == written
+    assert imported.tag != first.tag
+    assert imported.last_modified == written
+    assert first.etag("rss", "gzip") == f'"{first.tag}-rss-gzip"'
+
+
+@pytest.mark.asyncio
+async def test_data_version_is_scoped_to_the_feed() -> None:
+    """Test that a feed's version only follows the articles and parameters it depends on."""
+    repo = InMemoryArticleRepository()
+    await repo.initialize()
+
+    def article(guid: str, source_id: str, locale: str, written: datetime) -> Article:
+        return Article(
+            title=f"Article {guid}",
+            url=f"https://example.com/{guid}",
+            pub_date=datetime(2025, 12, 20, tzinfo=timezone.utc),
+            guid=guid,
+            source=ArticleSource.create(source_id, locale),
+            created_at=written,
+        )
+
+    early = datetime(2025, 12, 28, 10, 0, 0, tzinfo=timezone.utc)
+    late = datetime(2025, 12, 28, 12, 0, 0, tzinfo=timezone.utc)
+    await repo.save_batch(
+        [article("en", "lol", "en-us", early), article("it", "lol", "it-it", early)]
+    )
+    italian = await data_version(repo, locale="it-it", limit=50)
+    lol_english = await data_version(repo, locale="en-us", source_id="lol", limit=50)
+
+    await repo.save(article("tft", "tft", "en-us", late))
+
+    assert await data_version(repo, locale="it-it", limit=50) == italian
+    assert await data_version(repo, locale="en-us", source_id="lol", limit=50) == lol_english
+    english = await data_version(repo, locale="en-us", limit=50)
+    assert english.last_modified == late
+    assert italian.last_modified == early
+    # Parameters that change the document change the tag
+    assert (await data_version(repo, locale="it-it", limit=10)).tag != italian.tag
+    await repo.close()
+
+
 @pytest.mark.asyncio
 async def test_get_feed_by_source_en(mock_repository: AsyncMock) -> None:
     """Test getting feed filtered by English source."""
@@ -213,8 +365,9 @@ async def test_get_feed_by_category(mock_repository: AsyncMock) -> None:
     assert "<?xml" in feed_xml
     assert "<rss" in feed_xml
 
-    # Repository should fetch more articles for filtering
-    mock_repository.get_latest.assert_called_once_with(limit=100)  # limit * 2
+    # Category filtering happens in the repository
+    mock_repository.get_by_category.assert_called_once_with("Champions", limit=50)
+    mock_repository.get_latest.assert_not_called()
 
     # Parse and validate
     feed = feedparser.parse(feed_xml)
@@ -250,7 +403,7 @@ async def test_get_feed_by_category_caching(mock_repository: AsyncMock) -> None:
     feed2 = await service.get_feed_by_category("News", "http://localhost:8000/feed/news.xml")
 
     assert feed1 == feed2
-    assert mock_repository.get_latest.call_count == 1
+    assert mock_repository.get_by_category.call_count == 1
 
 
 @pytest.mark.asyncio
@@ -406,6 +559,7 @@ async def test_cache_keys_are_unique() -> None:
     """Test that different feed types have unique cache keys."""
     mock_repo = AsyncMock()
     mock_repo.get_latest = AsyncMock(return_value=[])
+    mock_repo.get_by_category = AsyncMock(return_value=[])
 
     service = FeedService(mock_repo, cache_ttl=300)
 
@@ -417,4 +571,117 @@ async def test_cache_keys_are_unique() -> None:
     await service.get_feed_by_category("News", "http://localhost/news.xml", limit=50)
 
     # Each should trigger a repository call (different cache keys)
-    assert mock_repo.get_latest.call_count == 3
+    assert mock_repo.get_latest.call_count == 2
+    assert mock_repo.get_by_category.call_count == 1
+
+
+def _clustered(guid: str, cluster_id: int, day: int, source_id: str = "lol") -> Article:
+    """Build an article carrying a repository-assigned cluster id."""
+    return Article(
+        title=f"Story {guid}",
+        url=f"https://example.com/{guid}",
+        pub_date=datetime(2025, 12, day, tzinfo=timezone.utc),
+        guid=guid,
+        source=ArticleSource.create(source_id, "en-us"),
+        cluster_id=cluster_id,
+    )
+
+
+def test_collapse_clusters_keeps_earliest_article() -> None:
+    """Test that each cluster is shown once, as its earliest article."""
+    articles = [
+        _clustered("copy-2", 1, 28, "dotesports"),
+        _clustered("other", 2, 27),
+        _clustered("copy-1", 1, 26, "dexerto"),
+        _clustered("original", 1, 25),
+    ]
+
+    collapsed = collapse_clusters(articles)
+
+    assert [a.guid for a in collapsed] == ["other", "original"]
+    assert [a.guid for a in collapsed[1].alternates] == ["copy-1", "copy-2"]
+
+
+@pytest.mark.asyncio
+async def test_main_feed_collapses_duplicates_on_request() -> None:
+    """Test that the collapsed main feed lists alternates and is cached separately."""
+    mock_repo = AsyncMock()
+    mock_repo.get_latest = AsyncMock(
+        side_effect=lambda limit=50, **kwargs: [
+            _clustered("copy", 1, 28, "dexerto"),
+            _clustered("original", 1, 27),
+        ][:limit]
+    )
+    service = FeedService(mock_repo)
+
+    collapsed = await service.get_main_feed("http://localhost/feed.xml", collapse_duplicates=True)
+    plain = await service.get_main_feed("http://localhost/feed.xml")
+
+    assert mock_repo.get_latest.await_args_list[0].kwargs["limit"] == 150
+    entries = feedparser.parse(collapsed).entries
+    assert [e.id for e in entries] == ["original"]
+    assert "Also covered by" in entries[0].summary
+    assert "https://example.com/copy" in entries[0].summary
+    assert len(feedparser.parse(plain).entries) == 2
+
+
+@pytest.mark.asyncio
+async def test_feeds_share_rendered_items(mock_repository: AsyncMock) -> None:
+    """Test that rebuilt and overlapping feeds reuse already rendered items."""
+    service = FeedService(mock_repository, cache_ttl=300)
+
+    main_feed = await service.get_main_feed("http://localhost:8000/feed.xml")
+    assert service.item_cache.get_stats()["misses"] == 3
+
+    # A category feed reuses the items the main feed rendered
+    await service.get_feed_by_category("News", "http://localhost:8000/feed/news.xml")
+    assert service.item_cache.get_stats()["misses"] == 3
+    assert service.item_cache.get_stats()["hits"] == 2
+
+    # After an update only the new article is rendered
+    service.invalidate_cache()
+    new_article = Article(
+        title="Test Article 4",
+        url="https://example.com/test4",
+        pub_date=datetime(2025, 12, 29, 9, 0, 0, tzinfo=timezone.utc),
+        guid="test-4",
+        source=ArticleSource.create("lol", "en-us"),
+        description="Fourth test article",
+    )
+    previous = mock_repository.get_latest.return_value
+    mock_repository.get_latest.return_value = [new_article, *previous]
+    rebuilt = await service.get_main_feed("http://localhost:8000/feed.xml")
+
+    assert service.item_cache.get_stats()["misses"] == 4
+    assert rebuilt.count("<item>") == 4
+    assert rebuilt.split("<item>", 2)[2:] == main_feed.split("<item>", 1)[1:]
+
+
+@pytest.mark.asyncio
+async def test_search_feeds_are_not_cached() -> None:
+    """Test that one-off search feeds never take slots in the shared feed cache."""
+    repo = InMemoryArticleRepository()
+    await repo.initialize()
+    await repo.save_batch(
+        [
+            Article(
+                title=f"Patch {i} notes",
+                url=f"https://example.com/patch-{i}",
+                pub_date=datetime(2025, 12, 20 + i, tzinfo=timezone.utc),
+                guid=f"patch-{i}",
+                source=ArticleSource.create("lol", "en-us"),
+                description="Balance changes",
+            )
+            for i in range(3)
+        ]
+    )
+    service = FeedServiceV2(repo)
+
+    for i in range(20):
+        feed = await service.get_search_feed(f"patch notes {i}", locale="en-us")
+        assert isinstance(feed, RenderedFeed)
+    feed = await service.get_search_feed("patch", locale="en-us")
+    await repo.close()
+
+    assert len(feedparser.parse(feed).entries) == 3
+    assert service.cache.get_stats()["total_entries"] == 0
@@ -0,0 +1,176 @@
+"""
+Tests for the single-writer ingest queue.
+
+This module tests ArticleIngestQueue batching, per-submission new-article
+accounting, error propagation and its use by UpdateServiceV2.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.database import ArticleRepository
+from src.models import Article, ArticleSource, SourceCategory
+from src.services.ingest_queue import ArticleIngestQueue, save_articles
+from src.services.update_service import UpdatePriority, UpdateServiceV2, UpdateTask
+
+
+def _article(guid: str, locale: str = "en-us") -> Article:
+    return Article(
+        title=f"Article {guid}",
+        url=f"https://example.com/{guid}",
+        pub_date=datetime(2025, 12, 28),
+        guid=guid,
+        source=ArticleSource.create("lol", locale),
+    )
+
+
+@pytest.fixture
+async def temp_db(tmp_path):
+    """Create a temporary database for testing."""
+    repo = ArticleRepository(str(tmp_path / "ingest.db"))
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_coalesce_into_one_batch(temp_db):
+    """Test that submissions within the batch window share one write."""
+    async with ArticleIngestQueue(temp_db, max_batch_size=100, max_batch_delay=0.1) as ingest:
+        counts = await asyncio.gather(
+            ingest.submit([_article("a-1"), _article("a-2")]),
+            ingest.submit([_article("b-1")]),
+            ingest.submit([_article("c-1"), _article("c-2"), _article("c-3")]),
+        )
+
+    assert counts == [2, 1, 3]
+    assert ingest.batches_written == 1
+    assert await temp_db.count() == 6
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_flush(temp_db):
+    """Test that reaching max_batch_size flushes without waiting for the window."""
+    async with ArticleIngestQueue(temp_db, max_batch_size=2, max_batch_delay=10) as ingest:
+        count = await asyncio.wait_for(ingest.submit([_article("x"), _article("y")]), 1)
+
+    assert count == 2
+
+
+@pytest.mark.asyncio
+async def test_duplicates_credited_once(temp_db):
+    """Test that duplicate GUIDs count as new only for the first submitter."""
+    await temp_db.save(_article("existing"))
+
+    async with ArticleIngestQueue(temp_db, max_batch_delay=0.1) as ingest:
+        counts = await asyncio.gather(
+            ingest.submit([_article("existing"), _article("shared")]),
+            ingest.submit([_article("shared"), _article("own")]),
+        )
+
+    assert counts == [1, 1]
+    assert await temp_db.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_write_error_propagates_to_submitters():
+    """Test that a failed batch write raises in every waiting worker."""
+    repo = AsyncMock()
+    repo.save_batch = AsyncMock(side_effect=RuntimeError("database is locked"))
+
+    async with ArticleIngestQueue(repo) as ingest:
+        with pytest.raises(RuntimeError, match="database is locked"):
+            await ingest.submit([_article("a")])
+
+
+@pytest.mark.asyncio
+async def test_bad_article_only_fails_its_own_write():
+    """Test that a failed batch is retried per submission, then per article."""
+    saved: list[str] = []
+
+    async def save_batch(articles: list[Article]) -> list[str]:
+        if any(a.guid == "bad" for a in articles):
+            raise ValueError("bad article")
+        saved.extend(a.guid for a in articles)
+        return [a.guid for a in articles]
+
+    repo = AsyncMock()
+    repo.save_batch = AsyncMock(side_effect=save_batch)
+
+    async with ArticleIngestQueue(repo, max_batch_delay=0.1) as ingest:
+        results = await asyncio.gather(
+            ingest.submit([_article("a-1"), _article("bad")]),
+            ingest.submit([_article("b-1"), _article("b-2")]),
+            ingest.submit([_article("bad")]),
+            return_exceptions=True,
+        )
+
+    assert results[:2] == [1, 2]
+    assert isinstance(results[2], ValueError)
+    assert sorted(saved) == ["a-1", "b-1", "b-2"]
+
+
+@pytest.mark.asyncio
+async def test_save_articles_falls_back_to_single_saves():
+    """Test that one bad article in a failed batch only loses itself."""
+    articles = [_article(guid) for guid in ("good-1", "bad", "good-2")]
+
+    async def save_batch(batch: list[Article]) -> list[str]:
+        if any(a.guid == "bad" for a in batch):
+            raise ValueError("bad article")
+        return [a.guid for a in batch]
+
+    repo = AsyncMock()
+    repo.save_batch = AsyncMock(side_effect=save_batch)
+
+    assert await save_articles(repo, articles, "lol:en-us") == 2
+    assert repo.save_batch.call_count == 4
+    assert await save_articles(repo, articles[1:2], "lol:en-us") == 0
+    with pytest.raises(ValueError, match="bad article"):
+        await save_articles(repo, articles[1:2], "lol:en-us", strict=True)
+
+
+@pytest.mark.asyncio
+async def test_submit_requires_running_writer(temp_db):
+    """Test that submitting without a started writer fails fast."""
+    ingest = ArticleIngestQueue(temp_db)
+
+    assert await ingest.submit([]) == 0
+    with pytest.raises(RuntimeError):
+        await ingest.submit([_article("a")])
+
+
+@pytest.mark.asyncio
+async def test_update_service_routes_writes_through_ingest_queue():
+    """Test that _execute_tasks hands articles to one shared writer."""
+    repo = AsyncMock()
+    repo.save_batch = AsyncMock(side_effect=lambda articles: [a.guid for a in articles])
+    service = UpdateServiceV2(repo, max_concurrent=5, ingest_batch_delay=0.2)
+    service.BASE_RATE_LIMIT = 0
+    service.DEFAULT_RATE_LIMITS = {}
+
+    async def fake_fetch(locale: str, category: str | None = None) -> list[Article]:
+        return [_article(f"lol-{locale}", locale)]
+
+    mock_client = AsyncMock()
+    mock_client.fetch_news = AsyncMock(side_effect=fake_fetch)
+    service.game_clients["lol"] = mock_client
+
+    tasks = [
+        UpdateTask(
+            priority=UpdatePriority.CRITICAL,
+            source_id="lol",
+            locale=locale,
+            category=SourceCategory.OFFICIAL_RIOT,
+        )
+        for locale in ["en-us", "it-it", "de-de"]
+    ]
+
+    stats = await service._execute_tasks(tasks)
+
+    assert stats["success"] == 3
+    assert stats["new_articles"] == 3
+    repo.save_batch.assert_called_once()
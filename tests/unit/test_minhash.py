@@ -0,0 +1,43 @@
+"""
+Tests for the MinHash near-duplicate signatures.
+"""
+
+from src.utils.minhash import LSH_BANDS, NUM_PERMUTATIONS, lsh_keys, minhash, shingles, similarity
+
+PATCH_NOTES = (
+    "Patch 14.1 notes: Riot nerfs Yasuo and buffs support items ahead of ranked "
+    "season start. The preseason continues with jungle changes."
+)
+
+
+def test_near_duplicates_score_above_unrelated_text():
+    """Test that reworded copies look similar and different stories do not."""
+    copy = (
+        "LoL patch 14.1 notes - Riot nerfs Yasuo, buffs support items ahead of ranked "
+        "season start. The preseason continues with jungle changes."
+    )
+    other = "Worlds 2025 final recap: T1 lift the Summoner's Cup for a sixth time in London."
+
+    signature = minhash(PATCH_NOTES)
+    assert len(signature) == NUM_PERMUTATIONS * 4
+    assert similarity(signature, minhash(PATCH_NOTES)) == 1.0
+    assert similarity(signature, minhash(copy)) >= 0.5
+    assert similarity(signature, minhash(other)) < 0.2
+
+
+def test_lsh_keys_are_shared_by_near_duplicates():
+    """Test that near-duplicates meet in at least one LSH band."""
+    copy = PATCH_NOTES.replace("Patch", "LoL patch").replace(":", " -")
+    keys = lsh_keys(minhash(PATCH_NOTES))
+
+    assert len(keys) == LSH_BANDS
+    assert all(-(2**63) <= key < 2**63 for key in keys)
+    assert set(keys) & set(lsh_keys(minhash(copy)))
+
+
+def test_signature_inputs():
+    """Test the shingling of short and empty texts."""
+    assert shingles("Hello, World!") == {"hello world"}
+    assert shingles("Yasuo") == {"yasuo"}
+    assert minhash("") is None
+    assert minhash("...") is None
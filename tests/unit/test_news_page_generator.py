@@ -84,7 +84,7 @@ class TestFetchArticles:
         articles = await fetch_articles(mock_repo, 10)
 
         assert articles == []
-        mock_repo.get_latest.assert_called_once_with(limit=10)
+        mock_repo.get_latest.assert_called_once_with(limit=10, projection="summary")
 
     @pytest.mark.asyncio
     async def test_fetch_articles_formats_dates(self) -> None:
@@ -207,7 +207,7 @@ class TestGenerateNewsPage:
             await generate_news_page(str(output_file), limit=25)
 
             # Verify limit was passed to repository
-            mock_repo.get_latest.assert_called_once_with(limit=25)
+            mock_repo.get_latest.assert_called_once_with(limit=25, projection="summary")
 
     @pytest.mark.asyncio
     async def test_generate_creates_parent_directory(self, tmp_path: Path) -> None:
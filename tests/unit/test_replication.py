@@ -0,0 +1,140 @@
+"""
+Tests for snapshot shipping between a primary and read-only replicas.
+
+Uses a local directory as the shared replication directory.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.database import ArticleRepository
+from src.models import Article, ArticleSource
+from src.services.replication import MANIFEST_NAME, ReplicaSync, SnapshotPublisher
+
+
+def _article(guid: str, minutes: int = 0) -> Article:
+    """Create a test article published ``minutes`` after a fixed time."""
+    return Article(
+        title=f"Article {guid}",
+        url=f"https://example.com/{guid}",
+        pub_date=datetime(2025, 12, 28, tzinfo=timezone.utc) + timedelta(minutes=minutes),
+        guid=guid,
+        source=ArticleSource.create("lol", "en-us"),
+    )
+
+
+@pytest.fixture
+async def primary(tmp_path):
+    """Create a primary repository with two articles."""
+    repo = ArticleRepository(str(tmp_path / "primary" / "articles.db"))
+    await repo.initialize()
+    await repo.save_many([_article("a"), _article("b", 1)])
+    yield repo
+    await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_replica_swaps_in_shipped_snapshots(primary, tmp_path):
+    """Test that each shipped snapshot is picked up exactly once and swapped in."""
+    shared = tmp_path / "shared"
+    publisher = SnapshotPublisher(primary, str(shared), keep=2)
+    await publisher.publish()
+
+    manifest = json.loads((shared / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert (shared / manifest["snapshot"]).exists()
+
+    swapped: list[ArticleRepository] = []
+    replica = ReplicaSync(str(shared), str(tmp_path / "replica"), on_swap=swapped.append)
+    first = await replica.open()
+    try:
+        assert await first.count() == 2
+        assert replica.lag_seconds() is not None and replica.lag_seconds() < 60
+        assert await replica.sync() is False
+
+        # New writes on the primary reach the replica with the next shipment
+        await primary.save(_article("c", 2))
+        await publisher.publish()
+        assert await replica.sync() is True
+        assert swapped == [first, replica.repository]
+        assert await replica.repository.count() == 3
+        assert replica.get_status()["snapshot"] == publisher.get_status()["snapshot"]
+
+        # The first copy is deleted once two newer snapshots have been swapped in
+        await primary.save(_article("d", 3))
+        await publisher.publish()
+        assert await replica.sync() is True
+        assert not Path(first.db_path).exists()
+        assert len(list(shared.glob("articles-*.db"))) == 2
+    finally:
+        await replica.close()
+
+
+@pytest.mark.asyncio
+async def test_replica_serves_empty_database_until_first_snapshot(tmp_path):
+    """Test that a replica starts with an empty database when nothing was shipped."""
+    replica = ReplicaSync(str(tmp_path / "shared"), str(tmp_path / "replica"))
+    repository = await replica.open()
+    try:
+        assert await repository.count() == 0
+        assert replica.lag_seconds() is None
+        assert replica.get_status()["snapshot"] is None
+    finally:
+        await replica.close()
+
+
+@pytest.mark.asyncio
+async def test_replica_opens_snapshots_read_only(primary, tmp_path):
+    """Test that a replica cannot write to, or migrate, the snapshot it serves."""
+    shared = tmp_path / "shared"
+    await SnapshotPublisher(primary, str(shared)).publish()
+
+    replica = ReplicaSync(str(shared), str(tmp_path / "replica"))
+    repository = await replica.open()
+    try:
+        assert repository.read_only
+        with pytest.raises(aiosqlite.OperationalError, match="readonly"):
+            await repository.save(_article("c", 2))
+        assert await repository.count() == 2
+    finally:
+        await replica.close()
+
+
+@pytest.mark.asyncio
+async def test_replica_refuses_other_schema_versions(primary, tmp_path):
+    """Test that snapshots at another schema version are never swapped in."""
+    shared = tmp_path / "shared"
+    publisher = SnapshotPublisher(primary, str(shared))
+    await publisher.publish()
+
+    replica = ReplicaSync(str(shared), str(tmp_path / "replica"))
+    first = await replica.open()
+    try:
+        # A manifest announcing another version is refused before copying
+        await primary.save(_article("c", 2))
+        await publisher.publish()
+        manifest_path = shared / MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest["schema_version"] = ArticleRepository.SCHEMA_VERSION + 1
+        manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+        assert await replica.sync() is False
+        assert not (tmp_path / "replica" / manifest["snapshot"]).exists()
+
+        # So is a file whose own schema_version disagrees with its manifest
+        manifest["schema_version"] = ArticleRepository.SCHEMA_VERSION
+        manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+        with sqlite3.connect(shared / manifest["snapshot"]) as db:
+            db.execute(
+                "DELETE FROM schema_version WHERE version = ?", (manifest["schema_version"],)
+            )
+        assert await replica.sync() is False
+        assert not (tmp_path / "replica" / manifest["snapshot"]).exists()
+
+        assert replica.repository is first
+        assert await first.count() == 2
+    finally:
+        await replica.close()
@@ -0,0 +1,319 @@
+"""
+Conformance tests for the Repository protocol.
+
+Every test runs against each storage engine (SQLite and in-memory), so the
+engines must return the same articles in the same order for the same
+calls. A final test replays a mixed workload on both engines side by side
+and compares every result.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.database import ArticleRepository
+from src.memory_database import InMemoryArticleRepository
+from src.models import Article, ArticleSource
+from src.repository import MaintainedRepository, Repository
+from src.sharded_database import ShardedArticleRepository
+
+NOW = datetime(2025, 12, 28, 12, 0, tzinfo=timezone.utc)
+ENGINES = ["sqlite", "memory"]
+
+
+def _article(
+    guid: str,
+    minutes: int = 0,
+    source_id: str = "lol",
+    locale: str = "en-us",
+    title: str | None = None,
+    description: str = "",
+    categories: list[str] | None = None,
+) -> Article:
+    """Create a test article published ``minutes`` before NOW."""
+    return Article(
+        title=title or f"Article {guid}",
+        url=f"https://example.com/{guid}",
+        pub_date=NOW - timedelta(minutes=minutes),
+        guid=guid,
+        source=ArticleSource.create(source_id, locale),
+        description=description,
+        content=f"<p>Body of {guid}</p>",
+        categories=categories or [],
+        created_at=NOW,
+    )
+
+
+async def _open(engine: str, tmp_path) -> Repository:
+    """Create and initialize a repository of the given engine."""
+    repo: Repository
+    if engine == "sqlite":
+        repo = ArticleRepository(str(tmp_path / f"{engine}.db"))
+    else:
+        repo = InMemoryArticleRepository()
+    await repo.initialize()
+    return repo
+
+
+@pytest.fixture(params=ENGINES)
+async def repo(request, tmp_path):
+    """Repository of each engine in turn."""
+    repository = await _open(request.param, tmp_path)
+    yield repository
+    await repository.close()
+
+
+def _guids(articles: list[Article]) -> list[str]:
+    """Get the GUIDs of articles in order."""
+    return [a.guid for a in articles]
+
+
+@pytest.mark.asyncio
+async def test_engine_implements_protocol(repo):
+    """Test that every engine satisfies the Repository protocol."""
+    assert isinstance(repo, Repository)
+
+
+def test_sqlite_engines_implement_maintenance(tmp_path):
+    """Test that both SQLite engines satisfy the MaintainedRepository protocol."""
+    single = ArticleRepository(str(tmp_path / "articles.db"))
+    sharded = ShardedArticleRepository(str(tmp_path / "shards"), {"all": ["en-us"]})
+
+    assert isinstance(single, MaintainedRepository)
+    assert isinstance(sharded, MaintainedRepository)
+    assert not isinstance(InMemoryArticleRepository(), MaintainedRepository)
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_skipped(repo):
+    """Test that GUID and URL duplicates are skipped, also within a batch."""
+    assert await repo.save(_article("a", 1)) is True
+    assert await repo.save(_article("a", 2)) is False
+
+    same_url = _article("b", 3)
+    same_url.url = "https://example.com/a"
+    new = await repo.save_batch([_article("c", 4), same_url, _article("d", 5), _article("c", 6)])
+
+    assert new == ["c", "d"]
+    assert await repo.save_many([_article("d"), _article("e")]) == 1
+    assert await repo.count() == 4
+
+
+@pytest.mark.asyncio
+async def test_round_trip_and_projections(repo):
+    """Test that stored articles read back equal, with summary skipping content."""
+    original = _article("a", 5, "u-gg", "it-it", description="Tier list", categories=["Dev"])
+    await repo.save(original)
+
+    stored = await repo.get_by_guid("a")
+    assert stored == original
+    assert stored.content == "<p>Body of a</p>"
+    assert stored.pub_date == NOW - timedelta(minutes=5)
+    assert stored.source_category == "analytics"
+    assert stored.cluster_id is not None
+    assert await repo.get_by_canonical_url("https://example.com/a") == original
+    assert await repo.get_by_guid("missing") is None
+
+    summary = await repo.get_latest(projection="summary")
+    assert summary[0].content == ""
+    assert summary[0].content_loaded is False
+    await repo.load_content(summary)
+    assert summary[0].content == "<p>Body of a</p>"
+    assert summary[0].content_loaded is True
+
+    with pytest.raises(ValueError):
+        await repo.get_latest(projection="wide")
+
+
+@pytest.mark.asyncio
+async def test_filtered_queries(repo):
+    """Test the source, locale and category filters of the list queries."""
+    await repo.save_batch(
+        [
+            _article("lol-en", 1, "lol", "en-us", categories=["Dev"]),
+            _article("ugg-en", 2, "u-gg", "en-us", categories=["Meta"]),
+            _article("lol-gb", 3, "lol", "en-gb", categories=["Dev", "Esports"]),
+            _article("lol-it", 4, "lol", "it-it", categories=["Dev"]),
+            _article("ugg-it", 5, "u-gg", "it-it"),
+        ]
+    )
+
+    assert _guids(await repo.get_latest()) == ["lol-en", "ugg-en", "lol-gb", "lol-it", "ugg-it"]
+    assert _guids(await repo.get_latest(limit=2)) == ["lol-en", "ugg-en"]
+    assert _guids(await repo.get_latest(source="lol:en-gb")) == ["lol-gb"]
+    assert _guids(await repo.get_latest(locale="it-it")) == ["lol-it", "ugg-it"]
+    assert await repo.get_latest(locale="xx-xx") == []
+
+    assert _guids(await repo.get_latest_by_locale("en-us")) == ["lol-en", "ugg-en"]
+    assert _guids(await repo.get_latest_by_locale("it-it", source_id="u-gg")) == ["ugg-it"]
+    assert _guids(await repo.get_latest_by_locale("en-us", source_category="official_riot")) == [
+        "lol-en"
+    ]
+
+    assert _guids(await repo.get_by_locale_group(["en-gb", "it-it"])) == [
+        "lol-gb",
+        "lol-it",
+        "ugg-it",
+    ]
+    english = await repo.get_by_locale_group(["en-us", "en-gb"], source_category="analytics")
+    assert _guids(english) == ["ugg-en"]
+    assert _guids(await repo.get_by_source_category("analytics")) == ["ugg-en", "ugg-it"]
+    assert _guids(await repo.get_by_source_category("analytics", locale="it-it")) == ["ugg-it"]
+
+    assert _guids(await repo.get_by_category("Dev")) == ["lol-en", "lol-gb", "lol-it"]
+    assert _guids(await repo.get_by_category("Dev", locale="en-gb")) == ["lol-gb"]
+    assert _guids(await repo.get_by_category("Dev", source="lol:it-it")) == ["lol-it"]
+    assert await repo.get_by_category("Unknown") == []
+
+
+@pytest.mark.asyncio
+async def test_pagination_breaks_ties_by_insertion(repo):
+    """Test keyset pages over equal pub_dates and cursor validation."""
+    await repo.save_batch([_article(f"t{i}", minutes=i // 3) for i in range(7)])
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page, cursor = await repo.get_page(limit=3, cursor=cursor)
+        seen.extend(_guids(page))
+        if cursor is None:
+            break
+
+    assert seen == [f"t{i}" for i in range(7)]
+    page, cursor = await repo.get_page(limit=7)
+    assert len(page) == 7 and cursor is None
+    assert (await repo.get_page(locale="xx-xx")) == ([], None)
+
+    with pytest.raises(ValueError):
+        await repo.get_page(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_search_matching_and_ranking(repo):
+    """Test that all terms must match, prefixes, diacritics and title weighting."""
+    await repo.save_batch(
+        [
+            _article("title", 1, title="Patch notes 14.1", description="Balance changes"),
+            _article("body", 2, title="Dev update", description="Read the patch notes now"),
+            _article("accent", 3, "lol", "fr-fr", title="Équilibrage du patch"),
+            _article("other", 4, title="Worlds recap", categories=["Esports"]),
+        ]
+    )
+
+    assert _guids(await repo.search("patch notes")) == ["title", "body"]
+    # Shorter rows rank higher for the same frequency
+    assert _guids(await repo.search("pat")) == ["accent", "title", "body"]
+    assert _guids(await repo.search("equilibrage")) == ["accent"]
+    assert _guids(await repo.search("worl")) == ["other"]
+    assert await repo.search("wo") == []
+    assert _guids(await repo.search("patch", locale="fr-fr")) == ["accent"]
+    assert _guids(await repo.search("recap", category="Esports")) == ["other"]
+    assert await repo.search("recap", category="Dev") == []
+
+    with pytest.raises(ValueError):
+        await repo.search("!!!")
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_share_a_cluster(repo):
+    """Test that similar stories inside the window share one cluster id."""
+    description = "Riot nerfs Yasuo and buffs support items ahead of the ranked season start."
+    await repo.save(_article("riot", 60, title="Patch 14.1 notes", description=description))
+    await repo.save_batch(
+        [
+            _article("copy", 30, "dexerto", title="LoL Patch 14.1 notes", description=description),
+            _article("late", -43200, "dexerto", title="Patch 14.1 notes", description=description),
+            _article("other", 10, "dexerto", title="Worlds final", description="T1 win again."),
+        ]
+    )
+
+    clusters = {a.guid: a.cluster_id for a in await repo.get_latest(projection="summary")}
+    assert clusters["copy"] == clusters["riot"]
+    assert clusters["late"] != clusters["riot"]
+    assert clusters["other"] != clusters["riot"]
+
+
+@pytest.mark.asyncio
+async def test_stats(repo):
+    """Test counts, locale/category listings and per-source stats."""
+    assert await repo.count() == 0
+    assert await repo.get_last_write_timestamp() is None
+    assert await repo.get_article_stats() == []
+
+    await repo.save_batch(
+        [
+            _article("a", 1, "lol", "en-us"),
+            _article("b", 2, "lol", "en-us"),
+            _article("c", 3, "u-gg", "it-it"),
+        ]
+    )
+
+    assert await repo.count() == 3
+    assert await repo.count(locale="en-us") == 2
+    assert await repo.count(locale="xx-xx") == 0
+    assert await repo.get_locales() == ["en-us", "it-it"]
+    assert await repo.get_source_categories() == ["analytics", "official_riot"]
+    assert await repo.get_last_write_timestamp() == NOW - timedelta(minutes=1)
+
+    stats = await repo.get_article_stats()
+    assert [(s["source_id"], s["locale"], s["count"]) for s in stats] == [
+        ("lol", "en-us", 2),
+        ("u-gg", "it-it", 1),
+    ]
+    assert stats[0]["source_category"] == "official_riot"
+    assert stats[0]["last_pub_date"] == NOW - timedelta(minutes=1)
+
+
+@pytest.mark.asyncio
+async def test_engines_agree_on_a_mixed_workload(tmp_path):
+    """Test that both engines return identical results for the same calls."""
+    locales = ["en-us", "en-gb", "it-it", "fr-fr"]
+    sources = ["lol", "u-gg", "dexerto", "tft"]
+    words = ["patch", "notes", "champion", "balance", "worlds", "skins", "ranked", "meta"]
+    articles = [
+        _article(
+            f"g{i}",
+            minutes=(i * 7) % 50,
+            source_id=sources[i % len(sources)],
+            locale=locales[(i // 2) % len(locales)],
+            title=" ".join(words[(i + k) % len(words)] for k in range(1 + i % 3)),
+            description=" ".join(words[(i * k) % len(words)] for k in range(4)),
+            categories=[["Dev"], ["Esports", "Dev"], []][i % 3],
+        )
+        for i in range(120)
+    ]
+    engines = [await _open(engine, tmp_path) for engine in ENGINES]
+
+    async def both(method: str, *args, **kwargs) -> list:
+        results = [await getattr(engine, method)(*args, **kwargs) for engine in engines]
+        assert results[0] == results[1], (method, args, kwargs)
+        return results[0]
+
+    try:
+        for start in range(0, len(articles), 40):
+            await both("save_batch", articles[start : start + 40])
+
+        await both("get_latest", limit=200)
+        await both("get_latest", locale="it-it", limit=15)
+        await both("get_latest", source="tft:en-gb")
+        await both("get_latest_by_locale", "fr-fr", source_id="dexerto")
+        await both("get_by_locale_group", ["en-us", "en-gb"], source_category="esports")
+        await both("get_by_source_category", "analytics", locale="en-us")
+        await both("get_by_category", "Esports", limit=25)
+        for query in ("patch", "champion bal", "meta worlds", "ran"):
+            hits = await both("search", query, limit=100)
+            assert hits
+        await both("get_locales")
+        await both("get_source_categories")
+        await both("get_article_stats")
+        await both("count", locale="en-gb")
+
+        cursor = None
+        for _ in range(10):
+            _, cursor = await both("get_page", limit=13, cursor=cursor, locale="en-us")
+            if cursor is None:
+                break
+        assert cursor is None
+    finally:
+        for engine in engines:
+            await engine.close()
@@ -5,13 +5,16 @@ This module tests the RSSFeedGenerator class to ensure RSS 2.0 compliance
 and proper handling of Article objects.
 """
 
+import dataclasses
+import json
 from datetime import datetime, timezone
+from email.utils import format_datetime
 
 import feedparser
 import pytest
 
 from src.models import Article, ArticleSource
-from src.rss.generator import RSSFeedGenerator
+from src.rss.generator import ItemFragmentCache, RSSFeedGenerator, item_version, last_updated
 
 
 @pytest.fixture
@@ -410,3 +413,199 @@ def test_generate_feed_preserves_title() -> None:
 
     # Title should still be original
     assert generator.feed_title == "Original Title"
+
+
+def test_generate_feed_lists_alternates() -> None:
+    """Test that a collapsed story links the other sources that covered it."""
+    generator = RSSFeedGenerator()
+    article = Article(
+        title="Patch 14.1 notes",
+        url="https://www.leagueoflegends.com/news/patch-14-1",
+        pub_date=datetime(2025, 12, 28, 10, 0, 0, tzinfo=timezone.utc),
+        guid="patch-14-1",
+        source=ArticleSource.create("lol", "en-us"),
+        description="Balance changes for ranked play",
+        content="<p>Full notes</p>",
+    )
+    article.alternates.append(
+        Article(
+            title="LoL Patch 14.1 notes",
+            url="https://www.dexerto.com/league-of-legends/patch-14-1?ref=a&b",
+            pub_date=datetime(2025, 12, 28, 12, 0, 0, tzinfo=timezone.utc),
+            guid="dexerto-patch-14-1",
+            source=ArticleSource.create("dexerto", "en-us"),
+        )
+    )
+
+    feed = feedparser.parse(generator.generate_feed([article], "http://localhost/feed.xml"))
+
+    content = feed.entries[0].content[0].value
+    assert content.startswith("<p>Full notes</p>")
+    assert 'href="https://www.dexerto.com/league-of-legends/patch-14-1?ref=a&amp;b"' in content
+    assert ">dexerto</a>" in content
+
+
+def test_iter_feed_streams_same_document(sample_articles: list[Article]) -> None:
+    """Test that iter_feed() yields the header, one chunk per item and the footer."""
+    generator = RSSFeedGenerator()
+
+    chunks = list(generator.iter_feed(sample_articles, "http://localhost:8000/feed.xml"))
+
+    assert len(chunks) == len(sample_articles) + 2
+    assert chunks[0].startswith("<?xml version='1.0' encoding='UTF-8'?>\n<rss ")
+    assert all(chunk.startswith("    <item>\n") for chunk in chunks[1:-1])
+    assert chunks[-1] == "  </channel>\n</rss>\n"
+    feed = feedparser.parse("".join(chunks))
+    assert not feed.bozo
+    assert [entry.id for entry in feed.entries] == [a.guid for a in sample_articles]
+
+
+def test_generate_feed_escapes_markup_and_drops_invalid_characters() -> None:
+    """Test that text and attributes are escaped and XML-invalid characters removed."""
+    generator = RSSFeedGenerator(feed_title="News & <Updates>")
+    article = Article(
+        title='Tom & "Jerry" <3\x00\x1f',
+        url="https://example.com/a?x=1&y=2",
+        pub_date=datetime(2025, 12, 28, 10, 0, 0),
+        guid="guid\x0b-1",
+        source=ArticleSource.create("lol", "en-us"),
+        description="Line one\r\nLine two\x08",
+        image_url='https://example.com/i.jpg?a="1"&b=2',
+    )
+
+    feed_xml = generator.generate_feed([article], "http://localhost/feed.xml?a=1&b=2")
+
+    assert "<title>News &amp; &lt;Updates&gt;</title>" in feed_xml
+    assert '<title>Tom &amp; "Jerry" &lt;3</title>' in feed_xml
+    assert "<description>Line one&#13;\nLine two</description>" in feed_xml
+    assert 'url="https://example.com/i.jpg?a=&quot;1&quot;&amp;b=2"' in feed_xml
+    assert "<pubDate>Sun, 28 Dec 2025 10:00:00 +0000</pubDate>" in feed_xml
+    feed = feedparser.parse(feed_xml)
+    assert not feed.bozo
+    assert feed.entries[0].title == 'Tom & "Jerry" <3'
+    assert feed.entries[0].id == "guid-1"
+
+
+def test_item_cache_reuses_fragments_until_the_article_changes(
+    sample_articles: list[Article],
+) -> None:
+    """Test that cached items are reused across feeds and re-rendered when edited."""
+    cache = ItemFragmentCache()
+    generator = RSSFeedGenerator(item_cache=cache)
+    other = RSSFeedGenerator(feed_title="Other", item_cache=cache)
+
+    first = generator.generate_feed(sample_articles, "http://localhost/feed.xml")
+    second = other.generate_feed(sample_articles[:2], "http://localhost/other.xml")
+
+    assert cache.get_stats()["misses"] == 3
+    assert cache.get_stats()["hits"] == 2
+    assert len(cache) == 3
+    for article in sample_articles[:2]:
+        fragment = cache.get(article.guid, item_version(article))
+        assert fragment is not None and fragment in first and fragment in second
+
+    sample_articles[0].title = "Briar (updated)"
+    updated = generator.generate_feed(sample_articles[:1], "http://localhost/feed.xml")
+    assert "<title>Briar (updated)</title>" in updated
+    assert cache.get_stats()["misses"] == 4
+
+
+def test_item_cache_evicts_least_recently_used() -> None:
+    """Test that the cache keeps at most max_items fragments, and none when 0."""
+    cache = ItemFragmentCache(max_items=2)
+    cache.set("a", b"1", "A")
+    cache.set("b", b"1", "B")
+    assert cache.get("a", b"1") == "A"
+    cache.set("c", b"1", "C")
+
+    assert cache.get("b", b"1") is None
+    assert cache.get("a", b"1") == "A"
+    assert cache.get("a", b"2") is None
+    assert len(cache) == 2
+
+    disabled = ItemFragmentCache(max_items=0)
+    disabled.set("a", b"1", "A")
+    assert len(disabled) == 0
+
+
+def test_item_version_is_a_digest(sample_articles: list[Article]) -> None:
+    """Test that the version is a short digest that follows the rendered fields."""
+    article = sample_articles[0]
+    article.content = "<p>Full patch notes</p>" * 1000
+    version = item_version(article)
+
+    assert len(version) == 16
+    assert item_version(dataclasses.replace(article)) == version
+    article.content += "<p>Hotfix</p>"
+    assert item_version(article) != version
+
+
+def test_generate_atom_feed(sample_articles: list[Article]) -> None:
+    """Test that the Atom rendering is a valid Atom 1.0 document."""
+    generator = RSSFeedGenerator()
+
+    feed_xml = generator.generate_feed(
+        sample_articles, "http://localhost:8000/feed.atom", fmt="atom"
+    )
+
+    feed = feedparser.parse(feed_xml)
+    assert not feed.bozo
+    assert feed.version == "atom10"
+    assert [entry.link for entry in feed.entries] == [a.url for a in sample_articles]
+    assert feed.entries[0].id == "tag:lolstonks-rss,2025:article-champion-briar"
+    assert feed.entries[0].published == "2025-12-28T10:00:00+00:00"
+    assert '<link href="http://localhost:8000/feed.atom" rel="self"/>' in feed_xml
+
+
+def test_generate_json_feed(sample_articles: list[Article]) -> None:
+    """Test that the JSON rendering is a JSON Feed 1.1 document."""
+    generator = RSSFeedGenerator()
+
+    feed = json.loads(
+        generator.generate_feed(sample_articles, "http://localhost:8000/feed.json", fmt="json")
+    )
+
+    assert feed["version"] == "https://jsonfeed.org/version/1.1"
+    assert feed["feed_url"] == "http://localhost:8000/feed.json"
+    assert [item["id"] for item in feed["items"]] == [a.guid for a in sample_articles]
+    item = feed["items"][0]
+    assert item["url"] == sample_articles[0].url
+    assert item["content_html"] == sample_articles[0].content
+    assert item["date_published"] == "2025-12-28T10:00:00+00:00"
+    assert item["tags"][-1] == str(sample_articles[0].source)
+    empty = generator.generate_feed([], "http://localhost/feed.json", fmt="json")
+    assert json.loads(empty)["items"] == []
+
+
+def test_generate_feed_rejects_unknown_format(sample_articles: list[Article]) -> None:
+    """Test that an unsupported format raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown feed format"):
+        RSSFeedGenerator().generate_feed(sample_articles, "http://localhost/feed", fmt="csv")
+
+
+def test_item_cache_keeps_formats_apart(sample_articles: list[Article]) -> None:
+    """Test that each format caches its own fragment for the same article."""
+    cache = ItemFragmentCache()
+    generator = RSSFeedGenerator(item_cache=cache)
+
+    for fmt in ("rss", "atom", "json"):
+        generator.generate_feed(sample_articles, "http://localhost/feed", fmt=fmt)
+
+    assert len(cache) == 3 * len(sample_articles)
+    assert cache.get_stats()["hits"] == 0
+    version = item_version(sample_articles[0])
+    assert "<entry>" in (cache.get(sample_articles[0].guid, version, fmt="atom") or "")
+    assert "<item>" in (cache.get(sample_articles[0].guid, version) or "")
+
+
+def test_last_build_date_is_newest_article(sample_articles: list[Article]) -> None:
+    """Test that <lastBuildDate> follows the content, so re-renders are identical."""
+    generator = RSSFeedGenerator()
+
+    feed_xml = generator.generate_feed(sample_articles, "http://localhost/feed.xml")
+
+    newest = max(a.pub_date for a in sample_articles)
+    assert last_updated(sample_articles) == newest
+    assert f"<lastBuildDate>{format_datetime(newest)}</lastBuildDate>" in feed_xml
+    assert generator.generate_feed(sample_articles, "http://localhost/feed.xml") == feed_xml
+    assert last_updated([]) is None
@@ -6,10 +6,11 @@ periodic updates, manual triggers, and status reporting.
 """
 
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.models import RetentionPolicy
 from src.services.scheduler import NewsScheduler
 
 
@@ -243,3 +244,132 @@ async def test_scheduler_job_configuration(scheduler: NewsScheduler) -> None:
     assert job.next_run_time is not None
 
     scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_adds_maintenance_job_when_enabled(mock_repository: AsyncMock) -> None:
+    """Test that a maintenance interval registers the database maintenance job."""
+    scheduler = NewsScheduler(mock_repository, interval_minutes=5, maintenance_interval_hours=24)
+    scheduler.start()
+
+    job_ids = {job.id for job in scheduler.scheduler.get_jobs()}
+    assert job_ids == {"update_news", "database_maintenance"}
+
+    scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_maintenance_job_applies_retention_and_vacuums(
+    scheduler: NewsScheduler, mock_repository: AsyncMock
+) -> None:
+    """Test that the maintenance job runs retention, recompression, then vacuum."""
+    policies = [RetentionPolicy(max_age_days=90)]
+    mock_repository.apply_retention.return_value = {"deleted": 3, "archived": 0}
+    mock_repository.recompress_stored_text.return_value = 12
+    mock_repository.run_maintenance.return_value = {
+        "page_size": 4096,
+        "pages_before": 10,
+        "pages_after": 8,
+        "freelist_pages": 0,
+        "bytes_reclaimed": 8192,
+    }
+
+    with (
+        patch("src.services.scheduler.settings.retention_policies", policies),
+        patch("src.services.scheduler.record_database_maintenance") as record,
+    ):
+        stats = await scheduler.trigger_maintenance_now()
+
+    mock_repository.apply_retention.assert_awaited_once()
+    assert mock_repository.apply_retention.await_args.args[0] == policies
+    mock_repository.run_maintenance.assert_awaited_once()
+    record.assert_called_once()
+    assert stats["bytes_reclaimed"] == 8192
+    assert stats["deleted"] == 3
+    assert stats["recompressed"] == 12
+
+
+@pytest.mark.asyncio
+async def test_scheduler_adds_backup_job_when_enabled(mock_repository: AsyncMock) -> None:
+    """Test that a backup interval registers the database backup job."""
+    scheduler = NewsScheduler(mock_repository, interval_minutes=5, backup_interval_hours=6)
+    scheduler.start()
+
+    job_ids = {job.id for job in scheduler.scheduler.get_jobs()}
+    assert job_ids == {"update_news", "database_backup"}
+
+    scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_backup_job_writes_snapshot(
+    scheduler: NewsScheduler, mock_repository: AsyncMock
+) -> None:
+    """Test that the backup job passes the configured directory and rotation."""
+    mock_repository.backup.return_value = {"path": "backups/a.db", "bytes": 4096}
+
+    with (
+        patch("src.services.scheduler.settings.backup_directory", "backups"),
+        patch("src.services.scheduler.settings.backup_keep", 3),
+        patch("src.services.scheduler.record_database_backup") as record,
+    ):
+        stats = await scheduler.trigger_backup_now()
+
+    assert mock_repository.backup.await_args.args == ("backups",)
+    assert mock_repository.backup.await_args.kwargs["keep"] == 3
+    record.assert_called_once_with("success", 4096)
+    assert stats["path"] == "backups/a.db"
+
+
+@pytest.mark.asyncio
+async def test_backup_job_handles_errors(
+    scheduler: NewsScheduler, mock_repository: AsyncMock
+) -> None:
+    """Test that a failing backup is reported instead of raised."""
+    mock_repository.backup.side_effect = OSError("disk full")
+
+    stats = await scheduler.trigger_backup_now()
+
+    assert stats["error"] == "disk full"
+
+
+@pytest.mark.asyncio
+async def test_replica_scheduler_polls_instead_of_updating(mock_repository: AsyncMock) -> None:
+    """Test that a replica only polls for snapshots and never runs updates."""
+    replica = MagicMock()
+    replica.sync = AsyncMock(return_value=True)
+    scheduler = NewsScheduler(mock_repository, interval_minutes=5, replica=replica)
+    scheduler.start()
+
+    job_ids = {job.id for job in scheduler.scheduler.get_jobs()}
+    assert job_ids == {"replica_sync"}
+    assert await scheduler._replica_sync_job() == {"swapped": True}
+
+    scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_primary_scheduler_ships_snapshots(mock_repository: AsyncMock) -> None:
+    """Test that a replication primary adds the snapshot shipping job."""
+    publisher = MagicMock()
+    publisher.publish = AsyncMock(side_effect=OSError("share unavailable"))
+    scheduler = NewsScheduler(mock_repository, interval_minutes=5, publisher=publisher)
+    scheduler.start()
+
+    job_ids = {job.id for job in scheduler.scheduler.get_jobs()}
+    assert job_ids == {"update_news", "ship_snapshot"}
+    assert (await scheduler._ship_snapshot_job())["error"] == "share unavailable"
+
+    scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_maintenance_job_handles_errors(
+    scheduler: NewsScheduler, mock_repository: AsyncMock
+) -> None:
+    """Test that a failing maintenance run is reported instead of raised."""
+    mock_repository.run_maintenance.side_effect = RuntimeError("database is locked")
+
+    stats = await scheduler.trigger_maintenance_now()
+
+    assert stats["error"] == "database is locked"
@@ -19,6 +19,7 @@ def mock_repository() -> AsyncMock:
     """Create a mock repository for testing."""
     repo = AsyncMock()
     repo.save = AsyncMock(return_value=True)
+    repo.save_batch = AsyncMock(side_effect=lambda articles: [a.guid for a in articles])
     return repo
 
 
@@ -0,0 +1,158 @@
+"""
+Tests for the per-locale-group sharded repository.
+
+Checks that articles are routed to their shard, and that cross-shard reads
+merge correctly, including pub_date ties and keyset pagination. Also checks
+that shards are written in parallel.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config import LOCALE_GROUPS
+from src.models import Article, ArticleSource
+from src.sharded_database import DEFAULT_SHARD, ShardedArticleRepository, build_shard_map
+
+NOW = datetime(2025, 12, 28, tzinfo=timezone.utc)
+
+
+def _article(guid: str, locale: str, minutes: int = 0, source_id: str = "lol") -> Article:
+    """Create a test article published ``minutes`` before NOW."""
+    return Article(
+        title=f"Article {guid}",
+        url=f"https://example.com/{guid}",
+        pub_date=NOW - timedelta(minutes=minutes),
+        guid=guid,
+        source=ArticleSource.create(source_id, locale),
+        categories=["Dev"],
+    )
+
+
+@pytest.fixture
+async def sharded(tmp_path):
+    """Create a sharded repository using the default locale groups."""
+    repo = ShardedArticleRepository(str(tmp_path / "shards"), LOCALE_GROUPS)
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+
+def test_build_shard_map_assigns_overlapping_locales_once():
+    """Test that a locale belongs to the first group listing it."""
+    shard_of = build_shard_map(LOCALE_GROUPS)
+
+    assert shard_of["en-gb"] == "english"
+    assert shard_of["es-es"] == "spanish"
+    assert shard_of["fr-fr"] == "eu"
+    assert shard_of["pt-br"] == "latam"
+    assert shard_of["ko-kr"] == "asia"
+    assert "sea" not in shard_of.values()
+    assert "all" not in shard_of.values()
+
+
+@pytest.mark.asyncio
+async def test_writes_are_routed_to_locale_shards(sharded):
+    """Test that each article lands in its locale's shard with a unique id."""
+    articles = [
+        _article("en-1", "en-us", 1),
+        _article("fr-1", "fr-fr", 2),
+        _article("ko-1", "ko-kr", 3),
+        _article("ru-1", "ru-ru", 4),
+        _article("en-2", "en-gb", 5),
+    ]
+
+    new = await sharded.save_batch([*articles, _article("en-1", "en-us", 1)])
+
+    assert new == ["en-1", "fr-1", "ko-1", "ru-1", "en-2"]
+    assert await sharded.shards["english"].count() == 2
+    assert await sharded.shards["eu"].count() == 1
+    assert await sharded.shards[DEFAULT_SHARD].count() == 1
+    assert await sharded.count() == 5
+    assert await sharded.count(locale="en-gb") == 1
+    assert await sharded.get_locales() == ["en-gb", "en-us", "fr-fr", "ko-kr", "ru-ru"]
+    assert (await sharded.get_by_guid("ko-1")).locale == "ko-kr"
+
+    ids = [row[0] for row in await sharded.fetch_all("SELECT id FROM articles")]
+    assert len(set(ids)) == 5
+
+    assert [a.guid for a in await sharded.get_latest_by_locale("fr-fr")] == ["fr-1"]
+    assert await sharded.save(_article("fr-1", "fr-fr")) is False
+
+
+@pytest.mark.asyncio
+async def test_cross_shard_reads_merge_newest_first(sharded):
+    """Test the k-way merge of fan-out reads, including pub_date ties."""
+    await sharded.save_batch(
+        [
+            _article("en-old", "en-us", 30),
+            _article("fr-new", "fr-fr", 0),
+            _article("ko-mid", "ko-kr", 10),
+            # Same instant in two shards: shard order decides
+            _article("ko-tie", "ko-kr", 20),
+            _article("en-tie", "en-us", 20),
+        ]
+    )
+
+    latest = await sharded.get_latest(limit=4)
+    assert [a.guid for a in latest] == ["fr-new", "ko-mid", "en-tie", "ko-tie"]
+
+    by_category = await sharded.get_by_category("Dev", limit=10)
+    assert [a.guid for a in by_category][:2] == ["fr-new", "ko-mid"]
+
+    group = await sharded.get_by_locale_group(["en-us", "ko-kr"], limit=10)
+    assert [a.guid for a in group] == ["ko-mid", "en-tie", "ko-tie", "en-old"]
+
+    # Search interleaves per-shard rankings: best of each shard first
+    hits = await sharded.search("Article", limit=10)
+    assert len(hits) == 5
+    assert {a.locale for a in hits[:3]} == {"en-us", "fr-fr", "ko-kr"}
+
+
+@pytest.mark.asyncio
+async def test_pagination_across_shards_visits_every_article_once(sharded):
+    """Test keyset pagination over merged shards, with ties at page boundaries."""
+    locales = ["en-us", "fr-fr", "ko-kr", "pt-br", "ru-ru"]
+    await sharded.save_batch(
+        [_article(f"{locale}-{i}", locale, i // 3) for i in range(12) for locale in locales]
+    )
+
+    seen: list[Article] = []
+    cursor = None
+    while True:
+        page, cursor = await sharded.get_page(limit=7, cursor=cursor, projection="summary")
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 60
+    assert len({a.guid for a in seen}) == 60
+    assert [a.guid for a in seen] == [a.guid for a in await sharded.get_latest(limit=60)]
+
+
+@pytest.mark.asyncio
+async def test_batches_for_different_shards_are_written_in_parallel(sharded):
+    """Test that a mixed batch commits its per-shard batches concurrently."""
+    started = 0
+    both_started = asyncio.Event()
+
+    def gate(original):
+        async def save_batch(articles):
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            # A sequential implementation would never reach the second shard
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+            return await original(articles)
+
+        return save_batch
+
+    for name in ("english", "eu"):
+        shard = sharded.shards[name]
+        shard.save_batch = gate(shard.save_batch)
+
+    new = await sharded.save_batch([_article("en-p", "en-us"), _article("fr-p", "fr-fr")])
+
+    assert new == ["en-p", "fr-p"]
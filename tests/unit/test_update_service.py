@@ -25,6 +25,7 @@ def mock_repository() -> AsyncMock:
     """Create a mock repository for testing."""
     repo = AsyncMock()
     repo.save = AsyncMock(return_value=True)
+    repo.save_batch = AsyncMock(side_effect=lambda articles: [a.guid for a in articles])
     return repo
 
 
@@ -119,8 +120,8 @@ async def test_update_all_sources_with_duplicates(
         )
     ]
 
-    # Mock repository to return False (duplicate) for some saves
-    mock_repository.save = AsyncMock(side_effect=[True, False])
+    # Mock repository to report the article as new once, then as a duplicate
+    mock_repository.save_batch = AsyncMock(side_effect=[["test-1"], []])
 
     # Mock API client
     mock_client = AsyncMock()
@@ -245,6 +246,7 @@ def mock_repository_v2() -> AsyncMock:
     """Create a mock repository for UpdateServiceV2 testing."""
     repo = AsyncMock()
     repo.save = AsyncMock(return_value=True)
+    repo.save_batch = AsyncMock(side_effect=lambda articles: [a.guid for a in articles])
     repo.initialize = AsyncMock()
     repo.close = AsyncMock()
     return repo
@@ -484,4 +486,4 @@ class TestUpdateSourceRouting:
         new_count = await update_service_v2._update_source(task)
 
         assert new_count == 1
-        mock_repository_v2.save.assert_called_once()
+        mock_repository_v2.save_batch.assert_called_once_with(mock_articles)